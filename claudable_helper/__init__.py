@@ -3,6 +3,7 @@ Claudable Helper - Integration of Claudable services.
 
 Provides easy access to Claudable's CLI adapters and services.
 """
+import sys
 
 # Import main CLI adapters for convenience
 try:
@@ -21,7 +22,7 @@ try:
         "GeminiCLI",
     ]
 except ImportError as e:
-    print(f"Warning: Could not import CLI adapters: {e}")
+    print(f"Warning: Could not import CLI adapters: {e}", file=sys.stderr)
     __all__ = []
 
 # Version info
@@ -5,7 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from claudable_helper.cli.base import BaseCLI
+from claudable_helper.cli.base import BaseCLI, mark_phase, track_process
 from claudable_helper.models.messages import Message, MessageType
 
 
@@ -27,6 +27,8 @@ class AntigravityCLI(BaseCLI):
         cmd = ["antigravity", instruction, "--project", project_path]
         try:
             proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=project_path)
+            track_process(proc)
+            mark_phase("spawned")
             if proc.stdout:
                 async for line in proc.stdout:
                     line_text = line.decode().strip()
@@ -18,7 +18,7 @@ except ImportError:
     # Fall back to mock implementation
     from claudable_helper.external.claude_code_sdk import ClaudeSDKClient, ClaudeCodeOptions
 
-from ..base import BaseCLI, CLIType
+from ..base import BaseCLI, CLIType, mark_phase
 
 
 class ClaudeCodeCLI(BaseCLI):
@@ -26,7 +26,6 @@ class ClaudeCodeCLI(BaseCLI):
 
     def __init__(self):
         super().__init__(CLIType.CLAUDE)
-        self.session_mapping: Dict[str, str] = {}  # Simple in-memory session storage
 
     async def check_availability(self) -> Dict[str, Any]:
         """Check if Claude Code CLI is available"""
@@ -136,31 +135,36 @@ class ClaudeCodeCLI(BaseCLI):
             allowed_tools=allowed_tools,
             permission_mode="bypassPermissions",
             model=cli_model,
-            continue_conversation=True,
+            # An initial prompt starts a fresh conversation
+            continue_conversation=not is_initial_prompt,
         )
 
         ui.info(f"Using model: {cli_model}", "Claude SDK")
         ui.debug(f"Project path: {project_path}", "Claude SDK")
         ui.debug(f"Instruction: {instruction[:100]}...", "Claude SDK")
 
+        existing_session_id = None
         try:
             # Change to project directory
             original_cwd = os.getcwd()
             os.chdir(project_path)
 
-            # Get project ID for session management
-            project_id = (
-                project_path.split("/")[-1] if "/" in project_path else project_path
-            )
-            existing_session_id = await self.get_session_id(project_id)
+            # Resume the stored session for this project and model (unless a
+            # new session is asked for): the agent keeps its context instead
+            # of re-reading the project
+            if not is_initial_prompt:
+                existing_session_id = await self.get_session_id(project_path, model)
 
             # Update options with resume session if available
             if existing_session_id:
-                options.resumeSessionId = existing_session_id
+                options.resume = existing_session_id
                 ui.info(f"Resuming session: {existing_session_id}", "Claude SDK")
 
             try:
                 async with ClaudeSDKClient(options=options) as client:
+                    # Connecting spawns the Claude Code CLI and initializes it
+                    mark_phase("spawned")
+                    mark_phase("session_ready")
                     # Send initial query
                     await client.query(instruction)
 
@@ -203,7 +207,7 @@ class ClaudeCodeCLI(BaseCLI):
                             ):
                                 claude_session_id = message_obj.session_id
                                 await self.set_session_id(
-                                    project_id, claude_session_id
+                                    project_path, claude_session_id, model
                                 )
 
                             # Send init message (hidden from UI)
@@ -373,20 +377,11 @@ class ClaudeCodeCLI(BaseCLI):
 
         except Exception as e:
             ui.error(f"Exception occurred: {str(e)}", "Claude SDK")
+            if existing_session_id:
+                await self.clear_session_id(project_path, model)
             if log_callback:
                 await log_callback(f"Claude SDK Exception: {str(e)}")
             raise
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
-        """Get current session ID for project"""
-        return self.session_mapping.get(project_id)
-
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
-        """Set session ID for project in memory"""
-        self.session_mapping[project_id] = session_id
-        ui.debug(
-            f"Session ID stored for project {project_id}", "Claude SDK"
-        )
-
 
 __all__ = ["ClaudeCodeCLI"]
@@ -15,7 +15,7 @@ from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
 from claudable_helper.core.terminal_ui import ui
 from claudable_helper.models.messages import Message
 
-from ..base import BaseCLI, CLIType, LineBuffer
+from ..base import BaseCLI, CLIType, LineBuffer, mark_phase, track_process
 
 
 class CodexCLI(BaseCLI):
@@ -23,14 +23,13 @@ class CodexCLI(BaseCLI):
 
     def __init__(self):
         super().__init__(CLIType.CODEX)
-        self._session_store = {}  # Simple in-memory session storage
 
     async def check_availability(self) -> Dict[str, Any]:
         """Check if Codex CLI is available"""
-        print(f"[DEBUG] CodexCLI.check_availability called")
+        ui.debug("CodexCLI.check_availability called", "Codex")
         try:
             # Check if codex is installed and working
-            print(f"[DEBUG] Running command: codex --version")
+            ui.debug("Running command: codex --version", "Codex")
             result = await asyncio.create_subprocess_shell(
                 "codex --version",
                 stdout=asyncio.subprocess.PIPE,
@@ -38,22 +37,22 @@ class CodexCLI(BaseCLI):
             )
             stdout, stderr = await result.communicate()
 
-            print(f"[DEBUG] Command result: returncode={result.returncode}")
-            print(f"[DEBUG] stdout: {stdout.decode().strip()}")
-            print(f"[DEBUG] stderr: {stderr.decode().strip()}")
+            ui.debug("Command result: returncode=%s", "Codex", result.returncode)
+            ui.debug("stdout: %s", "Codex", stdout.decode().strip())
+            ui.debug("stderr: %s", "Codex", stderr.decode().strip())
 
             if result.returncode != 0:
                 error_msg = (
                     f"Codex CLI not installed or not working (returncode: {result.returncode}). stderr: {stderr.decode().strip()}"
                 )
-                print(f"[DEBUG] {error_msg}")
+                ui.debug(error_msg, "Codex")
                 return {
                     "available": False,
                     "configured": False,
                     "error": error_msg,
                 }
 
-            print(f"[DEBUG] Codex CLI available!")
+            ui.debug("Codex CLI available!", "Codex")
             return {
                 "available": True,
                 "configured": True,
@@ -62,7 +61,7 @@ class CodexCLI(BaseCLI):
             }
         except Exception as e:
             error_msg = f"Failed to check Codex CLI: {str(e)}"
-            print(f"[DEBUG] Exception in check_availability: {error_msg}")
+            ui.debug(f"Exception in check_availability: {error_msg}", "Codex")
             return {
                 "available": False,
                 "configured": False,
@@ -87,9 +86,6 @@ class CodexCLI(BaseCLI):
         cli_model = self._get_cli_model_name(model) or "gpt-5"
         ui.info(f"Starting Codex execution with model: {cli_model}", "Codex")
 
-        # Get project ID for session management
-        project_id = project_path.split("/")[-1] if "/" in project_path else project_path
-
         # Use the provided project path directly
         project_repo_path = project_path
 
@@ -131,23 +127,17 @@ class CodexCLI(BaseCLI):
             "yes",
             "on",
         )
-        if enable_resume:
-            stored_rollout_path = await self.get_rollout_path(project_id)
-            if stored_rollout_path and os.path.exists(stored_rollout_path):
+        if enable_resume and not is_initial_prompt:
+            # The rollout of the session stored for this project path and model;
+            # never another project's, even one with the same directory name
+            stored_rollout_path = await self.get_rollout_path(project_path, model)
+            if stored_rollout_path:
                 cmd.extend(["-c", f"experimental_resume={stored_rollout_path}"])
                 ui.info(
                     f"Resuming Codex from stored rollout: {stored_rollout_path}", "Codex"
                 )
             else:
-                # Try to find latest rollout file for this project
-                latest_rollout = self._find_latest_rollout_for_project(project_id)
-                if latest_rollout and os.path.exists(latest_rollout):
-                    cmd.extend(["-c", f"experimental_resume={latest_rollout}"])
-                    ui.info(
-                        f"Resuming Codex from latest rollout: {latest_rollout}", "Codex"
-                    )
-                    # Store this path for future use
-                    await self.set_rollout_path(project_id, latest_rollout)
+                ui.debug(f"No Codex rollout stored for {project_path} (fresh session)", "Codex")
         else:
             ui.debug("Codex resume disabled (fresh session)", "Codex")
 
@@ -160,6 +150,8 @@ class CodexCLI(BaseCLI):
                 stderr=asyncio.subprocess.PIPE,
                 cwd=project_repo_path,
             )
+            track_process(process)
+            mark_phase("spawned")
 
             # Wrap stdout with LineBuffer for large NDJSON handling
             reader = LineBuffer(process.stdout)
@@ -187,9 +179,10 @@ class CodexCLI(BaseCLI):
                     event = json.loads(line_str)
                     if event.get("msg", {}).get("type") == "session_configured":
                         session_info = event["msg"]
+                        mark_phase("session_ready")
                         codex_session_id = session_info.get("session_id")
                         if codex_session_id:
-                            await self.set_session_id(project_id, codex_session_id)
+                            await self.set_session_id(project_path, codex_session_id, model)
 
                         ui.success(
                             f"Codex session configured: {codex_session_id}", "Codex"
@@ -321,9 +314,9 @@ class CodexCLI(BaseCLI):
                     )
                     for item in items:
                         if item.get("type") == "local_image":
-                            ui.debug(f"  - Image: {item.get('path')}", "Codex")
+                            ui.debug("  - Image: %s", "Codex", item.get("path"))
 
-                ui.debug(f"Sent user input: {request_id}", "Codex")
+                ui.debug("Sent user input: %s", "Codex", request_id)
 
             # Process streaming events with timeout to prevent hanging
             READLINE_TIMEOUT = 300  # 5 minutes timeout for readline operations
@@ -434,11 +427,11 @@ class CodexCLI(BaseCLI):
 
                     elif msg_type == "patch_apply_begin":
                         changes = event["msg"].get("changes", {})
-                        ui.debug(f"Patch apply begin - changes: {changes}", "Codex")
+                        ui.debug("Patch apply begin - changes: %s", "Codex", changes)
                         summary = self._create_tool_summary(
                             "apply_patch", {"changes": changes}
                         )
-                        ui.debug(f"Generated summary: {summary}", "Codex")
+                        ui.debug("Generated summary: %s", "Codex", summary)
                         yield Message(
                             id=str(uuid.uuid4()),
                             project_id=project_path,
@@ -503,7 +496,7 @@ class CodexCLI(BaseCLI):
                         "mcp_tool_call_end",
                     ]:
                         # Tool completion events - just log, don't show to user
-                        ui.debug(f"Tool completed: {msg_type}", "Codex")
+                        ui.debug("Tool completed: %s", "Codex", msg_type)
 
                     elif msg_type == "task_complete":
                         # Flush any remaining message buffer before completing
@@ -520,21 +513,10 @@ class CodexCLI(BaseCLI):
                             )
                             agent_message_buffer = ""
 
-                        # Task completion - save rollout file path for future resumption
+                        # Task completion - the session ID stored at session_configured
+                        # locates this run's rollout for future resumption
                         ui.success("Codex task completed", "Codex")
 
-                        # Find and store the latest rollout file for this session
-                        try:
-                            latest_rollout = self._find_latest_rollout_for_project(project_id)
-                            if latest_rollout:
-                                await self.set_rollout_path(project_id, latest_rollout)
-                                ui.debug(
-                                    f"Saved rollout path for future resumption: {latest_rollout}",
-                                    "Codex",
-                                )
-                        except Exception as e:
-                            ui.warning(f"Failed to save rollout path: {e}", "Codex")
-
                         break
 
                     elif msg_type == "error":
@@ -606,36 +588,18 @@ class CodexCLI(BaseCLI):
                 created_at=datetime.utcnow(),
             )
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
-        """Get stored session ID for project"""
-        return self._session_store.get(project_id)
-
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
-        """Store session ID for project in memory"""
-        self._session_store[project_id] = session_id
-        ui.debug(
-            f"Codex session stored for project {project_id}: {session_id}",
-            "Codex",
-        )
-
-    async def get_rollout_path(self, project_id: str) -> Optional[str]:
-        """Get stored rollout file path for project"""
-        # Simplified: just find latest rollout without database dependency
-        return self._find_latest_rollout_for_project(project_id)
-
-    async def set_rollout_path(self, project_id: str, rollout_path: str) -> None:
-        """Store rollout file path for project - simplified for MCP usage"""
-        ui.debug(
-            f"Codex rollout path noted for project {project_id}: {rollout_path}",
-            "Codex",
-        )
+    async def get_rollout_path(self, project_path: str, model: Optional[str] = None) -> Optional[str]:
+        """Rollout file of the session stored for this project path and model, if it still exists"""
+        session_id = await self.get_session_id(project_path, model)
+        if not session_id:
+            return None
+        return await asyncio.to_thread(self._find_rollout_for_session, session_id)
 
-    def _find_latest_rollout_for_project(self, project_id: str) -> Optional[str]:
-        """Find the latest rollout file using codex_chat.py logic"""
+    def _find_rollout_for_session(self, session_id: str) -> Optional[str]:
+        """Find the rollout file Codex wrote for a session (rollout-<timestamp>-<session_id>.jsonl)"""
         try:
             from pathlib import Path
 
-            # Use exact same logic as codex_chat.py _resolve_resume_path for "latest"
             root = Path.home() / ".codex" / "sessions"
             if not root.exists():
                 ui.debug(
@@ -643,35 +607,25 @@ class CodexCLI(BaseCLI):
                 )
                 return None
 
-            # Find all rollout files using same pattern as codex_chat.py
             candidates = sorted(
-                root.rglob("rollout-*.jsonl"),
+                root.rglob(f"rollout-*-{session_id}.jsonl"),
                 key=lambda p: p.stat().st_mtime,
                 reverse=True,  # Most recent first
             )
-
             if not candidates:
-                ui.debug(f"No rollout files found in {root}", "Codex")
-                return None
-
-            # Return the most recent file (same as codex_chat.py "latest" logic)
-            latest_file = candidates[0] if candidates else None
-            if not latest_file:
-                ui.debug(f"No valid rollout file found for project {project_id}", "Codex")
+                ui.debug(f"No rollout file found for Codex session {session_id}", "Codex")
                 return None
-                
-            rollout_path = str(latest_file.resolve())
 
+            rollout_path = str(candidates[0].resolve())
             ui.debug(
-                f"Found latest rollout file for project {project_id}: {rollout_path}",
+                f"Found rollout file for Codex session {session_id}: {rollout_path}",
                 "Codex",
             )
             return rollout_path
         except Exception as e:
-            ui.warning(f"Failed to find latest rollout file: {e}", "Codex")
+            ui.warning(f"Failed to find rollout file: {e}", "Codex")
             return None
 
-
     async def _set_codex_approval_policy(self, process, session_id: str):
         """Set Codex approval policy to never (full-auto mode)"""
         try:
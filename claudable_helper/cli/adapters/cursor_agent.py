@@ -14,7 +14,7 @@ from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
 from claudable_helper.models.messages import Message
 from claudable_helper.core.terminal_ui import ui
 
-from ..base import BaseCLI, CLIType, LineBuffer
+from ..base import BaseCLI, CLIType, LineBuffer, mark_phase, track_process
 
 
 class CursorAgentCLI(BaseCLI):
@@ -22,7 +22,6 @@ class CursorAgentCLI(BaseCLI):
 
     def __init__(self):
         super().__init__(CLIType.CURSOR)
-        self._session_store = {}  # Simple in-memory session storage
 
     async def check_availability(self) -> Dict[str, Any]:
         """Check if Cursor Agent CLI is available"""
@@ -231,10 +230,10 @@ class CursorAgentCLI(BaseCLI):
         """Execute Cursor Agent CLI with stream-json format and session continuity"""
         # Skip AGENTS.md creation - removed for MCP server usage
 
-        # Extract project ID - simplified path handling
-        project_id = os.path.basename(project_path)
-
-        stored_session_id = await self.get_session_id(project_id)
+        # An explicit session wins; an initial prompt starts a new one
+        stored_session_id = None
+        if not session_id and not is_initial_prompt:
+            stored_session_id = await self.get_session_id(project_path, model)
 
         cmd = [
             "cursor-agent",
@@ -245,11 +244,11 @@ class CursorAgentCLI(BaseCLI):
             "stream-json",  # Use stream-json format
         ]
 
-        # Add session resume if available (prefer stored session over parameter)
-        active_session_id = stored_session_id or session_id
+        # Add session resume if available
+        active_session_id = session_id or stored_session_id
         if active_session_id:
             cmd.extend(["--resume", active_session_id])
-            print(f"🔗 [Cursor] Resuming session: {active_session_id}")
+            ui.info(f"Resuming session: {active_session_id}", "Cursor")
 
         # Add API key if available
         if os.getenv("CURSOR_API_KEY"):
@@ -259,7 +258,7 @@ class CursorAgentCLI(BaseCLI):
         cli_model = self._get_cli_model_name(model) or os.getenv("CURSOR_MODEL")
         if cli_model:
             cmd.extend(["--model", cli_model])
-            print(f"🔧 [Cursor] Using model: {cli_model}")
+            ui.debug(f"Using model: {cli_model}", "Cursor")
 
         # Use the provided project path directly
         project_repo_path = project_path
@@ -272,6 +271,8 @@ class CursorAgentCLI(BaseCLI):
                 stderr=asyncio.subprocess.PIPE,
                 cwd=project_repo_path,
             )
+            track_process(process)
+            mark_phase("spawned")
 
             # Wrap stdout with LineBuffer for large NDJSON handling
             reader = LineBuffer(process.stdout)
@@ -330,16 +331,16 @@ class CursorAgentCLI(BaseCLI):
 
                     # Priority: Extract session ID from type: "result" event (most reliable)
                     if event_type == "result":
-                        print(f"🔍 [Cursor] Result event received: {event}")
+                        ui.debug("Result event received: %s", "Cursor", event)
 
                         # Extract session ID if not already found
                         if not cursor_session_id:
                             session_id_from_result = event.get("session_id")
                             if session_id_from_result:
                                 cursor_session_id = session_id_from_result
-                                await self.set_session_id(project_id, cursor_session_id)
-                                print(
-                                    f"💾 [Cursor] Session ID extracted from result event: {cursor_session_id}"
+                                await self.set_session_id(project_path, cursor_session_id, model)
+                                ui.debug(
+                                    f"Session ID extracted from result event: {cursor_session_id}", "Cursor"
                                 )
 
                         # Emit result message for MCP server
@@ -387,12 +388,12 @@ class CursorAgentCLI(BaseCLI):
 
                         if potential_session_id and potential_session_id != active_session_id:
                             cursor_session_id = potential_session_id
-                            await self.set_session_id(project_id, cursor_session_id)
-                            print(
-                                f"💾 [Cursor] Updated session ID for project {project_id}: {cursor_session_id}"
+                            await self.set_session_id(project_path, cursor_session_id, model)
+                            ui.debug(
+                                f"Updated session ID for project {project_path}: "
+                                f"{active_session_id} -> {cursor_session_id}",
+                                "Cursor",
                             )
-                            print(f"   Previous: {active_session_id}")
-                            print(f"   New: {cursor_session_id}")
 
                     # If we receive a non-assistant message, flush the buffer first
                     if event.get("type") != "assistant" and assistant_message_buffer:
@@ -426,20 +427,18 @@ class CursorAgentCLI(BaseCLI):
 
                     # ★ CRITICAL: Break after result event to end streaming
                     if result_received:
-                        print(
-                            f"🏁 [Cursor] Result event received, terminating stream early"
-                        )
+                        ui.debug("Result event received, terminating stream early", "Cursor")
                         try:
                             process.terminate()
-                            print(f"🔪 [Cursor] Process terminated")
+                            ui.debug("Process terminated", "Cursor")
                         except Exception as e:
-                            print(f"⚠️ [Cursor] Failed to terminate process: {e}")
+                            ui.warning(f"Failed to terminate process: {e}", "Cursor")
                         break
 
                 except json.JSONDecodeError as e:
                     # Handle malformed JSON
-                    print(f"⚠️ [Cursor] JSON decode error: {e}")
-                    print(f"⚠️ [Cursor] Raw line: {line_str}")
+                    ui.warning(f"JSON decode error: {e}", "Cursor")
+                    ui.debug("Raw line: %s", "Cursor", line_str)
 
                     # Still yield as raw output
                     message = Message(
@@ -476,10 +475,12 @@ class CursorAgentCLI(BaseCLI):
 
         except asyncio.CancelledError:
             # Handle cancellation gracefully
-            print(f"🔄 [Cursor] Operation cancelled, cleaning up process")
+            ui.info("Operation cancelled, cleaning up process", "Cursor")
             raise
         except Exception as e:
-            print(f"❌ [Cursor] Error during execution: {e}")
+            ui.error(f"Error during execution: {e}", "Cursor")
+            if stored_session_id:
+                await self.clear_session_id(project_path, model)
             raise
         except FileNotFoundError:
             error_msg = (
@@ -520,17 +521,6 @@ class CursorAgentCLI(BaseCLI):
                 stderr_task_var = locals().get('stderr_task')
                 await self._cleanup_cursor_process(process, stderr_task_var)
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
-        """Get stored session ID for project"""
-        return self._session_store.get(project_id)
-
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
-        """Store session ID for project in memory"""
-        self._session_store[project_id] = session_id
-        print(
-            f"💾 [Cursor] Session ID stored for project {project_id}: {session_id}"
-        )
-
     async def _drain_stderr(self, stderr) -> None:
         """Background task to drain stderr to prevent blocking."""
         if not stderr:
@@ -545,7 +535,7 @@ class CursorAgentCLI(BaseCLI):
                 # Optionally log stderr for debugging
                 line_str = line.decode().strip()
                 if line_str:
-                    print(f"🔍 [Cursor] stderr: {line_str}")
+                    ui.debug("stderr: %s", "Cursor", line_str)
         except asyncio.CancelledError:
             pass
         except Exception:
@@ -564,19 +554,19 @@ class CursorAgentCLI(BaseCLI):
 
             # Gracefully terminate process
             if process and process.returncode is None:
-                print(f"🔄 [Cursor] Terminating process gracefully")
+                ui.debug("Terminating process gracefully", "Cursor")
                 process.terminate()
                 try:
                     # Wait up to 5 seconds for graceful termination
                     await asyncio.wait_for(process.wait(), timeout=5.0)
-                    print(f"🔪 [Cursor] Process terminated gracefully")
+                    ui.debug("Process terminated gracefully", "Cursor")
                 except asyncio.TimeoutError:
-                    print(f"⚠️ [Cursor] Process didn't terminate gracefully, killing")
+                    ui.warning("Process didn't terminate gracefully, killing", "Cursor")
                     process.kill()
                     await process.wait()
-                    print(f"🔪 [Cursor] Process killed")
+                    ui.debug("Process killed", "Cursor")
         except Exception as e:
-            print(f"⚠️ [Cursor] Error during cleanup: {e}")
+            ui.warning(f"Error during cleanup: {e}", "Cursor")
 
 
 __all__ = ["CursorAgentCLI"]
@@ -17,7 +17,7 @@ from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optiona
 from claudable_helper.core.terminal_ui import ui
 from claudable_helper.models.messages import Message
 
-from ..base import BaseCLI, CLIType, adapter_session
+from ..base import BaseCLI, CLIType, adapter_session, mark_phase
 from .qwen_cli import _ACPClient, _mime_for  # Reuse minimal ACP client
 
 
@@ -136,13 +136,13 @@ class GeminiCLI(BaseCLI):
         model: Optional[str] = None,
         is_initial_prompt: bool = False,
     ) -> AsyncGenerator[Message, None]:
-        ui.debug(f"execute_with_streaming called with per_call_mode: {self._per_call_mode}", "Gemini")
+        ui.debug("execute_with_streaming called with per_call_mode: %s", "Gemini", self._per_call_mode)
         # Get client (per-call or per-loop)
         if self._per_call_mode:
             ui.debug("entering per-call mode path", "Gemini")
             # Per-call mode: use context manager for lifecycle
             client = await self._ensure_client()
-            ui.debug(f"got client: {client}", "Gemini")
+            ui.debug("got client: %s", "Gemini", client)
             async with adapter_session(client) as session_client:
                 ui.debug("inside adapter_session context", "Gemini")
                 await session_client.request(
@@ -160,7 +160,7 @@ class GeminiCLI(BaseCLI):
                     session_client, instruction, project_path, session_id,
                     log_callback, images, model, is_initial_prompt
                 ):
-                    ui.debug(f"yielding message from execute_with_streaming: {msg.role} - {msg.message_type}", "Gemini")
+                    ui.debug("yielding message from execute_with_streaming: %s - %s", "Gemini", msg.role, msg.message_type)
                     yield msg
                 ui.debug("_execute_streaming_impl completed", "Gemini")
         else:
@@ -197,8 +197,8 @@ class GeminiCLI(BaseCLI):
         # Use the provided project path directly
         project_repo_path = project_path
 
-        # Project ID - simplified path handling
-        project_id = os.path.basename(project_path)
+        # Sessions are keyed by the full path so same-named repos don't collide
+        project_id = os.path.abspath(project_path)
 
         # Ensure session
         # In per-call mode, do NOT reuse cached session IDs from previous processes
@@ -208,7 +208,7 @@ class GeminiCLI(BaseCLI):
             stored_session_id = None
         else:
             stored_session_id = await self.get_session_id(project_id)
-        ui.debug(f"[{turn_id}] resolved project_id={project_id}", "Gemini")
+        ui.debug("[%s] resolved project_id=%s", "Gemini", turn_id, project_id)
         if not stored_session_id:
             # Try creating a session to reuse cached OAuth credentials if present
             try:
@@ -255,33 +255,31 @@ class GeminiCLI(BaseCLI):
 
         def _on_update(params: Dict[str, Any]) -> None:
             try:
-                ui.debug(f"[{turn_id}] _on_update called with params keys: {list(params.keys()) if params else 'None'}", "Gemini")
+                ui.debug("[%s] _on_update called with params keys: %s", "Gemini", turn_id, list(params.keys()) if params else None)
                 if params.get("sessionId") != stored_session_id:
-                    ui.debug(f"[{turn_id}] sessionId mismatch: got {params.get('sessionId')}, expected {stored_session_id}", "Gemini")
+                    ui.debug("[%s] sessionId mismatch: got %s, expected %s", "Gemini", turn_id, params.get("sessionId"), stored_session_id)
                     return
                 update = params.get("update") or {}
-                try:
-                    kind = update.get("sessionUpdate") or update.get("type")
-                    snippet = ""
-                    if isinstance(update.get("text"), str):
-                        snippet = update.get("text")[:80]
-                    elif isinstance((update.get("content") or {}).get("text"), str):
-                        snippet = (update.get("content") or {}).get("text")[:80]
-                    ui.debug(
-                        f"[{turn_id}] notif session/update kind={kind} snippet={snippet!r}",
-                        "Gemini",
-                    )
-                except Exception as e:
-                    ui.debug(f"[{turn_id}] exception in update logging: {e}", "Gemini")
-                ui.debug(f"[{turn_id}] putting update in queue: {update}", "Gemini")
+                if ui.debug_enabled:
+                    try:
+                        kind = update.get("sessionUpdate") or update.get("type")
+                        snippet = ""
+                        if isinstance(update.get("text"), str):
+                            snippet = update.get("text")[:80]
+                        elif isinstance((update.get("content") or {}).get("text"), str):
+                            snippet = (update.get("content") or {}).get("text")[:80]
+                        ui.debug("[%s] notif session/update kind=%s snippet=%r", "Gemini", turn_id, kind, snippet)
+                    except Exception as e:
+                        ui.debug("[%s] exception in update logging: %s", "Gemini", turn_id, e)
+                ui.debug("[%s] putting update in queue: %s", "Gemini", turn_id, update)
                 q.put_nowait(update)
-                ui.debug(f"[{turn_id}] update queued successfully, queue size now: {q.qsize()}", "Gemini")
+                ui.debug("[%s] update queued successfully, queue size now: %s", "Gemini", turn_id, q.qsize())
             except Exception as e:
                 ui.error(f"[{turn_id}] exception in _on_update: {e}", "Gemini")
 
-        ui.debug(f"[{turn_id}] registering notification handler for session/update", "Gemini")
+        ui.debug("[%s] registering notification handler for session/update", "Gemini", turn_id)
         client.on_notification("session/update", _on_update)
-        ui.debug(f"[{turn_id}] notification handler registered", "Gemini")
+        ui.debug("[%s] notification handler registered", "Gemini", turn_id)
         try:
             # Main streaming logic
             async for msg in self._stream_prompt_response(
@@ -291,9 +289,9 @@ class GeminiCLI(BaseCLI):
                 yield msg
         finally:
             # Always unregister handler to prevent leaks
-            ui.debug(f"[{turn_id}] unregistering notification handler", "Gemini")
+            ui.debug("[%s] unregistering notification handler", "Gemini", turn_id)
             client.off_notification("session/update", _on_update)
-            ui.debug(f"[{turn_id}] notification handler unregistered", "Gemini")
+            ui.debug("[%s] notification handler unregistered", "Gemini", turn_id)
 
     async def _stream_prompt_response(
         self,
@@ -347,58 +345,59 @@ class GeminiCLI(BaseCLI):
 
         # Send prompt
         def _make_prompt_task() -> asyncio.Task:
-            ui.debug(f"[{turn_id}] sending session/prompt (parts={len(parts)})", "Gemini")
+            ui.debug("[%s] sending session/prompt (parts=%s)", "Gemini", turn_id, len(parts))
             return asyncio.create_task(
                 client.request(
                     "session/prompt", {"sessionId": stored_session_id, "prompt": parts}
                 )
             )
+        mark_phase("session_ready")
         prompt_task = _make_prompt_task()
         q_task = asyncio.create_task(q.get())  # Create once, reuse
 
         try:
-            ui.debug(f"[{turn_id}] entering main streaming loop", "Gemini")
+            ui.debug("[%s] entering main streaming loop", "Gemini", turn_id)
             loop_count = 0
             while True:
                 loop_count += 1
-                ui.debug(f"[{turn_id}] loop iteration #{loop_count}, queue size: {q.qsize()}", "Gemini")
+                ui.debug("[%s] loop iteration #%s, queue size: %s", "Gemini", turn_id, loop_count, q.qsize())
                 done, _ = await asyncio.wait(
                     {prompt_task, q_task},
                     return_when=asyncio.FIRST_COMPLETED,
                 )
-                ui.debug(f"[{turn_id}] wait completed, done tasks: {len(done)}", "Gemini")
+                ui.debug("[%s] wait completed, done tasks: %s", "Gemini", turn_id, len(done))
 
                 if q_task in done:
-                    ui.debug(f"[{turn_id}] q_task completed", "Gemini")
+                    ui.debug("[%s] q_task completed", "Gemini", turn_id)
                     # Process the update and create a new q_task
                     update = await q_task
-                    ui.debug(f"[{turn_id}] got update from queue: {update}", "Gemini")
+                    ui.debug("[%s] got update from queue: %s", "Gemini", turn_id, update)
                     message_count = 0
                     async for m in self._update_to_messages(update, project_path, session_id, thought_buffer, text_buffer):
                         if m:
                             message_count += 1
-                            ui.debug(f"[{turn_id}] yielding message #{message_count}: {m.role} - {m.message_type}", "Gemini")
+                            ui.debug("[%s] yielding message #%s: %s - %s", "Gemini", turn_id, message_count, m.role, m.message_type)
                             yield m
-                    ui.debug(f"[{turn_id}] _update_to_messages yielded {message_count} messages", "Gemini")
+                    ui.debug("[%s] _update_to_messages yielded %s messages", "Gemini", turn_id, message_count)
                     q_task = asyncio.create_task(q.get())  # Create new task for next get
-                    ui.debug(f"[{turn_id}] created new q_task", "Gemini")
+                    ui.debug("[%s] created new q_task", "Gemini", turn_id)
 
                 if prompt_task in done:
-                    ui.debug(f"[{turn_id}] prompt_task completed; draining updates", "Gemini")
+                    ui.debug("[%s] prompt_task completed; draining updates", "Gemini", turn_id)
                     # Drain remaining
                     drain_count = 0
                     while not q.empty():
                         drain_count += 1
                         update = q.get_nowait()
-                        ui.debug(f"[{turn_id}] draining update #{drain_count}: {update}", "Gemini")
+                        ui.debug("[%s] draining update #%s: %s", "Gemini", turn_id, drain_count, update)
                         message_count = 0
                         async for m in self._update_to_messages(update, project_path, session_id, thought_buffer, text_buffer):
                             if m:
                                 message_count += 1
-                                ui.debug(f"[{turn_id}] yielding drained message #{message_count}: {m.role} - {m.message_type}", "Gemini")
+                                ui.debug("[%s] yielding drained message #%s: %s - %s", "Gemini", turn_id, message_count, m.role, m.message_type)
                                 yield m
-                        ui.debug(f"[{turn_id}] drained update yielded {message_count} messages", "Gemini")
-                    ui.debug(f"[{turn_id}] drained {drain_count} updates", "Gemini")
+                        ui.debug("[%s] drained update yielded %s messages", "Gemini", turn_id, message_count)
+                    ui.debug("[%s] drained %s updates", "Gemini", turn_id, drain_count)
                     exc = prompt_task.exception()
                     if exc:
                         msg = str(exc)
@@ -477,31 +476,25 @@ class GeminiCLI(BaseCLI):
         thought_buffer: List[str],
         text_buffer: List[str],
     ) -> AsyncGenerator[Optional[Message], None]:
-        ui.debug(f"_update_to_messages called with update: {update}", "Gemini")
+        ui.debug("_update_to_messages called with update: %s", "Gemini", update)
         kind = update.get("sessionUpdate") or update.get("type")
-        ui.debug(f"_update_to_messages processing kind: {kind}", "Gemini")
+        ui.debug("_update_to_messages processing kind: %s", "Gemini", kind)
         now = datetime.utcnow()
         if kind in ("agent_message_chunk", "agent_thought_chunk"):
             text = ((update.get("content") or {}).get("text")) or update.get("text") or ""
-            try:
-                ui.debug(
-                    f"update chunk kind={kind} len={len(text or '')}",
-                    "Gemini",
-                )
-            except Exception:
-                pass
             if not isinstance(text, str):
                 text = str(text)
+            ui.debug("update chunk kind=%s len=%s", "Gemini", kind, len(text))
             if kind == "agent_thought_chunk":
-                ui.debug(f"adding thought chunk: {text[:50]}...", "Gemini")
+                ui.debug("adding thought chunk: %s...", "Gemini", text[:50])
                 thought_buffer.append(text)
                 # Do not yield thought-only messages to avoid duplicates; we'll
                 # render thinking alongside the first assistant text chunk.
             else:
-                ui.debug(f"adding text chunk: {text[:50]}...", "Gemini")
+                ui.debug("adding text chunk: %s...", "Gemini", text[:50])
                 # First assistant message chunk after thinking: render thinking immediately
                 if thought_buffer and not text_buffer:
-                    ui.debug(f"yielding thinking message, thought_buffer len: {len(thought_buffer)}", "Gemini")
+                    ui.debug("yielding thinking message, thought_buffer len: %s", "Gemini", len(thought_buffer))
                     yield Message(
                         id=str(uuid.uuid4()),
                         project_id=project_path,
@@ -514,7 +507,7 @@ class GeminiCLI(BaseCLI):
                     )
                     thought_buffer.clear()
                 text_buffer.append(text)
-            ui.debug(f"_update_to_messages returning after processing {kind}", "Gemini")
+            ui.debug("_update_to_messages returning after processing %s", "Gemini", kind)
             return
         elif kind in ("tool_call", "tool_call_update"):
             tool_name = self._parse_tool_name(update)
@@ -531,9 +524,9 @@ class GeminiCLI(BaseCLI):
                         if isinstance(content, dict) and content.get("type") == "text":
                             tool_result = content.get("text", "")
                             break
-                ui.debug(f"Tool update {tool_name}: has_result={bool(tool_result)}", "Gemini")
+                ui.debug("Tool update %s: has_result=%s", "Gemini", tool_name, bool(tool_result))
             else:
-                ui.debug(f"New tool call: {tool_name}", "Gemini")
+                ui.debug("New tool call: %s", "Gemini", tool_name)
 
             # Create concise summary for tool use; emit detailed results as chat below
             if tool_result:
@@ -668,14 +661,18 @@ class GeminiCLI(BaseCLI):
             tool_input["path"] = str(path)
         return tool_input
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
-        """Get stored session ID for project"""
+    async def get_session_id(self, project_id: str, model: Optional[str] = None) -> Optional[str]:
+        """Get stored session ID for project.
+
+        ACP session IDs only live as long as the gemini process, so they are
+        kept in memory instead of the durable session store.
+        """
         return self._session_store.get(project_id)
 
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
+    async def set_session_id(self, project_id: str, session_id: str, model: Optional[str] = None) -> None:
         """Store session ID for project in memory"""
         self._session_store[project_id] = session_id
-        ui.debug(f"Gemini session stored for project {project_id}: {session_id}", "Gemini")
+        ui.debug("Gemini session stored for project %s: %s", "Gemini", project_id, session_id)
 
 
 __all__ = ["GeminiCLI"]
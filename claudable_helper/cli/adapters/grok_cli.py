@@ -5,7 +5,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from claudable_helper.cli.base import BaseCLI
+from claudable_helper.cli.base import BaseCLI, mark_phase, track_process
 from claudable_helper.core.terminal_ui import ui
 from claudable_helper.models.messages import Message, MessageType
 
@@ -15,7 +15,6 @@ class GrokCLI(BaseCLI):
 
     def __init__(self):
         super().__init__(cli_type="grok")
-        self.session_mapping: Dict[str, str] = {}
 
     async def check_availability(self) -> Dict[str, Any]:
         """Check if Grok CLI is available."""
@@ -54,6 +53,8 @@ class GrokCLI(BaseCLI):
                 stderr=asyncio.subprocess.PIPE,
                 cwd=project_path,
             )
+            track_process(proc)
+            mark_phase("spawned")
 
             if proc.stdout:
                 async for line in proc.stdout:
@@ -91,10 +92,3 @@ class GrokCLI(BaseCLI):
                 created_at=datetime.utcnow(),
             )
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
-        """Get current session ID for project"""
-        return self.session_mapping.get(project_id)
-
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
-        """Set session ID for project in memory"""
-        self.session_mapping[project_id] = session_id
@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from claudable_helper.cli.base import BaseCLI
+from claudable_helper.cli.base import BaseCLI, mark_phase, track_process
 from claudable_helper.core.terminal_ui import ui
 from claudable_helper.models.messages import Message, MessageType
 
@@ -94,6 +94,8 @@ class KiroCLI(BaseCLI):
                 stderr=asyncio.subprocess.PIPE,
                 cwd=project_path,  # Set working directory here
             )
+            track_process(proc)
+            mark_phase("spawned")
 
             # Stream stdout
             if proc.stdout:
@@ -134,10 +136,10 @@ class KiroCLI(BaseCLI):
                 created_at=datetime.utcnow(),
             )
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
+    async def get_session_id(self, project_id: str, model: Optional[str] = None) -> Optional[str]:
         """Get session ID for project (Kiro doesn't use sessions)."""
         return None
 
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
+    async def set_session_id(self, project_id: str, session_id: str, model: Optional[str] = None) -> None:
         """Set session ID for project (Kiro doesn't use sessions)."""
         pass
@@ -16,10 +16,11 @@ import shutil
 from datetime import datetime
 from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
 
+from claudable_helper.core import tracing
 from claudable_helper.core.terminal_ui import ui
 from claudable_helper.models.messages import Message
 
-from ..base import BaseCLI, CLIType, LineBuffer
+from ..base import BaseCLI, CLIType, LineBuffer, mark_phase
 
 
 @dataclass
@@ -45,9 +46,7 @@ class _ACPClient:
     async def start(self) -> None:
         if self._proc is not None:
             return
-        print(f"🔧 [Qwen] Starting ACP client with command: {self._cmd}")
-
-        print(f"🔧 [Qwen] Current working directory: {self._cwd}")
+        ui.debug("Starting ACP client with command: %s (cwd: %s)", "Qwen", self._cmd, self._cwd)
         self._proc = await asyncio.create_subprocess_exec(
             *self._cmd,
             stdin=asyncio.subprocess.PIPE,
@@ -56,6 +55,7 @@ class _ACPClient:
             env=self._env,
             cwd=self._cwd,
         )
+        mark_phase("spawned")
 
         # Start reader tasks
         self._reader_task = asyncio.create_task(self._reader_loop())
@@ -126,9 +126,10 @@ class _ACPClient:
         self._pending[msg_id] = _Pending(fut=fut)
         obj = {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params or {}}
         data = (json.dumps(obj) + "\n").encode("utf-8")
-        self._proc.stdin.write(data)
-        await self._proc.stdin.drain()
-        return await fut
+        with tracing.span(f"acp:{method}", request_bytes=len(data)):
+            self._proc.stdin.write(data)
+            await self._proc.stdin.drain()
+            return await fut
 
     async def _reader_loop(self) -> None:
         assert self._proc and self._proc.stdout
@@ -538,6 +539,7 @@ class QwenCLI(BaseCLI):
                 )
             )
 
+        mark_phase("session_ready")
         prompt_task = _make_prompt_task()
 
         # Stream notifications until prompt completes
@@ -815,7 +817,9 @@ class QwenCLI(BaseCLI):
             tool_input["path"] = str(path)
         return tool_input
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
+    async def get_session_id(self, project_id: str, model: Optional[str] = None) -> Optional[str]:
+        # ACP session IDs only live as long as the shared qwen process, so they
+        # stay in the project DB / memory instead of the durable session store
         if self.db_session:
             try:
                 from claudable_helper.models.projects import Project
@@ -836,7 +840,7 @@ class QwenCLI(BaseCLI):
                 ui.warning(f"Qwen get_session_id DB error: {e}", "Qwen")
         return self._session_store.get(project_id)
 
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
+    async def set_session_id(self, project_id: str, session_id: str, model: Optional[str] = None) -> None:
         if self.db_session:
             try:
                 from claudable_helper.models.projects import Project
@@ -5,14 +5,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from claudable_helper.cli.base import BaseCLI
+from claudable_helper.cli.base import BaseCLI, mark_phase, track_process
 from claudable_helper.models.messages import Message, MessageType
 
 
 class RovoCLI(BaseCLI):
     def __init__(self):
         super().__init__(cli_type="rovo")
-        self.session_mapping: Dict[str, str] = {}
 
     async def check_availability(self) -> Dict[str, Any]:
         try:
@@ -27,6 +26,8 @@ class RovoCLI(BaseCLI):
         cmd = ["acli", "rovodev", "run", instruction]
         try:
             proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=project_path)
+            track_process(proc)
+            mark_phase("spawned")
             if proc.stdout:
                 async for line in proc.stdout:
                     line_text = line.decode().strip()
@@ -36,10 +37,3 @@ class RovoCLI(BaseCLI):
         except Exception as e:
             yield Message(project_id=project_path, role="assistant", message_type=MessageType.ERROR, content=f"Error: {str(e)}", session_id=session_id or "default", created_at=datetime.utcnow())
 
-    async def get_session_id(self, project_id: str) -> Optional[str]:
-        """Get current session ID for project"""
-        return self.session_mapping.get(project_id)
-
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
-        """Set session ID for project in memory"""
-        self.session_mapping[project_id] = session_id
@@ -9,7 +9,8 @@ from __future__ import annotations
 import os
 import uuid
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
@@ -73,6 +74,69 @@ def get_display_path(file_path: str) -> str:
     return file_path
 
 
+# Callback receiving adapter lifecycle phases ("spawned", "session_ready", ...)
+# for the execution running in the current context. Set by callers that want
+# per-phase timings; adapters only ever call mark_phase().
+_phase_listener: ContextVar[Optional[Callable[[str], None]]] = ContextVar(
+    "cli_phase_listener", default=None
+)
+
+
+def mark_phase(phase: str) -> None:
+    """Report that the current execution reached ``phase``."""
+    listener = _phase_listener.get()
+    if listener is not None:
+        listener(phase)
+
+
+@contextmanager
+def phase_listener(callback: Callable[[str], None]):
+    """Route mark_phase() calls made in this context to ``callback``."""
+    token = _phase_listener.set(callback)
+    try:
+        yield
+    finally:
+        _phase_listener.reset(token)
+
+
+# Subprocesses spawned for the execution running in the current context.
+# Adapters that start a process per call register it with track_process().
+_owned_processes: ContextVar[Optional[List[Any]]] = ContextVar(
+    "cli_owned_processes", default=None
+)
+
+
+def track_process(process: Any) -> None:
+    """Register a subprocess owned by the current execution."""
+    owned = _owned_processes.get()
+    if owned is not None:
+        owned.append(process)
+
+
+@contextmanager
+def owned_processes():
+    """Collect processes registered in this context and kill them on failure.
+
+    If the block exits with an exception (including cancellation, e.g. the
+    losing side of a hedged call), processes that are still running are
+    killed instead of being left to finish on their own.
+    """
+    processes: List[Any] = []
+    token = _owned_processes.set(processes)
+    try:
+        yield processes
+    except BaseException:
+        for process in processes:
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+        raise
+    finally:
+        _owned_processes.reset(token)
+
+
 # Model mapping from unified names to CLI-specific names
 MODEL_MAPPING: Dict[str, Dict[str, str]] = {
     "claude": {
@@ -197,9 +261,10 @@ async def adapter_session(client, start_method=None, stop_method=None):
 class BaseCLI(ABC):
     """Abstract adapter contract for CLI providers.
 
-    Subclasses must implement availability checks, streaming execution, and
-    session persistence. Common utilities (model mapping, content parsing,
-    tool summaries) are provided here for reuse.
+    Subclasses must implement availability checks and streaming execution;
+    session persistence defaults to the shared durable session store. Common
+    utilities (model mapping, content parsing, tool summaries) are provided
+    here for reuse.
     """
 
     def __init__(self, cli_type: CLIType):
@@ -230,13 +295,31 @@ class BaseCLI(ABC):
     ) -> AsyncGenerator[Message, None]:
         """Execute an instruction and yield `Message` objects in real time."""
 
-    @abstractmethod
-    async def get_session_id(self, project_id: str) -> Optional[str]:
-        """Return the active session ID for a project, if any."""
+    async def get_session_id(self, project_id: str, model: Optional[str] = None) -> Optional[str]:
+        """Return the stored session ID for a project, if any.
 
-    @abstractmethod
-    async def set_session_id(self, project_id: str, session_id: str) -> None:
-        """Persist the active session ID for a project."""
+        ``project_id`` is the project path; sessions are kept per agent,
+        absolute path and model in the shared durable session store.
+        """
+        from .session_store import get_session_store
+
+        return await get_session_store().get(self._agent_name(), project_id, model)
+
+    async def set_session_id(self, project_id: str, session_id: str, model: Optional[str] = None) -> None:
+        """Persist the active session ID for a project path and model."""
+        from .session_store import get_session_store
+
+        await get_session_store().set(self._agent_name(), project_id, session_id, model)
+
+    async def clear_session_id(self, project_id: str, model: Optional[str] = None) -> None:
+        """Forget the stored session, e.g. after resuming it failed."""
+        from .session_store import get_session_store
+
+        await get_session_store().delete(self._agent_name(), project_id, model)
+
+    def _agent_name(self) -> str:
+        # Newer adapters pass a plain string instead of a CLIType member
+        return getattr(self.cli_type, "value", self.cli_type)
 
     # ---- Common helpers (available to adapters) --------------------------
     def _get_cli_model_name(self, model: Optional[str]) -> Optional[str]:
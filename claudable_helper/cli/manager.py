@@ -12,6 +12,7 @@ from ..core.websocket.manager import manager as ws_manager
 from ..models.messages import Message
 
 from .base import CLIType
+from .persister import MessagePersister
 from .adapters import ClaudeCodeCLI, CursorAgentCLI, CodexCLI, QwenCLI, GeminiCLI
 
 
@@ -107,102 +108,104 @@ class UnifiedCLIManager:
             # CLI output logs are now only printed to console, not sent to UI
             pass
 
-        async for message in cli.execute_with_streaming(
-            instruction=instruction,
-            project_path=self.project_path,
-            session_id=self.session_id,
-            log_callback=log_callback,
-            images=images,
-            model=model,
-            is_initial_prompt=is_initial_prompt,
-        ):
-            # Check for error messages or result status
-            if message.message_type == "error":
-                has_error = True
-                ui.error(f"CLI error detected: {message.content[:100]}", "CLI")
-
-            # Check for Cursor result event (stored in metadata)
-            if message.metadata_json:
-                event_type = message.metadata_json.get("event_type")
-                original_event = message.metadata_json.get("original_event", {})
-
-                if event_type == "result" or original_event.get("type") == "result":
-                    # Cursor sends result event with success/error status
-                    is_error = original_event.get("is_error", False)
-                    subtype = original_event.get("subtype", "")
-
-                    # DEBUG: Log the complete result event structure
-                    ui.info(f"🔍 [Cursor] Result event received:", "DEBUG")
-                    ui.info(f"   Full event: {original_event}", "DEBUG")
-                    ui.info(f"   is_error: {is_error}", "DEBUG")
-                    ui.info(f"   subtype: '{subtype}'", "DEBUG")
-                    ui.info(f"   has event.result: {'result' in original_event}", "DEBUG")
-                    ui.info(f"   has event.status: {'status' in original_event}", "DEBUG")
-                    ui.info(f"   has event.success: {'success' in original_event}", "DEBUG")
-
-                    if is_error or subtype == "error":
-                        has_error = True
-                        result_success = False
-                        ui.error(
-                            f"Cursor result: error (is_error={is_error}, subtype='{subtype}')",
-                            "CLI",
-                        )
-                    elif subtype == "success":
-                        result_success = True
-                        ui.success(
-                            f"Cursor result: success (subtype='{subtype}')", "CLI"
-                        )
-                    else:
-                        # Handle case where subtype is not "success" but execution was successful
-                        ui.warning(
-                            f"Cursor result: no explicit success subtype (subtype='{subtype}', is_error={is_error})",
-                            "CLI",
-                        )
-                        # If there's no error indication, assume success
-                        if not is_error:
+        # Messages are committed in batches on a worker thread and flushed
+        # at the end of the run, also when streaming fails
+        async with MessagePersister(self.db) as persister:
+            async for message in cli.execute_with_streaming(
+                instruction=instruction,
+                project_path=self.project_path,
+                session_id=self.session_id,
+                log_callback=log_callback,
+                images=images,
+                model=model,
+                is_initial_prompt=is_initial_prompt,
+            ):
+                # Check for error messages or result status
+                if message.message_type == "error":
+                    has_error = True
+                    ui.error(f"CLI error detected: {message.content[:100]}", "CLI")
+
+                # Check for Cursor result event (stored in metadata)
+                if message.metadata_json:
+                    event_type = message.metadata_json.get("event_type")
+                    original_event = message.metadata_json.get("original_event", {})
+
+                    if event_type == "result" or original_event.get("type") == "result":
+                        # Cursor sends result event with success/error status
+                        is_error = original_event.get("is_error", False)
+                        subtype = original_event.get("subtype", "")
+
+                        # DEBUG: Log the complete result event structure
+                        ui.info(f"🔍 [Cursor] Result event received:", "DEBUG")
+                        ui.info(f"   Full event: {original_event}", "DEBUG")
+                        ui.info(f"   is_error: {is_error}", "DEBUG")
+                        ui.info(f"   subtype: '{subtype}'", "DEBUG")
+                        ui.info(f"   has event.result: {'result' in original_event}", "DEBUG")
+                        ui.info(f"   has event.status: {'status' in original_event}", "DEBUG")
+                        ui.info(f"   has event.success: {'success' in original_event}", "DEBUG")
+
+                        if is_error or subtype == "error":
+                            has_error = True
+                            result_success = False
+                            ui.error(
+                                f"Cursor result: error (is_error={is_error}, subtype='{subtype}')",
+                                "CLI",
+                            )
+                        elif subtype == "success":
                             result_success = True
                             ui.success(
-                                f"Cursor result: assuming success (no error detected)", "CLI"
+                                f"Cursor result: success (subtype='{subtype}')", "CLI"
                             )
-
-            # Save message to database
-            message.project_id = self.project_id
-            message.conversation_id = self.conversation_id
-            self.db.add(message)
-            self.db.commit()
-
-            messages_collected.append(message)
-
-            # Check if message should be hidden from UI
-            should_hide = (
-                message.metadata_json and message.metadata_json.get("hidden_from_ui", False)
-            )
-
-            # Send message via WebSocket only if not hidden
-            if not should_hide:
-                ws_message = {
-                    "type": "message",
-                    "data": {
-                        "id": message.id,
-                        "role": message.role,
-                        "message_type": message.message_type,
-                        "content": message.content,
-                        "metadata": message.metadata_json,
-                        "parent_message_id": getattr(message, "parent_message_id", None),
-                        "session_id": message.session_id,
-                        "conversation_id": self.conversation_id,
-                        "created_at": message.created_at.isoformat(),
-                    },
-                    "timestamp": message.created_at.isoformat(),
-                }
-                try:
-                    await ws_manager.send_message(self.project_id, ws_message)
-                except Exception as e:
-                    ui.error(f"WebSocket send failed: {e}", "Message")
-
-            # Check if changes were made
-            if message.metadata_json and "changes_made" in message.metadata_json:
-                has_changes = True
+                        else:
+                            # Handle case where subtype is not "success" but execution was successful
+                            ui.warning(
+                                f"Cursor result: no explicit success subtype (subtype='{subtype}', is_error={is_error})",
+                                "CLI",
+                            )
+                            # If there's no error indication, assume success
+                            if not is_error:
+                                result_success = True
+                                ui.success(
+                                    f"Cursor result: assuming success (no error detected)", "CLI"
+                                )
+
+                # Queue message for the next batched commit (flushed off-loop)
+                message.project_id = self.project_id
+                message.conversation_id = self.conversation_id
+                await persister.add(message)
+
+                messages_collected.append(message)
+
+                # Check if message should be hidden from UI
+                should_hide = (
+                    message.metadata_json and message.metadata_json.get("hidden_from_ui", False)
+                )
+
+                # Send message via WebSocket only if not hidden
+                if not should_hide:
+                    ws_message = {
+                        "type": "message",
+                        "data": {
+                            "id": message.id,
+                            "role": message.role,
+                            "message_type": message.message_type,
+                            "content": message.content,
+                            "metadata": message.metadata_json,
+                            "parent_message_id": getattr(message, "parent_message_id", None),
+                            "session_id": message.session_id,
+                            "conversation_id": self.conversation_id,
+                            "created_at": message.created_at.isoformat(),
+                        },
+                        "timestamp": message.created_at.isoformat(),
+                    }
+                    try:
+                        await ws_manager.send_message(self.project_id, ws_message)
+                    except Exception as e:
+                        ui.error(f"WebSocket send failed: {e}", "Message")
+
+                # Check if changes were made
+                if message.metadata_json and "changes_made" in message.metadata_json:
+                    has_changes = True
 
         # Determine final success status
         # For Cursor: check result_success if available, otherwise check has_error
@@ -0,0 +1,128 @@
+"""
+Write-behind persistence for streamed CLI messages.
+
+Committing every streamed message runs a synchronous SQLAlchemy commit (an
+fsync on SQLite) on the event-loop thread per delta. MessagePersister
+buffers messages instead and commits them in one transaction when the batch
+is full or ``flush_interval`` after the first buffered message, whichever
+comes first, so readers see a message at most ``flush_interval`` late.
+Commits run on a dedicated worker thread.
+
+When the given session exposes ``get_bind()`` (a SQLAlchemy Session),
+batches are committed through a separate session on the same engine, so
+the worker thread never shares a Session with code on the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from ..core.terminal_ui import ui
+
+
+class MessagePersister:
+    """Buffers messages and commits them in batches off the event loop."""
+
+    def __init__(self, db: Any, batch_size: int = 20, flush_interval: float = 0.5):
+        """Initialize the persister.
+
+        Args:
+            db: SQLAlchemy Session (or any object with add_all/commit/rollback)
+            batch_size: Buffered messages that trigger an immediate commit
+            flush_interval: Longest time in seconds a message stays buffered
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.committed = 0
+        self._db = db
+        self._bind = self._engine_of(db)
+        self._buffer: List[Any] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="message-persister")
+
+    @staticmethod
+    def _engine_of(db: Any) -> Optional[Any]:
+        get_bind = getattr(db, "get_bind", None)
+        if not callable(get_bind):
+            return None
+        try:
+            return get_bind()
+        except Exception:
+            return None
+
+    async def add(self, message: Any) -> None:
+        """Buffer a message, committing now if the batch is full."""
+        self._buffer.append(message)
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.flush_interval, self._flush_on_timer)
+
+    async def flush(self) -> None:
+        """Commit everything buffered so far.
+
+        Raises:
+            Exception: Whatever the commit raised; the batch is rolled back and dropped
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._commit, batch)
+            self.committed += len(batch)
+
+    async def close(self) -> None:
+        """Flush the remaining messages and stop the worker thread."""
+        try:
+            await self.flush()
+            if self._timer_task is not None:
+                await asyncio.gather(self._timer_task, return_exceptions=True)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "MessagePersister":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if exc_type is None:
+            await self.close()
+            return False
+        # Keep what was streamed before the error, but don't mask the error
+        try:
+            await self.close()
+        except Exception as e:
+            ui.error(f"Failed to persist messages after error: {e}", "Message")
+        return False
+
+    def _flush_on_timer(self) -> None:
+        self._timer = None
+        self._timer_task = asyncio.get_running_loop().create_task(self._flush_logged())
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            ui.error(f"Failed to persist messages: {e}", "Message")
+
+    def _commit(self, batch: List[Any]) -> None:
+        if self._bind is None:
+            session = self._db
+        else:
+            session = type(self._db)(bind=self._bind, expire_on_commit=False)
+        try:
+            session.add_all(batch)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if session is not self._db:
+                session.close()
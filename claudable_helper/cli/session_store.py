@@ -0,0 +1,190 @@
+"""
+Durable session store shared by all CLI adapters.
+
+Maps (agent, absolute project path, model) to the provider's session ID so a
+later call, from a fresh adapter instance or after a server restart, can
+resume the conversation instead of rebuilding the project context from
+scratch. Entries expire after a TTL without use and the least recently used
+ones are evicted beyond a size limit.
+
+The store is a SQLite database in WAL mode, so several server processes can
+share it. All queries run on one dedicated worker thread; callers on the
+event loop only await the result.
+
+Configured with environment variables:
+
+- CLAUDABLE_SESSION_DB: Database path (default $ROUNDTABLE_HOME/sessions.db)
+- CLAUDABLE_SESSION_TTL: Seconds an unused session is kept (default 7 days)
+- CLAUDABLE_SESSION_MAX: Maximum number of stored sessions (default 1000)
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..core.config import roundtable_home
+from ..core.terminal_ui import ui
+
+DEFAULT_TTL = 7 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    agent TEXT NOT NULL,
+    project_path TEXT NOT NULL,
+    model TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (agent, project_path, model)
+);
+CREATE INDEX IF NOT EXISTS sessions_last_used ON sessions (last_used);
+"""
+
+
+def _key(agent: str, project_path: str, model: Optional[str]) -> tuple:
+    return agent, os.path.abspath(os.path.expanduser(project_path)), model or ""
+
+
+class SessionStore:
+    """SQLite-backed (agent, project path, model) -> session ID mapping."""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file (created on first use)
+            ttl: Seconds after the last use at which a session expires
+            max_entries: Sessions kept before the least recently used are evicted
+            clock: Wall-clock time source (injectable for tests)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-store")
+
+    async def get(self, agent: str, project_path: str, model: Optional[str] = None) -> Optional[str]:
+        """Return the live session ID for the key, refreshing its last use."""
+        return await self._run(self._get, _key(agent, project_path, model))
+
+    async def set(self, agent: str, project_path: str, session_id: str, model: Optional[str] = None) -> None:
+        """Store the session ID for the key, evicting expired and excess entries."""
+        await self._run(self._set, _key(agent, project_path, model), session_id)
+
+    async def delete(self, agent: str, project_path: str, model: Optional[str] = None) -> None:
+        """Forget the session for the key (e.g. the provider no longer knows it)."""
+        await self._run(self._delete, _key(agent, project_path, model))
+
+    def close(self) -> None:
+        """Close the database and stop the worker thread."""
+        self._executor.submit(self._close).result()
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    # ---- Worker thread ----------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: tuple) -> Optional[str]:
+        conn = self._connect()
+        now = self._clock()
+        row = conn.execute(
+            "SELECT session_id, last_used FROM sessions WHERE agent = ? AND project_path = ? AND model = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+        session_id, last_used = row
+        with conn:
+            if now - last_used > self.ttl:
+                conn.execute("DELETE FROM sessions WHERE agent = ? AND project_path = ? AND model = ?", key)
+                ui.debug("Session for %s expired", "Session", key)
+                return None
+            conn.execute(
+                "UPDATE sessions SET last_used = ? WHERE agent = ? AND project_path = ? AND model = ?",
+                (now, *key),
+            )
+        return session_id
+
+    def _set(self, key: tuple, session_id: str) -> None:
+        conn = self._connect()
+        now = self._clock()
+        with conn:
+            conn.execute(
+                "INSERT INTO sessions (agent, project_path, model, session_id, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (agent, project_path, model) DO UPDATE SET "
+                "session_id = excluded.session_id, created_at = excluded.created_at, last_used = excluded.last_used",
+                (*key, session_id, now, now),
+            )
+            conn.execute("DELETE FROM sessions WHERE last_used < ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM sessions WHERE rowid IN "
+                "(SELECT rowid FROM sessions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        ui.debug("Session stored for %s: %s", "Session", key, session_id)
+
+    def _delete(self, key: tuple) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM sessions WHERE agent = ? AND project_path = ? AND model = ?", key)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_session_store: Optional[SessionStore] = None
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def get_session_store() -> SessionStore:
+    """Get the process-wide session store, configured from the environment."""
+    global _session_store
+    if _session_store is None:
+        path = os.getenv("CLAUDABLE_SESSION_DB") or str(roundtable_home() / "sessions.db")
+        _session_store = SessionStore(
+            Path(path).expanduser(),
+            ttl=_env_float("CLAUDABLE_SESSION_TTL", DEFAULT_TTL),
+            max_entries=int(_env_float("CLAUDABLE_SESSION_MAX", DEFAULT_MAX_ENTRIES)),
+        )
+    return _session_store
+
+
+def reset_session_store() -> None:
+    """Close the process-wide store; the next get_session_store() reopens it."""
+    global _session_store
+    if _session_store is not None:
+        _session_store.close()
+        _session_store = None
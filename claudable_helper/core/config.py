@@ -4,6 +4,7 @@ This module provides a mock implementation of the configuration interface
 that was originally imported from app.core.config.
 """
 import os
+from pathlib import Path
 from typing import Any, Optional
 
 
@@ -53,4 +54,9 @@ class MockSettings:
 
 
 # Create singleton instance
-settings = MockSettings()
\ No newline at end of file
+settings = MockSettings()
+
+
+def roundtable_home() -> Path:
+    """Directory for Roundtable's persistent data: $ROUNDTABLE_HOME, default ~/.roundtable."""
+    return Path(os.getenv("ROUNDTABLE_HOME") or Path.home() / ".roundtable").expanduser()
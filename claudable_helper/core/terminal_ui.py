@@ -2,34 +2,57 @@
 
 This module provides a mock implementation of the terminal UI interface
 that was originally imported from app.core.terminal_ui.
+
+Messages go through the ``claudable_helper.ui`` logger, so they end up
+wherever the host application configured logging (never on stdout, which
+an MCP stdio transport owns). Debug calls are meant for hot paths: pass
+``%``-style arguments after the category and they are only formatted when
+debug logging is enabled, e.g. ``ui.debug("update: %s", "Gemini", update)``.
+Setting DEBUG=1 enables debug output for this logger.
 """
-import sys
+import logging
+import os
 from typing import Any, Optional
 
+logger = logging.getLogger("claudable_helper.ui")
+
 
 class MockTerminalUI:
     """Mock terminal UI for logging and user interaction."""
     
-    def debug(self, message: str, category: str = "DEBUG") -> None:
-        """Log debug message."""
-        if self._should_show_debug():
-            print(f"[{category}] {message}", file=sys.stderr)
+    def __init__(self):
+        if os.environ.get("DEBUG", "").lower() in ("1", "true", "yes"):
+            logger.setLevel(logging.DEBUG)
+    
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug messages are emitted (cached by the logging module)."""
+        return logger.isEnabledFor(logging.DEBUG)
+    
+    def debug(self, message: str, category: str = "DEBUG", *args: Any) -> None:
+        """Log debug message, formatting ``args`` into it only if enabled."""
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, category, args)
     
-    def info(self, message: str, category: str = "INFO") -> None:
+    def info(self, message: str, category: str = "INFO", *args: Any) -> None:
         """Log info message."""
-        print(f"[{category}] {message}")
+        if logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, category, args)
     
-    def warning(self, message: str, category: str = "WARNING") -> None:
+    def warning(self, message: str, category: str = "WARNING", *args: Any) -> None:
         """Log warning message."""
-        print(f"[{category}] {message}", file=sys.stderr)
+        if logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, category, args)
     
-    def error(self, message: str, category: str = "ERROR") -> None:
+    def error(self, message: str, category: str = "ERROR", *args: Any) -> None:
         """Log error message."""
-        print(f"[{category}] {message}", file=sys.stderr)
+        if logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, message, category, args)
     
-    def success(self, message: str, category: str = "SUCCESS") -> None:
+    def success(self, message: str, category: str = "SUCCESS", *args: Any) -> None:
         """Log success message."""
-        print(f"[{category}] {message}")
+        if logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, category, args)
     
     def print(self, message: str = "", **kwargs) -> None:
         """Print message to stdout."""
@@ -69,11 +92,14 @@ class MockTerminalUI:
             except ValueError:
                 print("Please enter a valid number")
     
-    def _should_show_debug(self) -> bool:
-        """Check if debug messages should be shown."""
-        import os
-        return os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
+    def _log(self, level: int, message: str, category: str, args: tuple) -> None:
+        # stacklevel=3 attributes the record to the caller of debug()/info()/...
+        if args:
+            logger.log(level, "[%s] " + message, category, *args, stacklevel=3)
+        else:
+            # Already formatted (possibly containing '%'); don't re-interpolate
+            logger.log(level, "[%s] %s", category, message, stacklevel=3)
 
 
 # Create singleton instance
-ui = MockTerminalUI()
\ No newline at end of file
+ui = MockTerminalUI()
@@ -0,0 +1,225 @@
+"""Lightweight in-process tracing for CLI executions.
+
+Spans nest through a ContextVar, so a span opened by the MCP server is the
+parent of spans recorded while an adapter's ``execute_with_streaming``
+generator is iterated from the same task. Finished traces are appended to a
+local file, either as JSONL (one span per line) or in the Chrome trace-event
+format that Perfetto and chrome://tracing open directly.
+
+Tracing is off until ``configure()`` is called; until then ``span()`` returns
+a shared no-op context manager and ``enabled()`` is a single global lookup.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start_ns", "end_ns", "attributes", "track")
+
+    def __init__(self, trace_id: str, span_id: str, parent_id: Optional[str], name: str,
+                 track: int, attributes: Dict[str, Any], start_ns: Optional[int] = None):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.track = track
+        self.attributes = attributes
+        self.start_ns = time.time_ns() if start_ns is None else start_ns
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span as a JSONL record."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_us": self.start_ns // 1000,
+            "duration_us": ((self.end_ns or self.start_ns) - self.start_ns) // 1000,
+            "attributes": self.attributes,
+        }
+
+    def to_chrome_event(self) -> Dict[str, Any]:
+        """Return the span as a Chrome trace "complete" event."""
+        return {
+            "name": self.name,
+            "ph": "X",
+            "ts": self.start_ns // 1000,
+            "dur": ((self.end_ns or self.start_ns) - self.start_ns) // 1000,
+            "pid": os.getpid(),
+            "tid": self.track,
+            "args": {"trace_id": self.trace_id, "span_id": self.span_id,
+                     "parent_id": self.parent_id, **self.attributes},
+        }
+
+
+class Tracer:
+    """Collects finished spans and appends each completed trace to a file."""
+
+    def __init__(self, path: str, fmt: Optional[str] = None):
+        """Initialize the tracer.
+
+        Args:
+            path: File to append spans to
+            fmt: "jsonl" or "chrome" (defaults to jsonl for *.jsonl paths, chrome otherwise)
+        """
+        self.path = path
+        self.format = fmt or ("jsonl" if path.endswith(".jsonl") else "chrome")
+        self._pending: Dict[str, List[Span]] = {}
+        self._lock = threading.Lock()
+        self._tracks = itertools.count(1)
+        self._span_ids = itertools.count(1)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        if self.format == "chrome" and (not os.path.exists(path) or os.path.getsize(path) == 0):
+            # JSON array format; the closing bracket is optional for trace viewers
+            with open(path, "w") as f:
+                f.write("[\n")
+
+    def next_span_id(self) -> str:
+        return f"{next(self._span_ids):016x}"
+
+    def next_track(self) -> int:
+        return next(self._tracks)
+
+    def finish(self, span: Span) -> None:
+        """Record a finished span; the whole trace is written when its root ends."""
+        with self._lock:
+            spans = self._pending.setdefault(span.trace_id, [])
+            spans.append(span)
+            if span.parent_id is not None:
+                return
+            del self._pending[span.trace_id]
+        self._write(spans)
+
+    def _write(self, spans: List[Span]) -> None:
+        if self.format == "jsonl":
+            lines = [json.dumps(s.to_dict(), default=str) for s in spans]
+        else:
+            lines = [json.dumps(s.to_chrome_event(), default=str) + "," for s in spans]
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def flush(self) -> None:
+        """Write spans of traces whose root never finished."""
+        with self._lock:
+            pending = [span for spans in self._pending.values() for span in spans]
+            self._pending.clear()
+        if pending:
+            self._write(pending)
+
+
+_tracer: Optional[Tracer] = None
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class _NoopSpan:
+    """Context manager returned by span() while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _SpanScope:
+    def __init__(self, tracer: Tracer, name: str, attributes: Dict[str, Any], new_trace: bool):
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._new_trace = new_trace
+        self._token = None
+        self.span: Optional[Span] = None
+
+    def __enter__(self) -> Span:
+        parent = None if self._new_trace else _current_span.get()
+        if parent is None:
+            trace_id, parent_id, track = uuid.uuid4().hex, None, self._tracer.next_track()
+        else:
+            trace_id, parent_id, track = parent.trace_id, parent.span_id, parent.track
+        self.span = Span(trace_id, self._tracer.next_span_id(), parent_id, self._name, track, self._attributes)
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        self.span.end_ns = time.time_ns()
+        if exc is not None:
+            self.span.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._tracer.finish(self.span)
+        return False
+
+
+def configure(path: str, fmt: Optional[str] = None) -> Tracer:
+    """Enable tracing, appending finished traces to ``path``."""
+    global _tracer
+    _tracer = Tracer(path, fmt)
+    return _tracer
+
+
+def shutdown() -> None:
+    """Flush any unfinished traces and disable tracing."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+    _tracer = None
+
+
+def enabled() -> bool:
+    """Whether a tracer is configured."""
+    return _tracer is not None
+
+
+def current_trace_id() -> Optional[str]:
+    """Trace id of the span active in this context, if any."""
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+def start_trace(name: str, **attributes: Any):
+    """Open the root span of a new trace (one per tool call)."""
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _SpanScope(_tracer, name, attributes, new_trace=True)
+
+
+def span(name: str, **attributes: Any):
+    """Open a span nested under the span active in this context."""
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _SpanScope(_tracer, name, attributes, new_trace=False)
+
+
+def record_span(name: str, start_ns: int, end_ns: Optional[int] = None, **attributes: Any) -> None:
+    """Record an already finished span under the span active in this context.
+
+    Useful for intervals that are only known after the fact, such as the time
+    between two lifecycle phases reported by an adapter.
+    """
+    parent = _current_span.get()
+    if _tracer is None or parent is None:
+        return
+    recorded = Span(parent.trace_id, _tracer.next_span_id(), parent.span_id, name,
+                    parent.track, attributes, start_ns=start_ns)
+    recorded.end_ns = time.time_ns() if end_ns is None else end_ns
+    _tracer.finish(recorded)
@@ -1,78 +1,197 @@
-"""Mock websocket manager for claudable_helper.
+"""WebSocket connection manager for claudable_helper.
 
-This module provides a mock implementation of the websocket manager
-that was originally imported from app.core.websocket.manager.
+Each payload is serialized once, however many clients receive it, and put
+on a bounded per-connection queue that a writer task drains. Sending never
+waits for a socket, so one slow client can't stall the others or the agent
+stream feeding them. When a connection's queue is full the slow-client
+policy decides what happens:
+
+- ``drop_oldest``: discard the oldest queued payload (the client degrades
+  to seeing only recent updates)
+- ``disconnect``: close the connection (close code 1013, try again later)
+
+Websockets only need an async ``send_text(str)`` and ``close(code=...)``,
+as provided by Starlette/FastAPI.
 """
+from enum import Enum
 from typing import Any, Dict, List, Optional
 import asyncio
 import json
 
+from ..terminal_ui import ui
+
+# "Try again later": the server is overloaded for this client
+CLOSE_TRY_AGAIN_LATER = 1013
+
+
+class SlowClientPolicy(str, Enum):
+    """What to do when a connection's send queue is full."""
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+class _Connection:
+    """One websocket with its bounded send queue and writer task."""
+
+    def __init__(self, websocket: Any, client_id: str, queue_size: int):
+        self.websocket = websocket
+        self.client_id = client_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.sent = 0
+        self.dropped = 0
+        self.writer: Optional[asyncio.Task] = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+
+class WebSocketManager:
+    """WebSocket manager with serialize-once, queued fan-out."""
 
-class MockWebSocketManager:
-    """Mock WebSocket manager for handling real-time communication."""
-    
-    def __init__(self):
-        self.connections: Dict[str, List[Any]] = {}
+    def __init__(
+        self,
+        queue_size: int = 256,
+        policy: SlowClientPolicy = SlowClientPolicy.DROP_OLDEST,
+        send_timeout: float = 10.0,
+    ):
+        """Initialize the manager.
+
+        Args:
+            queue_size: Payloads buffered per connection before the policy applies
+            policy: What to do with a connection whose queue is full
+            send_timeout: Seconds a single send may take before the connection is dropped
+        """
+        self.queue_size = queue_size
+        self.policy = SlowClientPolicy(policy)
+        self.send_timeout = send_timeout
+        self.connections: Dict[str, List[_Connection]] = {}
         self.active = False
-    
+
     async def connect(self, websocket: Any, client_id: str) -> None:
-        """Mock connect a WebSocket client."""
-        if client_id not in self.connections:
-            self.connections[client_id] = []
-        self.connections[client_id].append(websocket)
+        """Register a WebSocket client and start its writer task."""
+        connection = _Connection(websocket, client_id, self.queue_size)
+        connection.writer = asyncio.create_task(self._write(connection))
+        self.connections.setdefault(client_id, []).append(connection)
         self.active = True
-    
+
     async def disconnect(self, websocket: Any, client_id: str) -> None:
-        """Mock disconnect a WebSocket client."""
-        if client_id in self.connections:
-            try:
-                self.connections[client_id].remove(websocket)
-                if not self.connections[client_id]:
-                    del self.connections[client_id]
-            except ValueError:
-                pass  # WebSocket not in list
-        
-        if not self.connections:
-            self.active = False
-    
+        """Unregister a WebSocket client; queued payloads are discarded."""
+        for connection in self.connections.get(client_id, [])[:]:
+            if connection.websocket is websocket:
+                self._remove(connection)
+
     async def send_message(self, client_id: str, message: Dict[str, Any]) -> None:
-        """Mock send message to a specific client."""
+        """Queue a message for every connection of a specific client."""
         if client_id not in self.connections:
             return
-        
-        message_str = json.dumps(message)
-        for websocket in self.connections[client_id][:]:  # Copy list to avoid modification during iteration
-            try:
-                # In a real implementation, this would be:
-                # await websocket.send_text(message_str)
-                # For mock, we'll just log it
-                print(f"[WebSocket] Sending to {client_id}: {message_str}")
-            except Exception as e:
-                print(f"[WebSocket] Error sending to {client_id}: {e}")
-                # Remove broken connection
-                try:
-                    self.connections[client_id].remove(websocket)
-                except ValueError:
-                    pass
-    
+        payload = json.dumps(message, default=str)
+        for connection in self.connections[client_id][:]:
+            await self._enqueue(connection, payload)
+
     async def broadcast(self, message: Dict[str, Any]) -> None:
-        """Mock broadcast message to all connected clients."""
-        message_str = json.dumps(message)
-        for client_id in list(self.connections.keys()):
-            await self.send_message(client_id, message)
-    
+        """Queue a message for all connected clients."""
+        payload = json.dumps(message, default=str)
+        for connections in list(self.connections.values()):
+            for connection in connections[:]:
+                await self._enqueue(connection, payload)
+
     def is_active(self) -> bool:
         """Check if there are active connections."""
         return self.active and bool(self.connections)
-    
+
     def get_connection_count(self) -> int:
         """Get total number of active connections."""
-        return sum(len(websockets) for websockets in self.connections.values())
-    
+        return sum(len(connections) for connections in self.connections.values())
+
     def get_client_ids(self) -> List[str]:
         """Get list of connected client IDs."""
         return list(self.connections.keys())
 
+    def get_queue_stats(self) -> Dict[str, List[Dict[str, int]]]:
+        """Queue depth, capacity, sent and dropped counts per client connection."""
+        return {
+            client_id: [connection.stats() for connection in connections]
+            for client_id, connections in self.connections.items()
+        }
+
+    async def close(self) -> None:
+        """Drop every connection and stop the writer tasks."""
+        connections = [c for group in self.connections.values() for c in group]
+        for connection in connections:
+            self._remove(connection)
+        writers = [c.writer for c in connections if c.writer is not None]
+        await asyncio.gather(*writers, return_exceptions=True)
+
+    async def _enqueue(self, connection: _Connection, payload: str) -> None:
+        try:
+            connection.queue.put_nowait(payload)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.policy == SlowClientPolicy.DISCONNECT:
+            ui.warning(
+                f"Disconnecting slow client {connection.client_id} "
+                f"({connection.queue.qsize()} messages queued)",
+                "WebSocket",
+            )
+            self._remove(connection)
+            try:
+                await connection.websocket.close(code=CLOSE_TRY_AGAIN_LATER)
+            except Exception as e:
+                ui.debug("Closing slow client %s failed: %s", "WebSocket", connection.client_id, e)
+            return
+
+        connection.queue.get_nowait()
+        connection.queue.put_nowait(payload)
+        connection.dropped += 1
+        if connection.dropped == 1 or connection.dropped % 100 == 0:
+            ui.warning(
+                f"Client {connection.client_id} is slow; dropped {connection.dropped} messages",
+                "WebSocket",
+            )
+
+    async def _write(self, connection: _Connection) -> None:
+        while True:
+            payload = await connection.queue.get()
+            # asyncio.wait rather than wait_for: on 3.10/3.11 wait_for can
+            # swallow our cancellation when the send finishes at the same time
+            send = asyncio.ensure_future(connection.websocket.send_text(payload))
+            try:
+                done, _ = await asyncio.wait({send}, timeout=self.send_timeout)
+            except asyncio.CancelledError:
+                send.cancel()
+                raise
+            try:
+                if not done:
+                    send.cancel()
+                    raise asyncio.TimeoutError(f"send took longer than {self.send_timeout}s")
+                send.result()
+            except Exception as e:
+                ui.error(f"Error sending to {connection.client_id}: {e!r}", "WebSocket")
+                self._remove(connection, cancel_writer=False)
+                return
+            connection.sent += 1
+
+    def _remove(self, connection: _Connection, cancel_writer: bool = True) -> None:
+        connections = self.connections.get(connection.client_id, [])
+        if connection in connections:
+            connections.remove(connection)
+            if not connections:
+                del self.connections[connection.client_id]
+        if cancel_writer and connection.writer is not None:
+            connection.writer.cancel()
+        if not self.connections:
+            self.active = False
+
+
+# Kept for code that imported the previous mock class
+MockWebSocketManager = WebSocketManager
 
 # Create singleton instance
-manager = MockWebSocketManager()
\ No newline at end of file
+manager = WebSocketManager()
@@ -1,216 +1,432 @@
-import subprocess
-import socket
+import asyncio
+import functools
 import signal
 import os
 import time
 import hashlib
-import threading
-import re
-from contextlib import closing
-from typing import Optional, Dict
+import shutil
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 from ..core.config import settings
+from ..core.terminal_ui import ui
+from ..core.websocket.manager import manager
+from .log_matcher import CONTEXT, ERROR, SUCCESS, LineMatcher, error_fingerprint
+from .node_modules_cache import get_node_modules_cache
+from .port_allocator import PortAllocator
+from .preview_logs import PreviewLogBuffer, spill_path_for
 
 
 # Global process registry to track running Next.js processes
-_running_processes: Dict[str, subprocess.Popen] = {}
-_process_logs: Dict[str, list] = {}  # Store process logs for each project
-
-def _monitor_preview_errors(project_id: str, process: subprocess.Popen):
-    """간단한 Preview 서버 에러 모니터링"""
-    from ..core.websocket.manager import manager
-    import asyncio
-    
-    error_patterns = [
-        "Build Error",
-        "Failed to compile", 
-        "Syntax Error",
-        "TypeError:",
-        "ReferenceError:",
-        "Module not found",
-        "Expected",
-        "⨯",  # Next.js error symbol
-        "Error:",  # Generic error
-        "runtime error",
-        "Runtime Error",
-        "Uncaught",
-        "Cannot read",
-        "Cannot access",
-        "is not defined",
-        "is not a function",
-        "Cannot resolve module",
-        "Error occurred prerendering",
-        "Unhandled Runtime Error",
-        "GET / 500",  # HTTP 500 errors
-        "POST / 500",
-        "Internal server error",
-        "Application error"
-    ]
-    
-    success_patterns = [
-        "✓ Ready in",
-        "○ Compiling",
-        "✓ Compiled",
-        "✓ Starting"
-    ]
+_running_processes: Dict[str, asyncio.subprocess.Process] = {}
+_monitor_tasks: Dict[str, asyncio.Task] = {}
+_preview_ports: Dict[str, int] = {}  # Port reserved for each running preview
+_preview_handles: Dict[str, "PreviewHandle"] = {}
+_port_allocator: Optional[PortAllocator] = None
+_process_logs: Dict[str, PreviewLogBuffer] = {}  # Store process logs for each project
+
+# Lines of output kept in memory per preview
+PREVIEW_LOG_CAPACITY = 1000
+
+# Seconds preview events are collected before they are sent to WebSockets
+PREVIEW_EVENT_FLUSH_INTERVAL = 0.1
+# Longest dev server output line the reader accepts
+PREVIEW_LINE_LIMIT = 1024 * 1024
+# Printed by `next dev` once it accepts connections
+READY_MARKER = "✓ Ready in"
+# Seconds a preview may take to become ready (cold compiles can take a while)
+PREVIEW_READY_TIMEOUT = 60.0
+
+ERROR_PATTERNS = [
+    "Build Error",
+    "Failed to compile",
+    "Syntax Error",
+    "TypeError:",
+    "ReferenceError:",
+    "Module not found",
+    "Expected",
+    "⨯",  # Next.js error symbol
+    "Error:",  # Generic error
+    "runtime error",
+    "Runtime Error",
+    "Uncaught",
+    "Cannot read",
+    "Cannot access",
+    "is not defined",
+    "is not a function",
+    "Cannot resolve module",
+    "Error occurred prerendering",
+    "Unhandled Runtime Error",
+    "GET / 500",  # HTTP 500 errors
+    "POST / 500",
+    "Internal server error",
+    "Application error"
+]
+
+SUCCESS_PATTERNS = [
+    "✓ Ready in",
+    "○ Compiling",
+    "✓ Compiled",
+    "✓ Starting"
+]
+
+# Lowercase keywords of lines that belong to the error being collected
+CONTEXT_KEYWORDS = ['error', 'failed', 'expected', 'at ', 'module', 'cannot', 'uncaught', 'undefined', 'null']
+
+
+_line_matcher = LineMatcher(SUCCESS_PATTERNS, ERROR_PATTERNS, CONTEXT_KEYWORDS)
+
+
+def configure_preview_patterns(
+    success: Optional[List[str]] = None,
+    error: Optional[List[str]] = None,
+    context: Optional[List[str]] = None,
+) -> LineMatcher:
+    """
+    Replace the pattern sets preview output is classified with
     
-    recent_errors = {}     # 에러 ID별 마지막 전송 시간
-    error_contexts = {}    # 에러별 컨텍스트 수집
-    current_error = None   # 현재 처리 중인 에러
-    error_lines = []       # 에러 관련 라인들
-    
-    def generate_error_id(error_line):
-        """에러 라인에서 고유 ID 생성"""
-        import hashlib
-        # 에러의 핵심 부분만 추출하여 ID 생성
-        core_error = error_line.strip()
-        # 시간이나 파일 경로 등 변동사항 제거
-        core_error = re.sub(r'\d{2}:\d{2}:\d{2}', '', core_error)  # 시간 제거
-        core_error = re.sub(r'at .*?:\d+:\d+', '', core_error)     # 위치 정보 제거
-        return hashlib.md5(core_error.encode()).hexdigest()[:8]
-    
-    def should_send_error(error_id):
-        """에러를 전송할지 판단 (5초 내 중복 방지)"""
-        now = time.time()
-        if error_id in recent_errors:
-            if now - recent_errors[error_id] < 5:  # 5초 내 중복 방지
-                return False
-        recent_errors[error_id] = now
-        return True
+    Args:
+        success: Substrings marking a successful build (default SUCCESS_PATTERNS)
+        error: Substrings starting an error (default ERROR_PATTERNS)
+        context: Case-insensitive substrings of error context lines (default CONTEXT_KEYWORDS)
     
-    def collect_error_context(line_text):
+    Returns:
+        The matcher now in use
+    """
+    global _line_matcher
+    _line_matcher = LineMatcher(
+        SUCCESS_PATTERNS if success is None else success,
+        ERROR_PATTERNS if error is None else error,
+        CONTEXT_KEYWORDS if context is None else context,
+    )
+    return _line_matcher
+
+
+def _log_buffer(project_id: str) -> PreviewLogBuffer:
+    """The project's log buffer, created on first use.
+
+    Lines pushed out of memory are spilled to <dir>/<project_id>.log when
+    CLAUDABLE_PREVIEW_LOG_DIR is set.
+    """
+    logs = _process_logs.get(project_id)
+    if logs is None:
+        spill_dir = os.getenv("CLAUDABLE_PREVIEW_LOG_DIR")
+        logs = _process_logs[project_id] = PreviewLogBuffer(
+            PREVIEW_LOG_CAPACITY,
+            spill_path=spill_path_for(os.path.expanduser(spill_dir), project_id) if spill_dir else None,
+        )
+    return logs
+
+
+def _clear_logs(project_id: str) -> None:
+    logs = _process_logs.pop(project_id, None)
+    if logs is not None:
+        logs.close()
+        ui.debug("Cleared logs for %s", "Preview", project_id)
+
+
+def _generate_error_id(error_line: str) -> str:
+    """에러 라인에서 고유 ID 생성"""
+    # 시간이나 파일 경로 등 변동사항을 제거한 핵심 부분으로 ID 생성
+    return hashlib.md5(error_fingerprint(error_line).encode()).hexdigest()[:8]
+
+
+class _PreviewMonitor:
+    """Classifies one preview's output lines and sends events in batches.
+
+    Lines are fed synchronously by the reader task; resulting events are
+    collected and sent ``flush_interval`` after the first one, on the same
+    event loop.
+    """
+
+    def __init__(self, project_id: str, flush_interval: float = PREVIEW_EVENT_FLUSH_INTERVAL):
+        self.project_id = project_id
+        self.flush_interval = flush_interval
+        self.recent_errors: Dict[str, float] = {}  # 에러 ID별 마지막 전송 시간
+        self.current_error: Optional[str] = None  # 현재 처리 중인 에러
+        self.error_lines: List[str] = []  # 에러 관련 라인들
+        self._pending: List[Dict[str, Any]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def feed(self, line_text: str) -> None:
         """에러 관련 컨텍스트 수집"""
-        nonlocal current_error, error_lines
-        
         # 프로젝트별 로그 저장 (전체 로그 수집용)
-        if project_id not in _process_logs:
-            _process_logs[project_id] = []
-        
-        # 중복 로그 제거 (같은 라인이 연속으로 오는 경우)
+        logs = _log_buffer(self.project_id)
+
         stripped_line = line_text.strip()
         if not stripped_line:  # 빈 라인 무시
             return
-            
+
         # 마지막 로그와 같은 경우 무시 (중복 제거)
-        if _process_logs[project_id] and _process_logs[project_id][-1] == stripped_line:
+        if logs.last == stripped_line:
             return
-            
-        _process_logs[project_id].append(stripped_line)
-        # 최대 1000라인까지만 저장
-        if len(_process_logs[project_id]) > 1000:
-            _process_logs[project_id] = _process_logs[project_id][-1000:]
-        
+
+        logs.append(stripped_line)
+
+        category = _line_matcher.classify(stripped_line, context=self.current_error is not None)
+
         # 성공 패턴 감지 - 에러 상태 클리어
-        for pattern in success_patterns:
-            if pattern in line_text:
-                # 성공 상태 전송
-                success_message = {
-                    "type": "preview_success",
-                    "success": {
-                        "message": line_text.strip(),
-                        "timestamp": int(time.time() * 1000)
-                    }
+        if category == SUCCESS:
+            self._queue({
+                "type": "preview_success",
+                "success": {
+                    "message": stripped_line,
+                    "timestamp": int(time.time() * 1000)
                 }
-                
-                print(f"[PreviewSuccess] 성공 메시지: {line_text.strip()}")
-                
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(
-                        manager.send_message(project_id, success_message)
-                    )
-                    print(f"[PreviewSuccess] WebSocket 전송 성공!")
-                except Exception as e:
-                    print(f"[PreviewSuccess] WebSocket 전송 실패: {e}")
-                
-                # 현재 에러 상태 클리어
-                current_error = None
-                error_lines = []
-                return
+            })
+            self.current_error = None
+            self.error_lines = []
+            return
 
         # 새로운 에러 시작 감지
-        for pattern in error_patterns:
-            if pattern in line_text:
-                # 이전 에러가 있다면 전송
-                if current_error and error_lines:
-                    send_error_with_context(current_error, error_lines)
-                
-                # 새로운 에러 시작
-                current_error = generate_error_id(line_text)
-                error_lines = [line_text.strip()]
-                return
-        
+        if category == ERROR:
+            # 이전 에러가 있다면 전송
+            if self.current_error and self.error_lines:
+                self._queue_error(self.current_error, self.error_lines)
+            self.current_error = _generate_error_id(stripped_line)
+            self.error_lines = [stripped_line]
+            return
+
         # 현재 에러에 관련된 라인 수집
-        if current_error and (line_text.strip() and 
-                              any(x in line_text.lower() for x in ['error', 'failed', 'expected', 'at ', 'module', 'cannot', 'uncaught', 'undefined', 'null'])):
-            error_lines.append(line_text.strip())
-            if len(error_lines) > 15:  # 런타임 에러는 스택트레이스가 길 수 있으므로 15라인까지
-                error_lines = error_lines[-15:]
-    
-    def send_error_with_context(error_id, lines):
-        """컨텍스트와 함께 에러 전송"""
-        if not should_send_error(error_id):
+        if self.current_error and category == CONTEXT:
+            self.error_lines.append(stripped_line)
+            if len(self.error_lines) > 15:  # 런타임 에러는 스택트레이스가 길 수 있으므로 15라인까지
+                self.error_lines = self.error_lines[-15:]
+
+    async def flush(self) -> None:
+        """Send the collected events.
+
+        Only the newest success event of a batch is sent: each one clears
+        the error state, so earlier ones carry no information.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        last_success = max(
+            (i for i, event in enumerate(batch) if event["type"] == "preview_success"), default=-1
+        )
+        for i, event in enumerate(batch):
+            if event["type"] == "preview_success" and i != last_success:
+                continue
+            try:
+                await manager.send_message(self.project_id, event)
+            except Exception as e:
+                ui.error(f"WebSocket send failed for {self.project_id}: {e}", "Preview")
+
+    async def close(self) -> None:
+        """Queue the error still being collected and send everything pending."""
+        if self.current_error and self.error_lines:
+            self._queue_error(self.current_error, self.error_lines)
+            self.current_error = None
+            self.error_lines = []
+        await self.flush()
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+
+    def _queue_error(self, error_id: str, lines: List[str]) -> None:
+        """컨텍스트와 함께 에러 전송 (5초 내 중복 방지)"""
+        now = time.time()
+        if now - self.recent_errors.get(error_id, 0.0) < 5:
             return
-        
-        # 에러 메시지와 컨텍스트 구성
+        self.recent_errors[error_id] = now
+
         main_message = lines[0] if lines else "Unknown error"
-        full_context = '\n'.join(lines[:5])  # 최대 5라인 컨텍스트
-        
-        message_data = {
+        self._queue({
             "type": "preview_error",
             "error": {
                 "id": error_id,
                 "message": main_message[:200],
-                "context": full_context,
-                "timestamp": int(time.time() * 1000)
+                "context": '\n'.join(lines[:5]),  # 최대 5라인 컨텍스트
+                "timestamp": int(now * 1000)
             }
-        }
-        
-        print(f"[PreviewError] 전송할 에러 (ID: {error_id}): {main_message[:100]}")
-        
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                manager.send_message(project_id, message_data)
-            )
-            print(f"[PreviewError] WebSocket 전송 성공! (ID: {error_id})")
-        except Exception as e:
-            print(f"[PreviewError] WebSocket 전송 실패: {e}")
+        })
+        ui.debug("Preview error %s for %s: %s", "Preview", error_id, self.project_id, main_message[:100])
+
+    def _queue(self, event: Dict[str, Any]) -> None:
+        self._pending.append(event)
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._flush_on_timer)
+
+    def _flush_on_timer(self) -> None:
+        self._timer = None
+        self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+
+async def _monitor_preview_output(
+    project_id: str,
+    process: asyncio.subprocess.Process,
+    ready: Optional[asyncio.Event] = None,
+) -> None:
+    """Read a preview's output until it exits, classifying every line.
+
+    ``ready`` is set when the dev server prints READY_MARKER.
+    """
+    monitor = _PreviewMonitor(project_id)
+    try:
+        while True:
+            try:
+                line = await process.stdout.readline()
+            except ValueError:
+                # Line longer than PREVIEW_LINE_LIMIT; the reader dropped it
+                continue
+            if not line:
+                break
+            line_text = line.decode('utf-8', errors='ignore')
+            if ready is not None and not ready.is_set() and READY_MARKER in line_text:
+                ready.set()
+            monitor.feed(line_text)
+    except Exception as e:
+        ui.error(f"Preview output monitor for {project_id} failed: {e}", "Preview")
+    finally:
+        await monitor.close()
+        ui.debug("Preview output monitor for %s stopped", "Preview", project_id)
+
+
+@dataclass
+class PreviewHandle:
+    """A launched preview; await ``ready`` for the seconds it took to become ready."""
+    project_id: str
+    process_name: str
+    port: int
+    process: asyncio.subprocess.Process
+    ready: "asyncio.Task[float]"
+
+
+async def _http_responds(port: int, timeout: float = 1.0) -> bool:
+    """Whether an HTTP server answers a GET on the port on localhost
+
+    Any status counts; a listener that accepts but doesn't speak HTTP doesn't.
+    """
+    writer = None
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", port), timeout=timeout)
+        writer.write(f"GET / HTTP/1.0\r\nHost: 127.0.0.1:{port}\r\n\r\n".encode("ascii"))
+        await writer.drain()
+        status = await asyncio.wait_for(reader.read(5), timeout=timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+    return status == b"HTTP/"
+
+
+async def _wait_until_ready(
+    process: asyncio.subprocess.Process,
+    port: int,
+    marker: asyncio.Event,
+    timeout: float,
+    initial_delay: float = 0.05,
+    max_delay: float = 1.0,
+) -> float:
+    """
+    Wait until a dev server is ready
     
-    while process.poll() is None:
-        try:
-            if process.stdout:
-                line = process.stdout.readline()
-                if line:
-                    line_text = line if isinstance(line, str) else line.decode('utf-8', errors='ignore')
-                    collect_error_context(line_text)
-            
-            time.sleep(0.1)
-        except Exception as e:
-            print(f"[PreviewError] 모니터링 에러: {e}")
-            break
+    The server is ready once it prints READY_MARKER (``marker`` is set) or,
+    while the process is still running, its port answers HTTP requests,
+    polled with exponential backoff. A bare listener on the port isn't
+    enough: it may belong to another process.
     
-    # 프로세스 종료 시 마지막 에러 전송
-    if current_error and error_lines:
-        send_error_with_context(current_error, error_lines)
+    Returns:
+        Seconds it took to become ready
     
-    print(f"[PreviewError] {project_id} 모니터링 종료")
+    Raises:
+        RuntimeError: The process exited first
+        asyncio.TimeoutError: Not ready after ``timeout`` seconds
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    exited = asyncio.ensure_future(process.wait())
+    marked = asyncio.ensure_future(marker.wait())
+    delay = initial_delay
+    try:
+        while True:
+            if marked.done() or (process.returncode is None and await _http_responds(port)):
+                return loop.time() - started
+            remaining = started + timeout - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            done, _ = await asyncio.wait(
+                {exited, marked}, timeout=min(delay, remaining), return_when=asyncio.FIRST_COMPLETED
+            )
+            if marked in done:
+                return loop.time() - started
+            if exited in done:
+                raise RuntimeError(f"exited with code {process.returncode} before it was ready")
+            delay = min(delay * 2, max_delay)
+    finally:
+        exited.cancel()
+        marked.cancel()
+
+
+async def _await_preview_ready(
+    project_id: str,
+    process: asyncio.subprocess.Process,
+    port: int,
+    marker: asyncio.Event,
+    timeout: float,
+) -> float:
+    """Wait for a launched preview; stop it if it never becomes ready"""
+    try:
+        return await _wait_until_ready(process, port, marker, timeout)
+    except (RuntimeError, asyncio.TimeoutError) as e:
+        reason = f"not ready after {timeout:g}s" if isinstance(e, asyncio.TimeoutError) else str(e)
+        monitor_task = _monitor_tasks.get(project_id)
+        if process.returncode is not None and monitor_task is not None:
+            await asyncio.gather(monitor_task, return_exceptions=True)
+        output = '\n'.join(_log_buffer(project_id).tail(20))
+        if _running_processes.get(project_id) is process:
+            await stop_preview_process(project_id)
+        raise RuntimeError(f"Next.js server {reason}: {output}") from None
+
+
+def _report_readiness(project_id: str, ready: "asyncio.Task[float]") -> None:
+    if ready.cancelled():
+        return
+    error = ready.exception()
+    if error is not None:
+        ui.error(f"Preview for {project_id} failed to start: {error}", "Preview")
+    else:
+        ui.info(f"Preview for {project_id} ready in {ready.result():.1f}s", "Preview")
 
 
-def _is_port_free(port: int) -> bool:
-    """Check if a port is available"""
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
-        sock.settimeout(0.2)
-        return sock.connect_ex(("127.0.0.1", port)) != 0
+def _get_port_allocator() -> PortAllocator:
+    """The allocator for the configured preview port range (default 3100-3999)."""
+    global _port_allocator
+    if _port_allocator is None:
+        _port_allocator = PortAllocator(
+            int(settings.preview_port_start or 3100),
+            int(settings.preview_port_end or 3999),
+        )
+    return _port_allocator
 
 
 def find_free_preview_port() -> int:
-    """Find a free port in the preview range"""
-    for port in range(settings.preview_port_start, settings.preview_port_end + 1):
-        if _is_port_free(port):
-            return port
-    raise RuntimeError("No free preview port available")
+    """Reserve a free port in the preview range
+
+    The port stays reserved until release_preview_port() is called with it;
+    stop_preview_process does that for the ports of previews it stops.
+    """
+    return _get_port_allocator().allocate()
+
+
+def release_preview_port(port: int) -> None:
+    """Return a port reserved by find_free_preview_port"""
+    _get_port_allocator().release(port)
+
+
+def _forget_process(project_id: str) -> None:
+    """Drop a preview from the registry and release its port"""
+    _running_processes.pop(project_id, None)
+    _preview_handles.pop(project_id, None)
+    port = _preview_ports.pop(project_id, None)
+    if port is not None:
+        release_preview_port(port)
 
 
 def _should_install_dependencies(repo_path: str) -> bool:
@@ -227,7 +443,7 @@ def _should_install_dependencies(repo_path: str) -> bool:
     
     # If node_modules doesn't exist, definitely need to install
     if not os.path.exists(node_modules_path):
-        print(f"node_modules not found, will install dependencies")
+        ui.info("node_modules not found, will install dependencies", "Preview")
         return True
     
     # Calculate current hash of package files
@@ -251,10 +467,10 @@ def _should_install_dependencies(repo_path: str) -> bool:
         with open(install_hash_path, 'r') as f:
             stored_hash = f.read().strip()
             if stored_hash == final_hash:
-                print(f"Dependencies are up to date (hash: {final_hash[:8]}...)")
+                ui.debug(f"Dependencies are up to date (hash: {final_hash[:8]}...)", "Preview")
                 return False
     
-    print(f"Package files changed, will install dependencies (new hash: {final_hash[:8]}...)")
+    ui.info(f"Package files changed, will install dependencies (new hash: {final_hash[:8]}...)", "Preview")
     return True
 
 
@@ -284,35 +500,105 @@ def _save_install_hash(repo_path: str) -> None:
         f.write(final_hash)
 
 
-def start_preview_process(project_id: str, repo_path: str, port: Optional[int] = None) -> tuple[str, int]:
+async def start_preview_process(
+    project_id: str,
+    repo_path: str,
+    port: Optional[int] = None,
+    ready_timeout: float = PREVIEW_READY_TIMEOUT,
+) -> tuple[str, int]:
     """
-    Start a Next.js development server using subprocess
+    Start a Next.js development server and wait until it is ready
     
     Args:
         project_id: Unique project identifier
         repo_path: Path to the project repository
         port: Optional port number, will auto-assign if not provided
+        ready_timeout: Seconds the server may take to become ready
     
     Returns:
         Tuple of (process_name, port)
     """
+    handle = await launch_preview_process(project_id, repo_path, port, ready_timeout)
+    try:
+        elapsed = await handle.ready
+    except RuntimeError as e:
+        raise RuntimeError(f"Failed to start preview process: {str(e)}")
+    ui.success(f"Next.js dev server started for {project_id} on port {handle.port} (PID: {handle.process.pid}, ready in {elapsed:.1f}s)", "Preview")
+    return handle.process_name, handle.port
+
+
+def _normalize_to_npm(repo_path: str) -> None:
+    """Remove pnpm/yarn lockfiles and node_modules so npm installs from scratch"""
+    try:
+        pnpm_lock = os.path.join(repo_path, "pnpm-lock.yaml")
+        yarn_lock = os.path.join(repo_path, "yarn.lock")
+        pnpm_dir = os.path.join(repo_path, "node_modules", ".pnpm")
+        if os.path.exists(pnpm_lock) or os.path.exists(yarn_lock) or os.path.isdir(pnpm_dir):
+            ui.info("Detected non-npm artifacts (pnpm/yarn). Cleaning to use npm...", "Preview")
+            # Remove node_modules to avoid arborist crashes
+            try:
+                shutil.rmtree(os.path.join(repo_path, "node_modules"), ignore_errors=True)
+            except Exception as _e:
+                ui.warning(f"Failed to remove node_modules: {_e}", "Preview")
+            # Remove other lockfiles
+            try:
+                if os.path.exists(pnpm_lock):
+                    os.remove(pnpm_lock)
+            except Exception:
+                pass
+            try:
+                if os.path.exists(yarn_lock):
+                    os.remove(yarn_lock)
+            except Exception:
+                pass
+    except Exception as _e:
+        ui.warning(f"npm normalization failed: {_e}", "Preview")
+
+
+async def launch_preview_process(
+    project_id: str,
+    repo_path: str,
+    port: Optional[int] = None,
+    ready_timeout: float = PREVIEW_READY_TIMEOUT,
+) -> PreviewHandle:
+    """
+    Start a Next.js development server as an asyncio subprocess
+    
+    Returns once the server process is running; await the handle's ``ready``
+    task for it to accept connections. A preview that exits or isn't ready
+    within ``ready_timeout`` is stopped and ``ready`` raises RuntimeError.
+    Its output is read by a task on the running event loop, which stores the
+    lines and sends preview events to the project's WebSocket clients.
+    
+    Args:
+        project_id: Unique project identifier
+        repo_path: Path to the project repository
+        port: Optional port number, will auto-assign if not provided
+        ready_timeout: Seconds the server may take to become ready
+    
+    Returns:
+        PreviewHandle of the launched preview
+    """
     # Stop existing process if any
-    stop_preview_process(project_id)
+    await stop_preview_process(project_id)
     
     # Clear previous logs for this project
-    if project_id in _process_logs:
-        _process_logs[project_id] = []
-        print(f"[PreviewError] Cleared previous logs for {project_id}")
-    
-    # Assign port
-    port = port or find_free_preview_port()
-    process_name = f"next-dev-{project_id}"
+    _clear_logs(project_id)
     
     # Check if project has package.json
     package_json_path = os.path.join(repo_path, "package.json")
     if not os.path.exists(package_json_path):
         raise RuntimeError(f"No package.json found in {repo_path}")
     
+    # Assign port
+    if port:
+        if not _get_port_allocator().reserve(port):
+            raise RuntimeError(f"Port {port} is already used by another preview")
+    else:
+        port = find_free_preview_port()
+    _preview_ports[project_id] = port
+    process_name = f"next-dev-{project_id}"
+    
     # Install dependencies and start dev server
     env = os.environ.copy()
     env.update({
@@ -323,96 +609,72 @@ def start_preview_process(project_id: str, repo_path: str, port: Optional[int] =
     })
     
     try:
-        # Normalize repository to npm to avoid mixed package managers
-        try:
-            pnpm_lock = os.path.join(repo_path, "pnpm-lock.yaml")
-            yarn_lock = os.path.join(repo_path, "yarn.lock")
-            pnpm_dir = os.path.join(repo_path, "node_modules", ".pnpm")
-            if os.path.exists(pnpm_lock) or os.path.exists(yarn_lock) or os.path.isdir(pnpm_dir):
-                print("Detected non-npm artifacts (pnpm/yarn). Cleaning to use npm...")
-                # Remove node_modules to avoid arborist crashes
-                try:
-                    import shutil
-                    shutil.rmtree(os.path.join(repo_path, "node_modules"), ignore_errors=True)
-                except Exception as _e:
-                    print(f"Warning: failed to remove node_modules: {_e}")
-                # Remove other lockfiles
-                try:
-                    if os.path.exists(pnpm_lock):
-                        os.remove(pnpm_lock)
-                except Exception:
-                    pass
-                try:
-                    if os.path.exists(yarn_lock):
-                        os.remove(yarn_lock)
-                except Exception:
-                    pass
-        except Exception as _e:
-            print(f"Warning during npm normalization: {_e}")
+        # Normalize repository to npm to avoid mixed package managers (removing
+        # a node_modules tree can take seconds, so off the event loop)
+        await asyncio.to_thread(_normalize_to_npm, repo_path)
 
         # Only install dependencies if needed
-        if _should_install_dependencies(repo_path):
-            print(f"Installing dependencies for project {project_id} with npm...")
-            install_result = subprocess.run(
-                ["npm", "install"],
-                cwd=repo_path,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minutes timeout for npm install
-            )
-            
-            if install_result.returncode != 0:
-                raise RuntimeError(f"npm install failed: {install_result.stderr}")
-            
-            # Save hash after successful install
-            _save_install_hash(repo_path)
-            print(f"Dependencies installed successfully for project {project_id} using npm")
+        if await asyncio.to_thread(_should_install_dependencies, repo_path):
+            cache = get_node_modules_cache()
+            if cache is not None and await cache.materialize(repo_path, env):
+                # Linked from the install shared by projects with the same lockfile
+                await asyncio.to_thread(_save_install_hash, repo_path)
+                ui.info(f"Dependencies for project {project_id} linked from the shared node_modules cache", "Preview")
+            else:
+                ui.info(f"Installing dependencies for project {project_id} with npm...", "Preview")
+                install = await asyncio.create_subprocess_exec(
+                    "npm", "install",
+                    cwd=repo_path,
+                    env=env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    _, install_stderr = await asyncio.wait_for(install.communicate(), timeout=120)  # 2 minutes timeout for npm install
+                except asyncio.TimeoutError:
+                    install.kill()
+                    await install.wait()
+                    raise
+                
+                if install.returncode != 0:
+                    raise RuntimeError(f"npm install failed: {install_stderr.decode('utf-8', errors='ignore')}")
+                
+                # Save hash after successful install
+                await asyncio.to_thread(_save_install_hash, repo_path)
+                ui.success(f"Dependencies installed successfully for project {project_id} using npm", "Preview")
         else:
-            print(f"Dependencies already up to date for project {project_id}, skipping npm install")
+            ui.info(f"Dependencies already up to date for project {project_id}, skipping npm install", "Preview")
         
         # Start development server
-        print(f"Starting Next.js dev server for project {project_id} on port {port}...")
-        process = subprocess.Popen(
-            ["npm", "run", "dev", "--", "-p", str(port)],
+        ui.info(f"Starting Next.js dev server for project {project_id} on port {port}...", "Preview")
+        process = await asyncio.create_subprocess_exec(
+            "npm", "run", "dev", "--", "-p", str(port),
             cwd=repo_path,
             env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            preexec_fn=os.setsid  # Create new process group for easier cleanup
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=PREVIEW_LINE_LIMIT,
+            start_new_session=True  # Create new process group for easier cleanup
         )
-        
-        # Wait a moment for the server to start
-        time.sleep(2)
-        
-        # Check if process is still running
-        if process.poll() is not None:
-            stdout, _ = process.communicate()
-            raise RuntimeError(f"Next.js server failed to start: {stdout}")
-        
-        # Start error monitoring thread
-        error_thread = threading.Thread(
-            target=_monitor_preview_errors,
-            args=(project_id, process),
-            daemon=True
-        )
-        error_thread.start()
-        print(f"[PreviewError] {project_id} 에러 모니터링 시작")
-        
-        # Store process reference
         _running_processes[project_id] = process
+        marker = asyncio.Event()
+        _monitor_tasks[project_id] = asyncio.create_task(_monitor_preview_output(project_id, process, marker))
         
-        print(f"Next.js dev server started for {project_id} on port {port} (PID: {process.pid})")
-        return process_name, port
+        # Probe readiness instead of sleeping a fixed time
+        ready = asyncio.create_task(_await_preview_ready(project_id, process, port, marker, ready_timeout))
+        ready.add_done_callback(functools.partial(_report_readiness, project_id))
+        handle = _preview_handles[project_id] = PreviewHandle(project_id, process_name, port, process, ready)
+        return handle
         
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
+        _forget_process(project_id)
         raise RuntimeError("npm install timed out after 2 minutes")
     except Exception as e:
+        _forget_process(project_id)
         raise RuntimeError(f"Failed to start preview process: {str(e)}")
 
 
-def stop_preview_process(project_id: str, cleanup_cache: bool = False) -> None:
+async def stop_preview_process(project_id: str, cleanup_cache: bool = False) -> None:
     """
     Stop the Next.js development server for a project
     
@@ -422,6 +684,11 @@ def stop_preview_process(project_id: str, cleanup_cache: bool = False) -> None:
     """
     process = _running_processes.get(project_id)
     
+    # Stop probing readiness (unless the probe itself is stopping the preview)
+    handle = _preview_handles.get(project_id)
+    if handle is not None and not handle.ready.done() and handle.ready is not asyncio.current_task():
+        handle.ready.cancel()
+    
     if process:
         try:
             # Terminate the entire process group
@@ -429,44 +696,50 @@ def stop_preview_process(project_id: str, cleanup_cache: bool = False) -> None:
             
             # Wait for process to terminate gracefully
             try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 # Force kill if it doesn't terminate gracefully
                 os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                process.wait()
+                await process.wait()
                 
-            print(f"Stopped Next.js dev server for project {project_id} (PID: {process.pid})")
+            ui.info(f"Stopped Next.js dev server for project {project_id} (PID: {process.pid})", "Preview")
             
         except (OSError, ProcessLookupError):
             # Process already terminated
             pass
         finally:
-            # Remove from registry
-            del _running_processes[project_id]
+            # Remove from registry and release the port
+            _forget_process(project_id)
+            # The output reader ends at EOF; wait for it to send what it collected
+            monitor_task = _monitor_tasks.pop(project_id, None)
+            if monitor_task is not None:
+                try:
+                    await asyncio.wait_for(monitor_task, timeout=5)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    pass
             # Clear logs when process stops
-            if project_id in _process_logs:
-                del _process_logs[project_id]
-                print(f"[PreviewStop] Cleared logs for {project_id}")
+            _clear_logs(project_id)
     
     # Optionally cleanup npm cache
     if cleanup_cache:
         try:
             repo_path = os.path.join(settings.projects_root, project_id, "repo")
             if os.path.exists(repo_path):
-                subprocess.run(
-                    ["npm", "cache", "clean", "--force"],
+                clean = await asyncio.create_subprocess_exec(
+                    "npm", "cache", "clean", "--force",
                     cwd=repo_path,
-                    capture_output=True,
-                    timeout=30
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
                 )
-                print(f"Cleaned npm cache for project {project_id}")
+                await asyncio.wait_for(clean.wait(), timeout=30)
+                ui.info(f"Cleaned npm cache for project {project_id}", "Preview")
         except Exception as e:
-            print(f"Failed to clean npm cache for {project_id}: {e}")
+            ui.warning(f"Failed to clean npm cache for {project_id}: {e}", "Preview")
 
 
-def cleanup_project_resources(project_id: str) -> None:
+async def cleanup_project_resources(project_id: str) -> None:
     """Cleanup all resources for a project"""
-    stop_preview_process(project_id, cleanup_cache=True)
+    await stop_preview_process(project_id, cleanup_cache=True)
 
 
 def preview_status(project_id: str) -> str:
@@ -482,23 +755,28 @@ def preview_status(project_id: str) -> str:
         return "not_found"
     
     # Check if process is still alive
-    if process.poll() is None:
+    if process.returncode is None:
         return "running"
     else:
         # Process has terminated, remove from registry
-        del _running_processes[project_id]
+        _forget_process(project_id)
         return "stopped"
 
 
+def get_preview_handle(project_id: str) -> Optional[PreviewHandle]:
+    """The handle of a running preview, e.g. to await its readiness"""
+    return _preview_handles.get(project_id)
+
+
 def get_running_processes() -> Dict[str, int]:
     """Get all currently running processes with their PIDs"""
     active_processes = {}
     for project_id, process in list(_running_processes.items()):
-        if process.poll() is None:
+        if process.returncode is None:
             active_processes[project_id] = process.pid
         else:
             # Clean up terminated processes
-            del _running_processes[project_id]
+            _forget_process(project_id)
     
     return active_processes
 
@@ -557,40 +835,19 @@ def get_preview_error_logs(project_id: str) -> str:
         project_id: Project identifier
     
     Returns:
-        String containing all error logs
+        String containing the stored log lines that match an error pattern
     """
-    process = _running_processes.get(project_id)
-    
-    if not process:
+    if project_id not in _running_processes:
         return "No preview process running"
     
-    # Get all available output
-    logs = []
-    try:
-        if process.stdout and hasattr(process.stdout, 'read'):
-            # Read all available data
-            import fcntl
-            import os
-            fd = process.stdout.fileno()
-            flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-            fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-            
-            try:
-                while True:
-                    line = process.stdout.readline()
-                    if not line:
-                        break
-                    logs.append(line)
-            except (IOError, OSError):
-                pass  # No more data available
-    except Exception as e:
-        return f"Error reading logs: {str(e)}"
-    
+    logs = [
+        line for line in _process_logs.get(project_id, ())
+        if _line_matcher.is_error(line)
+    ]
     if not logs:
         return "No error logs available"
     
-    # Join all logs and return
-    return ''.join(logs)
+    return '\n'.join(logs)
 
 def get_preview_logs(project_id: str, lines: int = 100) -> str:
     """
@@ -601,32 +858,28 @@ def get_preview_logs(project_id: str, lines: int = 100) -> str:
         lines: Number of lines to return
     
     Returns:
-        String containing the logs
+        String containing the most recent stored log lines
     """
-    process = _running_processes.get(project_id)
-    
-    if not process or not process.stdout:
+    if project_id not in _running_processes:
         return "No logs available - process not running or no output"
     
-    # Read available output without blocking
-    logs = []
-    try:
-        # Set stdout to non-blocking mode
-        import fcntl
-        import os
-        fd = process.stdout.fileno()
-        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-        fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-        
-        # Read available lines
-        while len(logs) < lines:
-            line = process.stdout.readline()
-            if not line:
-                break
-            logs.append(line)
-        
-    except (IOError, OSError):
-        # No more data available
-        pass
+    logs = _process_logs[project_id].tail(lines) if project_id in _process_logs else []
+    return '\n'.join(logs) if logs else "No recent logs available"
+
+
+def get_preview_logs_since(project_id: str, seq: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Get the log lines a client has not seen yet
     
-    return ''.join(logs[-lines:]) if logs else "No recent logs available"
+    Args:
+        project_id: Project identifier
+        seq: Sequence number to start from ("next" of the previous call, 0 for everything)
+        limit: Maximum number of lines to return
+    
+    Returns:
+        Dict with "lines", "first", "next" and "truncated" (see PreviewLogBuffer.since)
+    """
+    logs = _process_logs.get(project_id)
+    if logs is None:
+        return {"lines": [], "first": seq, "next": seq, "truncated": False}
+    return logs.since(seq, limit)
@@ -0,0 +1,117 @@
+"""Single-pass classification of dev server log lines.
+
+The success and error pattern sets are compiled into one regular expression,
+so a line is classified with one scan instead of one ``in`` test per
+pattern. Patterns are factored into a prefix trie first: CPython's regex
+engine tries every branch of a flat alternation at every position, while a
+trie only follows the branches whose first characters match. The combined
+expression has no capture groups, which would keep the engine from skipping
+ahead to possible first characters. Lines matching nothing, the bulk of dev
+server output, are rejected by that single scan.
+
+Where the scan finds a pattern, anchored per-category expressions tell which
+kind starts there. Success wins over error wherever the two occur in a line:
+after an error the scan resumes one character past its start, so an
+overlapping success pattern is still found. Context keywords are matched
+case-insensitively, and only when the caller asks for them (while an error
+is being collected).
+"""
+import re
+from typing import Dict, Iterable, Optional
+
+SUCCESS = "success"
+ERROR = "error"
+CONTEXT = "context"
+
+# Times and stack locations vary between repeats of the same error
+_VOLATILE = re.compile(r'\d{2}:\d{2}:\d{2}|at .*?:\d+:\d+')
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """Regex source matching any of ``words``, factored by common prefixes."""
+    root: Dict[str, dict] = {}
+    for word in words:
+        if not word:
+            continue
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ends here, so the rest is optional
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(root)
+
+
+def _compile(words: Iterable[str]) -> Optional["re.Pattern[str]"]:
+    source = trie_pattern(words)
+    return re.compile(source) if source else None
+
+
+class LineMatcher:
+    """Classifies a line as success, error, context or nothing."""
+
+    def __init__(
+        self,
+        success: Iterable[str],
+        error: Iterable[str],
+        context: Iterable[str] = (),
+    ):
+        """Compile the pattern sets.
+
+        Args:
+            success: Substrings marking a successful build or start
+            error: Substrings marking the start of an error
+            context: Substrings (matched case-insensitively) of lines that
+                belong to the error being collected
+        """
+        self.success = list(success)
+        self.error = list(error)
+        self.context = list(context)
+        self._any = _compile(self.success + self.error)
+        self._success = _compile(self.success)
+        self._error = _compile(self.error)
+        self._context = _compile(keyword.lower() for keyword in self.context)
+
+    def classify(self, line: str, context: bool = True) -> Optional[str]:
+        """Highest-priority category matched anywhere in the line, or None.
+
+        Args:
+            line: Log line
+            context: Also look for context keywords if nothing else matches
+        """
+        if self._any is not None:
+            match = self._any.search(line)
+            if match is not None:
+                while match is not None:
+                    position = match.start()
+                    if self._success is not None and self._success.match(line, position):
+                        return SUCCESS
+                    match = self._any.search(line, position + 1)
+                return ERROR
+        if context and self._context is not None and self._context.search(line.lower()):
+            return CONTEXT
+        return None
+
+    def is_error(self, line: str) -> bool:
+        """Whether the line contains an error pattern."""
+        if self._error is None:
+            return False
+        match = self._any.search(line)
+        while match is not None:
+            position = match.start()
+            if self._error.match(line, position):
+                return True
+            match = self._any.search(line, position + 1)
+        return False
+
+
+def error_fingerprint(line: str) -> str:
+    """The line without the parts that vary between repeats of an error."""
+    return _VOLATILE.sub('', line.strip())
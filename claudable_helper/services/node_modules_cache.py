@@ -0,0 +1,336 @@
+"""Content-addressed ``node_modules`` store shared by preview projects.
+
+Previews are mostly near-identical scaffolds, so instead of running
+``npm install`` in every project, dependencies are installed once per
+lockfile into ``<cache>/<digest>/node_modules`` and then materialized into
+each project with hard links (or a reflink, or a plain copy where links
+can't be made). The digest covers the lockfile without the root package's
+name and version, which is all that differs between scaffolds, plus the
+platform, CPU architecture and Node/npm major versions, so native modules
+built for one Node ABI are never linked into a preview running another.
+
+Installs for the same digest are single-flight: concurrent callers in this
+process share one install, and other processes wait on the entry's file
+lock (``.<digest>.lock``, held exclusively while installing and shared while
+linking). Entries are installed in a staging directory and renamed into
+place, so a crash never leaves a half-populated entry. Least recently used
+entries beyond ``max_entries`` are removed unless another process holds
+their lock; projects keep their linked files. Lock files are never removed,
+so every process always locks the same inode.
+
+Hard-linked files are shared with the cache, so tools must not modify files
+inside ``node_modules`` in place (npm itself replaces files rather than
+rewriting them).
+
+Configured with environment variables:
+
+- CLAUDABLE_NODE_MODULES_CACHE: Store directory (default
+  $ROUNDTABLE_HOME/node_modules_cache), or false to install per project
+- CLAUDABLE_NODE_MODULES_CACHE_MAX: Entries kept (default 20)
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from ..core.config import roundtable_home
+from ..core.terminal_ui import ui
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not on POSIX
+    fcntl = None
+
+DEFAULT_MAX_ENTRIES = 20
+# Linux ioctl that shares a file's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+# Staging directories left by a crashed install are removed after this many seconds
+STALE_STAGING_SECONDS = 24 * 3600
+
+
+@functools.lru_cache(maxsize=None)
+def runtime_tag(path: Optional[str] = None) -> str:
+    """Platform, CPU and Node/npm major versions found on ``path`` (e.g. "linux-x86_64-node20-npm10")."""
+    parts = [sys.platform, platform.machine()]
+    for tool in ("node", "npm"):
+        executable = shutil.which(tool, path=path)
+        version = ""
+        if executable:
+            try:
+                version = subprocess.run(
+                    [executable, "--version"], capture_output=True, text=True, timeout=10
+                ).stdout.strip()
+            except (OSError, subprocess.SubprocessError):
+                pass
+        parts.append(f"{tool}{version.lstrip('v').split('.')[0] or 'unknown'}")
+    return "-".join(parts)
+
+
+def lockfile_digest(repo_path: str, runtime: str = "") -> Optional[str]:
+    """Digest of the project's package-lock.json, or None if it has none.
+
+    The root package's name and version are left out, so scaffolds that only
+    differ in those share an entry; ``runtime`` (see runtime_tag) is mixed in.
+    """
+    lock_path = Path(repo_path) / "package-lock.json"
+    try:
+        lock = json.loads(lock_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(lock, dict):
+        return None
+    lock.pop("name", None)
+    lock.pop("version", None)
+    packages = lock.get("packages")
+    if isinstance(packages, dict) and isinstance(packages.get(""), dict):
+        packages[""] = {k: v for k, v in packages[""].items() if k not in ("name", "version")}
+    canonical = json.dumps(lock, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(runtime.encode("utf-8") + b"\0" + canonical).hexdigest()
+
+
+def _reflink(src: str, dst: str) -> None:
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+    shutil.copystat(src, dst)
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hard link ``src`` to ``dst``, falling back to a reflink, then a copy."""
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        pass
+    try:
+        _reflink(src, dst)
+        return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst)
+
+
+class NodeModulesCache:
+    """Installs node_modules once per lockfile digest and links them into projects."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        install_command: Sequence[str] = ("npm", "ci"),
+        install_timeout: float = 300.0,
+        runtime: Optional[str] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding one entry per lockfile digest
+            max_entries: Entries kept before the least recently used are removed
+            install_command: Command that installs node_modules from package-lock.json
+            install_timeout: Seconds an install may take
+            runtime: Runtime part of the digest (default: runtime_tag() for the install PATH)
+        """
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.install_command = list(install_command)
+        self.install_timeout = install_timeout
+        self.runtime = runtime
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def materialize(self, repo_path: str, env: Optional[Dict[str, str]] = None) -> bool:
+        """Replace the project's node_modules with the cached install for its lockfile.
+
+        Args:
+            repo_path: Project directory with package.json and package-lock.json
+            env: Environment for the install command
+
+        Returns:
+            True if node_modules now comes from the cache; False if the project
+            has no usable lockfile or the install failed (install per project then)
+        """
+        runtime = self.runtime
+        if runtime is None:
+            runtime = await asyncio.to_thread(runtime_tag, (env or os.environ).get("PATH"))
+        key = lockfile_digest(repo_path, runtime)
+        if key is None:
+            return False
+        try:
+            await self._ensure(key, repo_path, env)
+            await asyncio.to_thread(self._link_entry, key, Path(repo_path) / "node_modules")
+        except (OSError, RuntimeError, asyncio.TimeoutError) as e:
+            ui.warning(f"node_modules cache unavailable for {repo_path}: {e}", "Preview")
+            return False
+        ui.info(f"node_modules for {repo_path} linked from cache entry {key[:12]}", "Preview")
+        return True
+
+    def gc(self) -> List[str]:
+        """Remove least recently used entries beyond max_entries and stale staging directories.
+
+        Entries whose lock another process (or an in-flight link) holds are
+        skipped and removed by a later pass.
+
+        Returns:
+            Digests of the removed entries
+        """
+        if not self.root.is_dir():
+            return []
+        now = time.time()
+        entries = []
+        for path in self.root.iterdir():
+            if not path.is_dir():
+                continue
+            if path.name.startswith("."):
+                if now - path.stat().st_mtime > STALE_STAGING_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+                continue
+            # Entries being installed count as the most recently used
+            mtime = float("inf") if path.name in self._inflight else path.stat().st_mtime
+            entries.append((mtime, path))
+        entries.sort(reverse=True)
+        removed = []
+        for _, path in entries[self.max_entries:]:
+            lock_file = self._lock(path.name, blocking=False)
+            if lock_file is None:
+                continue
+            try:
+                shutil.rmtree(path, ignore_errors=True)
+            finally:
+                lock_file.close()
+            removed.append(path.name)
+        if removed:
+            ui.debug("Evicted %d node_modules cache entries", "Preview", len(removed))
+        return removed
+
+    async def _ensure(self, key: str, repo_path: str, env: Optional[Dict[str, str]]) -> Path:
+        """The entry for ``key``, installing it unless it exists or is being installed."""
+        entry = self.root / key
+        if (entry / "node_modules").is_dir():
+            os.utime(entry)
+            return entry
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._populate(key, repo_path, env))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a cancelled caller doesn't abort an install others wait for
+        return await asyncio.shield(task)
+
+    async def _populate(self, key: str, repo_path: str, env: Optional[Dict[str, str]]) -> Path:
+        entry = self.root / key
+        self.root.mkdir(parents=True, exist_ok=True)
+        lock_file = await asyncio.to_thread(self._lock, key)
+        staging = None
+        try:
+            # Another process may have installed it while we waited for the lock
+            if (entry / "node_modules").is_dir():
+                os.utime(entry)
+                return entry
+            staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.root))
+            for name in ("package.json", "package-lock.json", ".npmrc"):
+                source = Path(repo_path) / name
+                if source.exists():
+                    shutil.copy2(source, staging / name)
+            ui.info(f"Installing node_modules cache entry {key[:12]}...", "Preview")
+            process = await asyncio.create_subprocess_exec(
+                *self.install_command,
+                cwd=str(staging),
+                env=env,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=self.install_timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
+            if process.returncode != 0:
+                raise RuntimeError(
+                    f"{' '.join(self.install_command)} failed: {stderr.decode('utf-8', errors='ignore')[-2000:]}"
+                )
+            if not (staging / "node_modules").is_dir():
+                (staging / "node_modules").mkdir()
+            os.rename(staging, entry)
+            staging = None
+        finally:
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+            lock_file.close()
+        await asyncio.to_thread(self.gc)
+        return entry
+
+    def _lock(self, key: str, shared: bool = False, blocking: bool = True):
+        """Open and lock the entry's lock file.
+
+        Returns:
+            The open lock file (closing it releases the lock), or None if
+            ``blocking`` is False and another holder has it
+        """
+        lock_file = open(self.root / f".{key}.lock", "a")
+        if fcntl is not None:
+            flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            try:
+                fcntl.flock(lock_file.fileno(), flags if blocking else flags | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                return None
+        return lock_file
+
+    def _link_entry(self, key: str, target: Path) -> None:
+        """Link the entry into ``target`` while holding its lock shared, so gc can't remove it meanwhile."""
+        lock_file = self._lock(key, shared=True)
+        try:
+            source = self.root / key / "node_modules"
+            if not source.is_dir():
+                raise RuntimeError(f"cache entry {key[:12]} was evicted")
+            self._link_into(source, target)
+        finally:
+            lock_file.close()
+
+    @staticmethod
+    def _link_into(source: Path, target: Path) -> None:
+        """Replace ``target`` with a linked copy of ``source``."""
+        staging = target.with_name(f".{target.name}-{os.getpid()}-{time.monotonic_ns()}")
+        shutil.copytree(source, staging, symlinks=True, copy_function=_link_or_copy)
+        if target.is_symlink() or target.is_file():
+            target.unlink()
+        elif target.exists():
+            shutil.rmtree(target)
+        os.rename(staging, target)
+
+
+# Global cache (None when disabled)
+_node_modules_cache: Optional[NodeModulesCache] = None
+_configured = False
+
+
+def get_node_modules_cache() -> Optional[NodeModulesCache]:
+    """Get the global node_modules cache, or None if it is disabled."""
+    global _node_modules_cache, _configured
+    if not _configured:
+        _configured = True
+        setting = os.getenv("CLAUDABLE_NODE_MODULES_CACHE", "")
+        if setting.lower() not in ("false", "0", "no", "off"):
+            root = setting or str(roundtable_home() / "node_modules_cache")
+            try:
+                max_entries = int(os.getenv("CLAUDABLE_NODE_MODULES_CACHE_MAX", DEFAULT_MAX_ENTRIES))
+            except ValueError:
+                max_entries = DEFAULT_MAX_ENTRIES
+            _node_modules_cache = NodeModulesCache(Path(root).expanduser(), max_entries=max_entries)
+    return _node_modules_cache
+
+
+def reset_node_modules_cache() -> None:
+    """Forget the global cache; the environment is read again on next use."""
+    global _node_modules_cache, _configured
+    _node_modules_cache = None
+    _configured = False
@@ -0,0 +1,84 @@
+"""Port allocation for preview servers.
+
+Ports handed out are tracked in a reserved set until they are released, so
+two previews starting at the same time can't be given the same port. Released
+ports are handed out again first, without probing: the preview that held
+them has exited. Only ports the allocator doesn't track are probed, from a
+cursor that moves round the range, so a new allocation doesn't re-probe the
+ports below the ones in use.
+"""
+import socket
+import threading
+from collections import deque
+from contextlib import closing
+from typing import Callable, Deque, Set
+
+
+def is_port_free(port: int) -> bool:
+    """Check if nothing is listening on the port on localhost."""
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex(("127.0.0.1", port)) != 0
+
+
+class PortAllocator:
+    """Hands out ports from a range atomically."""
+
+    def __init__(self, start: int, end: int, probe: Callable[[int], bool] = is_port_free):
+        """Initialize the allocator.
+
+        Args:
+            start: First port of the range
+            end: Last port of the range (inclusive)
+            probe: Returns True if a port is free (injectable for tests)
+        """
+        if end < start:
+            raise ValueError(f"Empty port range {start}-{end}")
+        self.start = start
+        self.end = end
+        self._probe = probe
+        self._reserved: Set[int] = set()
+        self._released: Deque[int] = deque()
+        self._cursor = start
+        self._lock = threading.Lock()
+
+    def allocate(self) -> int:
+        """Reserve and return a free port.
+
+        Raises:
+            RuntimeError: Every port in the range is reserved or in use
+        """
+        with self._lock:
+            while self._released:
+                port = self._released.popleft()
+                if port not in self._reserved:
+                    self._reserved.add(port)
+                    return port
+            for _ in range(self.end - self.start + 1):
+                port = self._cursor
+                self._cursor = self.start if port >= self.end else port + 1
+                if port not in self._reserved and self._probe(port):
+                    self._reserved.add(port)
+                    return port
+        raise RuntimeError("No free preview port available")
+
+    def reserve(self, port: int) -> bool:
+        """Mark a port chosen by the caller as in use; False if it already was."""
+        with self._lock:
+            if port in self._reserved:
+                return False
+            self._reserved.add(port)
+            return True
+
+    def release(self, port: int) -> None:
+        """Return a port so it can be handed out again."""
+        with self._lock:
+            if port in self._reserved:
+                self._reserved.discard(port)
+                if self.start <= port <= self.end:
+                    self._released.append(port)
+
+    def reserved(self) -> Set[int]:
+        """Ports currently handed out."""
+        with self._lock:
+            return set(self._reserved)
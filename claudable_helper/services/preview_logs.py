@@ -0,0 +1,149 @@
+"""Fixed-capacity preview log storage.
+
+Each preview keeps its most recent lines in a ``deque(maxlen=capacity)``, so
+appending is O(1) and never copies the buffer. Every line gets a monotonic
+sequence number, so clients can poll for the lines after the last one they
+saw instead of re-reading the whole buffer. Lines pushed out of the buffer
+can optionally be spilled to a per-project file on disk that rotates once it
+reaches ``spill_max_bytes``.
+"""
+import itertools
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from ..core.terminal_ui import ui
+
+DEFAULT_CAPACITY = 1000
+DEFAULT_SPILL_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_SPILL_BACKUPS = 3
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class PreviewLogBuffer:
+    """Ring buffer of one preview's log lines with sequence numbers."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        spill_path: Optional[Path] = None,
+        spill_max_bytes: int = DEFAULT_SPILL_MAX_BYTES,
+        spill_backups: int = DEFAULT_SPILL_BACKUPS,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Lines kept in memory
+            spill_path: File that lines pushed out of memory are appended to (None to drop them)
+            spill_max_bytes: Size at which the spill file is rotated
+            spill_backups: Rotated spill files kept (path.1 is the newest)
+        """
+        self.capacity = capacity
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.spill_max_bytes = spill_max_bytes
+        self.spill_backups = spill_backups
+        self._lines: Deque[str] = deque(maxlen=capacity)
+        self._next_seq = 0
+        self._spill = None
+        self._spill_size = 0
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended line will get."""
+        return self._next_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest line still in memory."""
+        return self._next_seq - len(self._lines)
+
+    @property
+    def last(self) -> Optional[str]:
+        """The newest line, or None if the buffer is empty."""
+        return self._lines[-1] if self._lines else None
+
+    def append(self, line: str) -> int:
+        """Add a line and return its sequence number."""
+        if len(self._lines) == self.capacity and self.spill_path is not None:
+            self._write_spill(self._lines[0])
+        self._lines.append(line)
+        self._next_seq += 1
+        return self._next_seq - 1
+
+    def tail(self, count: int) -> List[str]:
+        """The newest ``count`` lines, oldest first."""
+        if count <= 0:
+            return []
+        start = max(0, len(self._lines) - count)
+        return list(itertools.islice(self._lines, start, None))
+
+    def since(self, seq: int, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Lines from sequence number ``seq`` on.
+
+        Args:
+            seq: First sequence number wanted (usually the previous "next")
+            limit: Maximum number of lines returned (negative counts as 0)
+
+        Returns:
+            Dict with "lines", "first" (sequence number of lines[0]), "next"
+            (sequence number to ask for next time) and "truncated" (lines
+            between ``seq`` and "first" are no longer in memory)
+        """
+        first = max(seq, self.first_seq)
+        stop = len(self._lines) if limit is None else min(len(self._lines), first - self.first_seq + max(0, limit))
+        lines = list(itertools.islice(self._lines, first - self.first_seq, stop))
+        return {
+            "lines": lines,
+            "first": first,
+            "next": first + len(lines),
+            "truncated": seq < self.first_seq,
+        }
+
+    def close(self) -> None:
+        """Flush and close the spill file."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lines)
+
+    def _write_spill(self, line: str) -> None:
+        data = (line + "\n").encode("utf-8", errors="replace")
+        try:
+            if self._spill is None:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill = open(self.spill_path, "ab")
+                self._spill_size = self._spill.tell()
+            if self._spill_size and self._spill_size + len(data) > self.spill_max_bytes:
+                self._rotate()
+            self._spill.write(data)
+            self._spill_size += len(data)
+        except OSError as e:
+            ui.warning(f"Could not spill preview log to {self.spill_path}: {e}", "Preview")
+            self.spill_path = None
+            self.close()
+
+    def _rotate(self) -> None:
+        self.close()
+        for index in range(self.spill_backups - 1, 0, -1):
+            older = self.spill_path.with_name(f"{self.spill_path.name}.{index}")
+            if older.exists():
+                os.replace(older, self.spill_path.with_name(f"{self.spill_path.name}.{index + 1}"))
+        if self.spill_backups > 0:
+            os.replace(self.spill_path, self.spill_path.with_name(f"{self.spill_path.name}.1"))
+        else:
+            self.spill_path.unlink()
+        self._spill = open(self.spill_path, "ab")
+        self._spill_size = 0
+
+
+def spill_path_for(directory: Path, project_id: str) -> Path:
+    """Spill file of a project inside ``directory``."""
+    return Path(directory) / f"{_UNSAFE_CHARS.sub('_', project_id)}.log"
@@ -0,0 +1,236 @@
+"""Background CLI availability refresher for Roundtable MCP Server.
+
+Re-runs the availability check on an interval, or sooner when a directory on
+PATH changes (a CLI was installed or removed), and reports the new set of
+available agents so the server can hot-reload its enabled subagents.
+
+PATH changes are detected with inotify on Linux and by polling directory
+mtimes everywhere else.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .availability_checker import CLIAvailabilityChecker
+except ImportError:
+    from availability_checker import CLIAvailabilityChecker
+
+logger = logging.getLogger(__name__)
+
+# inotify event mask: entries created, deleted, renamed or chmod'ed (+x)
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_PATH_WATCH_MASK = _IN_ATTRIB | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+
+def _path_directories() -> List[str]:
+    """Return the existing, de-duplicated directories listed in PATH."""
+    seen = set()
+    directories = []
+    for entry in os.environ.get("PATH", "").split(os.pathsep):
+        if entry and entry not in seen and os.path.isdir(entry):
+            seen.add(entry)
+            directories.append(entry)
+    return directories
+
+
+class _InotifyWatcher:
+    """Minimal inotify wrapper that sets an asyncio.Event on PATH changes."""
+
+    def __init__(self, directories: Iterable[str], changed: asyncio.Event):
+        self._directories = list(directories)
+        self._changed = changed
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def supported() -> bool:
+        return sys.platform.startswith("linux") and ctypes.util.find_library("c") is not None
+
+    def start(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        watched = 0
+        for directory in self._directories:
+            if libc.inotify_add_watch(fd, directory.encode(), _PATH_WATCH_MASK) >= 0:
+                watched += 1
+        if not watched:
+            os.close(fd)
+            raise OSError("inotify could not watch any PATH directory")
+
+        self._fd = fd
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(fd, self._on_readable)
+        logger.debug(f"Watching {watched} PATH directories with inotify")
+
+    def _on_readable(self) -> None:
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._changed.set()
+
+    def stop(self) -> None:
+        if self._fd is None:
+            return
+        if self._loop is not None:
+            self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
+
+class AvailabilityRefresher:
+    """Keeps the set of available CLI agents up to date in the background.
+
+    The refresher only computes availability; applying the result (updating
+    ``enabled_subagents``, notifying clients) is left to the ``on_change``
+    callback so adapters, warm ACP clients and caches are never touched.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[Set[str]], Awaitable[None]],
+        interval: float = 300.0,
+        checker: Optional[CLIAvailabilityChecker] = None,
+        current: Optional[Iterable[str]] = None,
+        poll_interval: float = 5.0,
+        debounce: float = 1.0,
+        watch_path: bool = True,
+    ):
+        """Initialize the refresher.
+
+        Args:
+            on_change: Coroutine called with the new set of available agents
+            interval: Seconds between unconditional availability checks
+            checker: Availability checker to use (defaults to ~/.roundtable cache)
+            current: Agents currently enabled, used to detect changes
+            poll_interval: Seconds between PATH polls when inotify is unavailable
+            debounce: Seconds to wait after a PATH change before re-checking
+            watch_path: Whether to re-check when PATH directories change
+        """
+        self.on_change = on_change
+        self.interval = interval
+        self.checker = checker or CLIAvailabilityChecker()
+        self.current: Set[str] = set(current or ())
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.watch_path = watch_path
+
+        self._path_changed = asyncio.Event()
+        self._watcher: Optional[_InotifyWatcher] = None
+        self._path_signature: Tuple[Tuple[str, int], ...] = ()
+        self._task: Optional[asyncio.Task] = None
+        self._poll_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start watching PATH and refreshing availability."""
+        if self._task is not None:
+            return
+
+        if self.watch_path:
+            directories = _path_directories()
+            if _InotifyWatcher.supported():
+                try:
+                    self._watcher = _InotifyWatcher(directories, self._path_changed)
+                    self._watcher.start()
+                except OSError as e:
+                    logger.debug(f"inotify unavailable, polling PATH instead: {e}")
+                    self._watcher = None
+            if self._watcher is None:
+                self._path_signature = self._compute_path_signature()
+                self._poll_task = asyncio.create_task(self._poll_path())
+
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Availability refresher started (interval: {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the refresher and release the PATH watcher."""
+        for task in (self._task, self._poll_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._poll_task = None
+
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    async def refresh(self) -> Set[str]:
+        """Re-check availability now and invoke ``on_change`` if it changed.
+
+        Returns:
+            The set of available agents after the check
+        """
+        results = await self.checker.check_all_availability()
+        try:
+            self.checker.save_availability_results(results)
+        except Exception as e:
+            logger.warning(f"Could not persist refreshed availability: {e}")
+
+        available = {
+            name for name, data in results.items()
+            if not name.startswith("_") and isinstance(data, dict) and data.get("available", False)
+        }
+
+        if available != self.current:
+            added = sorted(available - self.current)
+            removed = sorted(self.current - available)
+            logger.info(f"Agent availability changed (added: {added}, removed: {removed})")
+            self.current = available
+            await self.on_change(set(available))
+
+        return available
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._path_changed.wait(), timeout=self.interval)
+                # Installers touch PATH several times; let them settle first
+                await asyncio.sleep(self.debounce)
+                logger.debug("PATH changed, refreshing agent availability")
+            except asyncio.TimeoutError:
+                pass
+            self._path_changed.clear()
+
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Availability refresh failed: {e}")
+
+    async def _poll_path(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            signature = self._compute_path_signature()
+            if signature != self._path_signature:
+                self._path_signature = signature
+                self._path_changed.set()
+
+    @staticmethod
+    def _compute_path_signature() -> Tuple[Tuple[str, int], ...]:
+        signature = []
+        for directory in _path_directories():
+            try:
+                signature.append((directory, Path(directory).stat().st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(signature)
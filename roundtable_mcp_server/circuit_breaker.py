@@ -0,0 +1,181 @@
+"""Per-agent circuit breakers for Roundtable MCP Server.
+
+Each agent gets a breaker that watches the failure rate of its executions
+over a sliding time window:
+
+- closed: calls go through; once at least ``min_calls`` finished in the
+  window and the failure rate reaches ``failure_rate_threshold``, it opens
+- open: calls fail fast with CircuitOpenError until ``open_duration`` passes
+- half-open: up to ``half_open_max_calls`` trial calls go through; a success
+  closes the circuit, a failure opens it again
+
+This keeps a broken CLI (missing binary, expired credentials, crashing
+provider) from paying the spawn-and-fail cost on every call.
+"""
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker over a sliding window."""
+
+    def __init__(
+        self,
+        name: str,
+        window: float = 60.0,
+        min_calls: int = 5,
+        failure_rate_threshold: float = 0.5,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            name: Name used in log messages (the agent)
+            window: Seconds of call outcomes considered for the failure rate
+            min_calls: Outcomes needed in the window before the circuit can open
+            failure_rate_threshold: Failure rate (0-1) that opens the circuit
+            open_duration: Seconds to fail fast before allowing a trial call
+            half_open_max_calls: Concurrent trial calls allowed while half-open
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit turns half-open once its timeout passes)."""
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self.open_duration:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+            logger.info(f"Circuit for {self.name} half-open; allowing a trial call")
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit allows a trial call."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.open_duration - (self._clock() - self._opened_at))
+
+    def failure_rate(self) -> float:
+        """Failure rate over the current window."""
+        self._expire(self._clock())
+        return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may proceed; a True while half-open claims a trial slot."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+            self._trial_calls += 1
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info(f"Circuit for {self.name} closed after a successful trial call")
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+            self._failures = 0
+            return
+        self._record(False)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._open("trial call failed")
+            return
+        self._record(True)
+        if (
+            self._state == CircuitState.CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self._failures / len(self._outcomes) >= self.failure_rate_threshold
+        ):
+            self._open(f"{self._failures}/{len(self._outcomes)} calls failed in the last {self.window:.0f}s")
+
+    def release(self) -> None:
+        """Give back a trial slot for a call that ended without an outcome (e.g. cancelled)."""
+        if self._state == CircuitState.HALF_OPEN and self._trial_calls > 0:
+            self._trial_calls -= 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return the breaker state for stats reporting."""
+        return {
+            "state": self.state.value,
+            "failure_rate": round(self.failure_rate(), 3),
+            "calls_in_window": len(self._outcomes),
+            "retry_after": round(self.retry_after(), 1),
+        }
+
+    def _record(self, failed: bool) -> None:
+        now = self._clock()
+        self._outcomes.append((now, failed))
+        self._failures += failed
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def _open(self, reason: str) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self._failures = 0
+        logger.warning(f"Circuit for {self.name} opened ({reason}); failing fast for {self.open_duration:.0f}s")
+
+
+# Global breakers, one per agent
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(agent: str) -> CircuitBreaker:
+    """Get or create the circuit breaker for ``agent``."""
+    breaker = _breakers.get(agent)
+    if breaker is None:
+        breaker = _breakers[agent] = CircuitBreaker(agent)
+    return breaker
+
+
+def circuit_state(agent: str) -> CircuitState:
+    """State of ``agent``'s breaker without creating one (closed if none exists)."""
+    breaker = _breakers.get(agent)
+    return breaker.state if breaker is not None else CircuitState.CLOSED
+
+
+def circuit_snapshots() -> Dict[str, Dict[str, object]]:
+    """State of every breaker created so far, keyed by agent."""
+    return {agent: breaker.snapshot() for agent, breaker in sorted(_breakers.items())}
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all breakers (every agent starts closed again)."""
+    _breakers.clear()
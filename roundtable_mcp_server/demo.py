@@ -79,7 +79,7 @@ def main():
     print_section("Environment Variables", "🌍")
     print("- CLI_MCP_SUBAGENTS: Comma-separated list (default: all)")
     print("- CLI_MCP_WORKING_DIR: Working directory (default: current)")
-    print("- CLI_MCP_DEBUG: Enable debug logging (default: true)")
+    print("- CLI_MCP_DEBUG: Enable debug logging (default: false)")
 
     print_section("Logs and Debugging", "🔍")
     print("- Debug logs are written to: roundtable_mcp_server.log")
@@ -132,3 +132,25 @@ def log_error_with_context(
             extra={"context": context},
             exc_info=True
         )
+
+
+def handle_agent_error(
+    error: Exception,
+    agent_name: str,
+    instruction: Optional[str] = None
+) -> str:
+    """Log an unexpected agent failure and format it for the MCP client.
+    
+    Args:
+        error: The exception raised while executing the agent
+        agent_name: Name of the agent that failed
+        instruction: Instruction being executed, logged for context
+    
+    Returns:
+        Formatted error message
+    """
+    context = {"agent": agent_name}
+    if instruction:
+        context["instruction"] = instruction[:200]
+    log_error_with_context(error, f"{agent_name}_subagent", context)
+    return format_error_response(error, agent_name)
@@ -39,6 +39,17 @@ class AgentExecutionError(RoundtableError):
         super().__init__(full_message, "AGENT_EXECUTION_ERROR", context or {"agent": agent_name})
 
 
+class CircuitOpenError(RoundtableError):
+    """Agent calls are short-circuited after repeated failures."""
+    
+    def __init__(self, agent_name: str, retry_after: float, context: dict = None):
+        message = (
+            f"Agent '{agent_name}' is failing repeatedly; calls are paused "
+            f"for another {retry_after:.0f}s before it is tried again"
+        )
+        super().__init__(message, "CIRCUIT_OPEN", context or {"agent": agent_name, "retry_after": round(retry_after)})
+
+
 class StreamingError(RoundtableError):
     """Error during message streaming."""
     
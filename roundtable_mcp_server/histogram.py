@@ -0,0 +1,132 @@
+"""Streaming latency histograms for Roundtable MCP Server metrics.
+
+Values are counted in logarithmic buckets, so recording is O(1), memory is
+bounded by the dynamic range rather than the number of samples, and any
+percentile is accurate to within the bucket growth factor (~5% by default).
+"""
+import math
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+# Latencies below this (seconds) share the first bucket
+MIN_VALUE = 0.001
+# Ratio between consecutive bucket upper bounds
+GROWTH = 1.05
+_LOG_GROWTH = math.log(GROWTH)
+
+
+def bucket_index(value: float) -> int:
+    """Return the log bucket index holding ``value``."""
+    if value <= MIN_VALUE:
+        return 0
+    return int(math.ceil(math.log(value / MIN_VALUE) / _LOG_GROWTH))
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Return the largest value that falls into bucket ``index``."""
+    return MIN_VALUE * GROWTH ** index
+
+
+class LogHistogram:
+    """Log-bucketed histogram of non-negative values."""
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add one observation."""
+        index = bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Add all observations from ``other`` into this histogram."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the approximate ``q`` quantile (0..1), or None if empty."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(bucket_upper_bound(index), self.min), self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds: Iterable[float]) -> Dict[float, int]:
+        """Return approximate counts of observations <= each bound."""
+        result = {}
+        items = sorted(self.buckets.items())
+        for bound in bounds:
+            result[bound] = sum(count for index, count in items if bucket_upper_bound(index) <= bound)
+        return result
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Return count, mean, max and p50/p95/p99."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4),
+            "p50": round(self.quantile(0.50), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "p99": round(self.quantile(0.99), 4),
+            "max": round(self.max, 4),
+        }
+
+
+class WindowedHistogram:
+    """Histogram over a sliding time window, plus an all-time total.
+
+    Observations go into fixed-width time slices; a window is answered by
+    merging the slices it covers, so recording stays O(1) and old data ages
+    out without any per-sample bookkeeping.
+    """
+
+    def __init__(
+        self,
+        slice_seconds: float = 60.0,
+        max_slices: int = 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.slice_seconds = slice_seconds
+        self.clock = clock
+        self.total = LogHistogram()
+        self._slices: Deque[Tuple[int, LogHistogram]] = deque(maxlen=max_slices)
+
+    def record(self, value: float, now: Optional[float] = None) -> None:
+        """Add one observation at time ``now`` (defaults to the clock)."""
+        slot = int((self.clock() if now is None else now) // self.slice_seconds)
+        if not self._slices or self._slices[-1][0] != slot:
+            self._slices.append((slot, LogHistogram()))
+        self._slices[-1][1].record(value)
+        self.total.record(value)
+
+    def window(self, seconds: float, now: Optional[float] = None) -> LogHistogram:
+        """Return a histogram of the observations from the last ``seconds``."""
+        current = int((self.clock() if now is None else now) // self.slice_seconds)
+        oldest = current - max(1, math.ceil(seconds / self.slice_seconds)) + 1
+        merged = LogHistogram()
+        for slot, histogram in self._slices:
+            if slot >= oldest:
+                merged.merge(histogram)
+        return merged
@@ -0,0 +1,215 @@
+"""Full-text index over subagent transcripts for Roundtable MCP Server.
+
+When a run finishes, its text messages (instruction, answers, tool calls,
+errors) are queued and inserted into an SQLite FTS5 table in one
+transaction on a dedicated worker thread, so indexing never runs on the
+event loop and a burst of finished runs becomes a single batch. Searches run
+on the same thread and return BM25-ranked snippets.
+
+The index lives next to the transcripts (``history.db``) and only covers runs
+that finished while it existed; the transcripts stay the source of truth.
+"""
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Message types worth searching; system/progress chatter is left out
+INDEXED_TYPES = frozenset({"instruction", "chat", "assistant", "result", "tool_use", "error"})
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages USING fts5(
+    content,
+    run UNINDEXED,
+    agent UNINDEXED,
+    project UNINDEXED,
+    type UNINDEXED,
+    seq UNINDEXED,
+    ts UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+Row = Tuple[str, str, str, Optional[str], str, int, float]
+
+
+class HistorySearchError(Exception):
+    """The history index could not be searched."""
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching all of its words.
+
+    Every word becomes a quoted string (quotes doubled), so FTS5 operators
+    and punctuation in user input are never parsed as query syntax.
+    """
+    return " ".join('"{}"'.format(token.replace('"', '""')) for token in _TOKEN.findall(text))
+
+
+class HistoryIndex:
+    """SQLite FTS5 index of transcript messages, written in batches."""
+
+    def __init__(self, path: Path):
+        """Initialize the index.
+
+        Args:
+            path: SQLite database file (created on first use)
+        """
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: List[Row] = []
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-index")
+
+    def add_run(
+        self,
+        run_id: str,
+        agent: str,
+        project: Optional[str],
+        messages: List[Tuple[int, str, str]],
+    ) -> None:
+        """Queue a finished run's (seq, type, content) messages for indexing."""
+        now = time.time()
+        rows = [
+            (content, run_id, agent, project, message_type, seq, now)
+            for seq, message_type, content in messages
+            if message_type in INDEXED_TYPES and content and content.strip()
+        ]
+        if not rows:
+            return
+        with self._pending_lock:
+            self._pending.extend(rows)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._executor.submit(self._flush)
+
+    async def search(
+        self,
+        query: str,
+        agent: Optional[str] = None,
+        project: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Best-matching messages first.
+
+        Args:
+            query: Free text; every word must match (stemmed)
+            agent: Only messages from this agent
+            project: Only runs in this project path
+            since: Only runs finished after this UNIX timestamp
+            limit: Maximum number of results
+
+        Raises:
+            HistorySearchError: The database is unavailable, locked or lacks FTS5
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._search, query, agent, project, since, limit)
+
+    def prune(self, before: float) -> None:
+        """Drop messages indexed before the UNIX timestamp ``before`` (in the background)."""
+        self._executor.submit(self._prune, before)
+
+    def flush(self) -> None:
+        """Wait until every queued run has been indexed."""
+        self._executor.submit(self._flush).result()
+
+    def close(self) -> None:
+        """Index what is queued, then close the database."""
+        self._executor.submit(self._flush)
+        self._executor.submit(self._close).result()
+        self._executor.shutdown(wait=True)
+
+    # ---- Worker thread ----------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _flush(self) -> None:
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+            self._flush_scheduled = False
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO messages (content, run, agent, project, type, seq, ts) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            logger.debug(f"Indexed {len(rows)} transcript messages")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not index {len(rows)} transcript messages: {e}")
+
+    def _prune(self, before: float) -> None:
+        try:
+            conn = self._connect()
+            with conn:
+                removed = conn.execute("DELETE FROM messages WHERE ts < ?", (before,)).rowcount
+            logger.debug(f"Removed {removed} old messages from the history index")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not prune the history index: {e}")
+
+    def _search(
+        self,
+        query: str,
+        agent: Optional[str],
+        project: Optional[str],
+        since: Optional[float],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        match = fts_query(query)
+        if not match:
+            return []
+        sql = (
+            "SELECT run, agent, project, type, seq, ts, "
+            "snippet(messages, 0, '[', ']', '…', 16), bm25(messages) "
+            "FROM messages WHERE messages MATCH ?"
+        )
+        params: List[Any] = [match]
+        if agent:
+            sql += " AND agent = ?"
+            params.append(agent)
+        if project:
+            sql += " AND project = ?"
+            params.append(project)
+        if since is not None:
+            sql += " AND ts >= ?"
+            params.append(since)
+        sql += " ORDER BY bm25(messages) LIMIT ?"
+        params.append(limit)
+
+        try:
+            rows = self._connect().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"History search for {query!r} failed: {e}")
+            raise HistorySearchError(str(e)) from e
+        return [
+            {
+                "run": run, "agent": row_agent, "project": row_project, "type": message_type,
+                "seq": seq, "ts": ts, "snippet": snippet, "score": round(-score, 3),
+            }
+            for run, row_agent, row_project, message_type, seq, ts, snippet, score in rows
+        ]
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
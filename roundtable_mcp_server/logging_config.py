@@ -0,0 +1,158 @@
+"""Asynchronous, structured logging for Roundtable MCP Server.
+
+Log calls on the event-loop thread only truncate the record and put it on a
+queue; a QueueListener thread does all formatting and I/O. The log file is
+JSON lines with size-based rotation, stderr gets a human-readable format.
+
+Configured with environment variables:
+
+- CLI_MCP_LOG_LEVEL: Root log level (default INFO)
+- CLI_MCP_LOG_MAX_BYTES: Rotate the log file at this size (default 10 MiB)
+- CLI_MCP_LOG_BACKUPS: Number of rotated files to keep (default 5)
+- CLI_MCP_LOG_FIELD_CHARS: Budget for message and string fields (default 2000, 0 = unlimited)
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def truncate(text: str, limit: int) -> str:
+    """Cut ``text`` to ``limit`` characters, noting how much was dropped."""
+    if limit and len(text) > limit:
+        return f"{text[:limit]}... [truncated {len(text) - limit} chars]"
+    return text
+
+
+class ContentBudgetQueueHandler(QueueHandler):
+    """QueueHandler that truncates content fields before enqueueing.
+
+    Only the cheap work happens on the caller's thread: merging args into the
+    message, slicing it to the budget and rendering any traceback.
+    """
+
+    def __init__(self, log_queue, max_field_chars: int = 2000):
+        super().__init__(log_queue)
+        self.max_field_chars = max_field_chars
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = truncate(record.getMessage(), self.max_field_chars)
+        record.args = None
+        if record.exc_info:
+            record.exc_text = truncate(
+                logging.Formatter().formatException(record.exc_info), self.max_field_chars * 4
+            )
+            record.exc_info = None
+        for key, value in list(record.__dict__.items()):
+            if key not in _RECORD_ATTRS and isinstance(value, str):
+                setattr(record, key, truncate(value, self.max_field_chars))
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def setup_logging(
+    log_file: Path,
+    level: Any = None,
+    max_bytes: Optional[int] = None,
+    backup_count: Optional[int] = None,
+    max_field_chars: Optional[int] = None,
+    stream: Optional[TextIO] = None,
+) -> QueueListener:
+    """Route root logging through a queue to a rotating JSON file and stderr.
+
+    Arguments left as None are read from the CLI_MCP_LOG_* environment
+    variables. Calling it again replaces the previous pipeline.
+
+    Returns:
+        The running QueueListener (stopped automatically at exit)
+    """
+    global _listener, _queue_handler
+
+    if level is None:
+        level = os.getenv("CLI_MCP_LOG_LEVEL", "INFO").upper()
+    if isinstance(level, str):
+        level = logging.getLevelName(level)
+        if not isinstance(level, int):
+            level = logging.INFO
+    if max_bytes is None:
+        max_bytes = _env_int("CLI_MCP_LOG_MAX_BYTES", 10 * 1024 * 1024)
+    if backup_count is None:
+        backup_count = _env_int("CLI_MCP_LOG_BACKUPS", 5)
+    if max_field_chars is None:
+        max_field_chars = _env_int("CLI_MCP_LOG_FIELD_CHARS", 2000)
+
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+    )
+    file_handler.setFormatter(JsonFormatter())
+    stream_handler = logging.StreamHandler(stream or sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+    if _listener is not None:
+        _listener.stop()
+
+    _queue_handler = ContentBudgetQueueHandler(log_queue, max_field_chars)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    listener.start()
+    if _listener is None:
+        atexit.register(shutdown_logging)
+    _listener = listener
+    return listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
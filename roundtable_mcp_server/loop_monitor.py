@@ -0,0 +1,104 @@
+"""Event-loop lag monitor for Roundtable MCP Server.
+
+Every agent stream, the stdio transport and the metrics writer share one
+asyncio loop, so a single blocking call stalls all of them. The monitor:
+
+- wakes up at a fixed interval and records how late it was scheduled
+  (the loop lag) into a histogram reported through the metrics surface
+- runs a watchdog thread that, when the loop is late by more than the
+  slow-callback threshold, logs the stack of whatever is blocking it
+- sets ``loop.slow_callback_duration`` to the same threshold, so asyncio's
+  own slow-callback warnings agree when debug mode (PYTHONASYNCIODEBUG=1)
+  is on
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Samples event-loop scheduling delay and reports blocking callbacks."""
+
+    def __init__(
+        self,
+        on_lag: Optional[Callable[[float], None]] = None,
+        interval: float = 0.25,
+        slow_callback_threshold: float = 0.1,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            on_lag: Called on the loop with each lag sample in seconds
+            interval: Seconds between lag samples
+            slow_callback_threshold: Lag in seconds above which the blocking stack is logged
+        """
+        self.on_lag = on_lag
+        self.interval = interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self.stalls = 0
+
+        self._deadline = 0.0
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        """Start sampling lag on the running loop."""
+        if self._task is not None:
+            return
+        loop = asyncio.get_running_loop()
+        loop.slow_callback_duration = self.slow_callback_threshold
+        self._loop_thread_id = threading.get_ident()
+        self._deadline = time.monotonic() + self.interval
+        self._stopped.clear()
+
+        self._task = asyncio.create_task(self._sample())
+        self._watchdog = threading.Thread(target=self._watch, name="roundtable-loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.debug(f"Event-loop monitor started (threshold: {self.slow_callback_threshold * 1000:.0f}ms)")
+
+    async def stop(self) -> None:
+        """Stop sampling and the watchdog thread."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _sample(self) -> None:
+        while True:
+            self._deadline = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - self._deadline)
+            if self.on_lag is not None:
+                self.on_lag(lag)
+
+    def _watch(self) -> None:
+        reported_deadline = None
+        while not self._stopped.wait(self.slow_callback_threshold / 2):
+            deadline = self._deadline
+            lag = time.monotonic() - deadline
+            if lag <= self.slow_callback_threshold or deadline == reported_deadline:
+                continue
+            reported_deadline = deadline
+            self.stalls += 1
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "<unavailable>\n"
+            logger.warning(
+                f"Event loop blocked for {lag * 1000:.0f}ms (threshold "
+                f"{self.slow_callback_threshold * 1000:.0f}ms); blocking stack:\n{stack}"
+            )
@@ -3,17 +3,27 @@
 This module is OPTIONAL and disabled by default.
 Enable with CLI_MCP_METRICS=true environment variable.
 """
+import asyncio
+import gzip
 import json
 import logging
+import shutil
+import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
+from .histogram import LogHistogram, WindowedHistogram
+
 logger = logging.getLogger(__name__)
 
+# ExecutionMetric.error for executions that were cancelled (e.g. a hedging loser)
+CANCELLED = "cancelled"
+
 
 @dataclass
 class ExecutionMetric:
@@ -26,18 +36,138 @@ class ExecutionMetric:
     message_count: int = 0
     tool_uses: int = 0
     session_id: Optional[str] = None
+    model: Optional[str] = None
+    time_to_first_token: Optional[float] = None
+    time_to_first_tool_call: Optional[float] = None
+    bytes_received: int = 0
+    # Seconds since the execution started at which each phase was first reached
+    phases: Dict[str, float] = field(default_factory=dict)
+    tool_call_offsets: List[float] = field(default_factory=list)
+
+
+class ExecutionTrace:
+    """Phase timestamps and stream counters for one in-flight execution.
+
+    Phases ("availability_checked", "spawned", "session_ready", "first_token",
+    "first_tool_call", "completed") are stored on the metric as offsets in
+    seconds from the start of the execution; only the first mark counts.
+    """
+
+    def __init__(self, metric: ExecutionMetric, clock=time.monotonic):
+        self.metric = metric
+        self._clock = clock
+        self._start = clock()
+
+    def elapsed(self) -> float:
+        """Seconds since the execution started."""
+        return self._clock() - self._start
+
+    def mark(self, phase: str) -> None:
+        """Record that the execution reached ``phase``."""
+        if phase not in self.metric.phases:
+            self.metric.phases[phase] = round(self.elapsed(), 4)
+
+    def observe(self, message) -> None:
+        """Update counters and first-token/tool-call timings from a streamed message."""
+        metric = self.metric
+        metric.message_count += 1
+
+        content = getattr(message, "content", None)
+        if content:
+            metric.bytes_received += len(str(content).encode("utf-8", "replace"))
+
+        msg_type = getattr(message, "message_type", None)
+        msg_type = getattr(msg_type, "value", msg_type)
+        if msg_type == "tool_use":
+            offset = round(self.elapsed(), 4)
+            metric.tool_uses += 1
+            metric.tool_call_offsets.append(offset)
+            if metric.time_to_first_tool_call is None:
+                metric.time_to_first_tool_call = offset
+                self.mark("first_tool_call")
+        elif (
+            metric.time_to_first_token is None
+            and content
+            and getattr(message, "role", None) == "assistant"
+        ):
+            metric.time_to_first_token = round(self.elapsed(), 4)
+            self.mark("first_token")
+
+
+def _outcome(metric: "ExecutionMetric") -> str:
+    """Series outcome label: "success", "error" or "cancelled"."""
+    if metric.success:
+        return "success"
+    return "cancelled" if metric.error == CANCELLED else "error"
+
+
+class SeriesStats:
+    """Streaming aggregates for one (agent, model, outcome) series."""
+
+    def __init__(self):
+        self.duration = WindowedHistogram()
+        self.time_to_first_token = WindowedHistogram()
+        self.time_to_first_tool_call = WindowedHistogram()
+
+    def record(self, metric: "ExecutionMetric", now: Optional[float] = None):
+        self.duration.record(metric.duration_seconds, now)
+        if metric.time_to_first_token is not None:
+            self.time_to_first_token.record(metric.time_to_first_token, now)
+        if metric.time_to_first_tool_call is not None:
+            self.time_to_first_tool_call.record(metric.time_to_first_tool_call, now)
 
 
 class MetricsCollector:
-    """Collects and stores execution metrics."""
+    """Collects and stores execution metrics.
+
+    Recent metrics are kept in a fixed-size ring buffer. Once ``start()`` has
+    been awaited, records are handed to a background writer through an
+    ``asyncio.Queue`` and appended to the JSONL file in batches from a worker
+    thread; before that (or without a running loop) they are written inline.
+    All-time per-agent rollups are persisted next to the JSONL file.
+    """
     
-    def __init__(self, enabled: bool = False, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        enabled: bool = False,
+        storage_path: Optional[Path] = None,
+        max_history: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_file_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 3,
+    ):
         self.enabled = enabled
         self.storage_path = storage_path or Path.home() / ".roundtable" / "metrics.jsonl"
-        self.metrics: List[ExecutionMetric] = []
+        self.rollup_path = self.storage_path.with_name(self.storage_path.stem + "_rollup.json")
+        self.metrics: Deque[ExecutionMetric] = deque(maxlen=max_history)
+        self.series: Dict[Tuple[str, str, str], SeriesStats] = {}
+        # In-flight executions per agent (each holds a CLI subprocess or ACP session)
+        self.active: Dict[str, int] = {}
+        # Successful traced executions that spawned a process vs. reused a warm one
+        self.process_reuse: Dict[str, Dict[str, int]] = {}
+        # Event-loop scheduling delay samples (see loop_monitor.py)
+        self.loop_lag = WindowedHistogram()
+        # Hedged/raced calls: wins per (mode, agent) and estimated latency saved
+        self.hedge_wins: Dict[Tuple[str, str], int] = {}
+        self.hedge_saved = WindowedHistogram()
+        self.rollups: Dict[str, Dict[str, float]] = {}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._write_lock = threading.Lock()
+        self._rollup_version = 0
+        self._rollups_saved = 0
         
         if self.enabled:
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+            self._load_rollups()
             logger.info(f"Metrics collection enabled: {self.storage_path}")
     
     @contextmanager
@@ -53,24 +183,46 @@ class MetricsCollector:
             yield None
             return
         
+        with self.trace_execution(agent, session_id=session_id) as trace:
+            yield trace.metric
+    
+    @contextmanager
+    def trace_execution(
+        self,
+        agent: str,
+        session_id: Optional[str] = None,
+        model: Optional[str] = None
+    ):
+        """Context manager yielding an ExecutionTrace for per-phase timing.
+        
+        A trace is yielded even when collection is disabled so callers can
+        instrument unconditionally; it is only recorded when enabled.
+        """
         start_time = time.time()
-        metric = ExecutionMetric(
+        trace = ExecutionTrace(ExecutionMetric(
             agent=agent,
             timestamp=datetime.now().isoformat(),
             duration_seconds=0.0,
             success=False,
-            session_id=session_id
-        )
+            session_id=session_id,
+            model=model
+        ))
         
+        self.active[agent] = self.active.get(agent, 0) + 1
         try:
-            yield metric
-            metric.success = True
+            yield trace
+            trace.metric.success = True
+        except asyncio.CancelledError:
+            trace.metric.error = CANCELLED
+            raise
         except Exception as e:
-            metric.error = str(e)
+            trace.metric.error = str(e)
             raise
         finally:
-            metric.duration_seconds = time.time() - start_time
-            self.record(metric)
+            self.active[agent] -= 1
+            trace.mark("completed")
+            trace.metric.duration_seconds = time.time() - start_time
+            self.record(trace.metric)
     
     def record(self, metric: ExecutionMetric):
         """Record a metric."""
@@ -78,50 +230,327 @@ class MetricsCollector:
             return
         
         self.metrics.append(metric)
+        self._update_series(metric)
+        if metric.success and metric.phases:
+            reuse = self.process_reuse.setdefault(metric.agent, {"spawned": 0, "reused": 0})
+            reuse["spawned" if "spawned" in metric.phases else "reused"] += 1
+        self._update_rollup(metric)
+        
+        if self._queue is None:
+            # No background writer running: write inline
+            self._write_batch([json.dumps(asdict(metric))], self._rollup_snapshot())
+            return
+        
+        line = json.dumps(asdict(metric))
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._enqueue(line)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, line)
+    
+    async def start(self):
+        """Start the background batch writer on the running event loop."""
+        if not self.enabled or self._writer_task is not None:
+            return
+        
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.batch_size * 100)
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        logger.debug("Metrics background writer started")
+    
+    async def stop(self):
+        """Flush pending records and stop the background writer."""
+        if self._writer_task is None:
+            return
+        
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
         
-        # Append to file
+        # Drain whatever the writer had not picked up yet
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending:
+            await self._loop.run_in_executor(None, self._write_batch, pending, self._rollup_snapshot())
+        
+        self._writer_task = None
+        self._queue = None
+        self._loop = None
+        logger.debug("Metrics background writer stopped")
+    
+    def _enqueue(self, line: str):
+        if self._queue is None:
+            self._write_batch([line], self._rollup_snapshot())
+            return
         try:
-            with open(self.storage_path, 'a') as f:
-                f.write(json.dumps(asdict(metric)) + '\n')
+            self._queue.put_nowait(line)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Metrics queue full, dropped {self.dropped} record(s)")
+    
+    async def _writer_loop(self):
+        loop = asyncio.get_running_loop()
+        batch: List[str] = []
+        try:
+            while True:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                lines, batch = batch, []
+                await loop.run_in_executor(None, self._write_batch, lines, self._rollup_snapshot())
+        except asyncio.CancelledError:
+            if batch:
+                await loop.run_in_executor(None, self._write_batch, batch, self._rollup_snapshot())
+            raise
+    
+    def _write_batch(self, lines: List[str], rollups: Tuple[int, str]):
+        """Append lines to the JSONL file, rotating it first if it is too large.
+
+        ``rollups`` is a snapshot from _rollup_snapshot(), taken on the thread
+        that updates the rollups, so this can run on an executor thread.
+        """
+        with self._write_lock:
+            try:
+                self._rotate_if_needed()
+                with open(self.storage_path, 'a') as f:
+                    f.write("\n".join(lines) + "\n")
+            except Exception as e:
+                logger.warning(f"Failed to write {len(lines)} metric(s): {e}")
+            try:
+                self._save_rollups(*rollups)
+            except Exception as e:
+                logger.warning(f"Failed to save metric rollups: {e}")
+    
+    def _rotate_if_needed(self):
+        try:
+            if self.storage_path.stat().st_size < self.max_file_bytes:
+                return
+        except FileNotFoundError:
+            return
+        
+        # metrics.jsonl.2.gz -> metrics.jsonl.3.gz, ..., metrics.jsonl -> metrics.jsonl.1.gz
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.storage_path.with_name(f"{self.storage_path.name}.{index}.gz")
+            if source.exists():
+                source.replace(self.storage_path.with_name(f"{self.storage_path.name}.{index + 1}.gz"))
+        
+        if self.backup_count > 0:
+            target = self.storage_path.with_name(f"{self.storage_path.name}.1.gz")
+            with open(self.storage_path, 'rb') as src, gzip.open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        self.storage_path.unlink()
+        logger.info(f"Rotated metrics file: {self.storage_path}")
+    
+    def record_loop_lag(self, lag_seconds: float):
+        """Record one event-loop lag sample."""
+        if self.enabled:
+            self.loop_lag.record(lag_seconds)
+    
+    def record_hedge(self, mode: str, winner: str, latency: float, saved: Optional[float] = None):
+        """Record the outcome of a hedged or raced call.
+        
+        Args:
+            mode: "hedge" or "race"
+            winner: Agent whose result was used
+            latency: Seconds until the winning result arrived
+            saved: Estimated seconds saved versus waiting for the primary agent
+        """
+        if not self.enabled:
+            return
+        key = (mode, winner)
+        self.hedge_wins[key] = self.hedge_wins.get(key, 0) + 1
+        if saved is not None:
+            self.hedge_saved.record(saved)
+        logger.debug(f"Hedged call ({mode}) won by {winner} in {latency:.2f}s, saved {saved}")
+    
+    def latency_quantile(self, agent: str, q: float, min_count: int = 5) -> Optional[float]:
+        """Quantile of successful execution durations for ``agent`` since startup.
+        
+        Returns None until at least ``min_count`` successful executions were recorded.
+        """
+        merged = LogHistogram()
+        for (series_agent, _model, series_outcome), stats in self.series.items():
+            if series_agent == agent and series_outcome == "success":
+                merged.merge(stats.duration.total)
+        if merged.count < min_count:
+            return None
+        return merged.quantile(q)
+    
+    def agent_health(self, agent: str, window_seconds: float, now: Optional[float] = None) -> Dict:
+        """Recent latency, error rate and load for one agent.
+        
+        Args:
+            agent: Agent name
+            window_seconds: Length of the window ending now
+            now: Window end as a UNIX timestamp (defaults to current time)
+        
+        Returns:
+            Dictionary with finished call count, error rate, p50/p95 of
+            successful durations (None without successes) and in-flight calls
+        """
+        successes = LogHistogram()
+        count = errors = 0
+        for (series_agent, _model, outcome), stats in self.series.items():
+            if series_agent != agent:
+                continue
+            duration = stats.duration.window(window_seconds, now)
+            if outcome == "success":
+                successes.merge(duration)
+            elif outcome == "error":
+                errors += duration.count
+            else:
+                continue
+            count += duration.count
+        return {
+            "count": count,
+            "error_rate": errors / count if count else 0.0,
+            "p50": successes.quantile(0.5),
+            "p95": successes.quantile(0.95),
+            "active": self.active.get(agent, 0),
+        }
+    
+    def _update_series(self, metric: ExecutionMetric):
+        key = (metric.agent, metric.model or "default", _outcome(metric))
+        stats = self.series.get(key)
+        if stats is None:
+            stats = self.series[key] = SeriesStats()
+        stats.record(metric)
+    
+    def _update_rollup(self, metric: ExecutionMetric):
+        rollup = self.rollups.setdefault(
+            metric.agent,
+            {"count": 0, "success": 0, "failed": 0, "total_duration": 0.0}
+        )
+        rollup["count"] += 1
+        if metric.success:
+            rollup["success"] += 1
+        elif metric.error != CANCELLED:
+            rollup["failed"] += 1
+        rollup["total_duration"] += metric.duration_seconds
+    
+    def _load_rollups(self):
+        try:
+            with open(self.rollup_path) as f:
+                self.rollups = json.load(f).get("agents", {})
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.warning(f"Failed to write metric: {e}")
+            logger.warning(f"Failed to load metric rollups: {e}")
+    
+    def _rollup_snapshot(self) -> Tuple[int, str]:
+        """Serialized rollups, numbered so an older snapshot never overwrites a newer one."""
+        self._rollup_version += 1
+        data = json.dumps({"updated_at": datetime.now().isoformat(), "agents": self.rollups})
+        return self._rollup_version, data
+    
+    def _save_rollups(self, version: int, data: str):
+        # Batches may finish out of order on the executor (called under _write_lock)
+        if version <= self._rollups_saved:
+            return
+        tmp_path = self.rollup_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        tmp_path.replace(self.rollup_path)
+        self._rollups_saved = version
     
     def get_stats(self) -> Dict:
-        """Get aggregated statistics."""
-        if not self.metrics:
+        """Get aggregated statistics since startup."""
+        if not self.series:
             return {}
         
+        by_agent: Dict[str, Dict] = {}
+        durations: Dict[str, LogHistogram] = {}
+        for (agent, _model, series_outcome), stats in self.series.items():
+            agent_stats = by_agent.setdefault(agent, {"count": 0, "success": 0, "failed": 0})
+            count = stats.duration.total.count
+            agent_stats["count"] += count
+            if series_outcome == "success":
+                agent_stats["success"] += count
+            elif series_outcome == "error":
+                agent_stats["failed"] += count
+            durations.setdefault(agent, LogHistogram()).merge(stats.duration.total)
+        
+        overall = LogHistogram()
+        for agent, histogram in durations.items():
+            overall.merge(histogram)
+            summary = histogram.summary()
+            by_agent[agent].update({
+                "avg_duration": histogram.total / histogram.count,
+                "error_rate": by_agent[agent]["failed"] / histogram.count,
+                "p50_duration": summary["p50"],
+                "p95_duration": summary["p95"],
+                "p99_duration": summary["p99"],
+            })
+        
         stats = {
-            "total_executions": len(self.metrics),
-            "successful": sum(1 for m in self.metrics if m.success),
-            "failed": sum(1 for m in self.metrics if not m.success),
-            "by_agent": {},
-            "avg_duration": sum(m.duration_seconds for m in self.metrics) / len(self.metrics)
+            "total_executions": overall.count,
+            "successful": sum(a["success"] for a in by_agent.values()),
+            "failed": sum(a["failed"] for a in by_agent.values()),
+            "by_agent": by_agent,
+            "avg_duration": overall.total / overall.count
         }
+        if self.hedge_wins:
+            stats["hedging"] = {
+                "wins": {f"{mode}:{agent}": count for (mode, agent), count in sorted(self.hedge_wins.items())},
+                "latency_saved": self.hedge_saved.total.summary(),
+            }
+        return stats
+    
+    def window_stats(self, window_seconds: float, now: Optional[float] = None) -> Dict:
+        """Get latency percentiles and error rates over a sliding window.
+        
+        Args:
+            window_seconds: Length of the window ending now
+            now: Window end as a UNIX timestamp (defaults to current time)
         
-        # Per-agent stats
-        for metric in self.metrics:
-            if metric.agent not in stats["by_agent"]:
-                stats["by_agent"][metric.agent] = {
-                    "count": 0,
-                    "success": 0,
-                    "failed": 0,
-                    "avg_duration": 0.0
-                }
+        Returns:
+            Dictionary with per-agent error rates and per-series percentiles
+        """
+        by_agent: Dict[str, Dict] = {}
+        series = []
+        for (agent, model, outcome), stats in sorted(self.series.items()):
+            duration = stats.duration.window(window_seconds, now)
+            if not duration.count:
+                continue
             
-            agent_stats = stats["by_agent"][metric.agent]
-            agent_stats["count"] += 1
-            if metric.success:
-                agent_stats["success"] += 1
-            else:
-                agent_stats["failed"] += 1
+            agent_stats = by_agent.setdefault(agent, {"count": 0, "errors": 0})
+            agent_stats["count"] += duration.count
+            if outcome == "error":
+                agent_stats["errors"] += duration.count
+            
+            series.append({
+                "agent": agent,
+                "model": model,
+                "outcome": outcome,
+                "duration": duration.summary(),
+                "time_to_first_token": stats.time_to_first_token.window(window_seconds, now).summary(),
+                "time_to_first_tool_call": stats.time_to_first_tool_call.window(window_seconds, now).summary(),
+            })
         
-        # Calculate averages
-        for agent, agent_stats in stats["by_agent"].items():
-            agent_metrics = [m for m in self.metrics if m.agent == agent]
-            agent_stats["avg_duration"] = sum(m.duration_seconds for m in agent_metrics) / len(agent_metrics)
+        for agent_stats in by_agent.values():
+            agent_stats["error_rate"] = round(agent_stats["errors"] / agent_stats["count"], 4)
         
-        return stats
+        return {
+            "window_seconds": window_seconds,
+            "by_agent": by_agent,
+            "series": series,
+            "event_loop_lag": self.loop_lag.window(window_seconds, now).summary(),
+        }
     
     def export_json(self, path: Path):
         """Export metrics to JSON file."""
@@ -152,3 +581,15 @@ def get_metrics_collector() -> MetricsCollector:
         _metrics_collector = MetricsCollector(enabled=enabled)
     
     return _metrics_collector
+
+
+def track_execution(agent: str, session_id: Optional[str] = None, model: Optional[str] = None):
+    """Trace an execution with the global metrics collector.
+    
+    Usage:
+        with track_execution("codex", model="gpt-5") as trace:
+            trace.mark("availability_checked")
+            async for message in cli.execute_with_streaming(...):
+                trace.observe(message)
+    """
+    return get_metrics_collector().trace_execution(agent, session_id=session_id, model=model)
@@ -0,0 +1,185 @@
+"""OpenMetrics exposition for Roundtable MCP Server.
+
+Serves the MetricsCollector aggregates as OpenMetrics text over a local HTTP
+listener (TCP port or Unix socket) so long-running servers can be scraped by
+Prometheus. The listener runs on the server's event loop next to the stdio
+transport; rendering only reads in-memory aggregates, so a scrape never
+touches disk or blocks on a subprocess.
+
+Enable with CLI_MCP_METRICS_PORT or CLI_MCP_METRICS_SOCKET.
+"""
+import logging
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .metrics import MetricsCollector
+except ImportError:
+    from metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Histogram bucket upper bounds in seconds
+DURATION_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+FIRST_EVENT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+Sample = Tuple[Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class OpenMetricsExporter:
+    """Renders collector aggregates as OpenMetrics and serves them over HTTP."""
+
+    def __init__(
+        self,
+        collector: MetricsCollector,
+        port: Optional[int] = None,
+        host: str = "127.0.0.1",
+        unix_socket: Optional[str] = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            collector: Metrics collector to expose
+            port: TCP port to listen on
+            host: Interface to bind the TCP listener to (local only by default)
+            unix_socket: Unix socket path to listen on instead of (or as well as) TCP
+        """
+        self.collector = collector
+        self.port = port
+        self.host = host
+        self.unix_socket = unix_socket
+        self._gauges: List[Tuple[str, str, Callable[[], Iterable[Sample]]]] = []
+        self._runner = None
+
+    def add_gauge(self, name: str, help_text: str, callback: Callable[[], Iterable[Sample]]) -> None:
+        """Expose a gauge whose samples are produced by ``callback`` at scrape time."""
+        self._gauges.append((name, help_text, callback))
+
+    def render(self) -> str:
+        """Render all metric families as OpenMetrics text."""
+        lines: List[str] = []
+        collector = self.collector
+
+        lines.append("# TYPE roundtable_executions counter")
+        lines.append("# HELP roundtable_executions Subagent executions by agent, model and outcome.")
+        for (agent, model, outcome), stats in sorted(collector.series.items()):
+            labels = _labels({"agent": agent, "model": model, "outcome": outcome})
+            lines.append(f"roundtable_executions_total{labels} {stats.duration.total.count}")
+
+        for family, attribute, help_text, bounds in (
+            ("roundtable_execution_duration_seconds", "duration",
+             "Total subagent execution time.", DURATION_BUCKETS),
+            ("roundtable_time_to_first_token_seconds", "time_to_first_token",
+             "Time from invocation to the first assistant output.", FIRST_EVENT_BUCKETS),
+            ("roundtable_time_to_first_tool_call_seconds", "time_to_first_tool_call",
+             "Time from invocation to the first tool call.", FIRST_EVENT_BUCKETS),
+        ):
+            lines.append(f"# TYPE {family} histogram")
+            lines.append(f"# HELP {family} {help_text}")
+            for (agent, model, outcome), stats in sorted(collector.series.items()):
+                histogram = getattr(stats, attribute).total
+                if not histogram.count:
+                    continue
+                base = {"agent": agent, "model": model, "outcome": outcome}
+                for bound, count in histogram.cumulative_counts(bounds).items():
+                    lines.append(f"{family}_bucket{_labels({**base, 'le': _number(bound)})} {count}")
+                lines.append(f"{family}_bucket{_labels({**base, 'le': '+Inf'})} {histogram.count}")
+                lines.append(f"{family}_count{_labels(base)} {histogram.count}")
+                lines.append(f"{family}_sum{_labels(base)} {_number(histogram.total)}")
+
+        lag = collector.loop_lag.total
+        lines.append("# TYPE roundtable_event_loop_lag_seconds histogram")
+        lines.append("# HELP roundtable_event_loop_lag_seconds Event-loop scheduling delay.")
+        if lag.count:
+            for bound, count in lag.cumulative_counts(LOOP_LAG_BUCKETS).items():
+                lines.append(f"roundtable_event_loop_lag_seconds_bucket{_labels({'le': _number(bound)})} {count}")
+            lines.append(f"roundtable_event_loop_lag_seconds_bucket{_labels({'le': '+Inf'})} {lag.count}")
+            lines.append(f"roundtable_event_loop_lag_seconds_count {lag.count}")
+            lines.append(f"roundtable_event_loop_lag_seconds_sum {_number(lag.total)}")
+
+        lines.append("# TYPE roundtable_active_executions gauge")
+        lines.append("# HELP roundtable_active_executions In-flight subagent executions per agent.")
+        for agent, count in sorted(collector.active.items()):
+            lines.append(f"roundtable_active_executions{_labels({'agent': agent})} {count}")
+
+        lines.append("# TYPE roundtable_warm_process counter")
+        lines.append("# HELP roundtable_warm_process Executions that reused a warm CLI process (hit) or spawned one (miss).")
+        for agent, reuse in sorted(collector.process_reuse.items()):
+            lines.append(f"roundtable_warm_process_total{_labels({'agent': agent, 'result': 'hit'})} {reuse['reused']}")
+            lines.append(f"roundtable_warm_process_total{_labels({'agent': agent, 'result': 'miss'})} {reuse['spawned']}")
+
+        lines.append("# TYPE roundtable_hedge_wins counter")
+        lines.append("# HELP roundtable_hedge_wins Hedged or raced calls answered by each agent.")
+        for (mode, agent), count in sorted(collector.hedge_wins.items()):
+            lines.append(f"roundtable_hedge_wins_total{_labels({'mode': mode, 'agent': agent})} {count}")
+
+        saved = collector.hedge_saved.total
+        lines.append("# TYPE roundtable_hedge_latency_saved_seconds summary")
+        lines.append("# HELP roundtable_hedge_latency_saved_seconds Estimated latency saved by hedged calls.")
+        if saved.count:
+            lines.append(f"roundtable_hedge_latency_saved_seconds_count {saved.count}")
+            lines.append(f"roundtable_hedge_latency_saved_seconds_sum {_number(saved.total)}")
+
+        lines.append("# TYPE roundtable_metrics_dropped counter")
+        lines.append("# HELP roundtable_metrics_dropped Metric records dropped because the writer queue was full.")
+        lines.append(f"roundtable_metrics_dropped_total {collector.dropped}")
+
+        for name, help_text, callback in self._gauges:
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"# HELP {name} {help_text}")
+            try:
+                for labels, value in callback():
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+            except Exception as e:
+                logger.debug(f"Gauge {name} failed: {e}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    async def start(self) -> None:
+        """Start the HTTP listener(s)."""
+        from aiohttp import web
+
+        async def handle_metrics(request):
+            return web.Response(body=self.render().encode(), headers={"Content-Type": CONTENT_TYPE})
+
+        app = web.Application()
+        app.router.add_get("/metrics", handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        if self.port is not None:
+            await web.TCPSite(self._runner, self.host, self.port).start()
+            logger.info(f"OpenMetrics listener on http://{self.host}:{self.port}/metrics")
+        if self.unix_socket:
+            if os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)
+            await web.UnixSite(self._runner, self.unix_socket).start()
+            logger.info(f"OpenMetrics listener on unix:{self.unix_socket}")
+
+    async def stop(self) -> None:
+        """Stop the HTTP listener(s)."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        if self.unix_socket and os.path.exists(self.unix_socket):
+            os.unlink(self.unix_socket)
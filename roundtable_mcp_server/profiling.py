@@ -0,0 +1,165 @@
+"""On-demand profiling of subagent executions for Roundtable MCP Server.
+
+Profiling is armed for the next N executions (see the ``profile_next_calls``
+MCP tool) and uses one of two modes, selected with CLI_MCP_PROFILE:
+
+- ``cprofile``: deterministic cProfile of the event-loop thread, written as
+  ``.pstats`` (open with ``python -m pstats`` or snakeviz)
+- ``sample``: a helper thread samples the event-loop thread's stack with
+  ``sys._current_frames()`` and writes collapsed stacks (``.folded``) that
+  flamegraph.pl, speedscope or inferno render directly
+
+Both profile the whole event-loop thread while an execution is in flight, so
+concurrent calls show up too; only one execution is profiled at a time.
+Output goes to ~/.roundtable/profiles/.
+"""
+import cProfile
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+class _StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="roundtable-stack-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class Profiler:
+    """Profiles the next N subagent executions."""
+
+    def __init__(
+        self,
+        mode: str = "cprofile",
+        output_dir: Optional[Path] = None,
+        sample_interval: float = 0.005,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            mode: Default profiling mode ("cprofile" or "sample")
+            output_dir: Directory for profile files (defaults to ~/.roundtable/profiles)
+            sample_interval: Seconds between stack samples in "sample" mode
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.output_dir = output_dir or Path.home() / ".roundtable" / "profiles"
+        self.sample_interval = sample_interval
+        self.remaining = 0
+        self.written: List[Path] = []
+        self._active = False
+
+    def arm(self, count: int, mode: Optional[str] = None) -> None:
+        """Profile the next ``count`` executions (0 disarms)."""
+        if mode is not None:
+            if mode not in PROFILE_MODES:
+                raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+            self.mode = mode
+        self.remaining = max(0, count)
+
+    @contextmanager
+    def profile(self, agent: str):
+        """Profile the wrapped execution if profiling is armed."""
+        if self.remaining <= 0 or self._active:
+            yield None
+            return
+
+        self.remaining -= 1
+        self._active = True
+        stem = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{agent}-{os.getpid()}-{time.monotonic_ns() % 1000000}"
+        try:
+            if self.mode == "cprofile":
+                with self._cprofile(stem) as path:
+                    yield path
+            else:
+                with self._sample(stem) as path:
+                    yield path
+        finally:
+            self._active = False
+
+    @contextmanager
+    def _cprofile(self, stem: str):
+        path = self.output_dir / f"{stem}.pstats"
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield path
+        finally:
+            profile.disable()
+            self._save(path, profile.dump_stats)
+
+    @contextmanager
+    def _sample(self, stem: str):
+        path = self.output_dir / f"{stem}.folded"
+        sampler = _StackSampler(threading.get_ident(), self.sample_interval)
+        sampler.start()
+        try:
+            yield path
+        finally:
+            sampler.stop()
+
+            def write(target):
+                with open(target, "w") as f:
+                    for stack, count in sampler.stacks.most_common():
+                        f.write(f"{stack} {count}\n")
+
+            self._save(path, write)
+
+    def _save(self, path: Path, writer) -> None:
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            writer(str(path))
+            self.written.append(path)
+            logger.info(f"Profile written to {path}")
+        except Exception as e:
+            logger.warning(f"Failed to write profile {path}: {e}")
+
+
+# Global profiler (idle until armed)
+_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Profiler:
+    """Get or create the global profiler (mode from CLI_MCP_PROFILE)."""
+    global _profiler
+
+    if _profiler is None:
+        mode = os.getenv("CLI_MCP_PROFILE", "cprofile").lower() or "cprofile"
+        if mode not in PROFILE_MODES:
+            logger.warning(f"Invalid CLI_MCP_PROFILE value ignored: {mode}")
+            mode = "cprofile"
+        _profiler = Profiler(mode=mode)
+
+    return _profiler
@@ -1,53 +1,124 @@
-"""Retry logic for transient failures."""
+"""Retry logic for transient failures.
+
+Delays follow an exponential schedule capped at ``max_delay``. Callers that
+may fail together opt in to "full jitter" (``jitter=True``): each wait is
+then drawn uniformly from ``[0, min(max_delay, delay * backoff ** attempt)]``
+so they do not retry in lockstep. A shared RetryBudget caps retries
+at a fraction of recent traffic, so a struggling dependency never sees more
+than ``(1 + ratio)`` times its normal load.
+"""
 import asyncio
 import logging
+import random
+import time
+from collections import deque
 from functools import wraps
-from typing import Callable, Type, Tuple
+from typing import Callable, Deque, Optional, Type, Tuple
 
 from .exceptions import RetryableError
 
 logger = logging.getLogger(__name__)
 
 
+def backoff_delay(attempt: int, delay: float, backoff: float, max_delay: float, jitter: bool = True) -> float:
+    """Delay before retry number ``attempt`` (0-based).
+
+    Args:
+        attempt: Number of retries already made
+        delay: Base delay in seconds
+        backoff: Multiplier applied per attempt
+        max_delay: Upper bound for the exponential term
+        jitter: Draw the delay uniformly from [0, bound] (full jitter)
+    """
+    bound = min(max_delay, delay * backoff ** attempt)
+    return random.uniform(0, bound) if jitter else bound
+
+
+class RetryBudget:
+    """Caps retries at a fraction of the calls seen over a sliding window."""
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries: int = 3,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per first attempt in the window (0.1 = 10% of traffic)
+            min_retries: Retries always allowed in the window, so low traffic can still retry
+            window: Sliding window in seconds
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def record_request(self) -> None:
+        """Record a first attempt."""
+        self._requests.append(self._clock())
+
+    def try_acquire(self) -> bool:
+        """Spend one retry if the budget allows it."""
+        now = self._clock()
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+        if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+            return False
+        self._retries.append(now)
+        return True
+
+
 def retry_async(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: Tuple[Type[Exception], ...] = (RetryableError,)
+    exceptions: Tuple[Type[Exception], ...] = (RetryableError,),
+    max_delay: float = 30.0,
+    jitter: bool = False,
+    budget: Optional[RetryBudget] = None,
 ):
     """Decorator for retrying async functions with exponential backoff.
-    
+
     Args:
         max_attempts: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff: Multiplier for delay after each retry
         exceptions: Tuple of exception types to retry on
+        max_delay: Upper bound for a single delay
+        jitter: Use full-jitter delays instead of the deterministic schedule
+        budget: Optional shared RetryBudget; retries stop when it is exhausted
     """
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            current_delay = delay
-            last_exception = None
-            
+            if budget is not None:
+                budget.record_request()
+
             for attempt in range(max_attempts):
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
-                            f"Retrying in {current_delay}s..."
-                        )
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {e}"
-                        )
-            
-            raise last_exception
-        
+                    if attempt == max_attempts - 1:
+                        logger.error(f"All {max_attempts} attempts failed for {func.__name__}: {e}")
+                        raise
+                    if budget is not None and not budget.try_acquire():
+                        logger.warning(f"Retry budget exhausted; not retrying {func.__name__}: {e}")
+                        raise
+                    current_delay = backoff_delay(attempt, delay, backoff, max_delay, jitter)
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
+                        f"Retrying in {current_delay:.2f}s..."
+                    )
+                    await asyncio.sleep(current_delay)
+
         return wrapper
     return decorator
 
@@ -56,41 +127,44 @@ def retry_sync(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: Tuple[Type[Exception], ...] = (RetryableError,)
+    exceptions: Tuple[Type[Exception], ...] = (RetryableError,),
+    max_delay: float = 30.0,
+    jitter: bool = False,
+    budget: Optional[RetryBudget] = None,
 ):
     """Decorator for retrying sync functions with exponential backoff.
-    
+
     Args:
         max_attempts: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff: Multiplier for delay after each retry
         exceptions: Tuple of exception types to retry on
+        max_delay: Upper bound for a single delay
+        jitter: Use full-jitter delays instead of the deterministic schedule
+        budget: Optional shared RetryBudget; retries stop when it is exhausted
     """
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import time
-            current_delay = delay
-            last_exception = None
-            
+            if budget is not None:
+                budget.record_request()
+
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
-                            f"Retrying in {current_delay}s..."
-                        )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {e}"
-                        )
-            
-            raise last_exception
-        
+                    if attempt == max_attempts - 1:
+                        logger.error(f"All {max_attempts} attempts failed for {func.__name__}: {e}")
+                        raise
+                    if budget is not None and not budget.try_acquire():
+                        logger.warning(f"Retry budget exhausted; not retrying {func.__name__}: {e}")
+                        raise
+                    current_delay = backoff_delay(attempt, delay, backoff, max_delay, jitter)
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
+                        f"Retrying in {current_delay:.2f}s..."
+                    )
+                    time.sleep(current_delay)
+
         return wrapper
     return decorator
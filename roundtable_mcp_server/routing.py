@@ -0,0 +1,132 @@
+"""Latency-aware agent routing for Roundtable MCP Server.
+
+Ranks agents by the expected time until a successful answer, estimated from
+what the server observed over the last few minutes:
+
+- latency: p50 of successful calls for analysis tasks, p95 for edit tasks
+  (an edit holds the caller until it finishes, so its tail matters more)
+- reliability: latency is divided by the smoothed success rate, the expected
+  cost of trying until an answer arrives; edit tasks count it twice
+- load: every call already in flight on the agent adds another latency
+- circuit state: open circuits are skipped, half-open ones cost double
+
+Agents without recent successes get the median latency of the agents that
+have some, so an unused agent is neither favoured nor starved.
+"""
+import re
+from dataclasses import dataclass, field
+from statistics import median
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .circuit_breaker import CircuitState
+
+TASK_TYPES = ("analysis", "edit")
+
+# Window of recent calls the ranking is based on
+ROUTING_WINDOW = 15 * 60.0
+# Assumed latency when no agent has recent successes
+DEFAULT_PRIOR_LATENCY = 30.0
+
+_EDIT_PATTERN = re.compile(
+    r"\b(fix|implement|refactor|add|change|edit|modify|write|create|update|rename|"
+    r"delete|remove|apply|migrate|generate)\b",
+    re.IGNORECASE,
+)
+
+
+def infer_task_type(instruction: str) -> str:
+    """Guess "edit" or "analysis" from the verbs in ``instruction``."""
+    return "edit" if _EDIT_PATTERN.search(instruction) else "analysis"
+
+
+@dataclass
+class RouteCandidate:
+    """An agent with its routing score (expected seconds to an answer)."""
+    agent: str
+    score: float
+    reasons: List[str] = field(default_factory=list)
+
+
+def rank_agents(
+    agents: Iterable[str],
+    task_type: str,
+    health: Callable[[str], Dict],
+    circuit: Callable[[str], CircuitState],
+    prior_latency: float = DEFAULT_PRIOR_LATENCY,
+) -> Tuple[List[RouteCandidate], Dict[str, str]]:
+    """Rank ``agents`` for a task, best first.
+
+    Args:
+        agents: Candidate agents
+        task_type: "analysis" or "edit"
+        health: Returns recent stats for an agent (see MetricsCollector.agent_health)
+        circuit: Returns the agent's circuit breaker state
+        prior_latency: Latency assumed when no agent has recent successes
+
+    Returns:
+        (ranked candidates, skipped agents mapped to the reason)
+    """
+    quantile = "p95" if task_type == "edit" else "p50"
+    stats = {agent: health(agent) for agent in agents}
+    known = [s[quantile] for s in stats.values() if s[quantile] is not None]
+    fallback_latency = median(known) if known else prior_latency
+
+    ranked: List[RouteCandidate] = []
+    skipped: Dict[str, str] = {}
+    for agent, agent_stats in stats.items():
+        state = circuit(agent)
+        if state == CircuitState.OPEN:
+            skipped[agent] = "circuit open"
+            continue
+
+        reasons = []
+        latency = agent_stats[quantile]
+        if latency is None:
+            latency = fallback_latency
+            reasons.append(f"no recent successes, assuming {latency:.1f}s")
+        else:
+            reasons.append(f"{quantile} {latency:.1f}s")
+
+        count = agent_stats["count"]
+        successes = count * (1 - agent_stats["error_rate"])
+        success_rate = (successes + 1) / (count + 1)
+        score = latency / success_rate ** (2 if task_type == "edit" else 1)
+        if count:
+            reasons.append(f"error rate {agent_stats['error_rate']:.0%} over {count} calls")
+
+        if agent_stats["active"]:
+            score *= 1 + agent_stats["active"]
+            reasons.append(f"{agent_stats['active']} in flight")
+        if state == CircuitState.HALF_OPEN:
+            score *= 2
+            reasons.append("circuit half-open")
+
+        ranked.append(RouteCandidate(agent, score, reasons))
+
+    ranked.sort(key=lambda candidate: candidate.score)
+    return ranked, skipped
+
+
+def describe_route(
+    ranked: List[RouteCandidate],
+    skipped: Dict[str, str],
+    task_type: str,
+    chosen: Optional[str],
+    fallbacks: Dict[str, str],
+) -> str:
+    """Format the routing decision for the tool result."""
+    lines = [f"Routing ({task_type}):"]
+    for position, candidate in enumerate(ranked, 1):
+        if candidate.agent == chosen:
+            outcome = " ← answered"
+        elif candidate.agent in fallbacks:
+            outcome = f" ✗ {fallbacks[candidate.agent]}"
+        else:
+            outcome = ""
+        lines.append(
+            f"{position}. {candidate.agent}: ~{candidate.score:.1f}s "
+            f"({', '.join(candidate.reasons)}){outcome}"
+        )
+    for agent, reason in sorted(skipped.items()):
+        lines.append(f"- {agent}: skipped ({reason})")
+    return "\n".join(lines)
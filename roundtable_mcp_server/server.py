@@ -8,17 +8,22 @@ Developed by Roundtable AI for seamless AI assistant integration.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import sys
+import time
 import tomllib
+import weakref
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 import anyio
 
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.lowlevel import NotificationOptions
 from pydantic import BaseModel, Field
 
 # Handle imports for both package and direct execution
@@ -42,7 +47,8 @@ def _import_module_item(module_name: str, item_name: str):
 # Import required classes and functions
 
 
-# Configure logging with debug traces
+# Configure logging: a queue hands records to a background thread that writes
+# JSON lines to a rotating file and text to stderr (see logging_config.py)
 # Default to .juno_task/logs/ directory for consistency with juno_task CLI
 log_dir = Path.cwd() / ".juno_task" / "logs"
 try:
@@ -51,14 +57,7 @@ try:
 except (OSError, PermissionError):
     # Fallback to current directory if .juno_task/logs/ creation fails
     log_file = Path.cwd() / "roundtable_mcp_server.log"
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_file, mode='a'),
-        logging.StreamHandler(sys.stderr)
-    ]
-)
+_import_module_item("logging_config", "setup_logging")(log_file)
 logger = logging.getLogger(__name__)
 
 CLIAvailabilityChecker = _import_module_item("availability_checker", "CLIAvailabilityChecker")
@@ -69,12 +68,27 @@ try:
         RoundtableError,
         AgentNotAvailableError,
         AgentExecutionError,
-        ConfigurationError
+        CircuitOpenError,
+        ConfigurationError,
+        RetryableError
+    )
+    from roundtable_mcp_server.retry import RetryBudget, retry_async
+    from roundtable_mcp_server.circuit_breaker import circuit_snapshots, circuit_state, get_circuit_breaker
+    from roundtable_mcp_server.routing import (
+        ROUTING_WINDOW,
+        TASK_TYPES,
+        describe_route,
+        infer_task_type,
+        rank_agents,
     )
-    from roundtable_mcp_server.retry import retry_async
     from roundtable_mcp_server.error_handler import handle_agent_error
     from roundtable_mcp_server.metrics import MetricsCollector, track_execution
+    from roundtable_mcp_server.profiling import get_profiler
+    from roundtable_mcp_server.history_index import HistorySearchError
+    from roundtable_mcp_server.transcripts import TranscriptError, get_transcript_store
     ERROR_HANDLING_AVAILABLE = True
+    # Shared by all agents: availability re-checks may add at most 10% load
+    _retry_budget = RetryBudget(ratio=0.1)
 except ImportError as e:
     logger.warning(f"Error handling modules not available: {e}")
     ERROR_HANDLING_AVAILABLE = False
@@ -87,6 +101,8 @@ except ImportError as e:
         pass
     class ConfigurationError(RoundtableError):
         pass
+    class CircuitOpenError(RoundtableError):
+        pass
 
 # Import CLI adapters directly for MCP streaming with progress
 try:
@@ -104,6 +120,8 @@ try:
     from claudable_helper.cli.adapters.antigravity_cli import AntigravityCLI
     from claudable_helper.cli.adapters.factory_cli import FactoryCLI
     from claudable_helper.cli.adapters.rovo_cli import RovoCLI
+    from claudable_helper.cli.base import owned_processes, phase_listener
+    from claudable_helper.core import tracing
     CLI_ADAPTERS_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"CLI adapters not available for direct import: {e}")
@@ -130,13 +148,37 @@ class ServerConfig(BaseModel):
         description="Default working directory for all subagents"
     )
     debug: bool = Field(
-        default=True,
+        default=False,
         description="Enable debug logging"
     )
     verbose: bool = Field(
         default=False,
         description="Enable verbose output for subagents, showing tool calls and everystep of the execution. "
     )
+    subagents_source: str = Field(
+        default="default",
+        description="Where the subagent list came from: env, all, availability or default"
+    )
+    availability_refresh_interval: float = Field(
+        default=0.0,
+        description="Seconds between background availability refreshes (0 disables hot-reload)"
+    )
+    metrics_port: Optional[int] = Field(
+        default=None,
+        description="Local TCP port serving OpenMetrics at /metrics"
+    )
+    metrics_socket: Optional[str] = Field(
+        default=None,
+        description="Unix socket path serving OpenMetrics at /metrics"
+    )
+    slow_callback_threshold: float = Field(
+        default=0.1,
+        description="Event-loop lag in seconds above which the blocking stack is logged (0 disables the monitor)"
+    )
+    trace_path: Optional[str] = Field(
+        default=None,
+        description="File receiving execution trace spans (*.jsonl for JSONL, otherwise Chrome trace JSON)"
+    )
 
 # Parse configuration from environment and availability cache
 def parse_config_from_env() -> ServerConfig:
@@ -145,8 +187,13 @@ def parse_config_from_env() -> ServerConfig:
     Environment variables:
     - CLI_MCP_SUBAGENTS: Comma-separated list of subagents to enable (overrides availability cache)
     - CLI_MCP_WORKING_DIR: Default working directory for subagents
-    - CLI_MCP_DEBUG: Enable debug logging (true/false)
+    - CLI_MCP_DEBUG: Enable debug logging unless CLI_MCP_LOG_LEVEL is set (true/false, default false)
     - CLI_MCP_IGNORE_AVAILABILITY: Ignore availability cache and enable all subagents (true/false)
+    - CLI_MCP_AVAILABILITY_REFRESH: Seconds between background availability refreshes (0 disables)
+    - CLI_MCP_METRICS_PORT: Local TCP port for the OpenMetrics listener
+    - CLI_MCP_METRICS_SOCKET: Unix socket path for the OpenMetrics listener
+    - CLI_MCP_SLOW_CALLBACK_MS: Event-loop stall threshold in milliseconds (default 100, 0 disables)
+    - CLI_MCP_TRACE: File to write execution trace spans to (*.jsonl or Chrome trace JSON)
 
     Returns:
         ServerConfig instance
@@ -170,10 +217,12 @@ def parse_config_from_env() -> ServerConfig:
             logger.warning(f"Invalid subagent names ignored: {', '.join(invalid)}")
 
         logger.info(f"Using subagents from environment variable: {config.subagents}")
+        config.subagents_source = "env"
     elif ignore_availability:
         # Ignore availability cache and enable all subagents
         config.subagents = ["codex", "claude", "cursor", "gemini", "qwen", "kiro", "copilot", "grok", "kilocode", "crush", "opencode", "factory", "rovo"]
         logger.info("Ignoring availability cache - enabling all subagents")
+        config.subagents_source = "all"
     else:
         # Use availability cache to determine enabled subagents
         checker = CLIAvailabilityChecker()
@@ -181,6 +230,7 @@ def parse_config_from_env() -> ServerConfig:
 
         if available_clis:
             config.subagents = available_clis
+            config.subagents_source = "availability"
             logger.info(f"Using available subagents from cache: {config.subagents}")
         else:
             # Fallback to default if no availability data
@@ -194,9 +244,37 @@ def parse_config_from_env() -> ServerConfig:
         config.working_dir = working_dir
 
     # Parse debug flag
-    debug_env = os.getenv("CLI_MCP_DEBUG", "true").lower()
+    debug_env = os.getenv("CLI_MCP_DEBUG", "false").lower()
     config.debug = debug_env in ("true", "1", "yes", "on")
 
+    # Parse background availability refresh interval
+    refresh_env = os.getenv("CLI_MCP_AVAILABILITY_REFRESH")
+    if refresh_env:
+        try:
+            config.availability_refresh_interval = max(0.0, float(refresh_env))
+        except ValueError:
+            logger.warning(f"Invalid CLI_MCP_AVAILABILITY_REFRESH value ignored: {refresh_env}")
+
+    # Parse OpenMetrics listener
+    metrics_port_env = os.getenv("CLI_MCP_METRICS_PORT")
+    if metrics_port_env:
+        try:
+            config.metrics_port = int(metrics_port_env)
+        except ValueError:
+            logger.warning(f"Invalid CLI_MCP_METRICS_PORT value ignored: {metrics_port_env}")
+    config.metrics_socket = os.getenv("CLI_MCP_METRICS_SOCKET") or None
+
+    # Parse event-loop monitor threshold
+    slow_callback_env = os.getenv("CLI_MCP_SLOW_CALLBACK_MS")
+    if slow_callback_env:
+        try:
+            config.slow_callback_threshold = max(0.0, float(slow_callback_env) / 1000)
+        except ValueError:
+            logger.warning(f"Invalid CLI_MCP_SLOW_CALLBACK_MS value ignored: {slow_callback_env}")
+
+    # Parse execution trace output
+    config.trace_path = os.getenv("CLI_MCP_TRACE") or None
+
     return config
 
 
@@ -208,8 +286,169 @@ working_dir = Path.cwd()
 # Setup path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# MCP client sessions that have listed our tools (notified on hot-reload)
+_client_sessions: "weakref.WeakSet" = weakref.WeakSet()
+
+
+async def _apply_enabled_subagents(subagents: Set[str]) -> None:
+    """Swap in a new set of enabled subagents and notify connected clients.
+
+    The global is rebound in a single assignment so concurrent tool calls see
+    either the old or the new set, never a partially updated one. Adapter
+    classes (and their shared ACP clients) are left untouched.
+
+    Every tool stays registered and the enabled set is only checked when a
+    tool is called, so the tool list itself does not change: the
+    tools/list_changed notification just asks clients to reload it (and
+    whatever availability they derive from it).
+    """
+    global enabled_subagents
+
+    enabled_subagents = frozenset(subagents)
+    logger.info(f"Enabled subagents reloaded: {', '.join(sorted(enabled_subagents))}")
+
+    for session in list(_client_sessions):
+        try:
+            await session.send_tool_list_changed()
+        except Exception as e:
+            logger.debug(f"Failed to send tools/list_changed: {e}")
+
+
+def _acp_pool_samples():
+    """Yield (labels, value) samples for the warm ACP client pools."""
+    if not CLI_ADAPTERS_AVAILABLE:
+        return
+    yield {"agent": "gemini"}, sum(
+        1 for client in GeminiCLI._LOOP_CLIENTS.values()
+        if client._proc is not None and client._proc.returncode is None
+    )
+    shared = QwenCLI._SHARED_CLIENT
+    yield {"agent": "qwen"}, int(
+        shared is not None and shared._proc is not None and shared._proc.returncode is None
+    )
+
+
+def _circuit_samples():
+    """Yield circuit breaker states for the OpenMetrics exporter."""
+    levels = {"closed": 0, "half_open": 0.5, "open": 1}
+    for agent, snapshot in circuit_snapshots().items():
+        yield {"agent": agent}, levels[snapshot["state"]]
+
+
+@asynccontextmanager
+async def server_lifespan(app: "FastMCP"):
+    """Run background services for the lifetime of the MCP server."""
+    metrics = _import_module_item("metrics", "get_metrics_collector")()
+    await metrics.start()
+
+    loop_monitor = None
+    threshold = config.slow_callback_threshold if config is not None else 0.1
+    if threshold > 0:
+        LoopLagMonitor = _import_module_item("loop_monitor", "LoopLagMonitor")
+        loop_monitor = LoopLagMonitor(on_lag=metrics.record_loop_lag, slow_callback_threshold=threshold)
+        await loop_monitor.start()
+
+    if config is not None and config.trace_path and CLI_ADAPTERS_AVAILABLE:
+        tracing.configure(config.trace_path)
+        logger.info(f"Tracing subagent calls to {config.trace_path}")
+
+    exporter = None
+    if config is not None and (config.metrics_port is not None or config.metrics_socket):
+        if not metrics.enabled:
+            logger.warning("OpenMetrics listener enabled without CLI_MCP_METRICS; only gauges will be reported")
+        OpenMetricsExporter = _import_module_item("openmetrics", "OpenMetricsExporter")
+        exporter = OpenMetricsExporter(metrics, port=config.metrics_port, unix_socket=config.metrics_socket)
+        exporter.add_gauge(
+            "roundtable_acp_pool_clients",
+            "Warm ACP client processes held in the adapter pools.",
+            _acp_pool_samples,
+        )
+        if ERROR_HANDLING_AVAILABLE:
+            exporter.add_gauge(
+                "roundtable_circuit_open",
+                "1 while an agent's circuit breaker is failing calls fast (0.5 while half-open).",
+                _circuit_samples,
+            )
+        try:
+            await exporter.start()
+        except Exception as e:
+            logger.warning(f"Could not start OpenMetrics listener: {e}")
+            exporter = None
+
+    refresher = None
+    if config is not None and config.availability_refresh_interval > 0:
+        if config.subagents_source in ("availability", "default"):
+            AvailabilityRefresher = _import_module_item("availability_refresher", "AvailabilityRefresher")
+            refresher = AvailabilityRefresher(
+                on_change=_apply_enabled_subagents,
+                interval=config.availability_refresh_interval,
+                current=enabled_subagents,
+            )
+            await refresher.start()
+        else:
+            logger.warning(
+                "CLI_MCP_AVAILABILITY_REFRESH ignored: subagents are fixed by "
+                f"{'CLI_MCP_SUBAGENTS' if config.subagents_source == 'env' else 'CLI_MCP_IGNORE_AVAILABILITY'}"
+            )
+
+    try:
+        yield {}
+    finally:
+        if refresher is not None:
+            await refresher.stop()
+        if exporter is not None:
+            await exporter.stop()
+        await metrics.stop()
+        if CLI_ADAPTERS_AVAILABLE:
+            tracing.shutdown()
+        if loop_monitor is not None:
+            await loop_monitor.stop()
+
+
 # Initialize FastMCP server
-server = FastMCP("roundtable-ai")
+server = FastMCP("roundtable-ai", lifespan=server_lifespan)
+
+
+async def _list_tools_tracking_session():
+    """List tools and remember the requesting session for change notifications."""
+    try:
+        _client_sessions.add(server._mcp_server.request_context.session)
+    except LookupError:
+        pass
+    return await server.list_tools()
+
+
+def _install_tool_list_changed_hooks(app: FastMCP) -> bool:
+    """Advertise tools.listChanged and track the sessions that list tools.
+
+    FastMCP has no public API for either: it builds the initialization
+    options itself when it runs, and tool handlers only see sessions that
+    call a tool. Both hooks therefore go through its low-level server
+    (``_mcp_server``), which is why pyproject.toml requires mcp>=1.30,<2 and
+    tests/unit/test_availability_refresher.py checks the hooks are in place.
+    The notification only signals a reload; see _apply_enabled_subagents.
+
+    Returns:
+        False (with a warning) if this SDK version no longer has those internals
+    """
+    lowlevel = getattr(app, "_mcp_server", None)
+    if lowlevel is None or not all(
+        hasattr(type(lowlevel), name) for name in ("list_tools", "create_initialization_options", "request_context")
+    ):
+        logger.warning(
+            "This MCP SDK version does not expose the hooks for tools/list_changed; "
+            "clients will not be told when enabled subagents change"
+        )
+        return False
+    lowlevel.list_tools()(_list_tools_tracking_session)
+    lowlevel.create_initialization_options = functools.partial(
+        lowlevel.create_initialization_options,
+        NotificationOptions(tools_changed=True),
+    )
+    return True
+
+
+_install_tool_list_changed_hooks(server)
 
 def initialize_config():
     """Initialize configuration - called from main()."""
@@ -220,6 +459,11 @@ def initialize_config():
     verbose = config.verbose
     working_dir = Path(config.working_dir) if config.working_dir else Path.cwd()
 
+    # --debug / CLI_MCP_DEBUG lower the level set up at import; an explicit
+    # CLI_MCP_LOG_LEVEL wins
+    if config.debug and not os.getenv("CLI_MCP_LOG_LEVEL"):
+        logging.getLogger().setLevel(logging.DEBUG)
+
     logger.info(f"Initializing Roundtable AI MCP Server")
     logger.info(f"Enabled subagents: {', '.join(enabled_subagents)}")
     logger.info(f"Working directory: {working_dir}")
@@ -234,351 +478,253 @@ def initialize_config():
             logger.debug("Metrics collection disabled (set CLI_MCP_METRICS=true to enable)")
 
 
-# Helper functions with error handling
-async def _execute_codex_with_error_handling(
-    instruction: str,
-    project_path: str,
-    session_id: Optional[str],
-    model: str,
-    is_initial_prompt: bool
-) -> str:
-    """Execute Codex with error handling and retry logic."""
-    codex_cli = CodexCLI()
-    
-    availability = await codex_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Codex CLI not available: {availability.get('error', 'Unknown error')}")
-    
-    messages = []
-    agent_responses = []
-    
-    async for message in codex_cli.execute_with_streaming(
-        instruction=instruction,
-        project_path=project_path,
-        session_id=session_id,
-        model=model,
-        images=None,
-        is_initial_prompt=is_initial_prompt
-    ):
-        messages.append(message)
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    
-    if not agent_responses:
-        return "✅ Codex task completed successfully"
-    
-    return f"**Codex Response:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Codex Response:**\n{chr(10).join(agent_responses)}"
+# Helper function with error handling and per-phase instrumentation
+class _ExecutionSpans:
+    """Turns adapter phase marks and tool events into trace spans.
 
+    Spawn and session init are reported by adapters as points in time
+    (mark_phase), so their spans are recorded after the fact, from the
+    previous milestone to the mark. Each tool call spans from its tool_use
+    message to the matching tool_result (or the next tool_use).
+    """
 
-async def _execute_claude_with_error_handling(
+    _PHASE_SPANS = {"spawned": "spawn", "session_ready": "session_init"}
+
+    def __init__(self, trace):
+        self.trace = trace
+        self._last_ns = time.time_ns()
+        self._tool_start_ns: Optional[int] = None
+        self._tool_name = ""
+
+    def start_stream(self) -> None:
+        self._last_ns = time.time_ns()
+
+    def on_phase(self, phase: str) -> None:
+        self.trace.mark(phase)
+        name = self._PHASE_SPANS.get(phase)
+        if name is not None:
+            now = time.time_ns()
+            tracing.record_span(name, self._last_ns, now)
+            self._last_ns = now
+
+    def on_message(self, msg_type: str, content: Any) -> None:
+        if msg_type == "tool_use":
+            self.end_tool()
+            self._tool_start_ns = time.time_ns()
+            self._tool_name = str(content)[:120]
+        elif msg_type == "tool_result":
+            self.end_tool()
+
+    def end_tool(self) -> None:
+        if self._tool_start_ns is not None:
+            tracing.record_span("tool", self._tool_start_ns, tool=self._tool_name)
+            self._tool_start_ns = None
+
+
+async def _execute_with_error_handling(
+    agent: str,
+    display_name: str,
+    cli_class: type,
     instruction: str,
     project_path: str,
     session_id: Optional[str],
     model: Optional[str],
-    is_initial_prompt: bool
+    is_initial_prompt: bool,
+    ctx: Optional[Context] = None
 ) -> str:
-    """Execute Claude with error handling."""
-    claude_cli = ClaudeCodeCLI()
-    
-    availability = await claude_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Claude CLI not available: {availability.get('error', 'Unknown error')}")
-    
-    agent_responses = []
-    
-    async for message in claude_cli.execute_with_streaming(
-        instruction=instruction,
-        project_path=project_path,
-        session_id=session_id,
-        model=model,
-        images=None,
-        is_initial_prompt=is_initial_prompt
-    ):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    
-    if not agent_responses:
-        return "✅ Claude task completed successfully"
-    
-    return f"**Claude Response:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Claude Response:**\n{chr(10).join(agent_responses)}"
+    """Execute a CLI agent with progress reporting and execution tracing.
+
+    Phase timings (availability check, process spawn, session init, first
+    token, tool calls, completion) and message/byte counts are recorded with
+    the metrics collector. When CLI_MCP_TRACE is set, the call is also traced
+    as a tree of spans under one trace id, and it is profiled when armed with
+    profile_next_calls. Outcomes feed the agent's circuit breaker. If the
+    call fails or is cancelled, CLI processes it spawned are killed. Every
+    message is appended to the transcript store for get_subagent_transcript.
+
+    Raises:
+        CircuitOpenError: If the agent failed repeatedly and calls are paused
+        AgentNotAvailableError: If the CLI is not available
+        AgentExecutionError: If the agent reports an error message
+    """
+    breaker = get_circuit_breaker(agent)
+    if not breaker.allow():
+        logger.warning(f"{display_name} call rejected: circuit open for another {breaker.retry_after():.0f}s")
+        raise CircuitOpenError(agent, breaker.retry_after())
 
+    transcript = _start_transcript(agent, instruction, session_id, model, project_path)
+    try:
+        with owned_processes(), get_profiler().profile(agent), \
+                tracing.start_trace(f"{agent}_subagent", agent=agent, model=model, session_id=session_id) as root, \
+                track_execution(agent, session_id=session_id, model=model) as trace:
+            spans = _ExecutionSpans(trace) if tracing.enabled() else None
+            cli = cli_class()
+
+            with tracing.span("availability"):
+                availability = await _check_availability(cli)
+            trace.mark("availability_checked")
+            if not availability.get("available", False):
+                raise AgentNotAvailableError(agent, availability.get("error", "Unknown error"))
+
+            agent_responses = []
+            tool_uses = []
+            message_count = 0
+            logger.info(f"{display_name} subagent execution started :verbose={config.verbose}")
+
+            with tracing.span("stream"), phase_listener(spans.on_phase if spans else trace.mark):
+                if spans:
+                    spans.start_stream()
+                async for message in cli.execute_with_streaming(
+                    instruction=instruction,
+                    project_path=project_path,
+                    session_id=session_id,
+                    model=model,
+                    images=None,
+                    is_initial_prompt=is_initial_prompt
+                ):
+                    message_count += 1
+                    trace.observe(message)
+
+                    msg_type = getattr(message, "message_type", None)
+                    msg_type_str = getattr(msg_type, "value", str(msg_type))
+                    content = getattr(message, "content", "")
+                    if spans:
+                        spans.on_message(msg_type_str, content)
+                    if transcript is not None:
+                        transcript.append(
+                            msg_type_str, getattr(message, "role", None), content,
+                            getattr(message, "metadata", None)
+                        )
+
+                    progress_message = f"{display_name} #{message_count}: {msg_type_str} => {content}"
+                    logger.debug("[PROGRESS] %s", progress_message)
+                    if ctx is not None:
+                        await ctx.report_progress(
+                            progress=message_count,
+                            total=None,
+                            message=progress_message
+                        )
+
+                    if hasattr(message, 'role') and message.role == "assistant":
+                        if content and content.strip():
+                            agent_responses.append(content.strip())
+                    elif msg_type_str == "tool_use":
+                        tool_uses.append(content)
+                    elif msg_type_str == "tool_result":
+                        tool_uses.append(f"Tool result: {content}")
+                    elif msg_type_str == "error":
+                        logger.error(f"{display_name} error: {content}")
+                        raise AgentExecutionError(agent, str(content))
+                    elif content and str(content).strip():
+                        agent_responses.append(str(content).strip())
+                if spans:
+                    spans.end_tool()
+
+            root.set_attribute("messages", message_count)
+            root.set_attribute("bytes", trace.metric.bytes_received)
+            with tracing.span("aggregate"):
+                result = _aggregate_response(agent, display_name, agent_responses, tool_uses)
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+    finally:
+        if transcript is not None:
+            transcript.close()
+    breaker.record_success()
+
+    logger.info(f"{display_name} subagent execution completed")
+    logger.debug(
+        "[MCP-TOOL] %s execution completed - phases: %s, messages: %d, bytes: %d, tool_uses: %d",
+        display_name, trace.metric.phases, message_count, trace.metric.bytes_received, len(tool_uses)
+    )
+    return result
 
-async def _execute_cursor_with_error_handling(
-    instruction: str,
-    project_path: str,
-    session_id: Optional[str],
-    model: Optional[str],
-    is_initial_prompt: bool
-) -> str:
-    """Execute Cursor with error handling."""
-    cursor_cli = CursorAgentCLI()
-    
-    availability = await cursor_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Cursor CLI not available: {availability.get('error', 'Unknown error')}")
-    
-    agent_responses = []
-    
-    async for message in cursor_cli.execute_with_streaming(
-        instruction=instruction,
-        project_path=project_path,
-        session_id=session_id,
-        model=model,
-        images=None,
-        is_initial_prompt=is_initial_prompt
-    ):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    
-    if not agent_responses:
-        return "✅ Cursor task completed successfully"
-    
-    return f"**Cursor Response:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Cursor Response:**\n{chr(10).join(agent_responses)}"
 
+def _circuit_open_message(error: "CircuitOpenError") -> str:
+    """Fail-fast reply for a call rejected by an open circuit.
 
-async def _execute_gemini_with_error_handling(
-    instruction: str,
-    project_path: str,
-    session_id: Optional[str],
-    model: Optional[str],
-    is_initial_prompt: bool
-) -> str:
-    """Execute Gemini with error handling."""
-    gemini_cli = GeminiCLI()
-    
-    availability = await gemini_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Gemini CLI not available: {availability.get('error', 'Unknown error')}")
-    
-    agent_responses = []
-    
-    async for message in gemini_cli.execute_with_streaming(
-        instruction=instruction,
-        project_path=project_path,
-        session_id=session_id,
-        model=model,
-        images=None,
-        is_initial_prompt=is_initial_prompt
-    ):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    
-    if not agent_responses:
-        return "✅ Gemini task completed successfully"
-    
-    return f"**Gemini Response:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Gemini Response:**\n{chr(10).join(agent_responses)}"
+    The rejection is logged as a warning where it is raised, so it is not
+    passed through handle_agent_error (which logs a traceback at ERROR).
+    """
+    return f"❌ {error.message} (retry_after: {error.context.get('retry_after')}s)"
 
 
-async def _execute_qwen_with_error_handling(
+def _start_transcript(
+    agent: str,
     instruction: str,
-    project_path: str,
     session_id: Optional[str],
     model: Optional[str],
-    is_initial_prompt: bool
-) -> str:
-    """Execute Qwen with error handling."""
-    qwen_cli = QwenCLI()
-    
-    availability = await qwen_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Qwen CLI not available: {availability.get('error', 'Unknown error')}")
-    
-    agent_responses = []
-    
-    async for message in qwen_cli.execute_with_streaming(
-        instruction=instruction,
-        project_path=project_path,
-        session_id=session_id,
-        model=model,
-        images=None,
-        is_initial_prompt=is_initial_prompt
-    ):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    
-    if not agent_responses:
-        return "✅ Qwen task completed successfully"
-    
-    return f"**Qwen Response:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Qwen Response:**\n{chr(10).join(agent_responses)}"
-
-
-async def _execute_kiro_with_error_handling(
-    instruction: str,
     project_path: str,
-    session_id: Optional[str],
-    model: Optional[str],
-    is_initial_prompt: bool
-) -> str:
-    """Execute Kiro with error handling."""
-    kiro_cli = KiroCLI()
-    
-    availability = await kiro_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Kiro CLI not available: {availability.get('error', 'Unknown error')}")
-    
-    agent_responses = []
-    
-    async for message in kiro_cli.execute_with_streaming(
-        instruction=instruction,
-        project_path=project_path,
-        session_id=session_id,
-        model=model,
-        images=None,
-        is_initial_prompt=is_initial_prompt
-    ):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    
-    if not agent_responses:
-        return "✅ Kiro task completed successfully"
-    
-    return f"**Kiro Response:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Kiro Response:**\n{chr(10).join(agent_responses)}"
+):
+    """Open a transcript for this run, or None if transcripts are off or unwritable."""
+    store = get_transcript_store()
+    if store is None:
+        return None
+    try:
+        return store.start_run(agent, instruction, session_id=session_id, model=model, project_path=project_path)
+    except OSError as e:
+        logger.warning(f"Transcript not recorded for {agent}: {e}")
+        return None
 
 
-async def _execute_copilot_with_error_handling(
-    instruction: str,
-    project_path: str,
-    session_id: Optional[str],
-    model: Optional[str],
-    is_initial_prompt: bool
-) -> str:
-    """Execute GitHub Copilot with error handling."""
-    copilot_cli = CopilotCLI()
-    
-    availability = await copilot_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"GitHub Copilot CLI not available: {availability.get('error', 'Unknown error')}")
-    
-    agent_responses = []
-    async for message in copilot_cli.execute_with_streaming(
-        instruction=instruction,
-        project_path=project_path,
-        session_id=session_id,
-        model=model,
-        images=None,
-        is_initial_prompt=is_initial_prompt
-    ):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    
-    if not agent_responses:
-        return "✅ GitHub Copilot task completed successfully"
-    
-    return f"**GitHub Copilot Response:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**GitHub Copilot Response:**\n{chr(10).join(agent_responses)}"
-
-
-
-
-async def _execute_grok_with_error_handling(instruction: str, project_path: str, session_id: Optional[str], model: Optional[str], is_initial_prompt: bool) -> str:
-    grok_cli = GrokCLI()
-    availability = await grok_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Grok CLI not available")
-    agent_responses = []
-    async for message in grok_cli.execute_with_streaming(instruction=instruction, project_path=project_path, session_id=session_id, model=model, images=None, is_initial_prompt=is_initial_prompt):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    if not agent_responses:
-        return "✅ Grok task completed"
-    return f"**Grok:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Grok:**\n{chr(10).join(agent_responses)}"
-
-
-async def _execute_kilocode_with_error_handling(instruction: str, project_path: str, session_id: Optional[str], model: Optional[str], is_initial_prompt: bool) -> str:
-    kilocode_cli = KilocodeCLI()
-    availability = await kilocode_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Kilocode CLI not available")
-    agent_responses = []
-    async for message in kilocode_cli.execute_with_streaming(instruction=instruction, project_path=project_path, session_id=session_id, model=model, images=None, is_initial_prompt=is_initial_prompt):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    if not agent_responses:
-        return "✅ Kilocode task completed"
-    return f"**Kilocode:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Kilocode:**\n{chr(10).join(agent_responses)}"
-
-
-async def _execute_crush_with_error_handling(instruction: str, project_path: str, session_id: Optional[str], model: Optional[str], is_initial_prompt: bool) -> str:
-    crush_cli = CrushCLI()
-    availability = await crush_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Crush CLI not available")
-    agent_responses = []
-    async for message in crush_cli.execute_with_streaming(instruction=instruction, project_path=project_path, session_id=session_id, model=model, images=None, is_initial_prompt=is_initial_prompt):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    if not agent_responses:
-        return "✅ Crush task completed"
-    return f"**Crush:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Crush:**\n{chr(10).join(agent_responses)}"
-
-
-async def _execute_opencode_with_error_handling(instruction: str, project_path: str, session_id: Optional[str], model: Optional[str], is_initial_prompt: bool) -> str:
-    opencode_cli = OpenCodeCLI()
-    availability = await opencode_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"OpenCode CLI not available")
-    agent_responses = []
-    async for message in opencode_cli.execute_with_streaming(instruction=instruction, project_path=project_path, session_id=session_id, model=model, images=None, is_initial_prompt=is_initial_prompt):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    if not agent_responses:
-        return "✅ OpenCode task completed"
-    return f"**OpenCode:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**OpenCode:**\n{chr(10).join(agent_responses)}"
-
-
-async def _execute_antigravity_with_error_handling(instruction: str, project_path: str, session_id: Optional[str], model: Optional[str], is_initial_prompt: bool) -> str:
-    antigravity_cli = AntigravityCLI()
-    availability = await antigravity_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Antigravity CLI not available")
-    agent_responses = []
-    async for message in antigravity_cli.execute_with_streaming(instruction=instruction, project_path=project_path, session_id=session_id, model=model, images=None, is_initial_prompt=is_initial_prompt):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    if not agent_responses:
-        return "✅ Antigravity task completed"
-    return f"**Antigravity:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Antigravity:**\n{chr(10).join(agent_responses)}"
-
-
-async def _execute_factory_with_error_handling(instruction: str, project_path: str, session_id: Optional[str], model: Optional[str], is_initial_prompt: bool) -> str:
-    factory_cli = FactoryCLI()
-    availability = await factory_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Factory/Droid CLI not available")
-    agent_responses = []
-    async for message in factory_cli.execute_with_streaming(instruction=instruction, project_path=project_path, session_id=session_id, model=model, images=None, is_initial_prompt=is_initial_prompt):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    if not agent_responses:
-        return "✅ Factory/Droid task completed"
-    return f"**Factory/Droid:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Factory/Droid:**\n{chr(10).join(agent_responses)}"
-
-
-async def _execute_rovo_with_error_handling(instruction: str, project_path: str, session_id: Optional[str], model: Optional[str], is_initial_prompt: bool) -> str:
-    rovo_cli = RovoCLI()
-    availability = await rovo_cli.check_availability()
-    if not availability.get("available", False):
-        raise AgentNotAvailableError(f"Rovo Dev CLI not available")
-    agent_responses = []
-    async for message in rovo_cli.execute_with_streaming(instruction=instruction, project_path=project_path, session_id=session_id, model=model, images=None, is_initial_prompt=is_initial_prompt):
-        if hasattr(message, 'role') and message.role == "assistant":
-            if message.content and message.content.strip():
-                agent_responses.append(message.content.strip())
-    if not agent_responses:
-        return "✅ Rovo Dev task completed"
-    return f"**Rovo Dev:**\n{agent_responses[0]}" if len(agent_responses) == 1 else f"**Rovo Dev:**\n{chr(10).join(agent_responses)}"
+async def _check_availability(cli) -> Dict[str, Any]:
+    """Check CLI availability, re-checking once (jittered, within the retry budget)."""
+    async def check_availability():
+        availability = await cli.check_availability()
+        if not availability.get("available", False):
+            raise RetryableError(availability.get("error", "Unknown error"))
+        return availability
+
+    try:
+        return await retry_async(max_attempts=2, delay=0.5, jitter=True, budget=_retry_budget)(check_availability)()
+    except RetryableError as e:
+        return {"available": False, "error": e.message}
+
+
+# Agents whose adapters emit one assistant message per output line, with the
+# header their tool results are returned under
+_LINE_RESPONSE_HEADERS = {
+    "kiro": "**Kiro Response:**",
+    "copilot": "**GitHub Copilot:**",
+    "grok": "**Grok:**",
+    "kilocode": "**Kilocode:**",
+    "crush": "**Crush:**",
+    "opencode": "**OpenCode:**",
+    "antigravity": "**Antigravity:**",
+    "factory": "**Factory/Droid:**",
+    "rovo": "**Rovo Dev:**",
+}
+
+
+def _aggregate_response(agent: str, display_name: str, agent_responses: List[str], tool_uses: List[Any]) -> str:
+    """Build the tool result from the collected agent responses and tool uses.
+
+    Line-oriented agents return every line of their output; the others
+    return their last (final) response unless verbose.
+    """
+    line_header = _LINE_RESPONSE_HEADERS.get(agent)
+    if not config.verbose:
+        if not agent_responses:
+            return f"✅ {display_name} task completed successfully"
+        if line_header is not None:
+            return f"{line_header}\n" + "\n".join(agent_responses)
+        return agent_responses[-1]
+
+    summary_parts = []
+    if agent_responses:
+        if line_header is not None:
+            summary_parts.append(f"{line_header}\n" + "\n".join(agent_responses))
+        else:
+            summary_parts.append(f"**{display_name} Response:**\n" + "\n\n".join(agent_responses))
+    if tool_uses:
+        summary_parts.append(f"🔧 **Tools Used ({len(tool_uses)}):**")
+        summary_parts.extend(f"• {tool_use}" for tool_use in tool_uses)
+    if not summary_parts:
+        summary_parts.append(f"✅ {display_name} task completed successfully (no detailed output captured)")
+    return "\n\n".join(summary_parts)
 
 
 # Tool definitions
@@ -792,15 +938,18 @@ async def codex_subagent(
         logger.error(error_msg)
         return f"❌ {error_msg}"
 
-    logger.info(f"Codex: {model} [INSTRUCTION]: {instruction}")
+    logger.debug(f"Codex: {model} [INSTRUCTION]: {instruction}")
     logger.debug(f"[MCP-TOOL] codex_subagent started - project_path: {project_path}, model: {model}, session_id: {session_id}")
     
     # Use error handler if available
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_codex_with_error_handling(
-                instruction, project_path, session_id, model, is_initial_prompt
+            return await _execute_with_error_handling(
+                "codex", "Codex", CodexCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
             )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Codex CLI not available: {str(e)}"
         except AgentExecutionError as e:
@@ -896,7 +1045,7 @@ async def codex_subagent(
         logger.debug(f"Result summary: {summary}")
 
         final_response = summary if config.verbose else agent_responses[-1]
-        logger.info(f"[TOOL-RESPONSE] Codex final response: {final_response}")
+        logger.debug(f"[TOOL-RESPONSE] Codex final response: {final_response}")
         return final_response
 
 
@@ -973,14 +1122,17 @@ async def claude_subagent(
         logger.error(error_msg)
         return f"❌ {error_msg}"
 
-    logger.info(f"Claude: {model} [INSTRUCTION]: {instruction}")
+    logger.debug(f"Claude: {model} [INSTRUCTION]: {instruction}")
     logger.debug(f"[MCP-TOOL] claude_subagent started - project_path: {project_path}, model: {model}, session_id: {session_id}")
 
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_claude_with_error_handling(
-                instruction, project_path, session_id, model, is_initial_prompt
+            return await _execute_with_error_handling(
+                "claude", "Claude", ClaudeCodeCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
             )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Claude CLI not available: {str(e)}"
         except AgentExecutionError as e:
@@ -1078,7 +1230,7 @@ async def claude_subagent(
         logger.debug(f"Result summary: {summary}")
 
         final_response = summary if config.verbose else (agent_responses[-1] if agent_responses else "✅ Claude Code task completed successfully")
-        logger.info(f"[TOOL-RESPONSE] Claude final response: {final_response}")
+        logger.debug(f"[TOOL-RESPONSE] Claude final response: {final_response}")
         return final_response
 
     except Exception as e:
@@ -1134,14 +1286,17 @@ async def cursor_subagent(
         logger.error(error_msg)
         return f"❌ {error_msg}"
 
-    logger.info(f"Cursor: {model} [INSTRUCTION]: {instruction}")
+    logger.debug(f"Cursor: {model} [INSTRUCTION]: {instruction}")
     logger.debug(f"[MCP-TOOL] cursor_subagent started - project_path: {project_path}, model: {model}, session_id: {session_id}")
 
     if ERROR_HANDLING_AVAILABLE and CLI_ADAPTERS_AVAILABLE:
         try:
-            return await _execute_cursor_with_error_handling(
-                instruction, project_path, session_id, model, is_initial_prompt
+            return await _execute_with_error_handling(
+                "cursor", "Cursor", CursorAgentCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
             )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Cursor CLI not available: {str(e)}"
         except AgentExecutionError as e:
@@ -1268,7 +1423,7 @@ async def cursor_subagent(
         logger.debug(f"Result summary: {summary}")
 
         final_response = summary if config.verbose else (agent_responses[-1] if agent_responses else summary)
-        logger.info(f"[TOOL-RESPONSE] Cursor final response: {final_response}")
+        logger.debug(f"[TOOL-RESPONSE] Cursor final response: {final_response}")
         return final_response
 
     except Exception as e:
@@ -1342,14 +1497,17 @@ async def gemini_subagent(
         logger.error(error_msg)
         return f"❌ {error_msg}"
 
-    logger.info(f"Gemini: {model} [INSTRUCTION]: {instruction}")
+    logger.debug(f"Gemini: {model} [INSTRUCTION]: {instruction}")
     logger.debug(f"[MCP-TOOL] gemini_subagent started - project_path: {project_path}, model: {model}, session_id: {session_id}")
 
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_gemini_with_error_handling(
-                instruction, project_path, session_id, model, is_initial_prompt
+            return await _execute_with_error_handling(
+                "gemini", "Gemini", GeminiCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
             )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Gemini CLI not available: {str(e)}"
         except AgentExecutionError as e:
@@ -1447,7 +1605,7 @@ async def gemini_subagent(
         logger.debug(f"Result summary: {summary}")
 
         final_response = summary if config.verbose else (agent_responses[-1] if agent_responses else "✅ Gemini task completed successfully")
-        logger.info(f"[TOOL-RESPONSE] Gemini final response: {final_response}")
+        logger.debug(f"[TOOL-RESPONSE] Gemini final response: {final_response}")
         return final_response
 
     except Exception as e:
@@ -1521,14 +1679,17 @@ async def qwen_subagent(
         logger.error(error_msg)
         return f"❌ {error_msg}"
 
-    logger.info(f"Qwen: {model} [INSTRUCTION]: {instruction}")
+    logger.debug(f"Qwen: {model} [INSTRUCTION]: {instruction}")
     logger.debug(f"[MCP-TOOL] qwen_subagent started - project_path: {project_path}, model: {model}, session_id: {session_id}")
 
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_qwen_with_error_handling(
-                instruction, project_path, session_id, model, is_initial_prompt
+            return await _execute_with_error_handling(
+                "qwen", "Qwen", QwenCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
             )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Qwen CLI not available: {str(e)}"
         except AgentExecutionError as e:
@@ -1626,7 +1787,7 @@ async def qwen_subagent(
         logger.debug(f"Result summary: {summary}")
 
         final_response = summary if config.verbose else (agent_responses[-1] if agent_responses else "✅ Qwen task completed successfully")
-        logger.info(f"[TOOL-RESPONSE] Qwen final response: {final_response}")
+        logger.debug(f"[TOOL-RESPONSE] Qwen final response: {final_response}")
         return final_response
 
     except Exception as e:
@@ -1692,14 +1853,17 @@ async def kiro_subagent(
         logger.error(error_msg)
         return f"❌ {error_msg}"
 
-    logger.info(f"Kiro: {model} [INSTRUCTION]: {instruction}")
+    logger.debug(f"Kiro: {model} [INSTRUCTION]: {instruction}")
     logger.debug(f"[MCP-TOOL] kiro_subagent started - project_path: {project_path}, model: {model}, session_id: {session_id}")
 
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_kiro_with_error_handling(
-                instruction, project_path, session_id, model, is_initial_prompt
+            return await _execute_with_error_handling(
+                "kiro", "Kiro", KiroCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
             )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Kiro CLI not available: {str(e)}"
         except AgentExecutionError as e:
@@ -1776,9 +1940,12 @@ async def copilot_subagent(
 
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_copilot_with_error_handling(
-                instruction, project_path, session_id, model, is_initial_prompt
+            return await _execute_with_error_handling(
+                "copilot", "GitHub Copilot", CopilotCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
             )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ GitHub Copilot CLI not available: {str(e)}"
         except Exception as e:
@@ -1836,7 +2003,12 @@ async def grok_subagent(instruction: str, project_path: Optional[str] = None, se
         return f"❌ Project directory does not exist: {project_path}"
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_grok_with_error_handling(instruction, project_path, session_id, model, is_initial_prompt)
+            return await _execute_with_error_handling(
+                "grok", "Grok", GrokCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
+            )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Grok CLI not available: {str(e)}"
         except Exception as e:
@@ -1880,7 +2052,12 @@ async def kilocode_subagent(instruction: str, project_path: Optional[str] = None
         return f"❌ Project directory does not exist: {project_path}"
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_kilocode_with_error_handling(instruction, project_path, session_id, model, is_initial_prompt)
+            return await _execute_with_error_handling(
+                "kilocode", "Kilocode", KilocodeCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
+            )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Kilocode CLI not available: {str(e)}"
         except Exception as e:
@@ -1924,7 +2101,12 @@ async def crush_subagent(instruction: str, project_path: Optional[str] = None, s
         return f"❌ Project directory does not exist: {project_path}"
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_crush_with_error_handling(instruction, project_path, session_id, model, is_initial_prompt)
+            return await _execute_with_error_handling(
+                "crush", "Crush", CrushCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
+            )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Crush CLI not available: {str(e)}"
         except Exception as e:
@@ -1968,7 +2150,12 @@ async def opencode_subagent(instruction: str, project_path: Optional[str] = None
         return f"❌ Project directory does not exist: {project_path}"
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_opencode_with_error_handling(instruction, project_path, session_id, model, is_initial_prompt)
+            return await _execute_with_error_handling(
+                "opencode", "OpenCode", OpenCodeCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
+            )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ OpenCode CLI not available: {str(e)}"
         except Exception as e:
@@ -2012,11 +2199,16 @@ async def antigravity_subagent(instruction: str, project_path: Optional[str] = N
         return f"❌ Project directory does not exist: {project_path}"
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_antigravity_with_error_handling(instruction, project_path, session_id, model, is_initial_prompt)
+            return await _execute_with_error_handling(
+                "antigravity", "Antigravity", AntigravityCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
+            )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Antigravity CLI not available: {str(e)}"
         except Exception as e:
-            return handle_agent_error(e, instruction)
+            return handle_agent_error(e, "antigravity", instruction)
     try:
         antigravity_cli = AntigravityCLI()
         availability = await antigravity_cli.check_availability()
@@ -2056,7 +2248,12 @@ async def factory_subagent(instruction: str, project_path: Optional[str] = None,
         return f"❌ Project directory does not exist: {project_path}"
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_factory_with_error_handling(instruction, project_path, session_id, model, is_initial_prompt)
+            return await _execute_with_error_handling(
+                "factory", "Factory/Droid", FactoryCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
+            )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Factory/Droid CLI not available: {str(e)}"
         except Exception as e:
@@ -2100,7 +2297,12 @@ async def rovo_subagent(instruction: str, project_path: Optional[str] = None, se
         return f"❌ Project directory does not exist: {project_path}"
     if ERROR_HANDLING_AVAILABLE:
         try:
-            return await _execute_rovo_with_error_handling(instruction, project_path, session_id, model, is_initial_prompt)
+            return await _execute_with_error_handling(
+                "rovo", "Rovo Dev", RovoCLI,
+                instruction, project_path, session_id, model, is_initial_prompt, ctx
+            )
+        except CircuitOpenError as e:
+            return _circuit_open_message(e)
         except AgentNotAvailableError as e:
             return f"❌ Rovo Dev CLI not available: {str(e)}"
         except Exception as e:
@@ -2122,6 +2324,468 @@ async def rovo_subagent(instruction: str, project_path: Optional[str] = None, se
         return f"❌ Error: {str(e)}"
 
 
+# Display name and CLI adapter class name per agent, resolved at call time
+_AGENT_CLIS = {
+    "codex": ("Codex", "CodexCLI"),
+    "claude": ("Claude", "ClaudeCodeCLI"),
+    "cursor": ("Cursor", "CursorAgentCLI"),
+    "gemini": ("Gemini", "GeminiCLI"),
+    "qwen": ("Qwen", "QwenCLI"),
+    "kiro": ("Kiro", "KiroCLI"),
+    "copilot": ("GitHub Copilot", "CopilotCLI"),
+    "grok": ("Grok", "GrokCLI"),
+    "kilocode": ("Kilocode", "KilocodeCLI"),
+    "crush": ("Crush", "CrushCLI"),
+    "opencode": ("OpenCode", "OpenCodeCLI"),
+    "antigravity": ("Antigravity", "AntigravityCLI"),
+    "factory": ("Factory/Droid", "FactoryCLI"),
+    "rovo": ("Rovo Dev", "RovoCLI"),
+}
+
+HEDGE_MODES = ("hedge", "race")
+# Hedge delay when none is given and the primary has too little latency history
+DEFAULT_HEDGE_DELAY = 15.0
+
+
+async def _run_hedged(
+    agents: List[str],
+    instruction: str,
+    project_path: str,
+    mode: str,
+    hedge_delay: float,
+) -> Tuple[str, str, float]:
+    """Run ``instruction`` on several agents and return the first success.
+
+    In "race" mode every agent starts at once. In "hedge" mode the first agent
+    starts alone and each following agent starts ``hedge_delay`` seconds after
+    the previous one, or immediately once every running agent has failed.
+    Agents still running when a result arrives are cancelled, which kills
+    their CLI processes.
+
+    Returns:
+        (winning agent, its result, seconds until the result arrived)
+
+    Raises:
+        AgentExecutionError: If every agent failed
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    waiting = list(agents)
+    running: Dict[asyncio.Task, str] = {}
+    errors: Dict[str, str] = {}
+
+    def launch():
+        agent = waiting.pop(0)
+        display_name, class_name = _AGENT_CLIS[agent]
+        logger.info(f"Hedged call ({mode}): starting {display_name} after {loop.time() - start:.1f}s")
+        task = asyncio.create_task(_execute_with_error_handling(
+            agent, display_name, globals()[class_name],
+            instruction, project_path, None, None, False
+        ))
+        running[task] = agent
+
+    try:
+        if mode == "race":
+            while waiting:
+                launch()
+        else:
+            launch()
+        next_launch = start + hedge_delay
+
+        while running or waiting:
+            if not running:
+                launch()
+                next_launch = loop.time() + hedge_delay
+                continue
+            timeout = max(0.0, next_launch - loop.time()) if waiting else None
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                launch()
+                next_launch = loop.time() + hedge_delay
+                continue
+            for task in done:
+                agent = running.pop(task)
+                if task.exception() is None:
+                    return agent, task.result(), loop.time() - start
+                errors[agent] = str(task.exception())
+                logger.warning(f"Hedged call ({mode}): {agent} failed: {errors[agent]}")
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    raise AgentExecutionError(
+        ",".join(agents),
+        "; ".join(f"{agent}: {error}" for agent, error in errors.items()),
+    )
+
+
+@server.tool()
+async def hedged_subagent(
+    instruction: str,
+    agents: str,
+    project_path: Optional[str] = None,
+    mode: str = "hedge",
+    hedge_delay: Optional[float] = None,
+    ctx: Context = None
+) -> str:
+    """
+    Ask several agents the same question and return the first successful answer.
+
+    Meant for latency-critical questions where any of the agents may answer.
+    All agents work in the same project directory, so avoid instructions that
+    modify files.
+
+    Args:
+        instruction: The question or task to send to every agent
+        agents: Comma-separated agents in priority order (e.g. "claude,gemini"); the first is the primary
+        project_path: ABSOLUTE path to the project directory. If not provided, uses current working directory.
+        mode: "hedge" starts the primary alone and adds the next agent after hedge_delay; "race" starts all at once
+        hedge_delay: Seconds before launching a backup (default: the primary's recorded p95 latency, else 15)
+
+    Returns:
+        The winning agent's answer, followed by which agent answered and how fast
+    """
+    if mode not in HEDGE_MODES:
+        return f"❌ Unknown mode: {mode} (expected one of {', '.join(HEDGE_MODES)})"
+    if not ERROR_HANDLING_AVAILABLE or not CLI_ADAPTERS_AVAILABLE:
+        return "❌ Hedged execution is not available"
+
+    candidates = list(dict.fromkeys(a.strip().lower() for a in agents.split(",") if a.strip()))
+    unknown = [a for a in candidates if a not in _AGENT_CLIS]
+    if unknown:
+        return f"❌ Unknown agents: {', '.join(unknown)}"
+    disabled = [a for a in candidates if a not in enabled_subagents]
+    if disabled:
+        return f"❌ Agents not enabled in this server instance: {', '.join(disabled)}"
+    if len(candidates) < 2:
+        return "❌ Hedged execution needs at least two agents"
+
+    if not project_path or project_path.strip() == "":
+        project_path = str(working_dir.absolute()) if working_dir else str(Path.cwd().absolute())
+    else:
+        project_path = str(Path(project_path).absolute())
+    if not Path(project_path).exists():
+        return f"❌ Project directory does not exist: {project_path}"
+
+    metrics = _import_module_item("metrics", "get_metrics_collector")()
+    primary = candidates[0]
+    if hedge_delay is None:
+        hedge_delay = metrics.latency_quantile(primary, 0.95) or DEFAULT_HEDGE_DELAY
+    logger.info(f"Hedged call ({mode}) across {', '.join(candidates)}; hedge delay {hedge_delay:.1f}s")
+
+    try:
+        winner, result, latency = await _run_hedged(candidates, instruction, project_path, mode, hedge_delay)
+    except CircuitOpenError as e:
+        return _circuit_open_message(e)
+    except Exception as e:
+        return handle_agent_error(e, "hedged", instruction)
+
+    saved = 0.0
+    if winner != primary:
+        expected = metrics.latency_quantile(primary, 0.5)
+        saved = max(0.0, expected - latency) if expected is not None else None
+    metrics.record_hedge(mode, winner, latency, saved)
+
+    display_name = _AGENT_CLIS[winner][0]
+    if ctx is not None:
+        await ctx.report_progress(progress=1, total=1, message=f"{display_name} answered first ({latency:.1f}s)")
+    return f"{result}\n\n— answered by {display_name} in {latency:.1f}s ({mode})"
+
+
+@server.tool()
+async def auto_subagent(
+    instruction: str,
+    project_path: Optional[str] = None,
+    task_type: Optional[str] = None,
+    agents: Optional[str] = None,
+    ctx: Context = None
+) -> str:
+    """
+    Run a task on the agent expected to answer fastest, falling back down the ranking.
+
+    Agents are ranked by recent p50 (analysis) or p95 (edit) latency, error
+    rate, calls already in flight and circuit breaker state. An agent that is
+    not available or whose circuit is open is skipped for the next one. For
+    analysis tasks any failure falls back; an edit task stops at the first
+    agent that ran, so a half-applied edit is never repeated elsewhere.
+
+    Args:
+        instruction: The task or question for the agent
+        project_path: ABSOLUTE path to the project directory. If not provided, uses current working directory.
+        task_type: "analysis" or "edit" (default: guessed from the instruction)
+        agents: Optional comma-separated agents to choose from (default: all enabled agents)
+
+    Returns:
+        The chosen agent's answer followed by the routing decision and its reasons
+    """
+    if not ERROR_HANDLING_AVAILABLE or not CLI_ADAPTERS_AVAILABLE:
+        return "❌ Automatic routing is not available"
+    if task_type is None:
+        task_type = infer_task_type(instruction)
+    elif task_type not in TASK_TYPES:
+        return f"❌ Unknown task type: {task_type} (expected one of {', '.join(TASK_TYPES)})"
+
+    if agents:
+        candidates = list(dict.fromkeys(a.strip().lower() for a in agents.split(",") if a.strip()))
+        unknown = [a for a in candidates if a not in _AGENT_CLIS]
+        if unknown:
+            return f"❌ Unknown agents: {', '.join(unknown)}"
+        candidates = [a for a in candidates if a in enabled_subagents]
+    else:
+        candidates = [a for a in _AGENT_CLIS if a in enabled_subagents]
+    if not candidates:
+        return "❌ No enabled agents to route to"
+
+    if not project_path or project_path.strip() == "":
+        project_path = str(working_dir.absolute()) if working_dir else str(Path.cwd().absolute())
+    else:
+        project_path = str(Path(project_path).absolute())
+    if not Path(project_path).exists():
+        return f"❌ Project directory does not exist: {project_path}"
+
+    metrics = _import_module_item("metrics", "get_metrics_collector")()
+    now = time.time()
+    ranked, skipped = rank_agents(
+        candidates,
+        task_type,
+        health=lambda agent: metrics.agent_health(agent, ROUTING_WINDOW, now=now),
+        circuit=circuit_state,
+    )
+    logger.info(
+        f"Auto routing ({task_type}): "
+        + ", ".join(f"{c.agent}={c.score:.1f}s" for c in ranked)
+        + (f"; skipped {', '.join(skipped)}" if skipped else "")
+    )
+
+    # Failures that happen before the agent touches the project
+    fallback_errors: Tuple[type, ...] = (AgentNotAvailableError, CircuitOpenError)
+    if task_type == "analysis":
+        fallback_errors = (Exception,)
+
+    fallbacks: Dict[str, str] = {}
+    last_error: Optional[Exception] = None
+    for candidate in ranked:
+        agent = candidate.agent
+        display_name, class_name = _AGENT_CLIS[agent]
+        try:
+            result = await _execute_with_error_handling(
+                agent, display_name, globals()[class_name],
+                instruction, project_path, None, None, False, ctx
+            )
+        except fallback_errors as e:
+            logger.warning(f"Auto routing: {agent} failed, trying the next agent: {e}")
+            fallbacks[agent] = str(e)
+            last_error = e
+            continue
+        except Exception as e:
+            fallbacks[agent] = str(e)
+            route = describe_route(ranked, skipped, task_type, None, fallbacks)
+            return f"{handle_agent_error(e, agent, instruction)}\n\n{route}"
+        route = describe_route(ranked, skipped, task_type, agent, fallbacks)
+        return f"{result}\n\n{route}"
+
+    route = describe_route(ranked, skipped, task_type, None, fallbacks)
+    if last_error is None:
+        last_error = AgentNotAvailableError("auto", "every candidate agent has an open circuit")
+    if isinstance(last_error, CircuitOpenError):
+        return f"{_circuit_open_message(last_error)}\n\n{route}"
+    return f"{handle_agent_error(last_error, 'auto', instruction)}\n\n{route}"
+
+
+@server.tool()
+async def search_subagent_history(
+    query: str,
+    agent: Optional[str] = None,
+    project: Optional[str] = None,
+    limit: int = 10,
+    days: Optional[float] = None,
+    ctx: Context = None
+) -> str:
+    """
+    Search what subagents said in earlier runs, without re-running them.
+
+    Matches every word of the query (stemmed) against recorded instructions,
+    answers, tool calls and errors, best matches first. Open a hit in full
+    with get_subagent_transcript(run_id).
+
+    Args:
+        query: Words to search for (e.g. "cache layer eviction")
+        agent: Only runs of this agent (e.g. "gemini")
+        project: Only runs in this ABSOLUTE project path
+        limit: Maximum number of hits (default 10)
+        days: Only runs from the last N days
+
+    Returns:
+        Ranked hits with run id, agent, message number and a snippet
+    """
+    if not ERROR_HANDLING_AVAILABLE:
+        return "❌ History search is not available"
+    store = get_transcript_store()
+    if store is None or store.index is None:
+        return "❌ Transcripts are disabled (unset CLI_MCP_TRANSCRIPTS=false to record them)"
+
+    since = time.time() - days * 86400 if days else None
+    if project:
+        project = str(Path(project).absolute())
+    try:
+        hits = await store.index.search(
+            query, agent=agent.strip().lower() if agent else None,
+            project=project, since=since, limit=max(1, min(limit, 100))
+        )
+    except HistorySearchError as e:
+        return f"❌ History search failed: {e}"
+    if not hits:
+        return f"No matches for: {query}"
+    return f"{len(hits)} match(es) for: {query}\n" + "\n".join(
+        f"\n• run {hit['run']} #{hit['seq']} [{hit['type']}] {hit['agent']} "
+        f"{datetime.fromtimestamp(hit['ts']).strftime('%Y-%m-%d %H:%M')}"
+        + (f" {hit['project']}" if hit["project"] else "")
+        + f"\n  {hit['snippet']}"
+        for hit in hits
+    )
+
+
+def _parse_range(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """Parse "start:end" (either side optional) or a single index into slice bounds."""
+    if ":" not in text:
+        index = int(text)
+        return index, (index + 1) or None
+    start, stop = text.split(":", 1)
+    return (int(start) if start.strip() else None, int(stop) if stop.strip() else None)
+
+
+@server.tool()
+async def get_subagent_transcript(
+    run_id: str = "latest",
+    filter: Optional[str] = None,
+    range: Optional[str] = None,
+    ctx: Context = None
+) -> str:
+    """
+    Read back the messages of an earlier subagent run instead of re-running it.
+
+    Every subagent call is recorded. Use run_id "latest" or "latest:<agent>"
+    (e.g. "latest:codex") for the most recent run, or an empty run_id to list
+    recent runs with their ids.
+
+    Args:
+        run_id: Run id from the run list, "latest" or "latest:<agent>"
+        filter: Comma-separated message types to keep (e.g. "chat,tool_use,error")
+        range: Slice of message sequence numbers, "start:end" (e.g. "0:20", "-5:")
+
+    Returns:
+        The run's messages (message 0 is the instruction), or the list of recent runs
+    """
+    if not ERROR_HANDLING_AVAILABLE:
+        return "❌ Transcripts are not available"
+    store = get_transcript_store()
+    if store is None:
+        return "❌ Transcripts are disabled (unset CLI_MCP_TRANSCRIPTS=false to record them)"
+
+    if not run_id or not run_id.strip():
+        runs = await asyncio.to_thread(store.list_runs)
+        if not runs:
+            return "No subagent runs recorded yet"
+        return "Recent runs:\n" + "\n".join(
+            f"• {run['run']} {run['agent']} "
+            f"{datetime.fromtimestamp(run['started_at']).strftime('%Y-%m-%d %H:%M:%S')}: {run['instruction'][:80]}"
+            for run in runs
+        )
+
+    try:
+        start, stop = _parse_range(range or ":")
+    except ValueError:
+        return f"❌ Invalid range: {range} (expected \"start:end\", e.g. \"0:20\" or \"-5:\")"
+    types = {t.strip() for t in filter.split(",") if t.strip()} if filter else None
+
+    try:
+        transcript = await asyncio.to_thread(store.read, run_id.strip(), types, start, stop)
+    except TranscriptError as e:
+        logger.warning(str(e))
+        return f"❌ {e}"
+    if transcript is None:
+        return f"❌ Unknown run: {run_id}"
+
+    header = (
+        f"Run {transcript['run']} ({transcript['agent']}"
+        + (f", model {transcript['model']}" if transcript.get("model") else "")
+        + f"): {len(transcript['messages'])} of {transcript['total']} messages"
+    )
+    lines = [header]
+    for message in transcript["messages"]:
+        lines.append(f"\n#{message['seq']} [{message['type']}] {message['content']}")
+    return "\n".join(lines)
+
+
+@server.tool()
+async def get_roundtable_stats(window_minutes: Optional[int] = None, ctx: Context = None) -> str:
+    """
+    Get live latency percentiles and error rates for subagent executions.
+
+    Stats are grouped per agent, model and outcome, with p50/p95/p99 for total
+    duration, time to first token and time to first tool call. The state of
+    each agent's circuit breaker is included under "circuits".
+
+    Args:
+        window_minutes: Sliding window to report (default: 1, 5, 15 and 60 minutes)
+
+    Returns:
+        JSON document with per-window statistics
+    """
+    metrics = _import_module_item("metrics", "get_metrics_collector")()
+    if not metrics.enabled:
+        return "❌ Metrics collection is disabled (set CLI_MCP_METRICS=true to enable)"
+
+    windows = [window_minutes] if window_minutes else [1, 5, 15, 60]
+    now = time.time()
+    stats = {
+        f"{minutes}m": metrics.window_stats(minutes * 60, now=now)
+        for minutes in windows
+    }
+    return json.dumps(
+        {"since_start": metrics.get_stats(), "windows": stats, "circuits": circuit_snapshots()},
+        indent=2,
+    )
+
+
+@server.tool()
+async def profile_next_calls(n: int = 1, mode: Optional[str] = None, ctx: Context = None) -> str:
+    """
+    Profile the next N subagent executions on the server side.
+
+    Use this when a call is slow in Roundtable itself (parsing, summarization,
+    logging) rather than in the provider. Profiles are written to
+    ~/.roundtable/profiles/ as .pstats (cprofile) or collapsed-stack
+    flamegraph files (sample).
+
+    Args:
+        n: Number of upcoming subagent executions to profile (0 cancels)
+        mode: "cprofile" or "sample" (default: CLI_MCP_PROFILE, else cprofile)
+
+    Returns:
+        Confirmation with the profile mode and output directory
+    """
+    if not ERROR_HANDLING_AVAILABLE:
+        return "❌ Profiling is not available"
+
+    profiler = get_profiler()
+    try:
+        profiler.arm(n, mode)
+    except ValueError as e:
+        return f"❌ {e}"
+
+    if profiler.remaining == 0:
+        return "✅ Profiling cancelled"
+    recent = "".join(f"\n• {path}" for path in profiler.written[-5:])
+    return (
+        f"✅ Profiling the next {profiler.remaining} subagent call(s) with {profiler.mode}; "
+        f"output: {profiler.output_dir}"
+        + (f"\nRecent profiles:{recent}" if recent else "")
+    )
+
+
 @server.tool()
 async def test_tool(context: Context,signal: bool = True) -> Any:
     """
@@ -2192,8 +2856,16 @@ Examples:
 Environment Variables:
   CLI_MCP_SUBAGENTS          Comma-separated list of subagents (codex,claude,cursor,gemini,qwen)
   CLI_MCP_WORKING_DIR        Default working directory
-  CLI_MCP_DEBUG             Enable debug logging (true/false)
+  CLI_MCP_DEBUG              Log at DEBUG unless CLI_MCP_LOG_LEVEL is set (true/false)
+  CLI_MCP_LOG_LEVEL          Log level (default INFO)
+  CLI_MCP_LOG_FIELD_CHARS    Truncate logged messages to this many characters (default 2000)
   CLI_MCP_IGNORE_AVAILABILITY  Ignore availability cache (true/false)
+  CLI_MCP_AVAILABILITY_REFRESH Seconds between background availability re-checks (0 = off)
+  CLI_MCP_METRICS_PORT       Serve OpenMetrics on http://127.0.0.1:<port>/metrics
+  CLI_MCP_METRICS_SOCKET     Serve OpenMetrics on a Unix socket instead
+  CLI_MCP_SLOW_CALLBACK_MS   Log the blocking stack when the event loop stalls this long (default 100, 0 = off)
+  CLI_MCP_TRACE              Write per-call trace spans to a file (*.jsonl, or Chrome/Perfetto JSON)
+  CLI_MCP_PROFILE            Mode used by profile_next_calls: cprofile (default) or sample
 
 Priority Order:
   1. Command line --agents flag (highest priority)
@@ -2220,7 +2892,7 @@ Priority Order:
     parser.add_argument(
         "--debug",
         action="store_true",
-        help="Enable debug logging"
+        help="Enable debug logging (same as CLI_MCP_DEBUG=true)"
     )
     parser.add_argument(
         "--verbose",
@@ -2261,7 +2933,10 @@ Priority Order:
         os.environ["CLI_MCP_DEBUG"] = "true"
     if args.verbose:
         os.environ["CLI_MCP_VERBOSE"] = "true"
-        print(f"📋 Using agents from command line: {args.agents}")
+        logger.info(f"📋 Using agents from command line: {args.agents}")
+
+    # stdout carries JSON-RPC from here on; log anything else printed to it
+    _import_module_item("stdio_guard", "guard_stdout")()
 
     # Initialize configuration after processing command line arguments
     initialize_config()
@@ -0,0 +1,90 @@
+"""Keep stray writes off stdout while it carries the MCP stdio transport.
+
+Over stdio, stdout is the JSON-RPC channel: a ``print()`` from an adapter or
+a helper library both corrupts the framing and costs a synchronous flush on
+the event loop. ``guard_stdout()`` replaces ``sys.stdout`` with a text stream
+that turns each written line into a log record (so it goes through the
+queued, non-blocking logging pipeline to the log file and stderr), while its
+``buffer`` still exposes the real binary stdout that the MCP transport wraps.
+"""
+import io
+import logging
+import sys
+import threading
+from typing import Optional, TextIO
+
+logger = logging.getLogger("roundtable_mcp_server.stdout")
+
+
+class StdoutGuard(io.TextIOBase):
+    """Text stream that logs writes instead of emitting them on stdout."""
+
+    def __init__(self, protocol_stream: TextIO):
+        """Initialize the guard.
+
+        Args:
+            protocol_stream: The real stdout, reserved for protocol messages
+        """
+        super().__init__()
+        self.protocol_stream = protocol_stream
+        self._pending = ""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def buffer(self):
+        """Binary stdout, for the transport's own writer."""
+        return self.protocol_stream.buffer
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.protocol_stream, "encoding", "utf-8")
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            *lines, self._pending = (self._pending + text).split("\n")
+        for line in lines:
+            self._emit(line)
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            line, self._pending = self._pending, ""
+        self._emit(line)
+
+    def _emit(self, line: str) -> None:
+        if not line.strip():
+            return
+        if getattr(self._local, "emitting", False):
+            # A handler wrote to sys.stdout; don't loop back into logging
+            sys.__stderr__.write(line + "\n")
+            return
+        self._local.emitting = True
+        try:
+            logger.info(line)
+        finally:
+            self._local.emitting = False
+
+
+def guard_stdout() -> StdoutGuard:
+    """Install a StdoutGuard as ``sys.stdout`` (idempotent)."""
+    if isinstance(sys.stdout, StdoutGuard):
+        return sys.stdout
+    guard = StdoutGuard(sys.stdout)
+    sys.stdout = guard
+    return guard
+
+
+def restore_stdout() -> Optional[TextIO]:
+    """Flush and remove the guard, returning the restored stdout."""
+    if isinstance(sys.stdout, StdoutGuard):
+        sys.stdout.flush()
+        sys.stdout = sys.stdout.protocol_stream
+        return sys.stdout
+    return None
@@ -0,0 +1,533 @@
+"""Append-only transcript store for Roundtable MCP Server.
+
+Every message a subagent run produces is appended to a segmented log, so an
+earlier answer can be read back instead of re-running the agent. Layout under
+the transcript directory:
+
+- ``runs/<YYYYMMDD>.jsonl``: one line per run started that day (run id,
+  agent, session, model, project, start time, writer, first segment)
+- ``<session>/<writer>.<n>.seg``: records of a 4-byte length and a 1-byte
+  flag (bit 0 = zlib-compressed) followed by a JSON payload; a new segment
+  starts once the current one exceeds ``segment_bytes``
+- ``<session>/<writer>.<n>.idx``: sidecar JSON lines with run id, sequence
+  number, message type, offset and length of every record in the segment
+
+Runs without an MCP session are grouped per agent. Every server process is
+a separate writer with its own segment files, so processes sharing the
+directory never interleave records or offsets. All file I/O runs on one
+writer thread, in submission order, so recording never blocks the event
+loop and a read sees every message appended before it.
+
+Run records are kept in memory and topped up from the bytes other processes
+appended since the last lookup; the record offsets of this process's recent
+runs are kept in memory too, so only older or foreign runs scan a sidecar
+index (from the run's first segment, in its writer's files only). Segments
+and run lists untouched for ``retention_days`` are deleted. When a run
+finishes, its text messages are handed to the full-text index
+(history_index.py).
+
+Configured with environment variables:
+
+- CLI_MCP_TRANSCRIPTS: Set to false to stop recording transcripts
+- CLI_MCP_TRANSCRIPTS_DIR: Store directory (default $ROUNDTABLE_HOME/transcripts)
+- CLI_MCP_TRANSCRIPTS_COMPRESS: Compress records larger than 1 KiB with zlib
+- CLI_MCP_TRANSCRIPTS_RETENTION_DAYS: Days transcripts are kept (default 14, 0 = forever)
+"""
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from claudable_helper.core.config import roundtable_home
+
+from .history_index import INDEXED_TYPES, HistoryIndex
+
+logger = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct(">IB")
+FLAG_ZLIB = 0x01
+# Records smaller than this are never worth compressing
+COMPRESS_MIN_BYTES = 1024
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+DEFAULT_RETENTION_DAYS = 14
+# Seconds between two retention passes of a long-running server
+PRUNE_INTERVAL = 3600
+# This process's most recent runs whose record offsets are kept in memory
+MAX_CACHED_RUNS = 256
+RUNS_DIR = "runs"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+# (seq, message type, segment, offset) of one record
+Entry = Tuple[int, str, int, int]
+
+
+class TranscriptError(Exception):
+    """A transcript could not be read back."""
+
+
+def _bucket(agent: str, session_id: Optional[str]) -> str:
+    """Directory name of the log a run is appended to."""
+    if not session_id:
+        return agent
+    return f"{agent}-{_UNSAFE_CHARS.sub('_', session_id)[:64]}"
+
+
+def _segment_path(directory: Path, writer: str, segment: int, suffix: str) -> Path:
+    return directory / f"{writer}.{segment:06d}.{suffix}"
+
+
+class _SegmentLog:
+    """One writer's segmented log of a session; used from the writer thread only."""
+
+    def __init__(self, directory: Path, writer: str, segment_bytes: int):
+        self.directory = directory
+        self.writer = writer
+        self.segment_bytes = segment_bytes
+        self.segment = 1
+        directory.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+    @property
+    def path(self) -> Path:
+        return _segment_path(self.directory, self.writer, self.segment, "seg")
+
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._data = open(self.path, "ab")
+        self._index = open(_segment_path(self.directory, self.writer, self.segment, "idx"), "a", encoding="utf-8")
+        self.offset = self._data.tell()
+
+    def append(self, run_id: str, seq: int, message_type: str, payload: bytes, flags: int) -> Tuple[int, int]:
+        """Write one record and return its (segment, offset)."""
+        full = self.offset and self.offset + RECORD_HEADER.size + len(payload) > self.segment_bytes
+        # A segment deleted by another process's retention pass is replaced
+        if full or os.fstat(self._data.fileno()).st_nlink == 0:
+            self.close()
+            self.segment += 1
+            self._open()
+        record = RECORD_HEADER.pack(len(payload), flags) + payload
+        offset = self.offset
+        self._data.write(record)
+        self._index.write(json.dumps({
+            "run": run_id, "seq": seq, "type": message_type,
+            "offset": offset, "length": len(record),
+        }) + "\n")
+        self.offset += len(record)
+        return self.segment, offset
+
+    def flush(self) -> None:
+        self._data.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        self._data.close()
+        self._index.close()
+
+
+class TranscriptRun:
+    """Writer for the messages of one run."""
+
+    def __init__(
+        self,
+        store: "TranscriptStore",
+        run_id: str,
+        bucket: str,
+        agent: str,
+        project_path: Optional[str],
+    ):
+        self.store = store
+        self.run_id = run_id
+        self.bucket = bucket
+        self.agent = agent
+        self.project_path = project_path
+        self.count = 0
+        self._indexable: List[Tuple[int, str, str]] = []
+        self._closed = False
+
+    def append(
+        self,
+        message_type: str,
+        role: Optional[str],
+        content: Any,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Queue one message for the run's transcript."""
+        content = content if isinstance(content, str) else str(content)
+        message = {
+            "seq": self.count,
+            "type": message_type,
+            "role": role,
+            "content": content,
+            # Copied: the message is serialized later, on the writer thread
+            "metadata": dict(metadata) if isinstance(metadata, dict) else {},
+            "ts": time.time(),
+        }
+        self.store._submit(self.store._append, self.run_id, self.bucket, message)
+        if self.store.index is not None and message_type in INDEXED_TYPES:
+            self._indexable.append((self.count, message_type, content))
+        self.count += 1
+
+    def close(self) -> None:
+        """Flush the run's records to disk and queue them for full-text indexing."""
+        if self._closed:
+            return
+        self._closed = True
+        self.store._submit(self.store._finish, self)
+
+
+class TranscriptStore:
+    """Segmented, indexed log of subagent messages."""
+
+    def __init__(
+        self,
+        directory: Path,
+        compress: bool = False,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        index: Optional[HistoryIndex] = None,
+        retention_days: float = DEFAULT_RETENTION_DAYS,
+    ):
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the run lists and one folder per session
+            compress: Compress records of at least 1 KiB with zlib
+            segment_bytes: Size at which a new segment file is started
+            index: Full-text index that finished runs are added to
+            retention_days: Days after which untouched transcripts are deleted (0 = never)
+        """
+        self.directory = Path(directory)
+        self.compress = compress
+        self.segment_bytes = segment_bytes
+        self.index = index
+        self.retention_days = retention_days
+        self.writer = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._logs: Dict[str, _SegmentLog] = {}
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        # Bytes of each run list already loaded into _runs
+        self._runs_read: Dict[str, int] = {}
+        self._entries: "OrderedDict[str, List[Entry]]" = OrderedDict()
+        self._last_prune = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcripts")
+
+    def start_run(
+        self,
+        agent: str,
+        instruction: str,
+        session_id: Optional[str] = None,
+        model: Optional[str] = None,
+        project_path: Optional[str] = None,
+    ) -> TranscriptRun:
+        """Register a run and return its writer; the instruction is message 0."""
+        run_id = uuid.uuid4().hex[:12]
+        bucket = _bucket(agent, session_id)
+        now = time.time()
+        if self.retention_days > 0 and now - self._last_prune > PRUNE_INTERVAL:
+            self._last_prune = now
+            self._submit(self._prune, now)
+        self._submit(self._start, {
+            "run": run_id, "agent": agent, "bucket": bucket, "writer": self.writer,
+            "session_id": session_id, "model": model, "project_path": project_path,
+            "started_at": now, "instruction": instruction[:200],
+        })
+        run = TranscriptRun(self, run_id, bucket, agent, project_path)
+        run.append("instruction", "user", instruction)
+        return run
+
+    def list_runs(self, limit: int = 20, agent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent runs first, optionally for one agent."""
+        return self._call(self._list_runs, limit, agent)
+
+    def find_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Run record for ``run_id``; "latest" or "latest:<agent>" picks the newest."""
+        return self._call(self._find_run, run_id)
+
+    def read(
+        self,
+        run_id: str,
+        types: Optional[Set[str]] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Read a slice of a run's messages.
+
+        Args:
+            run_id: Run id, "latest" or "latest:<agent>"
+            types: Only return messages of these types
+            start: First sequence number (negative counts from the end)
+            stop: Sequence number to stop before (negative counts from the end)
+
+        Returns:
+            The run record with "total" (messages in the run) and "messages",
+            or None if the run is unknown
+
+        Raises:
+            TranscriptError: The run's files are missing or unreadable
+        """
+        return self._call(self._read, run_id, types, start, stop)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete run lists and segments untouched for ``retention_days``.
+
+        Returns:
+            Number of files removed
+        """
+        return self._call(self._prune, time.time() if now is None else now)
+
+    def flush(self) -> None:
+        """Wait until every queued message is on disk and finished runs are indexed."""
+        self._call(self._flush_logs)
+        if self.index is not None:
+            self.index.flush()
+
+    def close(self) -> None:
+        """Write what is queued, close all segment files and the full-text index."""
+        try:
+            self._call(self._close_logs)
+        except RuntimeError:
+            pass
+        self._executor.shutdown(wait=True)
+        if self.index is not None:
+            self.index.close()
+
+    # ---- Writer thread ----------------------------------------------------
+    def _prune(self, now: float) -> int:
+        if self.retention_days <= 0:
+            return 0
+        cutoff = now - self.retention_days * 86400
+        open_segments = {log.path for log in self._logs.values()}
+        removed = 0
+        for path in sorted(self.directory.glob("*/*.seg")) + sorted(self.directory.glob(f"{RUNS_DIR}/*.jsonl")):
+            try:
+                if path in open_segments or path.stat().st_mtime >= cutoff:
+                    continue
+                path.unlink()
+                if path.suffix == ".seg":
+                    path.with_suffix(".idx").unlink(missing_ok=True)
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not remove old transcript file {path}: {e}")
+        if removed:
+            for directory in self.directory.iterdir():
+                if directory.is_dir() and directory.name != RUNS_DIR:
+                    try:
+                        directory.rmdir()
+                    except OSError:
+                        pass
+            # Forget runs whose files are gone; the remaining lists are re-read on demand
+            self._runs.clear()
+            self._runs_read.clear()
+            if self.index is not None:
+                self.index.prune(cutoff)
+            logger.info(f"Removed {removed} transcript file(s) older than {self.retention_days:g} days")
+        return removed
+
+    def _submit(self, fn, *args) -> Optional[Future]:
+        try:
+            return self._executor.submit(self._guarded, fn, *args)
+        except RuntimeError:
+            logger.debug("Transcript store is closed; message not recorded")
+            return None
+
+    @staticmethod
+    def _guarded(fn, *args) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.warning(f"Could not write transcript: {e}")
+
+    def _call(self, fn, *args):
+        """Run ``fn`` on the writer thread after everything queued before it."""
+        return self._executor.submit(fn, *args).result()
+
+    def _log(self, bucket: str) -> _SegmentLog:
+        log = self._logs.get(bucket)
+        if log is None:
+            log = self._logs[bucket] = _SegmentLog(self.directory / bucket, self.writer, self.segment_bytes)
+        return log
+
+    def _start(self, record: Dict[str, Any]) -> None:
+        record["segment"] = self._log(record["bucket"]).segment
+        runs_dir = self.directory / RUNS_DIR
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        day = datetime.fromtimestamp(record["started_at"]).strftime("%Y%m%d")
+        with open(runs_dir / f"{day}.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        self._runs[record["run"]] = record
+        self._entries[record["run"]] = []
+        while len(self._entries) > MAX_CACHED_RUNS:
+            self._entries.popitem(last=False)
+
+    def _append(self, run_id: str, bucket: str, message: Dict[str, Any]) -> None:
+        payload = json.dumps(message, default=str, ensure_ascii=False).encode("utf-8")
+        flags = 0
+        if self.compress and len(payload) >= COMPRESS_MIN_BYTES:
+            payload = zlib.compress(payload)
+            flags |= FLAG_ZLIB
+        segment, offset = self._log(bucket).append(run_id, message["seq"], message["type"], payload, flags)
+        entries = self._entries.get(run_id)
+        if entries is not None:
+            entries.append((message["seq"], message["type"], segment, offset))
+
+    def _finish(self, run: TranscriptRun) -> None:
+        log = self._logs.get(run.bucket)
+        if log is not None:
+            log.flush()
+        if self.index is not None:
+            self.index.add_run(run.run_id, run.agent, run.project_path, run._indexable)
+
+    def _flush_logs(self) -> None:
+        for log in self._logs.values():
+            log.flush()
+
+    def _close_logs(self) -> None:
+        for log in self._logs.values():
+            log.close()
+        self._logs.clear()
+
+    def _refresh_runs(self) -> None:
+        """Load run records appended to the run lists since the last call."""
+        runs_dir = self.directory / RUNS_DIR
+        if not runs_dir.is_dir():
+            return
+        for path in sorted(runs_dir.glob("*.jsonl")):
+            position = self._runs_read.get(path.name, 0)
+            try:
+                if path.stat().st_size <= position:
+                    continue
+                with open(path, "rb") as f:
+                    f.seek(position)
+                    data = f.read()
+            except OSError:
+                continue
+            # A line another process is still writing is read next time
+            complete = data.rfind(b"\n") + 1
+            self._runs_read[path.name] = position + complete
+            for line in data[:complete].splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self._runs.setdefault(record["run"], record)
+
+    def _list_runs(self, limit: int, agent: Optional[str]) -> List[Dict[str, Any]]:
+        self._refresh_runs()
+        runs = [r for r in self._runs.values() if agent is None or r["agent"] == agent]
+        runs.sort(key=lambda r: r["started_at"], reverse=True)
+        return runs[:limit]
+
+    def _find_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        if run_id == "latest" or run_id.startswith("latest:"):
+            runs = self._list_runs(1, run_id.partition(":")[2] or None)
+            return runs[0] if runs else None
+        if run_id not in self._runs:
+            self._refresh_runs()
+        return self._runs.get(run_id)
+
+    def _read(
+        self,
+        run_id: str,
+        types: Optional[Set[str]],
+        start: Optional[int],
+        stop: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        run = self._find_run(run_id)
+        if run is None:
+            return None
+        directory = self.directory / run["bucket"]
+        try:
+            entries = self._entries.get(run["run"])
+            if entries is None:
+                entries = self._scan_index(directory, run)
+            elif run["bucket"] in self._logs:
+                self._logs[run["bucket"]].flush()
+
+            total = len(entries)
+            entries = entries[slice(start, stop)]
+            if types:
+                entries = [e for e in entries if e[1] in types]
+
+            messages = []
+            for segment, group in _by_segment(entries):
+                path = _segment_path(directory, run["writer"], segment, "seg")
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for _, _, _, offset in group:
+                        length, flags = RECORD_HEADER.unpack_from(mapped, offset)
+                        payload = mapped[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + length]
+                        if flags & FLAG_ZLIB:
+                            payload = zlib.decompress(payload)
+                        messages.append(json.loads(payload))
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            raise TranscriptError(f"Transcript of run {run['run']} is unreadable: {e}") from e
+        return {**run, "total": total, "messages": messages}
+
+    def _scan_index(self, directory: Path, run: Dict[str, Any]) -> List[Entry]:
+        """Record offsets of a run not cached in memory, from its writer's sidecar indexes."""
+        entries = []
+        needle = f'"{run["run"]}"'
+        segment = run["segment"]
+        while _segment_path(directory, run["writer"], segment, "idx").exists():
+            with open(_segment_path(directory, run["writer"], segment, "idx"), encoding="utf-8") as f:
+                for line in f:
+                    if needle in line:
+                        entry = json.loads(line)
+                        if entry["run"] == run["run"]:
+                            entries.append((entry["seq"], entry["type"], segment, entry["offset"]))
+            segment += 1
+        return entries
+
+
+def _by_segment(entries: List[Entry]):
+    """Group consecutive index entries by segment number."""
+    group: List[Entry] = []
+    for entry in entries:
+        if group and entry[2] != group[0][2]:
+            yield group[0][2], group
+            group = []
+        group.append(entry)
+    if group:
+        yield group[0][2], group
+
+
+# Global transcript store (None when disabled)
+_transcript_store: Optional[TranscriptStore] = None
+_configured = False
+
+
+def get_transcript_store() -> Optional[TranscriptStore]:
+    """Get the global transcript store, or None if transcripts are disabled."""
+    global _transcript_store, _configured
+    if not _configured:
+        _configured = True
+        if os.getenv("CLI_MCP_TRANSCRIPTS", "true").lower() not in ("false", "0", "no"):
+            directory = os.getenv("CLI_MCP_TRANSCRIPTS_DIR") or str(roundtable_home() / "transcripts")
+            compress = os.getenv("CLI_MCP_TRANSCRIPTS_COMPRESS", "false").lower() in ("true", "1", "yes")
+            try:
+                retention_days = float(os.getenv("CLI_MCP_TRANSCRIPTS_RETENTION_DAYS", DEFAULT_RETENTION_DAYS))
+            except ValueError:
+                retention_days = DEFAULT_RETENTION_DAYS
+            directory = Path(directory).expanduser()
+            _transcript_store = TranscriptStore(
+                directory, compress=compress, index=HistoryIndex(directory / "history.db"),
+                retention_days=retention_days,
+            )
+    return _transcript_store
+
+
+def reset_transcript_store() -> None:
+    """Close the global store; the environment is read again on next use."""
+    global _transcript_store, _configured
+    if _transcript_store is not None:
+        _transcript_store.close()
+    _transcript_store = None
+    _configured = False
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark preview log line classification.
+
+Compares the previous classifier (one ``in`` test per success pattern, per
+error pattern, then per lowercased context keyword, and two ``re.sub`` calls
+per error id) with the single-pass LineMatcher, on a recorded Next.js dev
+server log. Both must classify every line the same way. As in the preview
+monitor, context keywords are only checked while an error is being
+collected.
+
+    python scripts/bench_preview_log_matcher.py [log file] [repeats]
+"""
+import hashlib
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from claudable_helper.services.local_runtime import (  # noqa: E402
+    CONTEXT_KEYWORDS,
+    ERROR_PATTERNS,
+    SUCCESS_PATTERNS,
+)
+from claudable_helper.services.log_matcher import (  # noqa: E402
+    CONTEXT,
+    ERROR,
+    SUCCESS,
+    LineMatcher,
+    error_fingerprint,
+)
+
+DEFAULT_LOG = Path(__file__).resolve().parent / "data" / "nextjs_dev.log"
+
+
+def legacy_classify(line, context=True):
+    for pattern in SUCCESS_PATTERNS:
+        if pattern in line:
+            return SUCCESS
+    for pattern in ERROR_PATTERNS:
+        if pattern in line:
+            return ERROR
+    if context and any(x in line.lower() for x in CONTEXT_KEYWORDS):
+        return CONTEXT
+    return None
+
+
+def legacy_error_id(line):
+    core_error = line.strip()
+    core_error = re.sub(r'\d{2}:\d{2}:\d{2}', '', core_error)
+    core_error = re.sub(r'at .*?:\d+:\d+', '', core_error)
+    return hashlib.md5(core_error.encode()).hexdigest()[:8]
+
+
+def error_id(line):
+    return hashlib.md5(error_fingerprint(line).encode()).hexdigest()[:8]
+
+
+def run(lines, classify, make_id):
+    collecting = False
+    start = time.perf_counter()
+    for line in lines:
+        category = classify(line, collecting)
+        if category == ERROR:
+            make_id(line)
+            collecting = True
+        elif category == SUCCESS:
+            collecting = False
+    return time.perf_counter() - start
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LOG
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    recorded = [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    matcher = LineMatcher(SUCCESS_PATTERNS, ERROR_PATTERNS, CONTEXT_KEYWORDS)
+
+    mismatches = [
+        line for line in recorded for context in (True, False)
+        if legacy_classify(line, context) != matcher.classify(line, context)
+        or legacy_error_id(line) != error_id(line)
+    ]
+    assert not mismatches, f"classifiers disagree on: {mismatches[:3]}"
+
+    lines = recorded * repeats
+    print(f"{len(recorded)} recorded lines x {repeats} = {len(lines)} lines")
+    results = {}
+    for name, classify, make_id in (
+        ("per-pattern", legacy_classify, legacy_error_id),
+        ("single-pass", matcher.classify, error_id),
+    ):
+        best = min(run(lines, classify, make_id) for _ in range(5))
+        results[name] = len(lines) / best
+        print(f"{name:>12}: {results[name]:>12,.0f} lines/s")
+    print(f"{'speedup':>12}: {results['single-pass'] / results['per-pattern']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
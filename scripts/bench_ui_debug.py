@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Benchmark the per-chunk cost of adapter debug logging when DEBUG is off.
+
+Compares the old eager f-string call (formatted even though nothing is
+printed, plus an environment lookup per call) with the lazy ``%``-style call
+that ``ui.debug`` now supports, on a payload shaped like a Gemini
+``session/update`` notification.
+
+    python scripts/bench_ui_debug.py [iterations]
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.pop("DEBUG", None)
+
+from claudable_helper.core.terminal_ui import ui  # noqa: E402
+
+UPDATE = {
+    "sessionUpdate": "agent_message_chunk",
+    "content": {"type": "text", "text": "Refactoring the parser so errors carry line numbers. " * 8},
+}
+TURN_ID = "3f2a9c1d"
+
+
+def _eager_debug(message, category="DEBUG"):
+    # What MockTerminalUI.debug did before: an environment lookup per call
+    if os.environ.get("DEBUG", "").lower() in ("1", "true", "yes"):
+        print(f"[{category}] {message}", file=sys.stderr)
+
+
+def eager():
+    _eager_debug(f"[{TURN_ID}] putting update in queue: {UPDATE}", "Gemini")
+
+
+def lazy():
+    ui.debug("[%s] putting update in queue: %s", "Gemini", TURN_ID, UPDATE)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    assert not ui.debug_enabled, "unset DEBUG before benchmarking"
+    results = {}
+    for name, func in (("eager f-string", eager), ("lazy %-args", lazy)):
+        best = min(timeit.repeat(func, number=iterations, repeat=5))
+        results[name] = best / iterations * 1e9
+        print(f"{name:>16}: {results[name]:8.0f} ns/call")
+    saved = results["eager f-string"] - results["lazy %-args"]
+    print(f"{'saved':>16}: {saved:8.0f} ns/call ({results['eager f-string'] / results['lazy %-args']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -103,6 +103,34 @@ def reset_env_vars():
     os.environ.update(original_env)
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Start each test with every agent's circuit closed."""
+    from roundtable_mcp_server.circuit_breaker import reset_circuit_breakers
+    
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.fixture(autouse=True)
+def isolated_roundtable_home(tmp_path, monkeypatch):
+    """Keep sessions, transcripts and the node_modules cache under a per-test ROUNDTABLE_HOME."""
+    from claudable_helper.cli.session_store import reset_session_store
+    from claudable_helper.services.node_modules_cache import reset_node_modules_cache
+    from roundtable_mcp_server.transcripts import reset_transcript_store
+    
+    resets = (reset_session_store, reset_transcript_store, reset_node_modules_cache)
+    monkeypatch.setenv("ROUNDTABLE_HOME", str(tmp_path / "roundtable"))
+    for name in ("CLAUDABLE_SESSION_DB", "CLI_MCP_TRANSCRIPTS_DIR", "CLAUDABLE_NODE_MODULES_CACHE"):
+        monkeypatch.delenv(name, raising=False)
+    for reset in resets:
+        reset()
+    yield
+    for reset in resets:
+        reset()
+
+
 @pytest.fixture
 def mock_cli_adapter():
     """Mock CLI adapter base class."""
@@ -0,0 +1,137 @@
+"""Integration test: only JSON-RPC reaches stdout over the stdio transport."""
+import json
+import os
+import queue
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Stand-in for `codex` that speaks just enough of the proto protocol
+FAKE_CODEX = textwrap.dedent('''\
+    #!{python}
+    import json, sys
+
+    if "--version" in sys.argv:
+        print("codex-cli 0.0.0-test")
+        sys.exit(0)
+
+    def emit(event):
+        sys.stdout.write(json.dumps(event) + "\\n")
+        sys.stdout.flush()
+
+    print("codex starting up", file=sys.stderr)
+    emit({{"id": "", "msg": {{"type": "session_configured", "session_id": "s-1", "model": "gpt-5"}}}})
+    for line in sys.stdin:
+        op = json.loads(line)
+        if op["op"]["type"] != "user_input":
+            continue
+        rid = op["id"]
+        emit({{"id": rid, "msg": {{"type": "agent_message_delta", "delta": "Done: "}}}})
+        emit({{"id": rid, "msg": {{"type": "agent_message_delta", "delta": "added the function."}}}})
+        emit({{"id": rid, "msg": {{"type": "task_complete"}}}})
+        break
+''')
+
+
+def _send(proc, message):
+    proc.stdin.write((json.dumps(message) + "\n").encode())
+    proc.stdin.flush()
+
+
+def _read_until(lines, stdout_lines, request_id, timeout=60):
+    while True:
+        line = lines.get(timeout=timeout)
+        assert line is not None, "server closed stdout before responding"
+        stdout_lines.append(line)
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+class TestStdoutProtocol:
+    """Test stdout carries nothing but JSON-RPC during a subagent run."""
+    
+    def test_full_subagent_run_keeps_stdout_clean(self, tmp_path):
+        """Test a codex_subagent call writes only JSON-RPC messages to stdout."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        codex = bin_dir / "codex"
+        codex.write_text(FAKE_CODEX.format(python=sys.executable))
+        codex.chmod(0o755)
+        project = tmp_path / "project"
+        project.mkdir()
+        
+        env = {
+            **os.environ,
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "HOME": str(tmp_path),
+            "PYTHONPATH": str(REPO_ROOT),
+            "CLI_MCP_SUBAGENTS": "codex",
+            "CLI_MCP_LOG_LEVEL": "DEBUG",
+            "DEBUG": "1",
+        }
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "roundtable_mcp_server"],
+            cwd=tmp_path,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        lines: "queue.Queue" = queue.Queue()
+        
+        def pump():
+            for raw in proc.stdout:
+                lines.put(raw.decode())
+            lines.put(None)
+        
+        threading.Thread(target=pump, daemon=True).start()
+        stderr_reader = threading.Thread(target=proc.stderr.read, daemon=True)
+        stderr_reader.start()
+        
+        stdout_lines = []
+        try:
+            _send(proc, {
+                "jsonrpc": "2.0", "id": 1, "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-06-18",
+                    "capabilities": {},
+                    "clientInfo": {"name": "stdout-test", "version": "0"},
+                },
+            })
+            _read_until(lines, stdout_lines, 1)
+            _send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+            _send(proc, {
+                "jsonrpc": "2.0", "id": 2, "method": "tools/call",
+                "params": {
+                    "name": "codex_subagent",
+                    "arguments": {"instruction": "Add a function", "project_path": str(project)},
+                },
+            })
+            result = _read_until(lines, stdout_lines, 2)
+        finally:
+            proc.stdin.close()
+            try:
+                proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        
+        while True:
+            line = lines.get(timeout=10)
+            if line is None:
+                break
+            stdout_lines.append(line)
+        
+        assert "added the function" in json.dumps(result["result"])
+        for line in stdout_lines:
+            message = json.loads(line)
+            assert message["jsonrpc"] == "2.0"
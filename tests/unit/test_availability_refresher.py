@@ -0,0 +1,109 @@
+"""Unit tests for the background availability refresher."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from roundtable_mcp_server import server
+from roundtable_mcp_server.availability_checker import CLIAvailabilityChecker
+from roundtable_mcp_server.availability_refresher import AvailabilityRefresher
+
+
+def _results(**available):
+    results = {
+        name: {"available": is_available, "status": "", "error": None}
+        for name, is_available in available.items()
+    }
+    results["_metadata"] = {"available_count": sum(available.values())}
+    return results
+
+
+@pytest.fixture
+def checker(tmp_path):
+    checker = CLIAvailabilityChecker(roundtable_dir=tmp_path)
+    checker.check_all_availability = AsyncMock()
+    return checker
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAvailabilityRefresher:
+    """Test AvailabilityRefresher class."""
+
+    async def test_refresh_reports_change(self, checker):
+        """Test a newly available agent triggers on_change."""
+        checker.check_all_availability.return_value = _results(codex=True, gemini=True, qwen=False)
+        on_change = AsyncMock()
+        refresher = AvailabilityRefresher(on_change, checker=checker, current={"codex"})
+
+        available = await refresher.refresh()
+
+        assert available == {"codex", "gemini"}
+        on_change.assert_awaited_once_with({"codex", "gemini"})
+        assert checker.get_available_clis() == ["codex", "gemini"]
+
+    async def test_refresh_without_change(self, checker):
+        """Test on_change is not called when availability is unchanged."""
+        checker.check_all_availability.return_value = _results(codex=True, gemini=False)
+        on_change = AsyncMock()
+        refresher = AvailabilityRefresher(on_change, checker=checker, current={"codex"})
+
+        await refresher.refresh()
+
+        on_change.assert_not_awaited()
+
+    async def test_path_change_triggers_refresh(self, checker, tmp_path, monkeypatch):
+        """Test a new executable on PATH triggers a re-check before the interval."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        monkeypatch.setenv("PATH", str(bin_dir))
+        checker.check_all_availability.return_value = _results(codex=True)
+        changed = asyncio.Event()
+
+        async def on_change(available):
+            changed.set()
+
+        refresher = AvailabilityRefresher(
+            on_change, interval=3600, checker=checker, poll_interval=0.05, debounce=0.01
+        )
+        await refresher.start()
+        try:
+            (bin_dir / "codex").write_text("#!/bin/sh\n")
+            await asyncio.wait_for(changed.wait(), timeout=5)
+        finally:
+            await refresher.stop()
+
+        assert refresher.current == {"codex"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHotReload:
+    """Test applying refreshed availability to the server."""
+
+    async def test_apply_enabled_subagents(self):
+        """Test enabled subagents are swapped and clients notified."""
+        server.enabled_subagents = {"codex"}
+        session = MagicMock()
+        session.send_tool_list_changed = AsyncMock()
+        server._client_sessions.add(session)
+
+        try:
+            await server._apply_enabled_subagents({"codex", "gemini"})
+        finally:
+            server._client_sessions.discard(session)
+
+        assert server.enabled_subagents == {"codex", "gemini"}
+        session.send_tool_list_changed.assert_awaited_once()
+
+    async def test_sdk_hooks_in_place(self):
+        """Test the FastMCP internals behind tools/list_changed still exist in this SDK."""
+        from mcp import types
+        from mcp.server.fastmcp import FastMCP
+
+        options = server.server._mcp_server.create_initialization_options()
+        assert options.capabilities.tools.listChanged is True
+
+        app = FastMCP("hooks")
+        assert server._install_tool_list_changed_hooks(app)
+        assert types.ListToolsRequest in app._mcp_server.request_handlers
+        assert app._mcp_server.create_initialization_options().capabilities.tools.listChanged is True
@@ -0,0 +1,99 @@
+"""Unit tests for per-agent circuit breakers."""
+import pytest
+
+from roundtable_mcp_server.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    circuit_snapshots,
+    get_circuit_breaker,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+    
+    def test_opens_on_failure_rate(self):
+        """Test the circuit opens once the window's failure rate crosses the threshold."""
+        breaker = CircuitBreaker("codex", min_calls=4, failure_rate_threshold=0.5, clock=FakeClock())
+        
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+    
+    def test_old_outcomes_leave_window(self):
+        """Test failures outside the sliding window no longer count."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("codex", window=60, min_calls=3, clock=clock)
+        
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 61
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_success()
+        
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.failure_rate() == pytest.approx(1 / 3)
+    
+    def test_half_open_trial(self):
+        """Test an open circuit allows one trial call after the timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("codex", min_calls=1, open_duration=30, clock=clock)
+        breaker.record_failure()
+        
+        clock.now += 10
+        assert breaker.retry_after() == pytest.approx(20)
+        clock.now += 20
+        
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_half_open_failure_reopens(self):
+        """Test a failed trial call opens the circuit again."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("codex", min_calls=1, open_duration=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.allow()
+        
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_after() == pytest.approx(30)
+    
+    def test_release_returns_trial_slot(self):
+        """Test a cancelled trial call frees the half-open slot."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("codex", min_calls=1, open_duration=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.allow()
+        
+        breaker.release()
+        
+        assert breaker.allow()
+    
+    def test_registry(self):
+        """Test breakers are created once per agent and reported."""
+        breaker = get_circuit_breaker("gemini")
+        
+        assert get_circuit_breaker("gemini") is breaker
+        assert circuit_snapshots()["gemini"]["state"] == "closed"
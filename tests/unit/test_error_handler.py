@@ -4,7 +4,8 @@ from pathlib import Path
 from roundtable_mcp_server.error_handler import (
     validate_project_path,
     format_error_response,
-    log_error_with_context
+    log_error_with_context,
+    handle_agent_error
 )
 from roundtable_mcp_server.exceptions import (
     PathValidationError,
@@ -153,3 +154,16 @@ class TestLogErrorWithContext:
         
         assert "test_operation" in caplog.text
         assert "RuntimeError" in caplog.text
+
+
+
+@pytest.mark.unit
+class TestHandleAgentError:
+    """Test agent error handling."""
+    
+    def test_handle_agent_error(self, caplog):
+        """Test agent errors are logged and formatted."""
+        result = handle_agent_error(RuntimeError("boom"), "codex", "Fix the bug")
+        
+        assert result == "❌ codex - RuntimeError: boom"
+        assert "codex_subagent" in caplog.text
@@ -11,7 +11,7 @@ from roundtable_mcp_server.exceptions import (
     TimeoutError,
     RetryableError
 )
-from roundtable_mcp_server.retry import retry_async, retry_sync
+from roundtable_mcp_server.retry import RetryBudget, backoff_delay, retry_async, retry_sync
 
 
 @pytest.mark.unit
@@ -184,3 +184,42 @@ class TestRetrySync:
             always_fail()
         
         assert call_count == 2
+
+
+@pytest.mark.unit
+class TestBackoff:
+    """Test jittered backoff and the retry budget."""
+    
+    def test_full_jitter_bounds(self):
+        """Test jittered delays stay within the capped exponential bound."""
+        delays = [backoff_delay(3, 1.0, 2.0, 5.0) for _ in range(200)]
+        
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 1
+        assert backoff_delay(3, 1.0, 2.0, 30.0, jitter=False) == 8.0
+    
+    def test_budget_caps_retries(self):
+        """Test retries are limited to a fraction of requests."""
+        budget = RetryBudget(ratio=0.1, min_retries=1, window=60, clock=lambda: 0.0)
+        for _ in range(20):
+            budget.record_request()
+        
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+    
+    def test_exhausted_budget_stops_retrying(self):
+        """Test the decorator gives up once the budget is spent."""
+        budget = RetryBudget(ratio=0, min_retries=0)
+        call_count = 0
+        
+        @retry_sync(max_attempts=3, delay=0.01, budget=budget)
+        def always_fail():
+            nonlocal call_count
+            call_count += 1
+            raise RetryableError("Always fails")
+        
+        with pytest.raises(RetryableError):
+            always_fail()
+        
+        assert call_count == 1
@@ -0,0 +1,67 @@
+"""Unit tests for streaming latency histograms."""
+import random
+import pytest
+
+from roundtable_mcp_server.histogram import GROWTH, LogHistogram, WindowedHistogram
+
+
+@pytest.mark.unit
+class TestLogHistogram:
+    """Test LogHistogram class."""
+    
+    def test_empty(self):
+        """Test an empty histogram has no quantiles."""
+        histogram = LogHistogram()
+        
+        assert histogram.quantile(0.5) is None
+        assert histogram.summary() == {"count": 0}
+    
+    def test_quantile_accuracy(self):
+        """Test quantiles are within the bucket growth factor of exact values."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(0, 1.5) for _ in range(10000)]
+        histogram = LogHistogram()
+        for value in values:
+            histogram.record(value)
+        
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * len(ordered)) - 1]
+            assert exact / GROWTH <= histogram.quantile(q) <= exact * GROWTH
+    
+    def test_merge(self):
+        """Test merging preserves count, total and extremes."""
+        first, second = LogHistogram(), LogHistogram()
+        first.record(1.0)
+        second.record(10.0)
+        
+        first.merge(second)
+        
+        assert first.count == 2
+        assert first.total == 11.0
+        assert first.min == 1.0
+        assert first.max == 10.0
+
+
+@pytest.mark.unit
+class TestWindowedHistogram:
+    """Test WindowedHistogram class."""
+    
+    def test_window_excludes_old_slices(self):
+        """Test observations older than the window are not counted."""
+        histogram = WindowedHistogram(slice_seconds=60)
+        histogram.record(1.0, now=0)
+        histogram.record(2.0, now=600)
+        
+        assert histogram.window(60, now=600).count == 1
+        assert histogram.window(900, now=600).count == 2
+        assert histogram.total.count == 2
+    
+    def test_max_slices_bounds_memory(self):
+        """Test only the most recent slices are retained."""
+        histogram = WindowedHistogram(slice_seconds=1, max_slices=5)
+        for second in range(20):
+            histogram.record(1.0, now=second)
+        
+        assert histogram.window(3600, now=19).count == 5
+        assert histogram.total.count == 20
@@ -0,0 +1,306 @@
+"""Tests for the preview process runtime."""
+import asyncio
+import socket
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from claudable_helper.services import local_runtime
+
+
+class RecordingManager:
+    """Stands in for the WebSocket manager and records sent messages."""
+    
+    def __init__(self):
+        self.messages = []
+    
+    async def send_message(self, client_id, message):
+        self.messages.append((client_id, message))
+
+
+@pytest.fixture
+def ws():
+    recorder = RecordingManager()
+    with patch.object(local_runtime, "manager", recorder):
+        yield recorder
+    for project_id in list(local_runtime._process_logs):
+        local_runtime._clear_logs(project_id)
+
+
+class FinishedProcess:
+    """A preview process that has already exited."""
+    
+    pid = 4242
+    returncode = 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPreviewMonitor:
+    """Test line classification and batched event delivery."""
+    
+    async def test_batches_events_and_keeps_latest_success(self, ws):
+        monitor = local_runtime._PreviewMonitor("p1", flush_interval=0.01)
+        for line in ["○ Compiling /page ...", "✓ Compiled in 300ms", "GET / 200 in 12ms"]:
+            monitor.feed(line + "\n")
+        assert ws.messages == []
+        
+        await asyncio.sleep(0.05)
+        assert [m["type"] for _, m in ws.messages] == ["preview_success"]
+        assert ws.messages[0][1]["success"]["message"] == "✓ Compiled in 300ms"
+        assert local_runtime._process_logs["p1"].last == "GET / 200 in 12ms"
+    
+    async def test_error_context_sent_on_close(self, ws):
+        monitor = local_runtime._PreviewMonitor("p1")
+        monitor.feed("TypeError: Cannot read properties of undefined\n")
+        monitor.feed("    at Page (app/page.tsx:3:10)\n")
+        monitor.feed("unrelated line\n")
+        await monitor.close()
+        
+        [(client_id, message)] = ws.messages
+        assert client_id == "p1"
+        assert message["type"] == "preview_error"
+        assert message["error"]["context"].splitlines() == [
+            "TypeError: Cannot read properties of undefined",
+            "at Page (app/page.tsx:3:10)",
+        ]
+    
+    async def test_duplicate_errors_suppressed(self, ws):
+        monitor = local_runtime._PreviewMonitor("p1")
+        for _ in range(2):
+            monitor.feed("Module not found: Can't resolve 'x'\n")
+            monitor.feed("✓ Compiled in 10ms\n")
+            monitor.feed("Module not found: Can't resolve 'x'\n")
+            monitor.feed("ReferenceError: y is not defined\n")
+        await monitor.close()
+        
+        errors = [m for _, m in ws.messages if m["type"] == "preview_error"]
+        assert len(errors) == 2
+    
+    async def test_reader_task_consumes_subprocess_output(self, ws):
+        script = "print('✓ Ready in 500ms'); print('Error: boom'); print('failed at build')"
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", script,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        with patch("asyncio.new_event_loop", side_effect=AssertionError("no new loops")):
+            await local_runtime._monitor_preview_output("p1", process)
+        await process.wait()
+        
+        assert [m["type"] for _, m in ws.messages] == ["preview_success", "preview_error"]
+        assert ws.messages[1][1]["error"]["context"] == "Error: boom\nfailed at build"
+    
+    async def test_log_getters_read_stored_lines(self, ws):
+        for line in ["> dev", "Error: boom", "GET / 200"]:
+            local_runtime._log_buffer("p1").append(line)
+        with patch.dict(local_runtime._running_processes, {"p1": object()}):
+            assert local_runtime.get_preview_logs("p1", lines=2) == "Error: boom\nGET / 200"
+            assert local_runtime.get_preview_error_logs("p1") == "Error: boom"
+        assert local_runtime.get_preview_logs("p1") == "No logs available - process not running or no output"
+    
+    async def test_configured_patterns_drive_classification(self, ws):
+        try:
+            local_runtime.configure_preview_patterns(success=["BUILD OK"], error=["BUILD FAILED"])
+            monitor = local_runtime._PreviewMonitor("p1")
+            monitor.feed("BUILD FAILED: step 2\n")
+            monitor.feed("✓ Compiled in 10ms\n")
+            monitor.feed("BUILD OK\n")
+            await monitor.close()
+        finally:
+            local_runtime.configure_preview_patterns()
+        
+        assert [m["type"] for _, m in ws.messages] == ["preview_success"]
+        assert ws.messages[0][1]["success"]["message"] == "BUILD OK"
+    
+    async def test_logs_since_sequence(self, ws):
+        monitor = local_runtime._PreviewMonitor("p1")
+        for line in ["GET / 200 in 5ms", "GET / 200 in 5ms", "GET /api 200 in 3ms"]:
+            monitor.feed(line + "\n")
+        
+        page = local_runtime.get_preview_logs_since("p1")
+        assert page["lines"] == ["GET / 200 in 5ms", "GET /api 200 in 3ms"]
+        
+        monitor.feed("GET /about 200 in 9ms\n")
+        assert local_runtime.get_preview_logs_since("p1", page["next"])["lines"] == ["GET /about 200 in 9ms"]
+        assert local_runtime.get_preview_logs_since("missing", 7)["next"] == 7
+    
+    async def test_exited_preview_releases_port(self, ws):
+        allocator = local_runtime.PortAllocator(3000, 3001, probe=lambda port: True)
+        with patch.object(local_runtime, "_port_allocator", allocator):
+            port = local_runtime.find_free_preview_port()
+            local_runtime._running_processes["p1"] = FinishedProcess()
+            local_runtime._preview_ports["p1"] = port
+            
+            assert local_runtime.preview_status("p1") == "stopped"
+            assert allocator.reserved() == set()
+            assert local_runtime.find_free_preview_port() == port
+
+
+async def spawn(script):
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-c", script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,
+    )
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPreviewReadiness:
+    """Test readiness probing of launched previews."""
+    
+    async def register(self, project_id, script, port, timeout=5.0):
+        process = await spawn(script)
+        marker = asyncio.Event()
+        local_runtime._running_processes[project_id] = process
+        local_runtime._monitor_tasks[project_id] = asyncio.create_task(
+            local_runtime._monitor_preview_output(project_id, process, marker)
+        )
+        return process, asyncio.create_task(
+            local_runtime._await_preview_ready(project_id, process, port, marker, timeout)
+        )
+    
+    async def test_ready_marker(self, ws):
+        script = "import time; print('✓ Ready in 12ms', flush=True); time.sleep(30)"
+        process, ready = await self.register("p1", script, unused_port())
+        
+        started = time.monotonic()
+        assert await ready < 2
+        assert time.monotonic() - started < 2
+        await local_runtime.stop_preview_process("p1")
+        assert process.returncode is not None
+    
+    async def test_port_answering_http(self, ws):
+        async def respond(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            writer.close()
+        
+        server = await asyncio.start_server(respond, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            _, ready = await self.register("p1", "import time; time.sleep(30)", port)
+            assert await ready < 2
+        finally:
+            await local_runtime.stop_preview_process("p1")
+            server.close()
+            await server.wait_closed()
+    
+    async def test_listener_without_http_is_not_ready(self, ws):
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            process, ready = await self.register("p1", "import time; time.sleep(30)", port, timeout=0.5)
+            with pytest.raises(RuntimeError, match="not ready after 0.5s"):
+                await ready
+        finally:
+            server.close()
+            await server.wait_closed()
+    
+    async def test_foreign_server_on_port_after_exit(self, ws):
+        async def respond(reader, writer):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            writer.close()
+        
+        server = await asyncio.start_server(respond, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            process = await spawn("import sys; sys.exit(1)")
+            await process.wait()
+            local_runtime._running_processes["p1"] = process
+            with pytest.raises(RuntimeError, match="exited with code 1"):
+                await local_runtime._await_preview_ready("p1", process, port, asyncio.Event(), 5)
+        finally:
+            server.close()
+            await server.wait_closed()
+    
+    async def test_fails_early_when_process_exits(self, ws):
+        script = "import sys; print('Error: port in use'); sys.exit(3)"
+        process, ready = await self.register("p1", script, unused_port(), timeout=30)
+        
+        started = time.monotonic()
+        with pytest.raises(RuntimeError, match="exited with code 3") as excinfo:
+            await ready
+        assert time.monotonic() - started < 5
+        assert "Error: port in use" in str(excinfo.value)
+        assert "p1" not in local_runtime._running_processes
+    
+    async def test_timeout_stops_preview(self, ws):
+        process, ready = await self.register("p1", "import time; time.sleep(30)", unused_port(), timeout=0.3)
+        
+        with pytest.raises(RuntimeError, match="not ready after 0.3s"):
+            await ready
+        assert process.returncode is not None
+        assert "p1" not in local_runtime._running_processes
+    
+    async def test_start_preview_process_waits_for_ready(self, ws, tmp_path, monkeypatch, capsys):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        npm = bin_dir / "npm"
+        npm.write_text("#!/bin/sh\necho '✓ Ready in 5ms'\nexec sleep 30\n")
+        npm.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}:{local_runtime.os.environ['PATH']}")
+        repo = tmp_path / "repo"
+        (repo / "node_modules").mkdir(parents=True)
+        (repo / "package.json").write_text('{"name": "app"}')
+        local_runtime._save_install_hash(str(repo))
+        port = unused_port()
+        
+        try:
+            name, started_port = await local_runtime.start_preview_process("p1", str(repo), port=port)
+            assert (name, started_port) == ("next-dev-p1", port)
+            assert local_runtime.preview_status("p1") == "running"
+            assert await local_runtime.get_preview_handle("p1").ready < 2
+        finally:
+            await local_runtime.stop_preview_process("p1")
+        assert local_runtime.preview_status("p1") == "not_found"
+        # stdout is the MCP stdio transport; progress goes to the logger
+        assert capsys.readouterr().out == ""
+        assert port not in local_runtime._get_port_allocator().reserved()
+    
+    async def test_dependency_file_work_runs_off_the_loop(self, ws, tmp_path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        npm = bin_dir / "npm"
+        npm.write_text("#!/bin/sh\n[ \"$1\" = install ] && exit 0\necho '✓ Ready in 5ms'\nexec sleep 30\n")
+        npm.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}:{local_runtime.os.environ['PATH']}")
+        monkeypatch.setenv("CLAUDABLE_NODE_MODULES_CACHE", "false")
+        repo = tmp_path / "repo"
+        (repo / "node_modules" / ".pnpm").mkdir(parents=True)
+        (repo / "package.json").write_text('{"name": "app"}')
+        (repo / "pnpm-lock.yaml").write_text("lockfileVersion: 9\n")
+        loop_thread = threading.current_thread()
+        threads = {}
+        
+        def recording(name, function):
+            def wrapper(*args, **kwargs):
+                threads[name] = threading.current_thread()
+                return function(*args, **kwargs)
+            return wrapper
+        
+        monkeypatch.setattr(local_runtime.shutil, "rmtree", recording("rmtree", local_runtime.shutil.rmtree))
+        for name in ("_should_install_dependencies", "_save_install_hash"):
+            monkeypatch.setattr(local_runtime, name, recording(name, getattr(local_runtime, name)))
+        
+        try:
+            await local_runtime.start_preview_process("p1", str(repo), port=unused_port())
+        finally:
+            await local_runtime.stop_preview_process("p1")
+        
+        assert not (repo / "pnpm-lock.yaml").exists()
+        assert set(threads) == {"rmtree", "_should_install_dependencies", "_save_install_hash"}
+        assert loop_thread not in threads.values()
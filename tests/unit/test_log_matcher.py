@@ -0,0 +1,82 @@
+"""Tests for single-pass preview log classification."""
+from pathlib import Path
+
+import pytest
+
+from claudable_helper.services.local_runtime import (
+    CONTEXT_KEYWORDS,
+    ERROR_PATTERNS,
+    SUCCESS_PATTERNS,
+)
+from claudable_helper.services.log_matcher import (
+    CONTEXT,
+    ERROR,
+    SUCCESS,
+    LineMatcher,
+    error_fingerprint,
+    trie_pattern,
+)
+
+RECORDED_LOG = Path(__file__).resolve().parents[2] / "scripts" / "data" / "nextjs_dev.log"
+
+
+def legacy_classify(line):
+    """The per-pattern classification the matcher replaces."""
+    if any(p in line for p in SUCCESS_PATTERNS):
+        return SUCCESS
+    if any(p in line for p in ERROR_PATTERNS):
+        return ERROR
+    if any(x in line.lower() for x in CONTEXT_KEYWORDS):
+        return CONTEXT
+    return None
+
+
+@pytest.mark.unit
+class TestLineMatcher:
+    """Test classification precedence, configuration and equivalence."""
+    
+    def test_matches_legacy_classification_on_recorded_log(self):
+        matcher = LineMatcher(SUCCESS_PATTERNS, ERROR_PATTERNS, CONTEXT_KEYWORDS)
+        lines = [line.strip() for line in RECORDED_LOG.read_text(encoding="utf-8").splitlines()]
+        
+        assert [matcher.classify(line) for line in lines] == [legacy_classify(line) for line in lines]
+        assert {matcher.classify(line) for line in lines} == {SUCCESS, ERROR, CONTEXT, None}
+    
+    def test_success_wins_wherever_it_occurs(self):
+        matcher = LineMatcher(["ok"], ["Error", "Error: not ok"])
+        
+        assert matcher.classify("Error: not ok") == SUCCESS
+        assert matcher.classify("Error: fine") == ERROR
+        assert matcher.is_error("Error: not ok")
+        assert not matcher.is_error("all ok")
+    
+    def test_shared_prefix_between_categories(self):
+        matcher = LineMatcher(["✓ Compiled"], ["✓ Compiled with warnings", "Failed"])
+        
+        assert matcher.classify("✓ Compiled with warnings") == SUCCESS
+        assert matcher.is_error("✓ Compiled with warnings")
+        assert matcher.classify("✓ Comp") is None
+    
+    def test_context_is_case_insensitive_and_optional(self):
+        matcher = LineMatcher(["Ready"], ["Error:"], ["Cannot", "at "])
+        
+        assert matcher.classify("CANNOT find x") == CONTEXT
+        assert matcher.classify("    at fn (a.js:1:2)") == CONTEXT
+        assert matcher.classify("cannot find x", context=False) is None
+    
+    def test_empty_pattern_sets(self):
+        matcher = LineMatcher([], [], [])
+        
+        assert matcher.classify("Error: boom") is None
+        assert not matcher.is_error("Error: boom")
+    
+    def test_trie_pattern_escapes_and_factors(self):
+        source = trie_pattern(["a.b", "a.c", "a"])
+        
+        assert source == r"a(?:\.(?:b|c))?"
+    
+    def test_error_fingerprint_drops_times_and_locations(self):
+        first = error_fingerprint("12:00:01 TypeError: x at Page (app/page.tsx:3:10)")
+        second = error_fingerprint("12:05:44 TypeError: x at Page (app/page.tsx:9:2)")
+        
+        assert first == second
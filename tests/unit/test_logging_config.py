@@ -0,0 +1,103 @@
+"""Unit tests for the asynchronous logging pipeline."""
+import io
+import json
+import logging
+import pytest
+
+from roundtable_mcp_server import logging_config
+from roundtable_mcp_server.logging_config import setup_logging, shutdown_logging, truncate
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """Install a logging pipeline writing to a temp file, restored afterwards."""
+    root = logging.getLogger()
+    previous_level = root.level
+    previous_handler = logging_config._queue_handler
+    log_file = tmp_path / "server.log"
+    stream = io.StringIO()
+    
+    def install(**kwargs):
+        setup_logging(log_file, stream=stream, **kwargs)
+        return log_file, stream
+    
+    yield install
+    
+    shutdown_logging()
+    root.removeHandler(logging_config._queue_handler)
+    logging_config._queue_handler = None
+    if previous_handler is not None:
+        root.removeHandler(previous_handler)
+    root.setLevel(previous_level)
+
+
+def _records(log_file):
+    shutdown_logging()
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+@pytest.mark.unit
+class TestLoggingPipeline:
+    """Test setup_logging and its handlers."""
+    
+    def test_json_records_with_extras(self, pipeline):
+        """Test records are written as JSON with extra fields."""
+        log_file, stream = pipeline()
+        
+        logging.getLogger("roundtable.test").info("Agent %s done", "codex", extra={"agent": "codex"})
+        
+        records = _records(log_file)
+        assert records[0]["msg"] == "Agent codex done"
+        assert records[0]["agent"] == "codex"
+        assert records[0]["level"] == "INFO"
+        assert "Agent codex done" in stream.getvalue()
+    
+    def test_default_level_is_info(self, pipeline, monkeypatch):
+        """Test debug records are dropped at the default level."""
+        monkeypatch.delenv("CLI_MCP_LOG_LEVEL", raising=False)
+        log_file, _ = pipeline()
+        
+        logging.getLogger("roundtable.test").debug("hidden")
+        logging.getLogger("roundtable.test").info("shown")
+        
+        assert [r["msg"] for r in _records(log_file)] == ["shown"]
+    
+    def test_content_truncated(self, pipeline):
+        """Test long messages and string extras are cut to the field budget."""
+        log_file, _ = pipeline(max_field_chars=10)
+        
+        logging.getLogger("roundtable.test").info("x" * 50, extra={"instruction": "y" * 50})
+        
+        record = _records(log_file)[0]
+        assert record["msg"] == "x" * 10 + "... [truncated 40 chars]"
+        assert record["instruction"].startswith("y" * 10 + "...")
+    
+    def test_exception_recorded(self, pipeline):
+        """Test tracebacks are rendered into the exc field."""
+        log_file, _ = pipeline()
+        
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("roundtable.test").exception("failed")
+        
+        record = _records(log_file)[0]
+        assert record["msg"] == "failed"
+        assert "ValueError: boom" in record["exc"]
+    
+    def test_rotation(self, pipeline):
+        """Test the log file rotates at the size limit."""
+        log_file, _ = pipeline(max_bytes=500, backup_count=2)
+        
+        for i in range(20):
+            logging.getLogger("roundtable.test").info(f"message {i}")
+        shutdown_logging()
+        
+        assert (log_file.parent / "server.log.1").exists()
+        assert log_file.stat().st_size <= 500
+
+
+@pytest.mark.unit
+def test_truncate_unlimited():
+    """Test a zero budget disables truncation."""
+    assert truncate("abc" * 1000, 0) == "abc" * 1000
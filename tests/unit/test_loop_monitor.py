@@ -0,0 +1,49 @@
+"""Unit tests for the event-loop lag monitor."""
+import asyncio
+import logging
+import time
+import pytest
+
+from roundtable_mcp_server.loop_monitor import LoopLagMonitor
+from roundtable_mcp_server.metrics import MetricsCollector
+
+
+def _block_loop(seconds):
+    time.sleep(seconds)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLoopLagMonitor:
+    """Test LoopLagMonitor class."""
+    
+    async def test_samples_lag(self):
+        """Test lag samples are reported at the sampling interval."""
+        samples = []
+        monitor = LoopLagMonitor(on_lag=samples.append, interval=0.01)
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            await monitor.stop()
+        
+        assert len(samples) >= 3
+        assert all(lag >= 0 for lag in samples)
+    
+    async def test_blocking_call_logged_with_stack(self, caplog):
+        """Test a blocking callback is reported with its stack and shows up as lag."""
+        collector = MetricsCollector(enabled=True)
+        monitor = LoopLagMonitor(on_lag=collector.record_loop_lag, interval=0.01, slow_callback_threshold=0.05)
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.02)
+            with caplog.at_level(logging.WARNING, logger="roundtable_mcp_server.loop_monitor"):
+                _block_loop(0.3)
+                await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+        
+        assert monitor.stalls == 1
+        assert "_block_loop" in caplog.text
+        assert asyncio.get_running_loop().slow_callback_duration == 0.05
+        assert collector.window_stats(60)["event_loop_lag"]["max"] >= 0.2
@@ -1,4 +1,6 @@
 """Unit tests for MCP tools."""
+import asyncio
+import logging
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from roundtable_mcp_server import server
@@ -106,3 +108,373 @@ class TestSubagentTools:
             
             assert "completed" in result.lower()
             mock_context.report_progress.assert_called()
+
+    async def test_instruction_and_response_not_logged_at_info(self, mock_context, temp_project_dir, caplog):
+        """Test the default log level records neither the instruction nor the answer."""
+        server.enabled_subagents = {"kiro"}
+        server.CLI_ADAPTERS_AVAILABLE = True
+        server.config = MagicMock(verbose=False)
+        
+        with patch('roundtable_mcp_server.server.KiroCLI') as mock_cli_class:
+            mock_cli = MagicMock()
+            mock_cli.check_availability = AsyncMock(return_value={"available": True})
+            
+            async def mock_stream(*args, **kwargs):
+                msg = MagicMock()
+                msg.message_type = MagicMock(value="chat")
+                msg.role = "assistant"
+                msg.content = "private answer"
+                yield msg
+            
+            mock_cli.execute_with_streaming = mock_stream
+            mock_cli_class.return_value = mock_cli
+            
+            with caplog.at_level("INFO"):
+                await server.kiro_subagent(
+                    instruction="private instruction",
+                    project_path=str(temp_project_dir),
+                    ctx=mock_context
+                )
+        
+        logged = [r.getMessage() for r in caplog.records if r.levelno >= logging.INFO]
+        assert logged
+        assert not any("private" in message for message in logged)
+    
+    async def test_line_oriented_agent_returns_every_line(self, mock_context, temp_project_dir):
+        """Test kiro_subagent returns all of the lines its adapter streamed."""
+        server.enabled_subagents = {"kiro"}
+        server.CLI_ADAPTERS_AVAILABLE = True
+        server.config = MagicMock(verbose=False)
+        
+        with patch('roundtable_mcp_server.server.KiroCLI') as mock_cli_class:
+            mock_cli = MagicMock()
+            mock_cli.check_availability = AsyncMock(return_value={"available": True})
+            
+            async def mock_stream(*args, **kwargs):
+                for line in ("Line one", "Line two", "Line three"):
+                    msg = MagicMock()
+                    msg.message_type = MagicMock(value="chat")
+                    msg.role = "assistant"
+                    msg.content = line
+                    yield msg
+            
+            mock_cli.execute_with_streaming = mock_stream
+            mock_cli_class.return_value = mock_cli
+            
+            result = await server.kiro_subagent(
+                instruction="Explain",
+                project_path=str(temp_project_dir),
+                ctx=mock_context
+            )
+        
+        assert result == "**Kiro Response:**\nLine one\nLine two\nLine three"
+    
+    @pytest.mark.parametrize("agent", [
+        "codex", "claude", "cursor", "gemini", "qwen", "kiro", "copilot", "grok",
+        "kilocode", "crush", "opencode", "antigravity", "factory", "rovo",
+    ])
+    async def test_unexpected_error_is_reported_for_the_agent(self, agent, mock_context, temp_project_dir):
+        """Test every agent tool passes its own name and the instruction to handle_agent_error."""
+        server.enabled_subagents = {agent}
+        server.CLI_ADAPTERS_AVAILABLE = True
+        error = RuntimeError("boom")
+        
+        with patch('roundtable_mcp_server.server._execute_with_error_handling', AsyncMock(side_effect=error)), \
+                patch('roundtable_mcp_server.server.handle_agent_error', return_value="handled") as handler:
+            result = await getattr(server, f"{agent}_subagent")(
+                instruction="Fix the build",
+                project_path=str(temp_project_dir),
+                ctx=mock_context
+            )
+        
+        assert result == "handled"
+        handler.assert_called_once_with(error, agent, "Fix the build")
+
+    async def test_subagent_records_phases(self, mock_context, sample_instruction, temp_project_dir, monkeypatch):
+        """Test subagent executions are traced phase by phase."""
+        from claudable_helper.cli.base import mark_phase
+        from roundtable_mcp_server import metrics
+        collector = metrics.MetricsCollector(enabled=True)
+        monkeypatch.setattr(metrics, "_metrics_collector", collector)
+        server.enabled_subagents = {"qwen"}
+        server.config = MagicMock(verbose=False)
+        
+        with patch('roundtable_mcp_server.server.QwenCLI') as mock_cli_class:
+            mock_cli = MagicMock()
+            mock_cli.check_availability = AsyncMock(return_value={"available": True})
+            
+            async def mock_stream(*args, **kwargs):
+                mark_phase("spawned")
+                mark_phase("session_ready")
+                tool = MagicMock(message_type=MagicMock(value="tool_use"), role="assistant", content="")
+                yield tool
+                msg = MagicMock(message_type=MagicMock(value="chat"), role="assistant", content="Done")
+                yield msg
+            
+            mock_cli.execute_with_streaming = mock_stream
+            mock_cli_class.return_value = mock_cli
+            
+            result = await server.qwen_subagent(
+                instruction=sample_instruction,
+                project_path=str(temp_project_dir),
+                model="qwen3-coder",
+                ctx=mock_context
+            )
+        
+        assert result == "Done"
+        metric = collector.metrics[-1]
+        assert metric.success is True
+        assert metric.model == "qwen3-coder"
+        assert metric.message_count == 2
+        assert metric.tool_uses == 1
+        assert metric.bytes_received == 4
+        assert list(metric.phases) == [
+            "availability_checked", "spawned", "session_ready",
+            "first_tool_call", "first_token", "completed"
+        ]
+    
+    async def test_subagent_fails_fast_when_circuit_open(self, mock_context, sample_instruction, temp_project_dir, caplog):
+        """Test repeated failures open the circuit and later calls skip the CLI without a traceback."""
+        server.enabled_subagents = {"qwen"}
+        server.config = MagicMock(verbose=False)
+        
+        with patch('roundtable_mcp_server.server.QwenCLI') as mock_cli_class, \
+                patch('roundtable_mcp_server.retry.asyncio.sleep', new=AsyncMock()):
+            mock_cli = MagicMock()
+            mock_cli.check_availability = AsyncMock(return_value={"available": False, "error": "qwen: not found"})
+            mock_cli_class.return_value = mock_cli
+            
+            for _ in range(5):
+                result = await server.qwen_subagent(
+                    instruction=sample_instruction,
+                    project_path=str(temp_project_dir),
+                    ctx=mock_context
+                )
+                assert "not found" in result
+            mock_cli_class.reset_mock()
+            caplog.clear()
+            
+            result = await server.qwen_subagent(
+                instruction=sample_instruction,
+                project_path=str(temp_project_dir),
+                ctx=mock_context
+            )
+        
+        assert "❌" in result
+        assert "paused" in result and "retry_after" in result
+        mock_cli_class.assert_not_called()
+        assert not [r for r in caplog.records if r.levelname == "ERROR" or r.exc_info]
+
+
+def _streaming_cli(content, delay=0.0, fail=False, process=None):
+    """Mock CLI adapter whose stream answers ``content`` after ``delay`` seconds."""
+    from claudable_helper.cli.base import track_process
+    cli = MagicMock()
+    cli.check_availability = AsyncMock(return_value={"available": True})
+    
+    async def stream(*args, **kwargs):
+        if process is not None:
+            track_process(process)
+        await asyncio.sleep(delay)
+        if fail:
+            yield MagicMock(message_type=MagicMock(value="error"), role="system", content=content)
+        else:
+            yield MagicMock(message_type=MagicMock(value="chat"), role="assistant", content=content)
+    
+    cli.execute_with_streaming = stream
+    return cli
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHedgedSubagent:
+    """Test hedged and raced execution across agents."""
+    
+    async def test_race_returns_fastest_and_kills_loser(self, mock_context, temp_project_dir, monkeypatch):
+        """Test race mode uses the first answer and kills the slower agent's process."""
+        from roundtable_mcp_server import metrics
+        collector = metrics.MetricsCollector(enabled=True, storage_path=temp_project_dir / "m.jsonl")
+        monkeypatch.setattr(metrics, "_metrics_collector", collector)
+        server.enabled_subagents = {"claude", "gemini"}
+        server.config = MagicMock(verbose=False)
+        slow_process = MagicMock(returncode=None)
+        
+        with patch('roundtable_mcp_server.server.ClaudeCodeCLI', return_value=_streaming_cli("slow", 5, process=slow_process)), \
+                patch('roundtable_mcp_server.server.GeminiCLI', return_value=_streaming_cli("fast answer")):
+            result = await server.hedged_subagent(
+                instruction="What does main() do?",
+                agents="claude,gemini",
+                project_path=str(temp_project_dir),
+                mode="race",
+                ctx=mock_context
+            )
+        
+        assert result.startswith("fast answer")
+        assert "answered by Gemini" in result
+        slow_process.kill.assert_called_once()
+        assert collector.hedge_wins == {("race", "gemini"): 1}
+        outcomes = {(m.agent, m.error) for m in collector.metrics}
+        assert ("claude", metrics.CANCELLED) in outcomes
+    
+    async def test_hedge_launches_backup_after_delay(self, mock_context, temp_project_dir):
+        """Test hedge mode starts the backup only once the delay has passed."""
+        server.enabled_subagents = {"claude", "gemini"}
+        server.config = MagicMock(verbose=False)
+        gemini_cls = MagicMock(return_value=_streaming_cli("backup answer"))
+        
+        with patch('roundtable_mcp_server.server.ClaudeCodeCLI', return_value=_streaming_cli("primary answer", 0.01)), \
+                patch('roundtable_mcp_server.server.GeminiCLI', gemini_cls):
+            result = await server.hedged_subagent(
+                instruction="What does main() do?",
+                agents="claude,gemini",
+                project_path=str(temp_project_dir),
+                hedge_delay=1.0,
+                ctx=mock_context
+            )
+        
+        assert result.startswith("primary answer")
+        gemini_cls.assert_not_called()
+        
+        with patch('roundtable_mcp_server.server.ClaudeCodeCLI', return_value=_streaming_cli("primary answer", 5)), \
+                patch('roundtable_mcp_server.server.GeminiCLI', return_value=_streaming_cli("backup answer")):
+            result = await server.hedged_subagent(
+                instruction="What does main() do?",
+                agents="claude,gemini",
+                project_path=str(temp_project_dir),
+                hedge_delay=0.05,
+                ctx=mock_context
+            )
+        
+        assert result.startswith("backup answer")
+    
+    async def test_hedge_fails_over_immediately(self, mock_context, temp_project_dir):
+        """Test a failed primary starts the backup without waiting for the delay."""
+        server.enabled_subagents = {"claude", "gemini"}
+        server.config = MagicMock(verbose=False)
+        
+        with patch('roundtable_mcp_server.server.ClaudeCodeCLI', return_value=_streaming_cli("boom", fail=True)), \
+                patch('roundtable_mcp_server.server.GeminiCLI', return_value=_streaming_cli("backup answer")):
+            result = await asyncio.wait_for(server.hedged_subagent(
+                instruction="What does main() do?",
+                agents="claude,gemini",
+                project_path=str(temp_project_dir),
+                hedge_delay=30,
+                ctx=mock_context
+            ), timeout=5)
+        
+        assert result.startswith("backup answer")
+    
+    async def test_hedged_validation(self, mock_context):
+        """Test unknown, disabled and single agents are rejected."""
+        server.enabled_subagents = {"claude"}
+        
+        assert "Unknown agents: nope" in await server.hedged_subagent("q", "claude,nope", ctx=mock_context)
+        assert "not enabled" in await server.hedged_subagent("q", "claude,gemini", ctx=mock_context)
+        assert "at least two" in await server.hedged_subagent("q", "claude", ctx=mock_context)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAutoSubagent:
+    """Test latency-aware automatic routing."""
+    
+    async def test_routes_to_fastest_agent(self, mock_context, temp_project_dir, monkeypatch):
+        """Test the agent with the lowest recent latency answers and the ranking is reported."""
+        from roundtable_mcp_server import metrics
+        collector = metrics.MetricsCollector(enabled=True, storage_path=temp_project_dir / "m.jsonl")
+        monkeypatch.setattr(metrics, "_metrics_collector", collector)
+        for agent, duration in (("claude", 40.0), ("gemini", 5.0)):
+            for _ in range(3):
+                collector.record(metrics.ExecutionMetric(
+                    agent=agent, timestamp="2024-01-01T00:00:00",
+                    duration_seconds=duration, success=True
+                ))
+        server.enabled_subagents = {"claude", "gemini"}
+        server.config = MagicMock(verbose=False)
+        claude_cls = MagicMock(return_value=_streaming_cli("slow answer"))
+        
+        with patch('roundtable_mcp_server.server.ClaudeCodeCLI', claude_cls), \
+                patch('roundtable_mcp_server.server.GeminiCLI', return_value=_streaming_cli("fast answer")):
+            result = await server.auto_subagent(
+                instruction="Explain what main() does",
+                project_path=str(temp_project_dir),
+                ctx=mock_context
+            )
+        
+        assert result.startswith("fast answer")
+        assert "Routing (analysis):" in result
+        assert "1. gemini" in result and "← answered" in result
+        claude_cls.assert_not_called()
+    
+    async def test_falls_back_when_unavailable(self, mock_context, temp_project_dir, monkeypatch):
+        """Test an unavailable agent is skipped for the next one, even for edits."""
+        monkeypatch.setattr("roundtable_mcp_server.retry.asyncio.sleep", AsyncMock())
+        server.enabled_subagents = {"claude", "gemini"}
+        server.config = MagicMock(verbose=False)
+        missing = _streaming_cli("unused")
+        missing.check_availability = AsyncMock(return_value={"available": False, "error": "not installed"})
+        
+        with patch('roundtable_mcp_server.server.ClaudeCodeCLI', return_value=missing), \
+                patch('roundtable_mcp_server.server.GeminiCLI', return_value=_streaming_cli("edited")):
+            result = await server.auto_subagent(
+                instruction="Fix the failing test",
+                project_path=str(temp_project_dir),
+                agents="claude,gemini",
+                ctx=mock_context
+            )
+        
+        assert result.startswith("edited")
+        assert "Routing (edit):" in result
+        assert "1. claude" in result and "is not available: not installed" in result
+    
+    async def test_edit_does_not_fall_back_after_execution_error(self, mock_context, temp_project_dir):
+        """Test an edit task stops at the first agent that ran and failed."""
+        server.enabled_subagents = {"claude", "gemini"}
+        server.config = MagicMock(verbose=False)
+        gemini_cls = MagicMock(return_value=_streaming_cli("unused"))
+        
+        with patch('roundtable_mcp_server.server.ClaudeCodeCLI', return_value=_streaming_cli("boom", fail=True)), \
+                patch('roundtable_mcp_server.server.GeminiCLI', gemini_cls):
+            result = await server.auto_subagent(
+                instruction="Rename the helper",
+                project_path=str(temp_project_dir),
+                task_type="edit",
+                agents="claude,gemini",
+                ctx=mock_context
+            )
+        
+        assert "❌" in result
+        gemini_cls.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSubagentTranscripts:
+    """Test reading back earlier subagent runs."""
+    
+    async def test_run_is_recorded_and_read_back(self, mock_context, temp_project_dir):
+        """Test a subagent call can be read back with get_subagent_transcript."""
+        server.enabled_subagents = {"gemini"}
+        server.config = MagicMock(verbose=False)
+        
+        with patch('roundtable_mcp_server.server.GeminiCLI', return_value=_streaming_cli("The answer is 42")):
+            await server.gemini_subagent(
+                instruction="What is the answer?",
+                project_path=str(temp_project_dir),
+                ctx=mock_context
+            )
+        
+        listing = await server.get_subagent_transcript(run_id="")
+        assert "gemini" in listing and "What is the answer?" in listing
+        
+        transcript = await server.get_subagent_transcript(run_id="latest:gemini", filter="chat")
+        assert "1 of 2 messages" in transcript
+        assert "#1 [chat] The answer is 42" in transcript
+        
+        server.get_transcript_store().flush()
+        search = await server.search_subagent_history(query="answer", agent="gemini")
+        assert "2 match(es)" in search and "The [answer] is 42" in search
+        
+        first = await server.get_subagent_transcript(range="0")
+        assert "#0 [instruction] What is the answer?" in first
+        assert "❌" in await server.get_subagent_transcript(range="a:b")
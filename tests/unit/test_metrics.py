@@ -3,6 +3,7 @@ import pytest
 import json
 from pathlib import Path
 from roundtable_mcp_server.metrics import (
+    CANCELLED,
     ExecutionMetric,
     MetricsCollector,
     get_metrics_collector
@@ -199,3 +200,264 @@ class TestGetMetricsCollector:
         collector2 = get_metrics_collector()
         
         assert collector1 is collector2
+
+
+@pytest.mark.unit
+class TestBoundedHistory:
+    """Test ring buffer history and rollups."""
+    
+    def _metric(self, agent="codex", success=True, duration=1.0):
+        return ExecutionMetric(
+            agent=agent,
+            timestamp="2024-01-01T00:00:00",
+            duration_seconds=duration,
+            success=success
+        )
+    
+    def test_history_is_bounded(self, tmp_path):
+        """Test in-memory history keeps only the most recent metrics."""
+        collector = MetricsCollector(enabled=True, storage_path=tmp_path / "metrics.jsonl", max_history=3)
+        
+        for i in range(5):
+            collector.record(self._metric(duration=float(i)))
+        
+        assert len(collector.metrics) == 3
+        assert [m.duration_seconds for m in collector.metrics] == [2.0, 3.0, 4.0]
+        assert collector.rollups["codex"]["count"] == 5
+    
+    def test_rollups_persisted(self, tmp_path):
+        """Test rollups survive a new collector instance."""
+        storage = tmp_path / "metrics.jsonl"
+        collector = MetricsCollector(enabled=True, storage_path=storage)
+        collector.record(self._metric(success=True))
+        collector.record(self._metric(success=False))
+        
+        reloaded = MetricsCollector(enabled=True, storage_path=storage)
+        
+        assert reloaded.rollups["codex"]["count"] == 2
+        assert reloaded.rollups["codex"]["failed"] == 1
+    
+    def test_rollups_written_from_snapshot(self, tmp_path):
+        """Test the writer saves the snapshot it was given, never an older one."""
+        storage = tmp_path / "metrics.jsonl"
+        collector = MetricsCollector(enabled=True, storage_path=storage)
+        collector.record(self._metric())
+        older = collector._rollup_snapshot()
+        collector.record(self._metric(agent="gemini"))
+        newer = collector._rollup_snapshot()
+        
+        collector._write_batch(["{}"], newer)
+        collector.rollups["claude"] = {"count": 1}  # changed after the snapshot
+        collector._write_batch(["{}"], older)
+        
+        saved = json.loads(collector.rollup_path.read_text())["agents"]
+        assert set(saved) == {"codex", "gemini"}
+    
+    def test_rotation_compresses_old_file(self, tmp_path):
+        """Test the JSONL file is rotated and gzipped once it exceeds the limit."""
+        import gzip
+        storage = tmp_path / "metrics.jsonl"
+        collector = MetricsCollector(enabled=True, storage_path=storage, max_file_bytes=400)
+        
+        for _ in range(5):
+            collector.record(self._metric())
+        
+        rotated = tmp_path / "metrics.jsonl.1.gz"
+        assert rotated.exists()
+        with gzip.open(rotated, "rt") as f:
+            assert json.loads(f.readline())["agent"] == "codex"
+        assert storage.stat().st_size < 400
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBackgroundWriter:
+    """Test asynchronous batched writes."""
+    
+    async def test_records_batched_and_flushed_on_stop(self, tmp_path):
+        """Test records are queued while running and all flushed on stop."""
+        storage = tmp_path / "metrics.jsonl"
+        collector = MetricsCollector(enabled=True, storage_path=storage, flush_interval=60)
+        await collector.start()
+        
+        for i in range(10):
+            collector.record(ExecutionMetric(
+                agent="gemini",
+                timestamp="2024-01-01T00:00:00",
+                duration_seconds=float(i),
+                success=True
+            ))
+        
+        assert not storage.exists()
+        
+        await collector.stop()
+        
+        with open(storage) as f:
+            lines = f.readlines()
+        assert len(lines) == 10
+        assert json.loads(lines[-1])["duration_seconds"] == 9.0
+    
+    async def test_flush_on_batch_size(self, tmp_path):
+        """Test a full batch is written without waiting for the interval."""
+        import asyncio
+        storage = tmp_path / "metrics.jsonl"
+        collector = MetricsCollector(enabled=True, storage_path=storage, batch_size=2, flush_interval=60)
+        await collector.start()
+        
+        try:
+            for _ in range(2):
+                collector.record(ExecutionMetric(
+                    agent="qwen",
+                    timestamp="2024-01-01T00:00:00",
+                    duration_seconds=1.0,
+                    success=True
+                ))
+            for _ in range(50):
+                if storage.exists():
+                    break
+                await asyncio.sleep(0.02)
+            
+            assert storage.exists()
+        finally:
+            await collector.stop()
+
+
+@pytest.mark.unit
+class TestStreamingAggregates:
+    """Test per-series streaming aggregates."""
+    
+    def test_stats_survive_history_eviction(self):
+        """Test get_stats counts executions evicted from the history ring."""
+        collector = MetricsCollector(enabled=True, max_history=2)
+        for i in range(5):
+            collector.record(ExecutionMetric(
+                agent="codex",
+                timestamp="2024-01-01T00:00:00",
+                duration_seconds=float(i + 1),
+                success=i != 0
+            ))
+        
+        stats = collector.get_stats()
+        
+        assert stats["total_executions"] == 5
+        assert stats["failed"] == 1
+        assert stats["by_agent"]["codex"]["error_rate"] == 0.2
+        assert stats["avg_duration"] == 3.0
+    
+    def test_latency_quantile_and_cancelled(self):
+        """Test quantiles use successes only and cancelled runs are not failures."""
+        collector = MetricsCollector(enabled=True)
+        for i in range(4):
+            collector.record(ExecutionMetric(
+                agent="claude", timestamp="2024-01-01T00:00:00",
+                duration_seconds=10.0, success=True
+            ))
+        collector.record(ExecutionMetric(
+            agent="claude", timestamp="2024-01-01T00:00:00",
+            duration_seconds=90.0, success=False, error=CANCELLED
+        ))
+        
+        assert collector.latency_quantile("claude", 0.95) is None
+        collector.record(ExecutionMetric(
+            agent="claude", timestamp="2024-01-01T00:00:00",
+            duration_seconds=10.0, success=True
+        ))
+        assert collector.latency_quantile("claude", 0.95) == pytest.approx(10.0)
+        stats = collector.get_stats()["by_agent"]["claude"]
+        assert stats["count"] == 6
+        assert stats["failed"] == 0
+    
+    def test_window_stats_by_model(self):
+        """Test window stats split series by model and outcome."""
+        import time
+        collector = MetricsCollector(enabled=True)
+        for model, success in (("gpt-5", True), ("gpt-5", False), (None, True)):
+            collector.record(ExecutionMetric(
+                agent="codex",
+                timestamp="2024-01-01T00:00:00",
+                duration_seconds=2.0,
+                success=success,
+                model=model,
+                time_to_first_token=0.5
+            ))
+        
+        stats = collector.window_stats(60, now=time.time())
+        
+        keys = {(s["agent"], s["model"], s["outcome"]) for s in stats["series"]}
+        assert keys == {("codex", "gpt-5", "success"), ("codex", "gpt-5", "error"), ("codex", "default", "success")}
+        assert stats["by_agent"]["codex"]["error_rate"] == round(1 / 3, 4)
+        assert stats["series"][0]["time_to_first_token"]["p50"] == 0.5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRoundtableStatsTool:
+    """Test the get_roundtable_stats MCP tool."""
+    
+    async def test_disabled(self, monkeypatch):
+        """Test the tool reports when metrics are disabled."""
+        from roundtable_mcp_server import metrics, server
+        monkeypatch.setattr(metrics, "_metrics_collector", MetricsCollector(enabled=False))
+        
+        result = await server.get_roundtable_stats()
+        
+        assert "disabled" in result
+    
+    async def test_windows(self, monkeypatch):
+        """Test the tool returns the requested window."""
+        from roundtable_mcp_server import metrics, server
+        collector = MetricsCollector(enabled=True)
+        collector.record(ExecutionMetric(
+            agent="gemini",
+            timestamp="2024-01-01T00:00:00",
+            duration_seconds=1.0,
+            success=True
+        ))
+        monkeypatch.setattr(metrics, "_metrics_collector", collector)
+        
+        result = json.loads(await server.get_roundtable_stats(window_minutes=5))
+        
+        assert list(result["windows"]) == ["5m"]
+        assert result["windows"]["5m"]["by_agent"]["gemini"]["count"] == 1
+        assert result["since_start"]["total_executions"] == 1
+
+
+
+@pytest.mark.unit
+class TestExecutionTrace:
+    """Test per-phase execution tracing."""
+    
+    def test_trace_records_phases(self):
+        """Test phases keep their first offset and are recorded on exit."""
+        collector = MetricsCollector(enabled=True)
+        
+        with collector.trace_execution("codex", model="gpt-5") as trace:
+            trace.mark("spawned")
+            trace.mark("spawned")
+            assert collector.active["codex"] == 1
+        
+        assert collector.active["codex"] == 0
+        metric = collector.metrics[0]
+        assert metric.model == "gpt-5"
+        assert list(metric.phases) == ["spawned", "completed"]
+        assert metric.phases["spawned"] <= metric.phases["completed"]
+    
+    def test_trace_failure(self):
+        """Test failed executions are recorded with their error."""
+        collector = MetricsCollector(enabled=True)
+        
+        with pytest.raises(RuntimeError):
+            with collector.trace_execution("gemini"):
+                raise RuntimeError("spawn failed")
+        
+        assert collector.metrics[0].success is False
+        assert collector.metrics[0].error == "spawn failed"
+    
+    def test_trace_disabled(self):
+        """Test a trace is available but not recorded when disabled."""
+        collector = MetricsCollector(enabled=False)
+        
+        with collector.trace_execution("qwen") as trace:
+            trace.mark("spawned")
+        
+        assert len(collector.metrics) == 0
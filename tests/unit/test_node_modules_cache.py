@@ -0,0 +1,181 @@
+"""Tests for the content-addressed node_modules cache."""
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from claudable_helper.services import node_modules_cache
+from claudable_helper.services.node_modules_cache import NodeModulesCache, lockfile_digest, runtime_tag
+
+RUNTIME = "linux-x86_64-node20-npm10"
+
+# Stands in for `npm ci`: counts installs and writes a package with a bin link
+FAKE_INSTALL = """
+import os, pathlib, sys, time
+counter = pathlib.Path(sys.argv[1])
+with open(counter, "a") as f:
+    f.write("x")
+time.sleep(0.2)
+if os.environ.get("FAIL_INSTALL"):
+    sys.exit("install failed")
+pkg = pathlib.Path("node_modules/left-pad")
+pkg.mkdir(parents=True)
+(pkg / "index.js").write_text("module.exports = 1")
+pathlib.Path("node_modules/.bin").mkdir()
+os.symlink("../left-pad/index.js", "node_modules/.bin/left-pad")
+"""
+
+
+def make_project(path, name="app", dependencies=None):
+    dependencies = dependencies or {"left-pad": "^1.3.0"}
+    path.mkdir(parents=True)
+    (path / "package.json").write_text(json.dumps({"name": name, "dependencies": dependencies}))
+    (path / "package-lock.json").write_text(json.dumps({
+        "name": name,
+        "version": "0.1.0",
+        "lockfileVersion": 3,
+        "packages": {
+            "": {"name": name, "version": "0.1.0", "dependencies": dependencies},
+            "node_modules/left-pad": {"version": "1.3.0"},
+        },
+    }))
+    return path
+
+
+@pytest.fixture
+def counter(tmp_path):
+    return tmp_path / "installs"
+
+
+@pytest.fixture
+def cache(tmp_path, counter):
+    return NodeModulesCache(
+        tmp_path / "cache",
+        max_entries=2,
+        install_command=[sys.executable, "-c", FAKE_INSTALL, str(counter)],
+        runtime=RUNTIME,
+    )
+
+
+@pytest.mark.unit
+class TestLockfileDigest:
+    """Test the cache key."""
+    
+    def test_ignores_root_name_and_version(self, tmp_path):
+        first = make_project(tmp_path / "a", name="first-app")
+        second = make_project(tmp_path / "b", name="second-app")
+        other = make_project(tmp_path / "c", dependencies={"is-odd": "^3.0.0"})
+        
+        assert lockfile_digest(str(first)) == lockfile_digest(str(second))
+        assert lockfile_digest(str(first)) != lockfile_digest(str(other))
+    
+    def test_depends_on_runtime(self, tmp_path):
+        project = make_project(tmp_path / "a")
+        
+        assert lockfile_digest(str(project), "linux-x86_64-node20-npm10") != lockfile_digest(
+            str(project), "linux-x86_64-node22-npm10"
+        )
+        assert runtime_tag(str(tmp_path)).endswith("-nodeunknown-npmunknown")
+    
+    def test_missing_or_invalid_lockfile(self, tmp_path):
+        project = make_project(tmp_path / "a")
+        (project / "package-lock.json").write_text("{not json")
+        
+        assert lockfile_digest(str(project), RUNTIME) is None
+        assert lockfile_digest(str(tmp_path / "missing")) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestNodeModulesCache:
+    """Test single-flight installs, linking and eviction."""
+    
+    async def test_concurrent_projects_share_one_install(self, tmp_path, cache, counter):
+        projects = [make_project(tmp_path / f"p{n}", name=f"app-{n}") for n in range(3)]
+        
+        results = await asyncio.gather(*(cache.materialize(str(p)) for p in projects))
+        
+        assert results == [True, True, True]
+        assert counter.read_text() == "x"
+        entry = cache.root / lockfile_digest(str(projects[0]), RUNTIME) / "node_modules" / "left-pad" / "index.js"
+        for project in projects:
+            linked = project / "node_modules" / "left-pad" / "index.js"
+            assert linked.read_text() == "module.exports = 1"
+            assert os.stat(linked).st_ino == os.stat(entry).st_ino
+            assert os.readlink(project / "node_modules" / ".bin" / "left-pad") == "../left-pad/index.js"
+        
+        assert await cache.materialize(str(projects[0]))
+        assert counter.read_text() == "x"
+    
+    async def test_replaces_existing_node_modules(self, tmp_path, cache):
+        project = make_project(tmp_path / "p")
+        (project / "node_modules" / "stale").mkdir(parents=True)
+        
+        assert await cache.materialize(str(project))
+        assert sorted(os.listdir(project / "node_modules")) == [".bin", "left-pad"]
+    
+    async def test_falls_back_to_copy_when_links_fail(self, tmp_path, cache):
+        project = make_project(tmp_path / "p")
+        
+        with patch.object(node_modules_cache.os, "link", side_effect=OSError("cross-device link")), \
+                patch.object(node_modules_cache, "_reflink", side_effect=OSError("not supported")):
+            assert await cache.materialize(str(project))
+        
+        linked = project / "node_modules" / "left-pad" / "index.js"
+        entry = cache.root / lockfile_digest(str(project), RUNTIME) / "node_modules" / "left-pad" / "index.js"
+        assert linked.read_text() == "module.exports = 1"
+        assert os.stat(linked).st_ino != os.stat(entry).st_ino
+    
+    async def test_failed_install_leaves_no_entry(self, tmp_path, cache, monkeypatch):
+        monkeypatch.setenv("FAIL_INSTALL", "1")
+        project = make_project(tmp_path / "p")
+        
+        assert not await cache.materialize(str(project))
+        assert [p.name for p in cache.root.iterdir() if p.is_dir()] == []
+        assert not (project / "node_modules").exists()
+    
+    async def test_evicts_least_recently_used(self, tmp_path, cache):
+        projects = [
+            make_project(tmp_path / f"p{n}", dependencies={f"dep-{n}": "1.0.0"}) for n in range(3)
+        ]
+        keys = [lockfile_digest(str(p), RUNTIME) for p in projects]
+        for n, project in enumerate(projects[:2]):
+            assert await cache.materialize(str(project))
+            os.utime(cache.root / keys[n], (1000 + n, 1000 + n))
+        
+        assert await cache.materialize(str(projects[2]))
+        
+        assert sorted(p.name for p in cache.root.iterdir() if p.is_dir()) == sorted(keys[1:])
+        assert (projects[0] / "node_modules" / "left-pad" / "index.js").exists()
+    
+    async def test_gc_skips_entries_in_use_and_keeps_lock_files(self, tmp_path, cache):
+        projects = [
+            make_project(tmp_path / f"p{n}", dependencies={f"dep-{n}": "1.0.0"}) for n in range(3)
+        ]
+        keys = [lockfile_digest(str(p), RUNTIME) for p in projects]
+        cache.max_entries = 3
+        for n, project in enumerate(projects):
+            assert await cache.materialize(str(project))
+            os.utime(cache.root / keys[n], (1000 + n, 1000 + n))
+        cache.max_entries = 1
+        
+        in_use = cache._lock(keys[0], shared=True)  # e.g. another process linking from it
+        try:
+            assert cache.gc() == [keys[1]]
+        finally:
+            in_use.close()
+        assert (cache.root / keys[0]).is_dir()
+        assert cache.gc() == [keys[0]]
+        assert all((cache.root / f".{key}.lock").exists() for key in keys)
+    
+    async def test_global_cache_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv("CLAUDABLE_NODE_MODULES_CACHE", "false")
+        node_modules_cache.reset_node_modules_cache()
+        
+        assert node_modules_cache.get_node_modules_cache() is None
+    
+    async def test_global_cache_under_roundtable_home(self, tmp_path):
+        assert node_modules_cache.get_node_modules_cache().root == tmp_path / "roundtable" / "node_modules_cache"
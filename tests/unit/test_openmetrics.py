@@ -0,0 +1,93 @@
+"""Unit tests for OpenMetrics exposition."""
+import asyncio
+import socket
+import pytest
+
+from roundtable_mcp_server.metrics import ExecutionMetric, MetricsCollector
+from roundtable_mcp_server.openmetrics import CONTENT_TYPE, OpenMetricsExporter
+
+
+def _collector():
+    collector = MetricsCollector(enabled=True)
+    for duration, success in ((0.8, True), (3.0, True), (40.0, False)):
+        collector.record(ExecutionMetric(
+            agent="codex",
+            timestamp="2024-01-01T00:00:00",
+            duration_seconds=duration,
+            success=success,
+            model="gpt-5",
+            time_to_first_token=0.3,
+            phases={"spawned": 0.1}
+        ))
+    return collector
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _http_get(reader, writer):
+    writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+    await writer.drain()
+    response = (await reader.read()).decode()
+    writer.close()
+    return response
+
+
+@pytest.mark.unit
+class TestRender:
+    """Test OpenMetrics rendering."""
+    
+    def test_counters_and_histograms(self):
+        """Test execution counters and cumulative histogram buckets."""
+        text = OpenMetricsExporter(_collector()).render()
+        
+        assert 'roundtable_executions_total{agent="codex",model="gpt-5",outcome="success"} 2' in text
+        assert 'roundtable_executions_total{agent="codex",model="gpt-5",outcome="error"} 1' in text
+        assert 'roundtable_execution_duration_seconds_bucket{agent="codex",model="gpt-5",outcome="success",le="1"} 1' in text
+        assert 'roundtable_execution_duration_seconds_bucket{agent="codex",model="gpt-5",outcome="success",le="+Inf"} 2' in text
+        assert 'roundtable_time_to_first_token_seconds_count{agent="codex",model="gpt-5",outcome="success"} 2' in text
+        assert 'roundtable_warm_process_total{agent="codex",result="miss"} 2' in text
+        assert text.endswith("# EOF\n")
+    
+    def test_custom_gauge(self):
+        """Test gauges registered by the server are rendered with escaped labels."""
+        exporter = OpenMetricsExporter(MetricsCollector(enabled=True))
+        exporter.add_gauge("roundtable_acp_pool_clients", "Pool size.", lambda: [({"agent": 'q"wen'}, 1)])
+        
+        assert 'roundtable_acp_pool_clients{agent="q\\"wen"} 1' in exporter.render()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestListener:
+    """Test the HTTP listener."""
+    
+    async def test_tcp_scrape(self):
+        """Test /metrics is served over TCP."""
+        port = _free_port()
+        exporter = OpenMetricsExporter(_collector(), port=port)
+        await exporter.start()
+        try:
+            response = await _http_get(*await asyncio.open_connection("127.0.0.1", port))
+        finally:
+            await exporter.stop()
+        
+        assert response.startswith("HTTP/1.1 200")
+        assert CONTENT_TYPE in response
+        assert "roundtable_executions_total" in response
+    
+    async def test_unix_socket_scrape(self, tmp_path):
+        """Test /metrics is served over a Unix socket, which is removed on stop."""
+        path = str(tmp_path / "metrics.sock")
+        exporter = OpenMetricsExporter(_collector(), unix_socket=path)
+        await exporter.start()
+        try:
+            response = await _http_get(*await asyncio.open_unix_connection(path))
+        finally:
+            await exporter.stop()
+        
+        assert "# EOF" in response
+        assert not (tmp_path / "metrics.sock").exists()
@@ -0,0 +1,76 @@
+"""Tests for batched message persistence."""
+import asyncio
+import threading
+
+import pytest
+
+from claudable_helper.cli.persister import MessagePersister
+
+
+class FakeSession:
+    """Records committed batches and the thread they were committed on."""
+    
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.pending = []
+        self.batches = []
+        self.threads = set()
+        self.rollbacks = 0
+    
+    def add_all(self, items):
+        self.pending.extend(items)
+    
+    def commit(self):
+        self.threads.add(threading.get_ident())
+        if self.fail:
+            raise RuntimeError("disk full")
+        self.batches.append(self.pending)
+        self.pending = []
+    
+    def rollback(self):
+        self.pending = []
+        self.rollbacks += 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMessagePersister:
+    """Test batching, interval flushes and error handling."""
+    
+    async def test_commits_in_batches_off_loop(self):
+        """Test a full batch commits at once, the rest at the end, never on the loop thread."""
+        db = FakeSession()
+        async with MessagePersister(db, batch_size=3, flush_interval=60) as persister:
+            for i in range(7):
+                await persister.add(i)
+        
+        assert db.batches == [[0, 1, 2], [3, 4, 5], [6]]
+        assert threading.get_ident() not in db.threads
+    
+    async def test_interval_bounds_visibility(self):
+        """Test a partial batch is committed within the flush interval."""
+        db = FakeSession()
+        persister = MessagePersister(db, batch_size=100, flush_interval=0.05)
+        await persister.add("a")
+        await persister.add("b")
+        assert db.batches == []
+        
+        await asyncio.sleep(0.2)
+        assert db.batches == [["a", "b"]]
+        await persister.close()
+    
+    async def test_flushes_on_error_without_masking_it(self):
+        """Test messages streamed before an error are kept and the error propagates."""
+        db = FakeSession()
+        with pytest.raises(ValueError):
+            async with MessagePersister(db, batch_size=100, flush_interval=60) as persister:
+                await persister.add("before")
+                raise ValueError("stream broke")
+        assert db.batches == [["before"]]
+        
+        failing = FakeSession(fail=True)
+        persister = MessagePersister(failing, batch_size=100, flush_interval=60)
+        await persister.add("lost")
+        with pytest.raises(RuntimeError):
+            await persister.close()
+        assert failing.rollbacks == 1
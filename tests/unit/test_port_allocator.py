@@ -0,0 +1,90 @@
+"""Tests for preview port allocation."""
+import socket
+import threading
+from contextlib import closing
+
+import pytest
+
+from claudable_helper.services.port_allocator import PortAllocator, is_port_free
+
+
+class RecordingProbe:
+    """Port probe that reports the given ports as busy and counts calls."""
+    
+    def __init__(self, busy=()):
+        self.busy = set(busy)
+        self.probed = []
+    
+    def __call__(self, port):
+        self.probed.append(port)
+        return port not in self.busy
+
+
+@pytest.mark.unit
+class TestPortAllocator:
+    """Test reservation, reuse of released ports and probing."""
+    
+    def test_skips_busy_and_reserved_ports(self):
+        probe = RecordingProbe(busy={3001})
+        allocator = PortAllocator(3000, 3004, probe=probe)
+        
+        assert [allocator.allocate() for _ in range(3)] == [3000, 3002, 3003]
+        assert probe.probed == [3000, 3001, 3002, 3003]
+        assert allocator.reserved() == {3000, 3002, 3003}
+    
+    def test_released_ports_are_reused_without_probing(self):
+        probe = RecordingProbe()
+        allocator = PortAllocator(3000, 3009, probe=probe)
+        first = allocator.allocate()
+        allocator.allocate()
+        allocator.release(first)
+        probed = len(probe.probed)
+        
+        assert allocator.allocate() == first
+        assert len(probe.probed) == probed
+        
+        allocator.release(4242)  # never reserved: ignored
+        assert allocator.allocate() == 3002
+    
+    def test_cursor_wraps_and_range_can_be_exhausted(self):
+        allocator = PortAllocator(3000, 3002, probe=RecordingProbe())
+        ports = [allocator.allocate() for _ in range(3)]
+        
+        with pytest.raises(RuntimeError, match="No free preview port"):
+            allocator.allocate()
+        
+        allocator.release(ports[1])
+        assert allocator.allocate() == ports[1]
+    
+    def test_reserve_explicit_port(self):
+        allocator = PortAllocator(3000, 3002, probe=RecordingProbe())
+        
+        assert allocator.reserve(3000)
+        assert not allocator.reserve(3000)
+        assert allocator.allocate() == 3001
+    
+    def test_concurrent_allocations_are_distinct(self):
+        allocator = PortAllocator(3000, 3199, probe=RecordingProbe())
+        results = []
+        
+        def worker():
+            for _ in range(25):
+                results.append(allocator.allocate())
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == len(set(results)) == 200
+    
+    def test_is_port_free_detects_listener(self):
+        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            assert not is_port_free(server.getsockname()[1])
+    
+    def test_rejects_empty_range(self):
+        with pytest.raises(ValueError):
+            PortAllocator(3001, 3000)
@@ -0,0 +1,55 @@
+"""Tests for the preview log ring buffer."""
+import pytest
+
+from claudable_helper.services.preview_logs import PreviewLogBuffer, spill_path_for
+
+
+@pytest.mark.unit
+class TestPreviewLogBuffer:
+    """Test capacity, sequence numbers and spilling to disk."""
+    
+    def test_keeps_newest_lines_with_monotonic_sequence(self):
+        logs = PreviewLogBuffer(capacity=3)
+        seqs = [logs.append(f"line {n}") for n in range(5)]
+        
+        assert seqs == [0, 1, 2, 3, 4]
+        assert list(logs) == ["line 2", "line 3", "line 4"]
+        assert (logs.first_seq, logs.next_seq, logs.last) == (2, 5, "line 4")
+        assert logs.tail(2) == ["line 3", "line 4"]
+        assert logs.tail(10) == ["line 2", "line 3", "line 4"]
+        assert logs.tail(0) == []
+    
+    def test_since_returns_only_unseen_lines(self):
+        logs = PreviewLogBuffer(capacity=10)
+        for n in range(4):
+            logs.append(f"line {n}")
+        
+        page = logs.since(0, limit=3)
+        assert page == {"lines": ["line 0", "line 1", "line 2"], "first": 0, "next": 3, "truncated": False}
+        
+        logs.append("line 4")
+        page = logs.since(page["next"])
+        assert page["lines"] == ["line 3", "line 4"]
+        assert logs.since(page["next"]) == {"lines": [], "first": 5, "next": 5, "truncated": False}
+        assert logs.since(0, limit=-1) == {"lines": [], "first": 0, "next": 0, "truncated": False}
+    
+    def test_since_reports_lines_pushed_out(self):
+        logs = PreviewLogBuffer(capacity=2)
+        for n in range(5):
+            logs.append(f"line {n}")
+        
+        page = logs.since(1)
+        assert page == {"lines": ["line 3", "line 4"], "first": 3, "next": 5, "truncated": True}
+    
+    def test_spills_evicted_lines_and_rotates(self, tmp_path):
+        path = spill_path_for(tmp_path, "proj/1")
+        logs = PreviewLogBuffer(capacity=2, spill_path=path, spill_max_bytes=20, spill_backups=1)
+        for n in range(8):
+            logs.append(f"line {n}")
+        logs.close()
+        
+        assert path.name == "proj_1.log"
+        rotated = path.with_name("proj_1.log.1")
+        assert rotated.read_text() == "line 2\nline 3\n"
+        assert path.read_text() == "line 4\nline 5\n"
+        assert list(logs) == ["line 6", "line 7"]
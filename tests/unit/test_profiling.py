@@ -0,0 +1,77 @@
+"""Unit tests for on-demand profiling."""
+import pstats
+import time
+import pytest
+
+from roundtable_mcp_server.profiling import Profiler
+
+
+def _busy(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        sum(range(100))
+
+
+@pytest.mark.unit
+class TestProfiler:
+    """Test Profiler class."""
+    
+    def test_not_armed(self, tmp_path):
+        """Test nothing is profiled unless armed."""
+        profiler = Profiler(output_dir=tmp_path)
+        
+        with profiler.profile("codex") as path:
+            assert path is None
+        
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_cprofile_next_calls(self, tmp_path):
+        """Test only the armed number of executions is profiled."""
+        profiler = Profiler(output_dir=tmp_path)
+        profiler.arm(1)
+        
+        with profiler.profile("codex"):
+            _busy(0.01)
+        with profiler.profile("codex") as path:
+            assert path is None
+        
+        assert len(profiler.written) == 1
+        assert profiler.written[0].suffix == ".pstats"
+        assert pstats.Stats(str(profiler.written[0])).total_calls > 0
+    
+    def test_sample_writes_collapsed_stacks(self, tmp_path):
+        """Test sampling mode writes collapsed stacks including the busy function."""
+        profiler = Profiler(output_dir=tmp_path, sample_interval=0.001)
+        profiler.arm(1, mode="sample")
+        
+        with profiler.profile("gemini"):
+            _busy(0.1)
+        
+        lines = profiler.written[0].read_text().splitlines()
+        assert profiler.written[0].suffix == ".folded"
+        assert any("_busy" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    
+    def test_invalid_mode(self, tmp_path):
+        """Test unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            Profiler(output_dir=tmp_path).arm(1, mode="perf")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProfileNextCallsTool:
+    """Test the profile_next_calls MCP tool."""
+    
+    async def test_arm_and_cancel(self, tmp_path, monkeypatch):
+        """Test the tool arms and cancels the global profiler."""
+        from roundtable_mcp_server import profiling, server
+        profiler = Profiler(output_dir=tmp_path)
+        monkeypatch.setattr(profiling, "_profiler", profiler)
+        
+        result = await server.profile_next_calls(n=3, mode="sample")
+        
+        assert "next 3" in result
+        assert profiler.mode == "sample"
+        assert "Profiling cancelled" in await server.profile_next_calls(n=0)
+        assert "Unknown profile mode" in await server.profile_next_calls(n=1, mode="perf")
@@ -0,0 +1,76 @@
+"""Tests for latency-aware agent routing."""
+import pytest
+
+from roundtable_mcp_server.circuit_breaker import CircuitState
+from roundtable_mcp_server.routing import describe_route, infer_task_type, rank_agents
+
+
+def _health(**agents):
+    def health(agent):
+        defaults = {"count": 0, "error_rate": 0.0, "p50": None, "p95": None, "active": 0}
+        return {**defaults, **agents.get(agent, {})}
+    return health
+
+
+def _closed(agent):
+    return CircuitState.CLOSED
+
+
+@pytest.mark.unit
+class TestRankAgents:
+    """Test agent ranking."""
+    
+    def test_lower_latency_ranks_first(self):
+        """Test the agent with the lower p50 wins for analysis tasks."""
+        health = _health(
+            claude={"count": 10, "p50": 20.0, "p95": 30.0},
+            gemini={"count": 10, "p50": 5.0, "p95": 60.0},
+        )
+        ranked, skipped = rank_agents(["claude", "gemini"], "analysis", health, _closed)
+        
+        assert [c.agent for c in ranked] == ["gemini", "claude"]
+        assert skipped == {}
+    
+    def test_edit_tasks_use_tail_latency(self):
+        """Test edit tasks rank by p95 instead of p50."""
+        health = _health(
+            claude={"count": 10, "p50": 20.0, "p95": 30.0},
+            gemini={"count": 10, "p50": 5.0, "p95": 60.0},
+        )
+        ranked, _ = rank_agents(["claude", "gemini"], "edit", health, _closed)
+        
+        assert [c.agent for c in ranked] == ["claude", "gemini"]
+    
+    def test_errors_and_load_penalize(self):
+        """Test error rate and in-flight calls raise the expected cost."""
+        health = _health(
+            claude={"count": 10, "p50": 10.0, "error_rate": 0.5},
+            gemini={"count": 10, "p50": 10.0, "active": 2},
+            codex={"count": 10, "p50": 10.0},
+        )
+        ranked, _ = rank_agents(["claude", "gemini", "codex"], "analysis", health, _closed)
+        
+        assert ranked[0].agent == "codex"
+        assert "2 in flight" in ranked[-1].reasons
+    
+    def test_open_circuit_skipped_and_unknown_gets_median(self):
+        """Test open circuits are skipped and agents without history get the median latency."""
+        health = _health(claude={"count": 10, "p50": 10.0}, gemini={"count": 10, "p50": 30.0})
+        states = {"claude": CircuitState.OPEN}
+        ranked, skipped = rank_agents(
+            ["claude", "gemini", "codex"], "analysis", health,
+            lambda agent: states.get(agent, CircuitState.CLOSED)
+        )
+        
+        assert skipped == {"claude": "circuit open"}
+        codex = next(c for c in ranked if c.agent == "codex")
+        assert codex.score == pytest.approx(20.0)
+        assert "no recent successes" in codex.reasons[0]
+        
+        route = describe_route(ranked, skipped, "analysis", "codex", {})
+        assert "codex: ~20.0s" in route and "claude: skipped (circuit open)" in route
+    
+    def test_infer_task_type(self):
+        """Test task type is guessed from the instruction."""
+        assert infer_task_type("Refactor the parser") == "edit"
+        assert infer_task_type("Why is this test slow?") == "analysis"
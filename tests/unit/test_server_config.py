@@ -1,6 +1,8 @@
 """Unit tests for server configuration."""
+import logging
 import os
 import pytest
+from roundtable_mcp_server import server
 from roundtable_mcp_server.server import ServerConfig, parse_config_from_env
 
 
@@ -14,7 +16,7 @@ class TestServerConfig:
         
         assert config.subagents == ["codex", "claude", "cursor", "gemini", "qwen", "kiro", "copilot", "grok", "kilocode", "crush", "opencode", "factory", "rovo"]
         assert config.working_dir is None
-        assert config.debug is True
+        assert config.debug is False
         assert config.verbose is False
     
     def test_custom_config(self):
@@ -90,3 +92,44 @@ class TestParseConfigFromEnv:
         # Should enable all subagents
         assert len(config.subagents) == 13
         assert "qwen" in config.subagents
+
+
+@pytest.mark.unit
+class TestDebugLogLevel:
+    """Test CLI_MCP_DEBUG controls the root log level."""
+    
+    @pytest.fixture(autouse=True)
+    def restore_root_level(self):
+        root = logging.getLogger()
+        level = root.level
+        yield
+        root.setLevel(level)
+    
+    def test_default_keeps_info(self):
+        """Test debug logging is off unless asked for."""
+        os.environ.pop("CLI_MCP_DEBUG", None)
+        logging.getLogger().setLevel(logging.INFO)
+        
+        server.initialize_config()
+        
+        assert logging.getLogger().level == logging.INFO
+    
+    def test_debug_lowers_level(self):
+        """Test CLI_MCP_DEBUG=true (what --debug sets) logs at DEBUG."""
+        os.environ["CLI_MCP_DEBUG"] = "true"
+        os.environ.pop("CLI_MCP_LOG_LEVEL", None)
+        logging.getLogger().setLevel(logging.INFO)
+        
+        server.initialize_config()
+        
+        assert logging.getLogger().level == logging.DEBUG
+    
+    def test_explicit_log_level_wins(self):
+        """Test CLI_MCP_LOG_LEVEL overrides CLI_MCP_DEBUG."""
+        os.environ["CLI_MCP_DEBUG"] = "true"
+        os.environ["CLI_MCP_LOG_LEVEL"] = "WARNING"
+        logging.getLogger().setLevel(logging.WARNING)
+        
+        server.initialize_config()
+        
+        assert logging.getLogger().level == logging.WARNING
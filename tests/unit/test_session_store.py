@@ -0,0 +1,174 @@
+"""Tests for the durable adapter session store."""
+from unittest.mock import patch
+
+import pytest
+
+from claudable_helper.cli.adapters.claude_code import ClaudeCodeCLI
+from claudable_helper.cli.adapters.codex_cli import CodexCLI
+from claudable_helper.cli.adapters.crush_cli import CrushCLI
+from claudable_helper.cli.adapters.cursor_agent import CursorAgentCLI
+from claudable_helper.cli.session_store import SessionStore, get_session_store
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSessionStore:
+    """Test session persistence, expiry and eviction."""
+    
+    async def test_keyed_by_agent_full_path_and_model(self, tmp_path):
+        """Test same-named projects, agents and models don't share sessions."""
+        store = SessionStore(tmp_path / "s.db")
+        try:
+            await store.set("claude", "/work/a/api", "s1")
+            await store.set("claude", "/work/b/api", "s2")
+            await store.set("claude", "/work/a/api", "s3", model="opus")
+            await store.set("cursor", "/work/a/api", "s4")
+            
+            assert await store.get("claude", "/work/a/api") == "s1"
+            assert await store.get("claude", "/work/b/api") == "s2"
+            assert await store.get("claude", "/work/a/api/../api", "opus") == "s3"
+            assert await store.get("cursor", "/work/a/api") == "s4"
+            assert await store.get("codex", "/work/a/api") is None
+        finally:
+            store.close()
+    
+    async def test_survives_restart(self, tmp_path):
+        """Test sessions are read back by a new store on the same file."""
+        store = SessionStore(tmp_path / "s.db")
+        await store.set("claude", "/work/api", "s1")
+        store.close()
+        
+        reopened = SessionStore(tmp_path / "s.db")
+        try:
+            assert await reopened.get("claude", "/work/api") == "s1"
+            await reopened.delete("claude", "/work/api")
+            assert await reopened.get("claude", "/work/api") is None
+        finally:
+            reopened.close()
+    
+    async def test_ttl_and_lru_eviction(self, tmp_path):
+        """Test unused sessions expire and the least recently used are evicted."""
+        clock = FakeClock()
+        store = SessionStore(tmp_path / "s.db", ttl=100, max_entries=2, clock=clock)
+        try:
+            await store.set("claude", "/p1", "s1")
+            clock.now += 10
+            await store.set("claude", "/p2", "s2")
+            clock.now += 10
+            assert await store.get("claude", "/p1") == "s1"  # now more recent than /p2
+            clock.now += 10
+            await store.set("claude", "/p3", "s3")
+            
+            assert await store.get("claude", "/p2") is None
+            assert await store.get("claude", "/p1") == "s1"
+            
+            clock.now += 101
+            assert await store.get("claude", "/p3") is None
+        finally:
+            store.close()
+    
+    async def test_adapters_share_the_store(self, tmp_path):
+        """Test a session set through one adapter instance is seen by a fresh one."""
+        await CrushCLI().set_session_id(str(tmp_path), "s1", model="m")
+        
+        assert await CrushCLI().get_session_id(str(tmp_path), model="m") == "s1"
+        assert await get_session_store().get("crush", str(tmp_path), "m") == "s1"
+        assert get_session_store().path == tmp_path / "roundtable" / "sessions.db"
+
+
+class RecordingClaudeClient:
+    """ClaudeSDKClient stand-in that records its options and streams nothing."""
+    
+    options = []
+    
+    def __init__(self, options):
+        RecordingClaudeClient.options.append(options)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def query(self, instruction):
+        pass
+    
+    async def receive_messages(self):
+        return
+        yield
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAdapterResume:
+    """Test which session the adapters resume."""
+    
+    async def test_claude_resumes_stored_session_unless_initial(self, tmp_path):
+        """Test Claude passes the stored session as `resume`, and not for an initial prompt."""
+        cli = ClaudeCodeCLI()
+        await cli.set_session_id(str(tmp_path), "stored")
+        RecordingClaudeClient.options = []
+        
+        with patch("claudable_helper.cli.adapters.claude_code.ClaudeSDKClient", RecordingClaudeClient):
+            [m async for m in cli.execute_with_streaming("hi", str(tmp_path))]
+            [m async for m in cli.execute_with_streaming("hi", str(tmp_path), is_initial_prompt=True)]
+        
+        resumed, fresh = RecordingClaudeClient.options
+        assert resumed.resume == "stored"
+        assert fresh.resume is None and not fresh.continue_conversation
+    
+    async def test_cursor_prefers_explicit_session_and_skips_stored_on_initial(self, tmp_path):
+        """Test Cursor resumes an explicit session over the stored one, and none for an initial prompt."""
+        cli = CursorAgentCLI()
+        await cli.set_session_id(str(tmp_path), "stored")
+        commands = []
+        
+        async def spawn(*cmd, **kwargs):
+            commands.append(cmd)
+            raise RuntimeError("not spawned")
+        
+        with patch("claudable_helper.cli.adapters.cursor_agent.asyncio.create_subprocess_exec", spawn):
+            for kwargs in ({}, {"session_id": "explicit"}, {"is_initial_prompt": True}):
+                with pytest.raises(RuntimeError):
+                    [m async for m in cli.execute_with_streaming("hi", str(tmp_path), **kwargs)]
+        
+        def resumed(cmd):
+            return cmd[cmd.index("--resume") + 1] if "--resume" in cmd else None
+        
+        assert [resumed(cmd) for cmd in commands] == ["stored", "explicit", None]
+    
+    async def test_codex_resumes_only_its_own_projects_rollout(self, tmp_path, monkeypatch):
+        """Test Codex resumes the rollout of the session stored for the absolute path, not a same-named project's."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("CLAUDABLE_CODEX_RESUME", "true")
+        sessions = tmp_path / "home" / ".codex" / "sessions" / "2026" / "10"
+        sessions.mkdir(parents=True)
+        rollout = sessions / "rollout-2026-10-19T09-00-00-s-first.jsonl"
+        rollout.write_text("{}\n")
+        # Newer rollout of another project; the old lookup picked whichever was latest
+        (sessions / "rollout-2026-10-19T10-00-00-s-other.jsonl").write_text("{}\n")
+        first, second = tmp_path / "a" / "app", tmp_path / "b" / "app"
+        first.mkdir(parents=True)
+        second.mkdir(parents=True)
+        cli = CodexCLI()
+        await cli.set_session_id(str(first), "s-first")
+        commands = []
+        
+        async def spawn(*cmd, **kwargs):
+            commands.append(cmd)
+            raise RuntimeError("not spawned")
+        
+        with patch("claudable_helper.cli.adapters.codex_cli.asyncio.create_subprocess_exec", spawn):
+            for path in (first, second):
+                [m async for m in cli.execute_with_streaming("hi", str(path))]
+        
+        resumes = [[arg for arg in cmd if arg.startswith("experimental_resume=")] for cmd in commands]
+        assert resumes == [[f"experimental_resume={rollout.resolve()}"], []]
@@ -0,0 +1,59 @@
+"""Unit tests for the stdout guard."""
+import io
+import logging
+import sys
+import pytest
+
+from roundtable_mcp_server.stdio_guard import StdoutGuard, guard_stdout, restore_stdout
+
+
+@pytest.fixture
+def protocol_stdout(monkeypatch):
+    # Returns a setter: pytest's capture swaps sys.stdout between setup and call
+    stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    
+    def install():
+        monkeypatch.setattr(sys, "stdout", stream)
+        return stream
+    
+    yield install
+    restore_stdout()
+
+
+@pytest.mark.unit
+class TestStdoutGuard:
+    """Test StdoutGuard class."""
+    
+    def test_print_is_logged_not_written(self, protocol_stdout, caplog):
+        """Test print() output becomes log records instead of stdout bytes."""
+        stream = protocol_stdout()
+        guard = guard_stdout()
+        
+        with caplog.at_level(logging.INFO, logger="roundtable_mcp_server.stdout"):
+            print("[DEBUG] stray adapter output")
+            print("partial", end="")
+            guard.flush()
+        
+        assert caplog.messages == ["[DEBUG] stray adapter output", "partial"]
+        stream.flush()
+        assert stream.buffer.getvalue() == b""
+    
+    def test_buffer_is_protocol_channel(self, protocol_stdout):
+        """Test the transport can still write to the real stdout buffer."""
+        stream = protocol_stdout()
+        guard = guard_stdout()
+        
+        sys.stdout.buffer.write(b'{"jsonrpc": "2.0"}\n')
+        
+        assert isinstance(sys.stdout, StdoutGuard)
+        assert guard_stdout() is guard
+        assert stream.buffer.getvalue() == b'{"jsonrpc": "2.0"}\n'
+    
+    def test_restore(self, protocol_stdout):
+        """Test restore_stdout puts the original stream back."""
+        stream = protocol_stdout()
+        guard_stdout()
+        
+        assert restore_stdout() is stream
+        assert sys.stdout is stream
+        assert restore_stdout() is None
@@ -0,0 +1,65 @@
+"""Unit tests for the logging-backed terminal UI."""
+import logging
+import pytest
+
+from claudable_helper.core.terminal_ui import MockTerminalUI, logger as ui_logger
+
+
+class _CountingRepr:
+    """Counts how often it is rendered into a message."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __str__(self):
+        self.calls += 1
+        return "payload"
+
+
+@pytest.fixture
+def ui():
+    previous = ui_logger.level
+    yield MockTerminalUI()
+    ui_logger.setLevel(previous)
+
+
+@pytest.mark.unit
+class TestMockTerminalUI:
+    """Test MockTerminalUI class."""
+    
+    def test_debug_args_not_formatted_when_disabled(self, ui):
+        """Test lazy arguments are never rendered while debug is off."""
+        ui_logger.setLevel(logging.INFO)
+        payload = _CountingRepr()
+        
+        ui.debug("update: %s", "Gemini", payload)
+        
+        assert not ui.debug_enabled
+        assert payload.calls == 0
+    
+    def test_debug_formats_lazy_args(self, ui, caplog):
+        """Test lazy arguments are interpolated once debug is on."""
+        ui_logger.setLevel(logging.DEBUG)
+        
+        with caplog.at_level(logging.DEBUG, logger=ui_logger.name):
+            ui.debug("[%s] update: %s", "Gemini", "turn1", {"kind": "chunk"})
+        
+        assert ui.debug_enabled
+        assert caplog.messages == ["[Gemini] [turn1] update: {'kind': 'chunk'}"]
+        assert caplog.records[0].funcName == "test_debug_formats_lazy_args"
+    
+    def test_preformatted_message_with_percent(self, ui, caplog):
+        """Test messages without args are not interpolated again."""
+        with caplog.at_level(logging.INFO, logger=ui_logger.name):
+            ui.info("Progress 100% done", "Build")
+            ui.success("Installed", "npm")
+        
+        assert caplog.messages == ["[Build] Progress 100% done", "[npm] Installed"]
+    
+    def test_nothing_written_to_stdout(self, ui, capsys):
+        """Test log methods never write to stdout."""
+        ui.info("hello", "Test")
+        ui.success("done", "Test")
+        ui.error("failed", "Test")
+        
+        assert capsys.readouterr().out == ""
@@ -0,0 +1,118 @@
+"""Unit tests for in-process tracing."""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from claudable_helper.core import tracing
+
+
+@pytest.fixture
+def jsonl_tracer(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    tracing.configure(str(path))
+    yield path
+    tracing.shutdown()
+
+
+def _read_spans(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.unit
+class TestTracing:
+    """Test span creation and export."""
+    
+    def test_disabled_is_noop(self, tmp_path):
+        """Test spans are no-ops until a tracer is configured."""
+        assert not tracing.enabled()
+        with tracing.start_trace("call") as root:
+            root.set_attribute("ignored", True)
+            assert tracing.current_trace_id() is None
+    
+    def test_nested_spans_share_trace(self, jsonl_tracer):
+        """Test child spans link to their parent and are written when the root ends."""
+        with tracing.start_trace("codex_subagent", agent="codex"):
+            trace_id = tracing.current_trace_id()
+            with tracing.span("availability"):
+                pass
+            assert not jsonl_tracer.exists()
+        
+        spans = {s["name"]: s for s in _read_spans(jsonl_tracer)}
+        assert set(spans) == {"codex_subagent", "availability"}
+        assert spans["availability"]["trace_id"] == trace_id
+        assert spans["availability"]["parent_id"] == spans["codex_subagent"]["span_id"]
+        assert spans["codex_subagent"]["parent_id"] is None
+        assert spans["codex_subagent"]["attributes"] == {"agent": "codex"}
+    
+    def test_error_recorded(self, jsonl_tracer):
+        """Test exceptions are recorded on the span."""
+        with pytest.raises(ValueError):
+            with tracing.start_trace("call"):
+                raise ValueError("bad")
+        
+        assert _read_spans(jsonl_tracer)[0]["attributes"]["error"] == "ValueError: bad"
+    
+    def test_chrome_format(self, tmp_path):
+        """Test Chrome trace-event output is a JSON array of complete events."""
+        path = tmp_path / "trace.json"
+        tracing.configure(str(path))
+        try:
+            with tracing.start_trace("call"):
+                with tracing.span("stream"):
+                    pass
+        finally:
+            tracing.shutdown()
+        
+        events = json.loads(path.read_text().rstrip().rstrip(",") + "]")
+        assert [e["name"] for e in events] == ["stream", "call"]
+        assert all(e["ph"] == "X" for e in events)
+        assert events[0]["tid"] == events[1]["tid"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSubagentTracing:
+    """Test subagent calls are traced end to end."""
+    
+    async def test_subagent_spans(self, jsonl_tracer, mock_context, sample_instruction, temp_project_dir):
+        """Test a subagent call produces the expected span tree."""
+        from claudable_helper.cli.base import mark_phase
+        from roundtable_mcp_server import server
+        server.enabled_subagents = {"qwen"}
+        server.config = MagicMock(verbose=False)
+        
+        with patch('roundtable_mcp_server.server.QwenCLI') as mock_cli_class:
+            mock_cli = MagicMock()
+            mock_cli.check_availability = AsyncMock(return_value={"available": True})
+            
+            async def mock_stream(*args, **kwargs):
+                mark_phase("spawned")
+                with tracing.span("parse"):
+                    pass
+                mark_phase("session_ready")
+                yield MagicMock(message_type=MagicMock(value="tool_use"), role="tool", content="Read file")
+                yield MagicMock(message_type=MagicMock(value="tool_result"), role="tool", content="ok")
+                yield MagicMock(message_type=MagicMock(value="chat"), role="assistant", content="Done")
+            
+            mock_cli.execute_with_streaming = mock_stream
+            mock_cli_class.return_value = mock_cli
+            
+            await server.qwen_subagent(
+                instruction=sample_instruction,
+                project_path=str(temp_project_dir),
+                ctx=mock_context
+            )
+        
+        spans = _read_spans(jsonl_tracer)
+        by_name = {s["name"]: s for s in spans}
+        assert set(by_name) == {
+            "qwen_subagent", "availability", "stream", "spawn", "parse",
+            "session_init", "tool", "aggregate"
+        }
+        assert len({s["trace_id"] for s in spans}) == 1
+        stream_id = by_name["stream"]["span_id"]
+        for name in ("spawn", "parse", "session_init", "tool"):
+            assert by_name[name]["parent_id"] == stream_id
+        assert by_name["tool"]["attributes"]["tool"] == "Read file"
+        assert by_name["qwen_subagent"]["attributes"]["messages"] == 3
@@ -0,0 +1,171 @@
+"""Tests for the append-only transcript store."""
+import os
+import time
+
+import pytest
+
+from roundtable_mcp_server.history_index import HistoryIndex, HistorySearchError
+from roundtable_mcp_server.transcripts import TranscriptError, TranscriptStore, get_transcript_store
+
+
+@pytest.mark.unit
+class TestTranscriptStore:
+    """Test appending and reading back run transcripts."""
+    
+    def test_roundtrip_with_filter_and_range(self, tmp_path):
+        """Test a run's messages are read back, filtered by type and sliced."""
+        store = TranscriptStore(tmp_path)
+        run = store.start_run("codex", "Explain main()", project_path="/work/api")
+        run.append("chat", "assistant", "It parses args")
+        run.append("tool_use", "assistant", "Read main.py")
+        run.append("chat", "assistant", "Then it starts the server")
+        run.close()
+        
+        transcript = store.read(run.run_id)
+        assert transcript["agent"] == "codex"
+        assert transcript["total"] == 4
+        assert [m["content"] for m in transcript["messages"]][0] == "Explain main()"
+        
+        chats = store.read(run.run_id, types={"chat"})
+        assert [m["seq"] for m in chats["messages"]] == [1, 3]
+        
+        tail = store.read(run.run_id, start=-2)
+        assert [m["content"] for m in tail["messages"]] == ["Read main.py", "Then it starts the server"]
+        store.close()
+    
+    def test_runs_share_segments_and_rotate(self, tmp_path):
+        """Test interleaved runs in one session stay separate across segment files."""
+        store = TranscriptStore(tmp_path, segment_bytes=300)
+        first = store.start_run("claude", "first", session_id="s/1")
+        second = store.start_run("claude", "second", session_id="s/1")
+        for i in range(5):
+            first.append("chat", "assistant", f"first {i}")
+            second.append("chat", "assistant", f"second {i}")
+        store.flush()
+        
+        assert len(list((tmp_path / "claude-s_1").glob("*.seg"))) > 1
+        transcript = store.read(first.run_id)
+        assert [m["content"] for m in transcript["messages"]] == ["first"] + [f"first {i}" for i in range(5)]
+        assert store.read("latest:claude")["run"] == second.run_id
+        assert store.read("missing") is None
+        store.close()
+    
+    def test_compressed_records(self, tmp_path):
+        """Test large records are compressed on disk and restored on read."""
+        store = TranscriptStore(tmp_path, compress=True)
+        run = store.start_run("gemini", "Summarize")
+        run.append("chat", "assistant", "x" * 10000)
+        run.close()
+        store.flush()
+        
+        assert sum(p.stat().st_size for p in (tmp_path / "gemini").glob("*.seg")) < 2000
+        assert store.read(run.run_id)["messages"][1]["content"] == "x" * 10000
+        store.close()
+    
+    def test_processes_sharing_a_directory_keep_their_runs_apart(self, tmp_path):
+        """Test two stores on one directory never mix up each other's records."""
+        store_a = TranscriptStore(tmp_path)
+        store_b = TranscriptStore(tmp_path)
+        run_a = store_a.start_run("codex", "from A")
+        run_b = store_b.start_run("codex", "from B")
+        for i in range(3):
+            run_a.append("chat", "assistant", f"A {i}")
+            run_b.append("chat", "assistant", f"B {i} " + "padding " * i)
+        run_a.close()
+        run_b.close()
+        store_a.flush()
+        store_b.flush()
+        
+        for store in (store_a, store_b):
+            assert [m["content"] for m in store.read(run_a.run_id)["messages"]] == ["from A", "A 0", "A 1", "A 2"]
+            assert store.read(run_b.run_id)["messages"][0]["content"] == "from B"
+        assert {r["run"] for r in store_a.list_runs()} == {run_a.run_id, run_b.run_id}
+        store_a.close()
+        store_b.close()
+    
+    def test_old_transcripts_are_pruned(self, tmp_path):
+        """Test segments and run lists untouched for retention_days are deleted."""
+        store = TranscriptStore(tmp_path, retention_days=1)
+        run = store.start_run("gemini", "old question")
+        run.close()
+        store.close()
+        
+        old = time.time() - 2 * 86400
+        for path in tmp_path.rglob("*"):
+            if path.is_file():
+                os.utime(path, (old, old))
+        
+        store = TranscriptStore(tmp_path, retention_days=1)
+        assert store.prune() == 2
+        assert store.read(run.run_id) is None
+        assert not (tmp_path / "gemini").exists()
+        store.close()
+    
+    def test_unreadable_transcript_raises_transcript_error(self, tmp_path):
+        """Test a run whose segment is gone fails with TranscriptError."""
+        store = TranscriptStore(tmp_path)
+        run = store.start_run("codex", "question")
+        run.close()
+        store.close()
+        for path in (tmp_path / "codex").glob("*.seg"):
+            path.write_bytes(b"")
+        
+        store = TranscriptStore(tmp_path)
+        with pytest.raises(TranscriptError):
+            store.read(run.run_id)
+        store.close()
+    
+    def test_global_store_under_roundtable_home(self, tmp_path):
+        """Test the global store defaults to ROUNDTABLE_HOME/transcripts."""
+        assert get_transcript_store().directory == tmp_path / "roundtable" / "transcripts"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHistoryIndex:
+    """Test full-text search over finished runs."""
+    
+    async def test_finished_runs_are_searchable(self, tmp_path):
+        """Test runs are indexed on close and searched with agent and project filters."""
+        index = HistoryIndex(tmp_path / "history.db")
+        store = TranscriptStore(tmp_path, index=index)
+        gemini = store.start_run("gemini", "Review the caching layer", project_path="/work/api")
+        gemini.append("chat", "assistant", "The cache layer evicts entries too eagerly")
+        gemini.append("system", "system", "cache cache cache")
+        codex = store.start_run("codex", "Review the cache", project_path="/work/web")
+        codex.append("chat", "assistant", "Caches look fine")
+        
+        assert await index.search("cache") == []
+        gemini.close()
+        codex.close()
+        index.flush()
+        
+        hits = await index.search("caches evicted")
+        assert [(h["run"], h["seq"]) for h in hits] == [(gemini.run_id, 1)]
+        assert "[cache]" in hits[0]["snippet"]
+        
+        assert {h["agent"] for h in await index.search("cache")} == {"gemini", "codex"}
+        assert {h["agent"] for h in await index.search("cache", agent="codex")} == {"codex"}
+        assert {h["project"] for h in await index.search("cache", project="/work/api")} == {"/work/api"}
+        assert await index.search('"; DROP TABLE messages; --') == []
+        store.close()
+    
+    async def test_query_punctuation_is_not_fts_syntax(self, tmp_path):
+        """Test quotes, dashes and FTS5 operators in a query are searched as plain words."""
+        index = HistoryIndex(tmp_path / "history.db")
+        index.add_run("r1", "codex", None, [(1, "chat", "The cache-layer is NOT thread safe")])
+        index.flush()
+        
+        for query in ('"cache-layer', 'cache -layer', 'thread NOT safe', 'safe" NOT "is', 'layer*'):
+            assert [h["run"] for h in await index.search(query)] == ["r1"], query
+        assert await index.search('"unbalanced -') == []
+        index.close()
+    
+    async def test_database_errors_raise_history_search_error(self, tmp_path):
+        """Test SQLite failures surface as HistorySearchError, not raw sqlite3 errors."""
+        (tmp_path / "history.db").mkdir()
+        index = HistoryIndex(tmp_path / "history.db")
+        
+        with pytest.raises(HistorySearchError):
+            await index.search("cache")
+        index.close()
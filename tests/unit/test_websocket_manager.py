@@ -0,0 +1,122 @@
+"""Tests for the queued WebSocket fan-out."""
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from claudable_helper.core.websocket.manager import (
+    CLOSE_TRY_AGAIN_LATER,
+    SlowClientPolicy,
+    WebSocketManager,
+)
+
+
+class FakeWebSocket:
+    """Records sent text; a blocked socket waits until released."""
+    
+    def __init__(self, blocked=False):
+        self.sent = []
+        self.closed_with = None
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+    
+    async def send_text(self, text):
+        await self.release.wait()
+        self.sent.append(text)
+    
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWebSocketManager:
+    """Test serialize-once fan-out, queue bounds and slow-client policies."""
+    
+    async def test_broadcast_serializes_once_and_slow_client_does_not_block(self):
+        manager = WebSocketManager(queue_size=4)
+        fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+        await manager.connect(fast, "fast")
+        await manager.connect(slow, "slow")
+        
+        with patch("claudable_helper.core.websocket.manager.json.dumps", wraps=json.dumps) as dumps:
+            await manager.broadcast({"type": "message", "n": 1})
+        await settle()
+        
+        assert dumps.call_count == 1
+        assert [json.loads(t) for t in fast.sent] == [{"type": "message", "n": 1}]
+        assert slow.sent == []
+        
+        slow.release.set()
+        await settle()
+        assert slow.sent == fast.sent
+        assert manager.get_queue_stats()["slow"][0]["sent"] == 1
+        
+        await manager.close()
+        assert manager.get_connection_count() == 0
+    
+    async def test_drop_oldest_keeps_recent_messages(self):
+        manager = WebSocketManager(queue_size=2, policy="drop_oldest")
+        slow = FakeWebSocket(blocked=True)
+        await manager.connect(slow, "p1")
+        await settle()
+        
+        for n in range(5):
+            await manager.send_message("p1", {"n": n})
+        
+        stats = manager.get_queue_stats()["p1"][0]
+        assert stats["queue_depth"] == 2
+        assert stats["dropped"] >= 2
+        
+        slow.release.set()
+        await settle()
+        assert json.loads(slow.sent[-1]) == {"n": 4}
+        assert manager.is_active()
+    
+    async def test_disconnect_policy_closes_slow_client(self):
+        manager = WebSocketManager(queue_size=1, policy=SlowClientPolicy.DISCONNECT)
+        slow, other = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, "p1")
+        await manager.connect(other, "p1")
+        await settle()
+        
+        for n in range(3):
+            await manager.send_message("p1", {"n": n})
+            await settle()
+        
+        assert slow.closed_with == CLOSE_TRY_AGAIN_LATER
+        assert manager.get_connection_count() == 1
+        assert len(other.sent) == 3
+    
+    async def test_failed_send_removes_connection(self):
+        manager = WebSocketManager()
+        
+        class BrokenWebSocket(FakeWebSocket):
+            async def send_text(self, text):
+                raise ConnectionResetError("gone")
+        
+        await manager.connect(BrokenWebSocket(), "p1")
+        await manager.send_message("p1", {"n": 1})
+        await settle()
+        
+        assert manager.get_client_ids() == []
+        assert not manager.is_active()
+    
+    async def test_disconnect_unknown_client_is_noop(self):
+        manager = WebSocketManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, "p1")
+        await manager.disconnect(FakeWebSocket(), "p1")
+        await manager.disconnect(ws, "missing")
+        assert manager.get_connection_count() == 1
+        
+        await manager.disconnect(ws, "p1")
+        assert manager.get_connection_count() == 0
+        await manager.send_message("p1", {"n": 1})